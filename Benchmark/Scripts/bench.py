@@ -0,0 +1,149 @@
+
+""" Runs rigging system benchmarks outside of MODO.
+
+    lx, lxu and modo modules are replaced with in-memory fakes from the fakes folder.
+    rs package is loaded without running its __init__ so no plugin
+    initialisation happens and only benchmarked modules get imported.
+
+    Usage:
+        python bench.py                                 run all benchmarks
+        python bench.py -l                              list benchmarks
+        python bench.py name_op item_settings           run benchmarks which identifiers start with given strings
+        python bench.py -r 10                           repeat each benchmark 10 times
+        python bench.py -s results.json                 save results
+        python bench.py -c baseline.json -t 0.15        compare with saved results, exit code is 1 on regression
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import types
+
+
+SCRIPTS_PATH = os.path.dirname(os.path.abspath(__file__))
+FAKES_PATH = os.path.join(SCRIPTS_PATH, 'fakes')
+KIT_SCRIPTS_PATH = os.path.normpath(os.path.join(SCRIPTS_PATH, '..', '..', 'Kit', 'AutoCharacterSystem', 'Scripts'))
+
+
+def setupEnvironment():
+    """ Sets up import paths so kit modules import fake MODO modules.
+    """
+    sys.path.insert(0, FAKES_PATH)
+    sys.path.insert(1, KIT_SCRIPTS_PATH)
+
+    # rs/__init__.py registers the entire system with MODO,
+    # package module is created by hand so only the submodules are loaded.
+    rsPackage = types.ModuleType('rs')
+    rsPackage.__path__ = [os.path.join(KIT_SCRIPTS_PATH, 'rs')]
+    sys.modules['rs'] = rsPackage
+
+
+def runBenchmark(benchmarkClass, repeat):
+    """ Runs single benchmark a number of times.
+
+    Returns
+    -------
+    dict
+        Best and median run times in seconds.
+    """
+    benchmark = benchmarkClass()
+    times = []
+    for x in range(repeat):
+        benchmark.setup()
+        start = time.perf_counter()
+        result = benchmark.run()
+        times.append(time.perf_counter() - start)
+        benchmark.verify(result)
+    times.sort()
+    return {'best': times[0],
+            'median': times[len(times) // 2],
+            'repeat': repeat}
+
+
+def compareResults(results, baseline, threshold):
+    """ Compares results with baseline results.
+
+    Best times are compared since they are the least affected by system noise.
+
+    Returns
+    -------
+    [str]
+        Identifiers of benchmarks that are slower than baseline by more than threshold.
+    """
+    regressions = []
+    for ident in results:
+        try:
+            baseTime = baseline['results'][ident]['best']
+        except KeyError:
+            print('%-40s no baseline' % ident)
+            continue
+        currentTime = results[ident]['best']
+        ratio = currentTime / baseTime if baseTime > 0.0 else 1.0
+        status = ''
+        if ratio > 1.0 + threshold:
+            status = 'REGRESSION'
+            regressions.append(ident)
+        elif ratio < 1.0 - threshold:
+            status = 'faster'
+        print('%-40s %10.3f ms -> %10.3f ms  x%.2f  %s' % (ident, baseTime * 1000.0, currentTime * 1000.0, ratio, status))
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Rigging system benchmarks.')
+    parser.add_argument('filters', nargs='*', help='Run only benchmarks which identifiers start with one of these.')
+    parser.add_argument('-l', '--list', action='store_true', help='List benchmarks and exit.')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Number of timed runs per benchmark.')
+    parser.add_argument('-s', '--save', help='Save results to a json file.')
+    parser.add_argument('-c', '--compare', help='Compare results with results saved in a json file.')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='Relative slowdown that is reported as regression (0.1 is 10%%).')
+    args = parser.parse_args(argv)
+
+    setupEnvironment()
+    import benchmarks
+
+    benchmarkClasses = benchmarks.getAllBenchmarks()
+    if args.filters:
+        benchmarkClasses = [b for b in benchmarkClasses
+                            if any(b.descIdentifier.startswith(f) for f in args.filters)]
+
+    if args.list:
+        for benchmarkClass in benchmarkClasses:
+            print('%-40s %s' % (benchmarkClass.descIdentifier, benchmarkClass.descUsername))
+        return 0
+
+    results = {}
+    for benchmarkClass in benchmarkClasses:
+        result = runBenchmark(benchmarkClass, max(1, args.repeat))
+        results[benchmarkClass.descIdentifier] = result
+        print('%-40s best %10.3f ms  median %10.3f ms' % (benchmarkClass.descIdentifier,
+                                                          result['best'] * 1000.0,
+                                                          result['median'] * 1000.0))
+
+    if args.save:
+        data = {'python': platform.python_version(),
+                'platform': platform.platform(),
+                'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'results': results}
+        with open(args.save, 'w') as f:
+            json.dump(data, f, indent=4, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        print('')
+        regressions = compareResults(results, baseline, args.threshold)
+        if regressions:
+            print('\n%d benchmark(s) regressed.' % len(regressions))
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,77 @@
+
+""" Benchmarks of rigging system python hot paths.
+
+    Each benchmark module lists its benchmark classes in the module level
+    'benchmarks' attribute. Add new modules to the MODULES list below.
+"""
+
+
+import importlib
+
+
+MODULES = ['name_op',
+           'item_settings',
+           'pose',
+           'module_map',
+           'xfrm_in_mesh',
+           'channel_lxe',
+           'guide_symmetry',
+           'time_range',
+           'retarget_map',
+           'key_reduce',
+           'feature_index',
+           'command_cache',
+           'weight_matrix',
+           'weight_transfer']
+
+
+class Benchmark(object):
+    """ Base class for a single benchmark.
+
+    setup() is called before every timed run and is not timed itself
+    so benchmarks that change scene data can rebuild it each time.
+    Only run() is timed.
+
+    Attributes
+    ----------
+    descIdentifier : str
+        Unique benchmark identifier, results are stored and compared under it.
+
+    descUsername : str
+        Short description of the measured workload.
+    """
+
+    descIdentifier = ''
+    descUsername = ''
+
+    def setup(self):
+        pass
+
+    def run(self):
+        pass
+
+    def verify(self, result):
+        """ Tests whether result returned from run() is correct.
+
+        Benchmark that gets faster because the workload silently stopped doing
+        its job is not a speedup so benchmarks should check their results.
+
+        Raises
+        ------
+        AssertionError
+        """
+        pass
+
+
+def getAllBenchmarks():
+    """ Gets all benchmark classes from all benchmark modules.
+
+    Returns
+    -------
+    [Benchmark]
+    """
+    result = []
+    for moduleName in MODULES:
+        module = importlib.import_module('.' + moduleName, __name__)
+        result.extend(module.benchmarks)
+    return result
@@ -0,0 +1,76 @@
+
+""" Envelope filtering benchmarks.
+"""
+
+
+import random
+
+import lx
+from fakescene import EnvelopeData
+from modox.channel_lxe import EnvelopeUtils
+
+from . import Benchmark
+
+
+KEYS_COUNT = 3000
+ENVELOPES_COUNT = 20
+
+
+def buildBakedEnvelope(keysCount, isInt=False, seed=1):
+    """ Builds envelope that looks like baked animation.
+
+    Envelope has a key on every frame, values hold still for random number
+    of frames and then change, so a lot of keys are static.
+
+    Returns
+    -------
+    EnvelopeData
+    """
+    rnd = random.Random(seed)
+    env = EnvelopeData(isInt)
+    value = 0
+    x = 0
+    while x < keysCount:
+        holdFrames = rnd.randrange(1, 30)
+        for y in range(holdFrames):
+            if x >= keysCount:
+                break
+            env.addKey(x / 24.0, value)
+            x += 1
+        value = value + 1 if isInt else value + rnd.random()
+    return env
+
+
+class FilterStaticKeysBenchmark(Benchmark):
+
+    descIdentifier = 'channel_lxe.filter_static_keys'
+    descUsername = 'Filter static keys on %d float envelopes with %d keys' % (ENVELOPES_COUNT, KEYS_COUNT)
+
+    isInt = False
+
+    def setup(self):
+        self.envelopes = [buildBakedEnvelope(KEYS_COUNT, self.isInt, seed=x) for x in range(ENVELOPES_COUNT)]
+
+    def run(self):
+        result = []
+        for env in self.envelopes:
+            deleted, isStatic = EnvelopeUtils(lx.object.Envelope(env)).FilterStaticKeys()
+            result.append(deleted)
+        return result
+
+    def verify(self, result):
+        assert all(deleted > 0 for deleted in result)
+        for env in self.envelopes:
+            assert len(env.keys) < KEYS_COUNT
+
+
+class FilterStaticKeysIntBenchmark(FilterStaticKeysBenchmark):
+
+    descIdentifier = 'channel_lxe.filter_static_keys_int'
+    descUsername = 'Filter static keys on %d integer envelopes with %d keys' % (ENVELOPES_COUNT, KEYS_COUNT)
+
+    isInt = True
+
+
+benchmarks = [FilterStaticKeysBenchmark,
+              FilterStaticKeysIntBenchmark]
@@ -0,0 +1,100 @@
+
+""" Command query cache benchmarks.
+
+    Simulates form refreshes querying a popup command which query walks
+    scene items, with and without caching of query results.
+"""
+
+
+import lx
+import modox
+from modox.command import Argument
+from modox.command_profile import commandResultCache
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+
+
+ITEMS_COUNT = 500
+REFRESHES_COUNT = 400
+REFRESHES_PER_NOTIFY = 40
+
+
+class PopupCommand(modox.Command):
+    """ Command which query counts all locators in the scene.
+    """
+
+    NAME = 'bench.popup'
+
+    def arguments(self):
+        listArg = Argument('list', 'integer')
+        listArg.flags = 'query'
+        return [listArg]
+
+    def query(self, argument):
+        scene = lx.object.Scene()
+        found = 0
+        for x in range(scene.ItemCount(lx.symbol.iTYPE_ANY)):
+            if scene.ItemByIndex(lx.symbol.iTYPE_ANY, x).Type() == 'locator':
+                found += 1
+        self.queriesCount += 1
+        return found
+
+    def init(self):
+        self.queriesCount = 0
+
+
+class CachedPopupCommand(PopupCommand):
+
+    NAME = 'bench.popupCached'
+
+    def queryCacheOn(self):
+        return True
+
+
+class CommandCacheBenchmark(Benchmark):
+
+    commandClass = None
+
+    def setup(self):
+        resetScene()
+        for x in range(ITEMS_COUNT):
+            addItem('locator', 'Item%d' % x)
+        commandResultCache.invalidateAll()
+        self.command = self.commandClass()
+
+    def run(self):
+        for x in range(REFRESHES_COUNT):
+            # Notifier fires once every number of refreshes.
+            if x % REFRESHES_PER_NOTIFY == 0:
+                commandResultCache.invalidateCommand(self.command.NAME)
+            self.command.cmd_Query(0, None)
+        return self.command.queriesCount
+
+    def verify(self, result):
+        assert result > 0
+
+
+class CommandQueryUncachedBenchmark(CommandCacheBenchmark):
+
+    descIdentifier = 'command_cache.query_uncached'
+    descUsername = 'Query popup command %d times, result evaluated every time' % REFRESHES_COUNT
+    commandClass = PopupCommand
+
+    def verify(self, result):
+        assert result == REFRESHES_COUNT
+
+
+class CommandQueryCachedBenchmark(CommandCacheBenchmark):
+
+    descIdentifier = 'command_cache.query_cached'
+    descUsername = 'Query popup command %d times, cached until notifier fires' % REFRESHES_COUNT
+    commandClass = CachedPopupCommand
+
+    def verify(self, result):
+        assert result == REFRESHES_COUNT // REFRESHES_PER_NOTIFY
+
+
+benchmarks = [CommandQueryUncachedBenchmark,
+              CommandQueryCachedBenchmark]
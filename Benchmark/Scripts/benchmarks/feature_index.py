@@ -0,0 +1,119 @@
+
+""" Item feature lookup benchmarks.
+
+    Compares feature lookups answered from the scene wide feature index
+    with reading and splitting the features tag on every query.
+    Index is cleared before each run so its build sweep is included in the times.
+"""
+
+
+import lx
+import lxu.select
+from rs.item_feature_settings import ItemFeatureSettings
+from rs.item_feature_settings import featureIndex
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+
+
+ITEMS_COUNT = 3000
+FEATURES = ['rs.controller', 'rs.guide', 'rs.dynaSpace', 'rs.ikfkSwitch', 'rs.bindProxy']
+
+
+def addFeatureItems(count):
+    """ Adds items with various feature sets, every third item has no features.
+
+    Returns
+    -------
+    [modo.Item]
+    """
+    items = []
+    for x in range(count):
+        modoItem = addItem('locator', 'Item%d' % x)
+        if x % 3:
+            modoItem.setTag('RSIF', ';'.join(FEATURES[:1 + x % len(FEATURES)]))
+        items.append(modoItem)
+    return items
+
+
+def hasFeatureBySplit(identifier, modoItem):
+    """ Feature test as it was done before the index, tag is read and split every time.
+    """
+    try:
+        val = modoItem.readTag('RSIF')
+    except LookupError:
+        return False
+    return identifier in val.split(';')
+
+
+class FeatureIndexBenchmark(Benchmark):
+
+    def setup(self):
+        resetScene()
+        self.items = addFeatureItems(ITEMS_COUNT)
+        featureIndex.invalidateAll()
+
+    def verify(self, result):
+        expected = [len([modoItem for modoItem in self.items if hasFeatureBySplit(identifier, modoItem)])
+                    for identifier in FEATURES]
+        assert result == expected
+
+
+class FeatureIndexItemQueriesBenchmark(FeatureIndexBenchmark):
+
+    descIdentifier = 'feature_index.item_queries'
+    descUsername = 'Test %d features on %d items, 3 times, feature index' % (len(FEATURES), ITEMS_COUNT)
+
+    def run(self):
+        for x in range(3):
+            result = [len([modoItem for modoItem in self.items if featureIndex.hasFeature(modoItem, identifier)])
+                      for identifier in FEATURES]
+        return result
+
+
+class FeatureSplitItemQueriesBenchmark(FeatureIndexBenchmark):
+
+    descIdentifier = 'feature_index.item_queries_split'
+    descUsername = 'Test %d features on %d items, 3 times, tag split per query' % (len(FEATURES), ITEMS_COUNT)
+
+    def run(self):
+        for x in range(3):
+            result = [len([modoItem for modoItem in self.items if hasFeatureBySplit(identifier, modoItem)])
+                      for identifier in FEATURES]
+        return result
+
+
+class FeatureIndexItemsWithFeatureBenchmark(FeatureIndexBenchmark):
+
+    descIdentifier = 'feature_index.items_with_feature'
+    descUsername = 'Find scene items with each of %d features, feature index' % len(FEATURES)
+
+    def run(self):
+        return [len(featureIndex.getItemIdsWithFeature(identifier)) for identifier in FEATURES]
+
+
+class FeatureSplitItemsWithFeatureBenchmark(FeatureIndexBenchmark):
+
+    descIdentifier = 'feature_index.items_with_feature_split'
+    descUsername = 'Find scene items with each of %d features, raw tag split per item' % len(FEATURES)
+
+    def run(self):
+        scene = lx.object.Scene(lxu.select.SceneSelection().current())
+        count = scene.ItemCount(lx.symbol.iTYPE_ANY)
+        result = []
+        for identifier in FEATURES:
+            found = 0
+            for x in range(count):
+                rawItem = scene.ItemByIndex(lx.symbol.iTYPE_ANY, x)
+                val = rawItem.GetTag(ItemFeatureSettings._TAG_ITEM_FEATURES_CODE)
+                if val is not None and identifier in val.split(';'):
+                    found += 1
+            result.append(found)
+        return result
+
+
+benchmarks = [FeatureIndexItemQueriesBenchmark,
+              FeatureSplitItemQueriesBenchmark,
+              FeatureIndexItemsWithFeatureBenchmark,
+              FeatureSplitItemsWithFeatureBenchmark]
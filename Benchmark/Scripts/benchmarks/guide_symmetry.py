@@ -0,0 +1,139 @@
+
+""" Guide symmetry benchmarks.
+
+    Compares batched flipped transforms calculation with the
+    per guide modo.Matrix4 calculation it replaced.
+"""
+
+
+import math
+import random
+
+import modo
+from rs.guide_symmetry import GuideSymmetry
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+
+
+GUIDE_PAIRS_COUNT = 120
+
+
+def buildTransform(rnd):
+    """ Builds random rotation and translation matrix (with a bit of uniform scale).
+
+    Returns
+    -------
+    tuple
+        4x4 matrix as tuple of rows.
+    """
+    rx, ry, rz = [rnd.uniform(-math.pi, math.pi) for x in range(3)]
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    scale = rnd.uniform(0.5, 2.0)
+    rows = ((scale * (cy * cz), scale * (cy * sz), scale * -sy, 0.0),
+            (scale * (sx * sy * cz - cx * sz), scale * (sx * sy * sz + cx * cz), scale * (sx * cy), 0.0),
+            (scale * (cx * sy * cz + sx * sz), scale * (cx * sy * sz - sx * cz), scale * (cx * cy), 0.0),
+            (rnd.uniform(-2.0, 2.0), rnd.uniform(0.0, 2.0), rnd.uniform(-2.0, 2.0), 1.0))
+    return rows
+
+
+def addGuides(pairsCount, seed=1):
+    """ Adds left and right guides to the fake scene.
+
+    Every fourth guide does not inherit transforms so both
+    local and world flipping is exercised.
+
+    Returns
+    -------
+    [modo.Item], [modo.Item]
+        Source (left) and target (right) guides.
+    """
+    rnd = random.Random(seed)
+    sources = []
+    targets = []
+    for x in range(pairsCount):
+        for side, items in (('L', sources), ('R', targets)):
+            inherit = 0 if x % 4 == 3 else 1
+            channels = {'worldMatrix': buildTransform(rnd),
+                        'wParentMatrix': buildTransform(rnd),
+                        'inheritPos': inherit,
+                        'inheritRot': inherit}
+            items.append(addItem('locator', '%s_Guide%d' % (side, x), channels))
+    return sources, targets
+
+
+def calculateFlippedTransformByMatrix4(sourceModoItem, targetModoItem):
+    """ Flipped transform calculation for a single guide as it was done before batching.
+
+    Returns
+    -------
+    modo.Matrix4
+    """
+    negativeScaleMtx = modo.Matrix4()
+    negativeScaleMtx.m[0][0] = -1.0
+
+    refWorldMtx = modo.Matrix4(sourceModoItem.channel('worldMatrix').get())
+    flippedWorldMtx = negativeScaleMtx * refWorldMtx * negativeScaleMtx
+
+    inheritPos = bool(targetModoItem.channel('inheritPos').get())
+    inheritRot = bool(targetModoItem.channel('inheritRot').get())
+
+    if inheritPos and inheritRot:
+        refParentMtx = modo.Matrix4(sourceModoItem.channel('wParentMatrix').get())
+        flippedParentMtx = negativeScaleMtx * refParentMtx * negativeScaleMtx
+        flippedParentMtx.invert()
+    else:
+        flippedParentMtx = modo.Matrix4()
+
+    return flippedWorldMtx * flippedParentMtx
+
+
+class GuideSymmetryBenchmark(Benchmark):
+
+    def setup(self):
+        resetScene()
+        self.sources, self.targets = addGuides(GUIDE_PAIRS_COUNT)
+        self.symmetry = GuideSymmetry()
+
+    def verify(self, result):
+        assert len(result) == len(self.targets)
+        # Flipped transforms have to match the per guide modo.Matrix4 calculation.
+        for x in range(0, len(self.targets), 7):
+            expected = calculateFlippedTransformByMatrix4(self.sources[x], self.targets[x]).m
+            got = result[x]
+            if not isinstance(got, list):
+                got = got.m
+            for r in range(4):
+                for c in range(4):
+                    assert abs(expected[r][c] - got[r][c]) < 1e-6
+
+
+class GuideSymmetryBatchBenchmark(GuideSymmetryBenchmark):
+
+    descIdentifier = 'guide_symmetry.flip_batch'
+    descUsername = 'Calculate flipped transforms for %d guides in one batch' % (GUIDE_PAIRS_COUNT * 2)
+
+    def run(self):
+        # Symmetry is applied to right guides and then mirrored on the left ones,
+        # the same amount of work as flipping all guides.
+        self.symmetry._calculateFlippedTransforms(self.targets, self.targets)
+        return self.symmetry._calculateFlippedTransforms(self.sources, self.targets)
+
+
+class GuideSymmetryMatrix4Benchmark(GuideSymmetryBenchmark):
+
+    descIdentifier = 'guide_symmetry.flip_matrix4'
+    descUsername = 'Calculate flipped transforms for %d guides one by one with modo.Matrix4' % (GUIDE_PAIRS_COUNT * 2)
+
+    def run(self):
+        for modoItem in self.targets:
+            calculateFlippedTransformByMatrix4(modoItem, modoItem)
+        return [calculateFlippedTransformByMatrix4(self.sources[x], self.targets[x])
+                for x in range(len(self.targets))]
+
+
+benchmarks = [GuideSymmetryBatchBenchmark,
+              GuideSymmetryMatrix4Benchmark]
@@ -0,0 +1,79 @@
+
+""" Item settings benchmarks.
+"""
+
+
+from rs.item_settings import ItemSettings
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addSettingsItems
+
+
+ITEMS_COUNT = 2000
+
+
+class ItemSettingsLoadBenchmark(Benchmark):
+
+    descIdentifier = 'item_settings.load'
+    descUsername = 'Read settings of %d items, cache cleared' % ITEMS_COUNT
+
+    def setup(self):
+        resetScene()
+        self.items = addSettingsItems(ITEMS_COUNT)
+        ItemSettings.clearCache()
+
+    def run(self):
+        return [ItemSettings(modoItem).getFromGroup('guide', 'link') for modoItem in self.items]
+
+    def verify(self, result):
+        assert result[0] == 'item1'
+
+
+class ItemSettingsCachedLoadBenchmark(Benchmark):
+
+    descIdentifier = 'item_settings.load_cached'
+    descUsername = 'Read settings of %d items, 5 times each' % ITEMS_COUNT
+
+    def setup(self):
+        resetScene()
+        self.items = addSettingsItems(ITEMS_COUNT)
+        ItemSettings.clearCache()
+
+    def run(self):
+        result = []
+        for x in range(5):
+            result = [ItemSettings(modoItem).get('ctrlShape') for modoItem in self.items]
+        return result
+
+    def verify(self, result):
+        assert result[8] == 1
+
+
+class ItemSettingsWriteBackBenchmark(Benchmark):
+
+    descIdentifier = 'item_settings.write_back'
+    descUsername = 'Set 4 settings on %d items in write-back mode' % ITEMS_COUNT
+
+    def setup(self):
+        resetScene()
+        self.items = addSettingsItems(ITEMS_COUNT)
+        ItemSettings.clearCache()
+
+    def run(self):
+        ItemSettings.beginWriteBack()
+        for modoItem in self.items:
+            ItemSettings(modoItem).set('side', 'right')
+            ItemSettings(modoItem).set('mirror', False)
+            ItemSettings(modoItem).setInGroup('ctrl', 'space', 'local')
+            ItemSettings(modoItem).setInGroup('guide', 'symmetric', True)
+        ItemSettings.endWriteBack()
+
+    def verify(self, result):
+        ItemSettings.clearCache()
+        assert all(ItemSettings(modoItem).getFromGroup('ctrl', 'space') == 'local' for modoItem in self.items)
+
+
+benchmarks = [ItemSettingsLoadBenchmark,
+              ItemSettingsCachedLoadBenchmark,
+              ItemSettingsWriteBackBenchmark]
@@ -0,0 +1,103 @@
+
+""" Retarget key reduction benchmarks.
+
+    Reduces keys on dense baked envelopes of skeleton rotation channels
+    in a single in-process pass and checks that reduced curves stay
+    within tolerance of the baked ones.
+"""
+
+
+import math
+import random
+
+from fakescene import EnvelopeData
+from modox import ChannelUtils
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+
+
+JOINTS_COUNT = 20
+FRAMES_COUNT = 2000
+FPS = 24.0
+TOLERANCE = 0.001
+ROTATION_CHANNELS = ['rot.X', 'rot.Y', 'rot.Z']
+
+
+def buildMocapEnvelope(seed=1):
+    """ Builds envelope that looks like baked motion capture rotation.
+
+    There is a key on every frame, values are a mix of a few waves
+    with a little noise. Slopes are calculated the way auto slopes are.
+
+    Returns
+    -------
+    EnvelopeData
+    """
+    rnd = random.Random(seed)
+    waves = [(rnd.uniform(0.05, 1.0), rnd.uniform(0.1, 2.0), rnd.uniform(0.0, math.pi)) for x in range(3)]
+    values = []
+    for frame in range(FRAMES_COUNT):
+        time = frame / FPS
+        value = sum([amplitude * math.sin(time * frequency + phase) for amplitude, frequency, phase in waves])
+        values.append(value + rnd.uniform(-0.0002, 0.0002))
+
+    env = EnvelopeData()
+    for frame, value in enumerate(values):
+        previousValue = values[max(frame - 1, 0)]
+        nextValue = values[min(frame + 1, FRAMES_COUNT - 1)]
+        frames = min(frame + 1, FRAMES_COUNT - 1) - max(frame - 1, 0)
+        slope = (nextValue - previousValue) / (frames / FPS)
+        env.keys.append([frame / FPS, value, value, slope, slope])
+    return env
+
+
+def evaluateHermite(keys, time):
+    """ Evaluates envelope at given time the way reduced keys are fitted.
+    """
+    for x in range(1, len(keys)):
+        if keys[x][0] >= time:
+            break
+    t0, v0, s0 = keys[x - 1][0], keys[x - 1][2], keys[x - 1][4]
+    t1, v1, s1 = keys[x][0], keys[x][1], keys[x][3]
+    span = t1 - t0
+    s = (time - t0) / span
+    return ((2 * s ** 3 - 3 * s ** 2 + 1) * v0 + (s ** 3 - 2 * s ** 2 + s) * s0 * span +
+            (3 * s ** 2 - 2 * s ** 3) * v1 + (s ** 3 - s ** 2) * s1 * span)
+
+
+class KeyReduceBenchmark(Benchmark):
+
+    descIdentifier = 'key_reduce.skeleton'
+    descUsername = 'Reduce keys on %d joints rotation baked for %d frames' % (JOINTS_COUNT, FRAMES_COUNT)
+
+    def setup(self):
+        resetScene()
+        self.channels = []
+        self.baked = []
+        seed = 0
+        for x in range(JOINTS_COUNT):
+            modoItem = addItem('locator', 'Joint%d' % x, dict([(name, 0.0) for name in ROTATION_CHANNELS]))
+            for name in ROTATION_CHANNELS:
+                env = buildMocapEnvelope(seed)
+                seed += 1
+                modoItem._data.envelopes[name] = env
+                self.baked.append((env, [list(key) for key in env.keys]))
+            self.channels.extend(modoItem.channels())
+
+    def run(self):
+        return ChannelUtils.reduceKeys(self.channels, TOLERANCE)
+
+    def verify(self, result):
+        keysBefore, keysAfter = result
+        assert keysBefore == JOINTS_COUNT * len(ROTATION_CHANNELS) * FRAMES_COUNT
+        assert keysAfter < keysBefore / 4
+        for env, bakedKeys in self.baked[::7]:
+            assert env.keys[0][0] == bakedKeys[0][0]
+            assert env.keys[-1][0] == bakedKeys[-1][0]
+            for bakedKey in bakedKeys[::5]:
+                assert abs(evaluateHermite(env.keys, bakedKey[0]) - bakedKey[1]) <= TOLERANCE + 1e-9
+
+
+benchmarks = [KeyReduceBenchmark]
@@ -0,0 +1,112 @@
+
+""" Module map dependency graph benchmarks.
+
+    Reading plug to socket connections requires fully initialised rig modules
+    so graphs in these benchmarks get plug targets from synthetic data instead.
+    Modules map graph itself is real and is read from fake scene items.
+"""
+
+
+import random
+
+from rs.module_map import ModuleMap
+from rs.module_map import ModuleDependencyGraph
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+
+
+MODULES_COUNT = 300
+
+
+class SyntheticDependencyGraph(ModuleDependencyGraph):
+    """ Dependency graph that takes plug targets from a dictionary.
+    """
+
+    def _getPlugTargets(self, rootModoItem):
+        try:
+            return self._plugTargets[rootModoItem.id]
+        except KeyError:
+            pass
+        targets = self._syntheticTargets.get(rootModoItem.id, [])
+        self._plugTargets[rootModoItem.id] = targets
+        return targets
+
+    def __init__(self, rigRootModoItem, plugTargets):
+        self._syntheticTargets = plugTargets
+        ModuleDependencyGraph.__init__(self, rigRootModoItem)
+
+
+def buildModulesMap(count, seed=1):
+    """ Builds rig root and module root items connected in modules map graph.
+
+    Most modules are plugged into a single module, every 10th module
+    is plugged into two modules, like a muscle with two endings.
+
+    Returns
+    -------
+    modo.Item, [modo.Item], dict {str : [str]}
+        Rig root item, module root items and plug targets of each module.
+    """
+    resetScene()
+    rnd = random.Random(seed)
+    rigRoot = addItem('groupLocator', 'Rig')
+    modules = []
+    plugTargets = {}
+    for x in range(count):
+        moduleRoot = addItem('groupLocator', 'Module%d' % x)
+        if not modules:
+            targets = [rigRoot]
+        elif x % 10 == 0 and len(modules) > 1:
+            targets = rnd.sample(modules, 2)
+        else:
+            targets = [rnd.choice(modules[-20:])]
+        graph = moduleRoot.itemGraph(ModuleMap.GRAPH_NAME)
+        for target in targets:
+            graph >> target.itemGraph(ModuleMap.GRAPH_NAME)
+        plugTargets[moduleRoot.id] = [target.id for target in targets if target != rigRoot]
+        modules.append(moduleRoot)
+    return rigRoot, modules, plugTargets
+
+
+class ModuleMapBuildBenchmark(Benchmark):
+
+    descIdentifier = 'module_map.build'
+    descUsername = 'Build dependency graph and order of %d modules' % MODULES_COUNT
+
+    def setup(self):
+        self.rigRoot, self.modules, self.plugTargets = buildModulesMap(MODULES_COUNT)
+
+    def run(self):
+        return SyntheticDependencyGraph(self.rigRoot, self.plugTargets)
+
+    def verify(self, graph):
+        order = [modoItem.id for modoItem in graph.order]
+        assert len(order) == MODULES_COUNT
+        assert not graph.cycleItems
+        position = dict((ident, x) for x, ident in enumerate(order))
+        for moduleId, targets in self.plugTargets.items():
+            for targetId in targets:
+                assert position[targetId] < position[moduleId]
+
+
+class ModuleMapDependentsBenchmark(Benchmark):
+
+    descIdentifier = 'module_map.dependents'
+    descUsername = 'Get recursive dependent modules of each of %d modules' % MODULES_COUNT
+
+    def setup(self):
+        self.rigRoot, self.modules, self.plugTargets = buildModulesMap(MODULES_COUNT)
+        self.graph = SyntheticDependencyGraph(self.rigRoot, self.plugTargets)
+
+    def run(self):
+        return [len(self.graph.getDependentItems(modoItem, recursive=True)) for modoItem in self.modules]
+
+    def verify(self, result):
+        assert len(result) == MODULES_COUNT
+        assert result[0] > 0
+
+
+benchmarks = [ModuleMapBuildBenchmark,
+              ModuleMapDependentsBenchmark]
@@ -0,0 +1,85 @@
+
+""" Item name rendering benchmarks.
+"""
+
+
+import random
+
+from rs import const as c
+from rs.const import NameToken as n
+from rs.const import RigItemType as t
+from rs.const import ItemFeatureType as i
+from rs.name_op import NameOperator
+from rs.naming_schemes.standard import NamingSchemeStandard
+
+from . import Benchmark
+
+
+ITEMS_COUNT = 5000
+
+
+def buildNameComponents(count, seed=1):
+    """ Builds name components for a rig sized set of items.
+
+    Returns
+    -------
+    [dict]
+    """
+    rnd = random.Random(seed)
+    itemTypes = [t.GENERIC, t.GUIDE, t.BIND_LOCATOR, t.PLUG, t.SOCKET, t.MODULE_ROOT, t.MODULE_ASSM]
+    modoTypes = ['locator', 'groupLocator', 'genInfluence', 'widget', 'mesh']
+    sides = [c.Side.CENTER, c.Side.LEFT, c.Side.RIGHT]
+    components = []
+    for x in range(count):
+        comp = {n.RIG_NAME: 'Character',
+                n.MODULE_NAME: 'Module%d' % (x % 60),
+                n.BASE_NAME: 'Item%d' % x,
+                n.SIDE: rnd.choice(sides),
+                n.ITEM_TYPE: rnd.choice(itemTypes),
+                n.MODO_ITEM_TYPE: rnd.choice(modoTypes)}
+        if x % 3 == 0:
+            comp[n.ITEM_FEATURE] = [i.CONTROLLER]
+        components.append(comp)
+    return components
+
+
+class NameRenderBenchmark(Benchmark):
+
+    descIdentifier = 'name_op.render'
+    descUsername = 'Render %d item names with standard naming scheme' % ITEMS_COUNT
+
+    def setup(self):
+        self.nameOp = NameOperator(NamingSchemeStandard())
+        self.components = buildNameComponents(ITEMS_COUNT)
+
+    def run(self):
+        renderName = self.nameOp.renderName
+        return [renderName(comp) for comp in self.components]
+
+    def verify(self, result):
+        assert len(result) == ITEMS_COUNT
+        assert all(result)
+
+
+class NameRenderRepeatedBenchmark(Benchmark):
+    """ Renaming the same rig over and over, names repeat a lot.
+    """
+
+    descIdentifier = 'name_op.render_repeated'
+    descUsername = 'Render names of 250 items 20 times'
+
+    def setup(self):
+        self.nameOp = NameOperator(NamingSchemeStandard())
+        self.components = buildNameComponents(250) * 20
+
+    def run(self):
+        renderName = self.nameOp.renderName
+        return [renderName(comp) for comp in self.components]
+
+    def verify(self, result):
+        assert len(result) == 5000
+        assert result[0] == result[250]
+
+
+benchmarks = [NameRenderBenchmark,
+              NameRenderRepeatedBenchmark]
@@ -0,0 +1,53 @@
+
+""" Pose mirroring benchmarks.
+"""
+
+
+from rs.pose import Pose
+
+from . import Benchmark
+
+
+CONTROLLERS_COUNT = 400
+CHANNELS = ['pos.X', 'pos.Y', 'pos.Z', 'rot.X', 'rot.Y', 'rot.Z', 'scl.X', 'scl.Y', 'scl.Z']
+
+
+def buildPoseBuffer(controllersCount):
+    """ Builds pose buffer the way Pose._storePoseInBuffer() does.
+
+    Returns
+    -------
+    dict {str : float}
+    """
+    buffer = {}
+    sides = ['L', 'R', 'C']
+    for x in range(controllersCount):
+        side = sides[x % 3]
+        for y, channelName in enumerate(CHANNELS):
+            ident = '%s..Module%d..ctrl..Controller_%d..%s' % (side, x % 40, x, channelName)
+            buffer[ident] = float(x + y) * 0.1
+    return buffer
+
+
+class PoseMirrorBufferBenchmark(Benchmark):
+
+    descIdentifier = 'pose.mirrored_buffer'
+    descUsername = 'Mirror pose buffer of %d controllers, 10 times' % CONTROLLERS_COUNT
+
+    def setup(self):
+        # Mirroring buffer does not need rig, pose object is not initialised.
+        self.pose = Pose.__new__(Pose)
+        self.buffer = buildPoseBuffer(CONTROLLERS_COUNT)
+
+    def run(self):
+        result = None
+        for x in range(10):
+            result = self.pose._getMirroredBuffer(self.buffer)
+        return result
+
+    def verify(self, result):
+        assert len(result) == len(self.buffer)
+        assert result['R..Module0..ctrl..Controller_0..pos.X'] == -self.buffer['L..Module0..ctrl..Controller_0..pos.X']
+
+
+benchmarks = [PoseMirrorBufferBenchmark]
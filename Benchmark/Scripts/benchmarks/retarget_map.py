@@ -0,0 +1,123 @@
+
+""" Retarget joint name matching benchmarks.
+
+    Compares resolving links for many source skeletons with
+    precompiled name index against list based matching it replaced.
+"""
+
+
+import random
+
+from rs.retarget import Retargeting
+from rs.retarget_map import RetargetNameIndex
+
+from . import Benchmark
+
+
+SKELETONS_COUNT = 200
+
+_NAMING_CONVENTIONS = (
+    ('mixamorig:', 'Left', 'Right', ''),
+    ('', 'L_', 'R_', ''),
+    ('Bip01 ', 'L ', 'R ', ''),
+    ('Armature|', 'Left', 'Right', '_jnt'),
+)
+
+_BASE_NAMES = ('Hips', 'Spine', 'Spine1', 'Spine2', 'Neck', 'Head',
+               '%sShoulder', '%sArm', '%sForeArm', '%sHand',
+               '%sHandThumb1', '%sHandThumb2', '%sHandThumb3',
+               '%sHandIndex1', '%sHandIndex2', '%sHandIndex3',
+               '%sHandMiddle1', '%sHandMiddle2', '%sHandMiddle3',
+               '%sUpLeg', '%sLeg', '%sFoot', '%sToeBase')
+
+
+def buildSourceSkeletons(count, seed=1):
+    """ Builds joint name lists of source skeletons with various naming conventions.
+
+    Returns
+    -------
+    [[str]]
+    """
+    rnd = random.Random(seed)
+    skeletons = []
+    for x in range(count):
+        prefix, left, right, suffix = _NAMING_CONVENTIONS[x % len(_NAMING_CONVENTIONS)]
+        names = []
+        for baseName in _BASE_NAMES:
+            if '%s' in baseName:
+                names.append(prefix + (baseName % left) + suffix)
+                names.append(prefix + (baseName % right) + suffix)
+            else:
+                names.append(prefix + baseName + suffix)
+        # Some extra joints that are not in the mapping.
+        for y in range(rnd.randrange(0, 20)):
+            names.append(prefix + 'Extra%d' % y + suffix)
+        rnd.shuffle(names)
+        skeletons.append(names)
+    return skeletons
+
+
+def resolveLinksByLists(retargetMap, sourceNames):
+    """ Link resolution as it was done before the name index,
+    with list lookups and no fuzzy matching.
+    """
+    collection = {}
+    for name in sourceNames:
+        nameTmp = name.split(':')[-1]
+        nameTmp = nameTmp.split('-')[-1]
+        nameTmp = nameTmp.split('(')[0]
+        nameTmp = nameTmp.replace(' ', '')
+        collection[str(nameTmp).lower()] = name
+
+    mapKeys = list(retargetMap.keys())
+    sourceSkeletonKeys = list(collection.keys())
+    connected = []
+    links = {}
+    for mapKey in mapKeys:
+        for match in retargetMap[mapKey]:
+            if match not in sourceSkeletonKeys:
+                continue
+            if match in connected:
+                continue
+            links[mapKey] = collection[match]
+            connected.append(match)
+            break
+    return links
+
+
+class RetargetMapBenchmark(Benchmark):
+
+    def setup(self):
+        self.skeletons = buildSourceSkeletons(SKELETONS_COUNT)
+
+    def verify(self, result):
+        assert len(result) == SKELETONS_COUNT
+        # Mixamo naming is matched exactly by both methods.
+        expected = resolveLinksByLists(Retargeting._RETARGET_MAP, self.skeletons[0])
+        got = result[0]
+        for refName, sourceName in expected.items():
+            links = got[refName]
+            assert sourceName == (links if isinstance(links, str) else links[0])
+
+
+class RetargetNameIndexBenchmark(RetargetMapBenchmark):
+
+    descIdentifier = 'retarget_map.name_index'
+    descUsername = 'Resolve retarget links for %d skeletons with name index (exact and fuzzy)' % SKELETONS_COUNT
+
+    def run(self):
+        nameIndex = RetargetNameIndex(Retargeting._RETARGET_MAP)
+        return nameIndex.resolveLinksBatch(self.skeletons)
+
+
+class RetargetListsBenchmark(RetargetMapBenchmark):
+
+    descIdentifier = 'retarget_map.lists'
+    descUsername = 'Resolve retarget links for %d skeletons with list lookups (exact only)' % SKELETONS_COUNT
+
+    def run(self):
+        return [resolveLinksByLists(Retargeting._RETARGET_MAP, names) for names in self.skeletons]
+
+
+benchmarks = [RetargetNameIndexBenchmark,
+              RetargetListsBenchmark]
@@ -0,0 +1,75 @@
+
+""" Helpers for building rig sized workloads in fake scene.
+"""
+
+
+import json
+
+import lx
+import modo
+from fakescene import scene as sceneData
+from fakescene import MeshData
+
+
+def resetScene():
+    """ Clears fake scene.
+    """
+    sceneData.clear()
+
+
+def addItem(itemType, name=None, channels=None, parent=None):
+    """ Adds new item to the fake scene.
+
+    Returns
+    -------
+    modo.Item
+    """
+    data = sceneData.addItem(itemType, name, channels)
+    if parent is not None:
+        sceneData.setParent(data.id, parent.id)
+    if itemType == 'mesh':
+        data.mesh = MeshData()
+        # Raw mesh is read from the mesh channel.
+        data.addChannel(lx.symbol.sICHAN_MESH_MESH, data.mesh)
+        return modo.Mesh(data)
+    return modo.Item(data)
+
+
+def addSettingsItems(count):
+    """ Adds locators with typical item settings stored on them.
+
+    Returns
+    -------
+    [modo.Item]
+    """
+    items = []
+    for x in range(count):
+        modoItem = addItem('locator', 'Item%d' % x)
+        single = {'side': 'left', 'ctrlShape': x % 7, 'mirror': True, 'ident': 'item%d' % x}
+        groups = {'ctrl': {'axes': [0, 1, 2], 'space': 'world'},
+                  'guide': {'link': 'item%d' % (x + 1), 'symmetric': bool(x % 2)}}
+        modoItem.setTag('RSIS', json.dumps(single))
+        modoItem.setTag('RSIG', json.dumps(groups))
+        items.append(modoItem)
+    return items
+
+
+def addQuadGrid(mesh, resolution, size=2.0):
+    """ Fills mesh with a grid of quads lying on the XZ plane.
+
+    Returns
+    -------
+    int
+        Number of created polygons.
+    """
+    data = mesh._data.mesh
+    step = size / resolution
+    for z in range(resolution + 1):
+        for x in range(resolution + 1):
+            data.addVertex((-size * 0.5 + x * step, 0.0, -size * 0.5 + z * step))
+    row = resolution + 1
+    for z in range(resolution):
+        for x in range(resolution):
+            v = z * row + x
+            data.addPolygon((v, v + 1, v + row + 1, v + row))
+    return resolution * resolution
@@ -0,0 +1,120 @@
+
+""" Actor animation time range benchmarks.
+
+    Compares reading time ranges of all actor channels in all actions
+    with one ChannelRead per action against the per channel reads
+    that TimeUtils.getChannelsTimeRange() used to do.
+"""
+
+
+import random
+
+import lx
+from fakescene import EnvelopeData
+from modox import TimeUtils
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+
+
+CONTROLLERS_COUNT = 60
+CHANNELS_PER_CONTROLLER = ['pos.X', 'pos.Y', 'pos.Z', 'rot.X', 'rot.Y', 'rot.Z', 'scl.X', 'scl.Y', 'scl.Z']
+ACTIONS_COUNT = 40
+
+
+def addActorChannels(seed=1):
+    """ Adds controllers with partially animated channels to the fake scene.
+
+    Returns
+    -------
+    [modo.Channel]
+    """
+    rnd = random.Random(seed)
+    channels = []
+    for x in range(CONTROLLERS_COUNT):
+        modoItem = addItem('locator', 'Ctrl%d' % x, dict([(name, 0.0) for name in CHANNELS_PER_CONTROLLER]))
+        for name in CHANNELS_PER_CONTROLLER:
+            # Scale channels are mostly not animated.
+            if name.startswith('scl') and rnd.random() < 0.8:
+                continue
+            env = EnvelopeData()
+            start = rnd.randrange(0, 10)
+            for frame in range(start, start + rnd.randrange(2, 120), 4):
+                env.addKey(frame / 24.0, rnd.random())
+            modoItem._data.envelopes[name] = env
+        channels.extend(modoItem.channels())
+    return channels
+
+
+def getChannelsTimeRangeByChannel(channels, action):
+    """ Time range calculation as it was done before batching,
+    with new ChannelRead created for every channel.
+    """
+    startTime = 1000000.0
+    endTime = -1000000.0
+    animatedChannels = False
+
+    for channel in channels:
+        scene = lx.object.Scene(channel.item.internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(action, 0.0))
+        if not chanRead.IsAnimated(channel.item.internalItem, channel.index):
+            continue
+        env = lx.object.Envelope(chanRead.Envelope(channel.item.internalItem, channel.index))
+
+        animatedChannels = True
+        key = lx.object.Keyframe(env.Enumerator())
+        key.First()
+        firstTime = key.GetTime()
+        key.Last()
+        lastTime = key.GetTime()
+
+        if firstTime < startTime:
+            startTime = firstTime
+        if lastTime > endTime:
+            endTime = lastTime
+
+    if not animatedChannels:
+        raise ValueError
+    return startTime, endTime
+
+
+class TimeRangeBenchmark(Benchmark):
+
+    def setup(self):
+        resetScene()
+        self.channels = addActorChannels()
+        self.actions = ['Action%d' % x for x in range(ACTIONS_COUNT)]
+
+    def verify(self, result):
+        assert len(result) == len(self.actions)
+        expected = getChannelsTimeRangeByChannel(self.channels, self.actions[0])
+        for action in self.actions:
+            assert result[action] == expected
+
+
+class ActionsTimeRangesBenchmark(TimeRangeBenchmark):
+
+    descIdentifier = 'time_range.actions_batch'
+    descUsername = 'Time ranges of %d channels in %d actions, one channel read per action' % (
+        CONTROLLERS_COUNT * len(CHANNELS_PER_CONTROLLER), ACTIONS_COUNT)
+
+    def run(self):
+        return TimeUtils.getActionsTimeRanges(self.channels, self.actions)
+
+
+class ChannelTimeRangeBenchmark(TimeRangeBenchmark):
+
+    descIdentifier = 'time_range.per_channel'
+    descUsername = 'Time ranges of %d channels in %d actions, one channel read per channel' % (
+        CONTROLLERS_COUNT * len(CHANNELS_PER_CONTROLLER), ACTIONS_COUNT)
+
+    def run(self):
+        result = {}
+        for action in self.actions:
+            result[action] = getChannelsTimeRangeByChannel(self.channels, action)
+        return result
+
+
+benchmarks = [ActionsTimeRangesBenchmark,
+              ChannelTimeRangeBenchmark]
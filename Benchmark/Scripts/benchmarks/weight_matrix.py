@@ -0,0 +1,189 @@
+
+""" Weight matrix benchmarks.
+
+    Compares reading and editing bind weights through the sparse weight matrix
+    with per vertex and per weight map access through modo.WeightMap.
+"""
+
+
+import random
+
+import modox
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+from .scene_data import addQuadGrid
+
+
+GRID_RESOLUTION = 70
+MAPS_COUNT = 80
+INFLUENCES_PER_VERTEX = 4
+SHIFTED_MAPS_COUNT = 4
+
+
+def addWeightedMesh(seed=1):
+    """ Adds grid mesh with each vertex weighted to a few maps of the many that the mesh has.
+
+    Returns
+    -------
+    modo.Mesh
+    """
+    rnd = random.Random(seed)
+    mesh = addItem('mesh', 'BindMesh')
+    addQuadGrid(mesh, GRID_RESOLUTION)
+    data = mesh._data.mesh
+    maps = [data.addWeightMap('Joint%02d' % x) for x in range(MAPS_COUNT)]
+    row = GRID_RESOLUTION + 1
+    for v in range(len(data.vertices)):
+        # Neighbouring vertices are influenced by neighbouring maps, like on real characters.
+        first = min(MAPS_COUNT - INFLUENCES_PER_VERTEX, (v // row) * MAPS_COUNT // row)
+        weights = [rnd.uniform(0.05, 1.0) for x in range(INFLUENCES_PER_VERTEX)]
+        total = sum(weights)
+        for x in range(INFLUENCES_PER_VERTEX):
+            maps[first + x][v] = weights[x] / total
+    return mesh
+
+
+def getInfluencingMapsByWeightMaps(mesh, vertIndices):
+    """ Gets influencing maps and their strength the way it was done before the weight matrix.
+    """
+    wmaps = mesh.geometry.vmaps.weightMaps
+    wmapNamesToChooseFrom = []
+    wmapStrengthByName = {}
+    for vertIndex in vertIndices:
+        for wmap in wmaps:
+            weight = wmap[vertIndex]
+            if weight is None:
+                continue
+            if weight[0] < 0.09:
+                continue
+            if wmap.name not in wmapNamesToChooseFrom:
+                wmapNamesToChooseFrom.append(wmap.name)
+            if wmap.name not in wmapStrengthByName:
+                wmapStrengthByName[wmap.name] = 0.0
+            wmapStrengthByName[wmap.name] += weight[0]
+    return wmapNamesToChooseFrom, wmapStrengthByName
+
+
+def shiftWeightsByWeightMaps(mesh, vertIndices, mapNames):
+    """ Sets average weight on each map and normalizes other maps, one weight map at a time.
+
+    This is what setting weights with the weight tool does for each map.
+    """
+    wmaps = mesh.geometry.vmaps.weightMaps
+    for wmap in [wmap for wmap in wmaps if wmap.name in mapNames]:
+        total = 0.0
+        for vertIndex in vertIndices:
+            weight = wmap[vertIndex]
+            if weight is not None:
+                total += weight[0]
+        value = total / len(vertIndices)
+
+        for vertIndex in vertIndices:
+            wmap[vertIndex] = (value,)
+            others = [(other, other[vertIndex]) for other in wmaps if other.name != wmap.name]
+            othersTotal = sum([weight[0] for other, weight in others if weight is not None])
+            if othersTotal <= 0.0:
+                continue
+            scale = max(0.0, 1.0 - value) / othersTotal
+            for other, weight in others:
+                if weight is None:
+                    continue
+                if weight[0] * scale < 0.001:
+                    other[vertIndex] = None
+                else:
+                    other[vertIndex] = (weight[0] * scale,)
+
+
+class WeightMatrixBenchmark(Benchmark):
+
+    def setup(self):
+        resetScene()
+        self.mesh = addWeightedMesh()
+        self.vertIndices = list(range(len(self.mesh._data.mesh.vertices)))
+        self.mapNames = ['Joint%02d' % (x * 7) for x in range(SHIFTED_MAPS_COUNT)]
+
+
+class WeightMatrixInfluencingBenchmark(WeightMatrixBenchmark):
+
+    descIdentifier = 'weight_matrix.influencing'
+    descUsername = 'Find maps influencing %d vertices out of %d maps, weight matrix' % ((GRID_RESOLUTION + 1) ** 2, MAPS_COUNT)
+
+    def run(self):
+        totals = modox.WeightMatrix(self.mesh, self.vertIndices).getMapTotals(threshold=0.09)
+        return [mapName for mapName, total in totals], dict(totals)
+
+    def verify(self, result):
+        expectedNames, expectedStrength = getInfluencingMapsByWeightMaps(self.mesh, self.vertIndices)
+        assert result[0] == expectedNames
+        for mapName in expectedNames:
+            assert abs(result[1][mapName] - expectedStrength[mapName]) < 1e-6
+
+
+class WeightMapsInfluencingBenchmark(WeightMatrixBenchmark):
+
+    descIdentifier = 'weight_matrix.influencing_wmaps'
+    descUsername = 'Find maps influencing %d vertices out of %d maps, per vertex and map' % ((GRID_RESOLUTION + 1) ** 2, MAPS_COUNT)
+
+    def run(self):
+        return getInfluencingMapsByWeightMaps(self.mesh, self.vertIndices)
+
+
+class ShiftWeightsBenchmark(WeightMatrixBenchmark):
+
+    def verify(self, result):
+        data = self.mesh._data.mesh
+        for vertIndex in range(0, len(self.vertIndices), 97):
+            total = sum([wmap.get(vertIndex, 0.0) for wmap in data.weightMaps.values()])
+            assert abs(total - 1.0) < 1e-6
+
+
+class WeightMatrixShiftBenchmark(ShiftWeightsBenchmark):
+
+    descIdentifier = 'weight_matrix.shift'
+    descUsername = 'Shift %d maps to average and normalize, weight matrix and one mesh edit' % SHIFTED_MAPS_COUNT
+
+    def run(self):
+        weights = modox.WeightMatrix(self.mesh, self.vertIndices)
+        for mapName in self.mapNames:
+            mapWeights = weights.getMapWeights(mapName)
+            weights.setMapWeight(mapName, sum(mapWeights) / len(mapWeights), normalize=True)
+            weights.prune(0.001)
+        return weights.write()
+
+
+class WeightMapsShiftBenchmark(ShiftWeightsBenchmark):
+
+    descIdentifier = 'weight_matrix.shift_wmaps'
+    descUsername = 'Shift %d maps to average and normalize, per vertex and map' % SHIFTED_MAPS_COUNT
+
+    def run(self):
+        shiftWeightsByWeightMaps(self.mesh, self.vertIndices, self.mapNames)
+
+
+class WeightMatrixSmoothBenchmark(WeightMatrixBenchmark):
+
+    descIdentifier = 'weight_matrix.smooth'
+    descUsername = 'Smooth weights of %d vertices 3 times, weight matrix with neighbours' % ((GRID_RESOLUTION + 1) ** 2 // 2)
+
+    def run(self):
+        weights = modox.WeightMatrix(self.mesh, self.vertIndices[:len(self.vertIndices) // 2], neighbours=True)
+        weights.smooth(0.5, iterations=3)
+        weights.prune(0.001)
+        weights.normalize()
+        return weights.write()
+
+    def verify(self, result):
+        assert result > 0
+        data = self.mesh._data.mesh
+        for vertIndex in range(0, len(self.vertIndices) // 2, 53):
+            total = sum([wmap.get(vertIndex, 0.0) for wmap in data.weightMaps.values()])
+            assert abs(total - 1.0) < 1e-6
+
+
+benchmarks = [WeightMatrixInfluencingBenchmark,
+              WeightMapsInfluencingBenchmark,
+              WeightMatrixShiftBenchmark,
+              WeightMapsShiftBenchmark,
+              WeightMatrixSmoothBenchmark]
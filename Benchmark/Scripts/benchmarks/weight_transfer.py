@@ -0,0 +1,132 @@
+
+""" Weight transfer benchmarks.
+
+    Transfers weights from a body mesh to a clothing mesh floating above it.
+    Batched transfer finds closest points once for all the maps, it's compared
+    with finding them again for every map, which is what running transfer
+    command once per map does.
+"""
+
+
+import random
+
+import modox
+from modox.vertMap import _TriangleGrid
+from modox.vertMap import _readGeometry
+from modox.vertMap import _getReadOnlyMesh
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+from .scene_data import addQuadGrid
+
+
+SOURCE_RESOLUTION = 60
+TARGET_RESOLUTION = 30
+MAPS_COUNT = 120
+EMPTY_MAPS_COUNT = 20
+INFLUENCES_PER_VERTEX = 4
+PER_MAP_COUNT = 6
+
+
+def addBodyAndClothing(seed=1):
+    """ Adds weighted body mesh and a clothing mesh with no weights above it.
+
+    Last maps on the list are empty on the body.
+
+    Returns
+    -------
+    modo.Mesh, modo.Mesh, [str]
+        Body mesh, clothing mesh and names of all maps.
+    """
+    rnd = random.Random(seed)
+    body = addItem('mesh', 'Body')
+    addQuadGrid(body, SOURCE_RESOLUTION)
+    data = body._data.mesh
+    mapNames = ['Joint%03d' % x for x in range(MAPS_COUNT)]
+    maps = [data.addWeightMap(mapName) for mapName in mapNames]
+    weightedCount = MAPS_COUNT - EMPTY_MAPS_COUNT
+    row = SOURCE_RESOLUTION + 1
+    for v in range(len(data.vertices)):
+        first = min(weightedCount - INFLUENCES_PER_VERTEX, (v // row) * weightedCount // row)
+        weights = [rnd.uniform(0.05, 1.0) for x in range(INFLUENCES_PER_VERTEX)]
+        total = sum(weights)
+        for x in range(INFLUENCES_PER_VERTEX):
+            maps[first + x][v] = weights[x] / total
+
+    clothing = addItem('mesh', 'Clothing')
+    addQuadGrid(clothing, TARGET_RESOLUTION, size=1.8)
+    clothingData = clothing._data.mesh
+    # Lift the clothing a bit above the body and make it uneven.
+    clothingData.vertices = [(p[0], 0.05 + rnd.uniform(0.0, 0.02), p[2]) for p in clothingData.vertices]
+    return body, clothing, mapNames
+
+
+def transferByMap(body, clothing, mapNames):
+    """ Transfers maps one by one, closest points are found again for each map.
+    """
+    positions, triangles = _readGeometry(_getReadOnlyMesh(body.internalItem))
+    targetPositions, nothing = _readGeometry(_getReadOnlyMesh(clothing.internalItem), triangles=False)
+    sourceMaps = body._data.mesh.weightMaps
+    targetData = clothing._data.mesh
+    for mapName in mapNames:
+        grid = _TriangleGrid(positions, triangles)
+        sourceMap = sourceMaps[mapName]
+        targetMap = targetData.addWeightMap(mapName)
+        for vertexIndex, position in enumerate(targetPositions):
+            indices, barycentric = grid.getClosestPoint(position)
+            weight = 0.0
+            for n in range(3):
+                weight += sourceMap.get(indices[n], 0.0) * barycentric[n]
+            if weight > 0.0:
+                targetMap[vertexIndex] = weight
+
+
+class WeightTransferBenchmark(Benchmark):
+
+    def setup(self):
+        resetScene()
+        self.body, self.clothing, self.mapNames = addBodyAndClothing()
+
+
+class WeightTransferBatchBenchmark(WeightTransferBenchmark):
+
+    descIdentifier = 'weight_transfer.batch'
+    descUsername = 'Transfer %d maps (%d empty) to %d vertices, batched' % (MAPS_COUNT, EMPTY_MAPS_COUNT, (TARGET_RESOLUTION + 1) ** 2)
+
+    def run(self):
+        return modox.VertexMapUtils.transferWeightsBatch(self.body, self.clothing, self.mapNames)
+
+    def verify(self, result):
+        assert len(result.skippedEmpty) == EMPTY_MAPS_COUNT
+        assert set(result.transferred) | set(result.emptyMaps) == set(self.mapNames)
+        targetMaps = self.clothing._data.mesh.weightMaps
+        # Empty maps are not added to the target.
+        assert list(targetMaps.keys()) == result.transferred
+        vertexCount = len(self.clothing._data.mesh.vertices)
+        for vertexIndex in range(0, vertexCount, 37):
+            total = sum([wmap.get(vertexIndex, 0.0) for wmap in targetMaps.values()])
+            assert abs(total - 1.0) < 1e-6
+
+        # The same weights as when maps are transferred one by one.
+        expectedMaps = set(result.transferred[:PER_MAP_COUNT])
+        weights = dict([(mapName, dict(targetMaps[mapName])) for mapName in expectedMaps])
+        for mapName in expectedMaps:
+            del targetMaps[mapName]
+        transferByMap(self.body, self.clothing, sorted(expectedMaps))
+        for mapName in expectedMaps:
+            for vertexIndex in range(vertexCount):
+                assert abs(weights[mapName].get(vertexIndex, 0.0) - targetMaps[mapName].get(vertexIndex, 0.0)) < 1e-9
+
+
+class WeightTransferByMapBenchmark(WeightTransferBenchmark):
+
+    descIdentifier = 'weight_transfer.by_map'
+    descUsername = 'Transfer %d maps to %d vertices, closest points found for each map' % (PER_MAP_COUNT, (TARGET_RESOLUTION + 1) ** 2)
+
+    def run(self):
+        transferByMap(self.body, self.clothing, self.mapNames[:PER_MAP_COUNT])
+
+
+benchmarks = [WeightTransferBatchBenchmark,
+              WeightTransferByMapBenchmark]
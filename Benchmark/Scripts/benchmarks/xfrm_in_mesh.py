@@ -0,0 +1,137 @@
+
+""" Benchmarks of reading positions embedded in a mesh.
+"""
+
+
+import random
+from collections import OrderedDict
+
+import lx
+from rs.xfrm_in_mesh import TransformsInMesh
+from rs.xfrm_in_mesh import EmbeddedDataIndex
+from rs.xfrm_in_mesh import MeshTrianglesCache
+from rs.xfrm_in_mesh import HitType
+from rs.xfrm_in_mesh import solveBarycentricBatch
+
+from . import Benchmark
+from .scene_data import resetScene
+from .scene_data import addItem
+from .scene_data import addQuadGrid
+
+
+GRID_RESOLUTION = 150
+HITS_COUNT = 4000
+EMBEDDED_ITEMS_COUNT = 150
+
+
+def buildHits(mesh, count, seed=1):
+    """ Builds hits at random points inside random polygons of the mesh.
+
+    Returns
+    -------
+    [(int, (float, float, float))]
+    """
+    rnd = random.Random(seed)
+    data = mesh._data.mesh
+    hits = []
+    for x in range(count):
+        polygonIndex = rnd.randrange(len(data.polygons))
+        verts = [data.vertices[v] for v in data.polygons[polygonIndex]]
+        a = rnd.random()
+        b = rnd.random()
+        point = tuple(verts[0][i] + (verts[1][i] - verts[0][i]) * a + (verts[3][i] - verts[0][i]) * b
+                      for i in range(3))
+        hits.append((polygonIndex, point))
+    return hits
+
+
+def buildEmbeddedData(mesh, count, withIndex, seed=1):
+    """ Embeds raycast records for a number of items in the mesh.
+
+    Returns
+    -------
+    OrderedDict
+        Identifier and item pairs to pass to TransformsInMesh.readEmbeddedTransforms().
+    """
+    rnd = random.Random(seed)
+    xfrmInMesh = TransformsInMesh(mesh)
+    index = EmbeddedDataIndex(mesh)
+    polygonsCount = len(mesh._data.mesh.polygons)
+    itemsToSet = OrderedDict()
+
+    with mesh.geometry as geo:
+        for x in range(count):
+            identifier = 'guide%d' % x
+            records = []
+            for t in (None, rnd.random()):
+                u = rnd.random() * 0.5
+                v = rnd.random() * 0.5
+                records.append({'tp': HitType.RAYCAST,
+                                'id': identifier,
+                                'coords': [1.0 - u - v, u, v],
+                                'pix': rnd.randrange(polygonsCount),
+                                'tix': rnd.randrange(2),
+                                't': t})
+            for record in records:
+                xfrmInMesh._storeRecords(geo, record['pix'], [record])
+                index.addRecord(record)
+            itemsToSet[identifier] = addItem('locator', identifier)
+
+    if withIndex:
+        index.save()
+    return itemsToSet
+
+
+class BarycentricBatchBenchmark(Benchmark):
+
+    descIdentifier = 'xfrm_in_mesh.barycentric_batch'
+    descUsername = 'Solve barycentric coordinates for %d hits' % HITS_COUNT
+
+    def setup(self):
+        resetScene()
+        self.mesh = addItem('mesh', 'Mesh')
+        addQuadGrid(self.mesh, GRID_RESOLUTION)
+        self.hits = buildHits(self.mesh, HITS_COUNT)
+
+    def run(self):
+        with self.mesh.geometry as geo:
+            return solveBarycentricBatch(MeshTrianglesCache(geo), self.hits)
+
+    def verify(self, result):
+        assert len(result) == HITS_COUNT
+        assert all(r is not None for r in result)
+
+
+class ReadEmbeddedIndexBenchmark(Benchmark):
+
+    descIdentifier = 'xfrm_in_mesh.read_index'
+    descUsername = 'Read %d embedded positions using embedded data index' % EMBEDDED_ITEMS_COUNT
+
+    withIndex = True
+
+    def setup(self):
+        resetScene()
+        self.mesh = addItem('mesh', 'Mesh')
+        addQuadGrid(self.mesh, GRID_RESOLUTION)
+        self.itemsToSet = buildEmbeddedData(self.mesh, EMBEDDED_ITEMS_COUNT, self.withIndex)
+        del lx.evalLog[:]
+
+    def run(self):
+        TransformsInMesh(self.mesh).readEmbeddedTransforms(self.itemsToSet)
+
+    def verify(self, result):
+        assert EmbeddedDataIndex(self.mesh).exists == self.withIndex
+        assert len([cmd for cmd in lx.evalLog if cmd.startswith('item.setPosition')]) == EMBEDDED_ITEMS_COUNT
+
+
+class ReadEmbeddedScanBenchmark(ReadEmbeddedIndexBenchmark):
+
+    descIdentifier = 'xfrm_in_mesh.read_scan'
+    descUsername = 'Read %d embedded positions by scanning legacy polygon tags' % EMBEDDED_ITEMS_COUNT
+
+    withIndex = False
+
+
+benchmarks = [BarycentricBatchBenchmark,
+              ReadEmbeddedIndexBenchmark,
+              ReadEmbeddedScanBenchmark]
@@ -0,0 +1,78 @@
+
+""" Building blocks shared by fake lx, lxu and modo modules.
+
+    Fake modules implement in memory only the parts of MODO API that
+    benchmarked code actually exercises. Everything else resolves to
+    permissive stubs so that rigging system modules can be imported
+    outside of MODO.
+"""
+
+
+class StubMeta(type):
+    """ Metaclass that makes any class level attribute access return a new stub class.
+    """
+
+    def __getattr__(cls, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return makeStub(name)
+
+
+class Stub(object, metaclass=StubMeta):
+    """ Permissive object that accepts any arguments and resolves any attribute.
+
+    Stubs can be instantiated, called, subclassed and iterated over (as empty sequence).
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return makeStub(name)
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+    def __iter__(self):
+        return iter([])
+
+    def __len__(self):
+        return 0
+
+    def __bool__(self):
+        return False
+
+
+def makeStub(name):
+    """ Creates new stub class with a given name.
+    """
+    return StubMeta(name, (Stub,), {})
+
+
+class SymbolModule(object):
+    """ Resolves lx.symbol constants.
+
+    String symbols (s...) resolve to their own name, all other symbols
+    resolve to unique integers that are stable for a given name
+    so flags can be combined with bitwise operators.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if name.startswith('s'):
+            value = name
+        elif name.startswith('f'):
+            value = 1 << (self._flagsCount % 31)
+            self._flagsCount += 1
+        else:
+            value = 1000 + self._valuesCount
+            self._valuesCount += 1
+        setattr(self, name, value)
+        return value
+
+    def __init__(self):
+        self._flagsCount = 0
+        self._valuesCount = 0
@@ -0,0 +1,150 @@
+
+""" In-memory scene data shared by fake lx and modo modules.
+
+    Both modo.Item and lx.object.Item wrap the same ItemData record
+    so changes done through one API are visible through the other,
+    the same way it works in MODO.
+"""
+
+
+from collections import OrderedDict
+
+
+class EnvelopeData(object):
+    """ Keys of a channel envelope.
+
+    Each key is a list of [time, valueIn, valueOut, slopeIn, slopeOut].
+    Keys are kept sorted by time.
+    """
+
+    def __init__(self, isInt=False):
+        self.isInt = isInt
+        self.keys = []
+
+    def addKey(self, time, value, slope=0.0, valueOut=None):
+        if valueOut is None:
+            valueOut = value
+        self.keys.append([time, value, valueOut, slope, slope])
+        self.keys.sort(key=lambda k: k[0])
+
+
+class MeshData(object):
+    """ Mesh geometry, vertex positions and polygons as lists of vertex indices.
+
+    Weight maps are dictionaries of vertex index and weight.
+    """
+
+    def __init__(self):
+        self.vertices = []
+        self.polygons = []
+        self.polygonTags = {}
+        self.weightMaps = OrderedDict()
+        self._vertexPolygons = None
+
+    def addVertex(self, position):
+        self.vertices.append((float(position[0]), float(position[1]), float(position[2])))
+        self._vertexPolygons = None
+        return len(self.vertices) - 1
+
+    def addPolygon(self, vertexIndices):
+        self.polygons.append(list(vertexIndices))
+        self._vertexPolygons = None
+        return len(self.polygons) - 1
+
+    def addWeightMap(self, name):
+        return self.weightMaps.setdefault(name, {})
+
+    def getVertexPolygons(self, vertexIndex):
+        """ Gets indices of polygons the vertex belongs to.
+        """
+        if self._vertexPolygons is None:
+            self._vertexPolygons = [[] for v in self.vertices]
+            for polyIndex, polygon in enumerate(self.polygons):
+                for v in polygon:
+                    self._vertexPolygons[v].append(polyIndex)
+        return self._vertexPolygons[vertexIndex]
+
+
+class ItemData(object):
+    """ Single scene item record.
+    """
+
+    def __init__(self, itemId, itemType, name, channels=None):
+        self.id = itemId
+        self.type = itemType
+        self.name = name
+        self.tags = {}
+        self.channelNames = []
+        self.channelValues = {}
+        self.envelopes = {}
+        self.graphs = {}
+        self.parentId = None
+        self.childIds = []
+        self.mesh = None
+        if channels:
+            for name, value in channels.items():
+                self.addChannel(name, value)
+
+    def addChannel(self, name, value=0):
+        if name not in self.channelValues:
+            self.channelNames.append(name)
+        self.channelValues[name] = value
+
+    def getGraphLinks(self, graphName):
+        try:
+            return self.graphs[graphName]
+        except KeyError:
+            links = ([], [])
+            self.graphs[graphName] = links
+            return links
+
+
+class SceneData(object):
+    """ All the items of the fake scene.
+    """
+
+    def addItem(self, itemType, name=None, channels=None):
+        self._counter += 1
+        itemId = '%s%03d' % (itemType, self._counter)
+        if name is None:
+            name = itemId
+        item = ItemData(itemId, itemType, name, channels)
+        self.items[itemId] = item
+        return item
+
+    def removeItem(self, itemId):
+        item = self.items.pop(itemId)
+        for forward, reverse in list(item.graphs.values()):
+            del forward[:]
+            del reverse[:]
+        for other in self.items.values():
+            for forward, reverse in other.graphs.values():
+                if itemId in forward:
+                    forward.remove(itemId)
+                if itemId in reverse:
+                    reverse.remove(itemId)
+
+    def connect(self, graphName, fromId, toId):
+        """ Makes a forward connection from one item to another on a given graph.
+        """
+        self.items[fromId].getGraphLinks(graphName)[0].append(toId)
+        self.items[toId].getGraphLinks(graphName)[1].append(fromId)
+
+    def setParent(self, childId, parentId):
+        child = self.items[childId]
+        if child.parentId is not None:
+            self.items[child.parentId].childIds.remove(childId)
+        child.parentId = parentId
+        if parentId is not None:
+            self.items[parentId].childIds.append(childId)
+
+    def clear(self):
+        self.items = OrderedDict()
+        self.selection = []
+        self._counter = 0
+
+    def __init__(self):
+        self.clear()
+
+
+scene = SceneData()
@@ -0,0 +1,59 @@
+
+""" Fake lx module.
+
+    Commands are not executed, lx.eval() only answers a few queries
+    that rigging system modules run when they are imported.
+"""
+
+
+import os
+
+from fakebase import SymbolModule
+from fakebase import makeStub
+
+from . import object
+from . import service
+
+
+symbol = SymbolModule()
+
+KIT_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..',
+                                         'Kit', 'AutoCharacterSystem'))
+
+evalLog = []
+
+
+def eval(command):
+    """ Records command and returns a default result for known queries.
+    """
+    evalLog.append(command)
+    if 'platformservice alias' in command:
+        return KIT_PATH
+    if command.startswith('query'):
+        return None
+    return None
+
+
+def eval1(command):
+    return eval(command)
+
+
+def evalN(command):
+    result = eval(command)
+    if result is None:
+        return []
+    return [result]
+
+
+def out(*args):
+    pass
+
+
+def bless(*args, **kwargs):
+    pass
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
@@ -0,0 +1,560 @@
+
+""" Fake lx.object module.
+
+    Implements items, channel read/write, string tags and envelopes
+    on top of the in-memory fake scene. Other interfaces are stubs.
+"""
+
+
+from fakebase import makeStub
+from fakescene import scene as sceneData
+from fakescene import ItemData
+from fakescene import EnvelopeData
+from fakescene import MeshData
+
+
+def _getItemData(source):
+    if isinstance(source, ItemData):
+        return source
+    try:
+        return source._data
+    except AttributeError:
+        pass
+    if isinstance(source, str):
+        return sceneData.items[source]
+    raise TypeError
+
+
+class Item(object):
+    """ Raw item interface.
+    """
+
+    def test(self):
+        return self._data is not None
+
+    def Ident(self):
+        return self._data.id
+
+    def Name(self):
+        return self._data.name
+
+    def UniqueName(self):
+        return self._data.name
+
+    def Type(self):
+        return self._data.type
+
+    def ChannelCount(self):
+        return len(self._data.channelNames)
+
+    def ChannelLookup(self, name):
+        try:
+            return self._data.channelNames.index(name)
+        except ValueError:
+            raise LookupError
+
+    def ChannelName(self, index):
+        try:
+            return self._data.channelNames[index]
+        except IndexError:
+            raise LookupError
+
+    def Context(self):
+        return Scene()
+
+    def GetTag(self, tagId):
+        # Raw item returns None when there is no tag.
+        return self._data.tags.get(tagId)
+
+    def __eq__(self, other):
+        try:
+            return self._data is _getItemData(other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._data.id)
+
+    def __init__(self, source=None):
+        if source is None:
+            self._data = None
+        else:
+            self._data = _getItemData(source)
+
+
+class Scene(object):
+    """ Raw scene interface.
+    """
+
+    def ItemLookup(self, ident):
+        try:
+            return Item(sceneData.items[ident])
+        except KeyError:
+            raise LookupError
+
+    def ItemCount(self, itemType=None):
+        return len(sceneData.items)
+
+    def ItemByIndex(self, itemType, index):
+        # Items are kept in insertion order, item type filter is ignored.
+        if self._itemIds is None:
+            self._itemIds = list(sceneData.items.keys())
+        try:
+            return Item(sceneData.items[self._itemIds[index]])
+        except IndexError:
+            raise LookupError
+
+    def Channels(self, action, time):
+        return _ChannelAccess(action, time)
+
+    def __init__(self, source=None):
+        self._itemIds = None
+
+
+class _ChannelAccess(object):
+
+    def __init__(self, action, time):
+        self.action = action
+        self.time = time
+
+
+class ChannelRead(object):
+    """ Reads channel values from items at a time and action given when the object was created.
+    """
+
+    def Integer(self, item, index):
+        data = _getItemData(item)
+        return int(data.channelValues[data.channelNames[index]])
+
+    def Double(self, item, index):
+        data = _getItemData(item)
+        return float(data.channelValues[data.channelNames[index]])
+
+    def Value(self, item, index):
+        data = _getItemData(item)
+        return data.channelValues[data.channelNames[index]]
+
+    def ValueObj(self, item, index):
+        data = _getItemData(item)
+        return data.channelValues[data.channelNames[index]]
+
+    def IsAnimated(self, item, index):
+        data = _getItemData(item)
+        return data.channelNames[index] in data.envelopes
+
+    def Envelope(self, item, index):
+        data = _getItemData(item)
+        try:
+            return Envelope(data.envelopes[data.channelNames[index]])
+        except KeyError:
+            raise LookupError
+
+    def __init__(self, source=None):
+        self._access = source
+
+
+class ChannelWrite(object):
+    """ Writes channel values to items.
+    """
+
+    def Integer(self, item, index, value):
+        data = _getItemData(item)
+        data.channelValues[data.channelNames[index]] = int(value)
+
+    def Double(self, item, index, value):
+        data = _getItemData(item)
+        data.channelValues[data.channelNames[index]] = float(value)
+
+    def Envelope(self, item, index):
+        data = _getItemData(item)
+        name = data.channelNames[index]
+        try:
+            return Envelope(data.envelopes[name])
+        except KeyError:
+            raise LookupError
+
+    def __init__(self, source=None):
+        self._access = source
+
+
+class Matrix(object):
+    """ Matrix interface.
+
+    Matrix channel values are stored in fake scene as tuples of 4 rows.
+    """
+
+    def Get4(self):
+        return tuple(tuple(row) for row in self._rows)
+
+    def __init__(self, source=None):
+        if isinstance(source, Matrix):
+            self._rows = source._rows
+        elif source is None:
+            self._rows = ((1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0), (0.0, 0.0, 1.0, 0.0), (0.0, 0.0, 0.0, 1.0))
+        else:
+            self._rows = source
+
+
+class StringTag(object):
+    """ String tags interface of an item.
+    """
+
+    def Get(self, tagId):
+        try:
+            return self._data.tags[tagId]
+        except KeyError:
+            raise LookupError
+
+    def Set(self, tagId, value):
+        if value is None:
+            self._data.tags.pop(tagId, None)
+        else:
+            self._data.tags[tagId] = value
+
+    def __init__(self, source=None):
+        self._data = _getItemData(source)
+
+
+class Envelope(object):
+    """ Channel envelope interface.
+
+    Casting an envelope returns the same envelope.
+    """
+
+    def test(self):
+        return self._env is not None
+
+    def IsInt(self):
+        return self._env.isInt
+
+    def Enumerator(self):
+        return Keyframe(self)
+
+    def __new__(cls, source=None):
+        if isinstance(source, Envelope):
+            return source
+        self = object.__new__(cls)
+        if isinstance(source, EnvelopeData):
+            self._env = source
+        else:
+            self._env = None
+        return self
+
+
+class Keyframe(object):
+    """ Keyframe enumerator of an envelope.
+
+    Enumerator state is initialised in __new__ since modox Keyframe subclasses
+    do not call Keyframe.__init__() on themselves.
+    """
+
+    def First(self):
+        self._setIndex(0)
+
+    def Last(self):
+        self._setIndex(len(self._env.keys) - 1)
+
+    def Next(self):
+        self._setIndex(self._index + 1)
+
+    def Previous(self):
+        self._setIndex(self._index - 1)
+
+    def Find(self, time, side):
+        # Keys are sorted by time so binary search is used
+        # to keep fake lookup cost close to the real one.
+        keys = self._env.keys
+        low = 0
+        high = len(keys)
+        while low < high:
+            mid = (low + high) // 2
+            if keys[mid][0] < time:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(keys) and keys[low][0] == time:
+            self._index = low
+            return
+        raise LookupError
+
+    def Delete(self):
+        del self._env.keys[self._index]
+        self._index = None
+
+    def GetTime(self):
+        return self._key()[0]
+
+    def GetBroken(self):
+        key = self._key()
+        flags = 0
+        if key[1] != key[2]:
+            flags = _symbol().fKEYBREAK_VALUE
+        return flags, 0
+
+    def GetValueF(self, side):
+        return float(self._value(side))
+
+    def GetValueI(self, side):
+        return int(self._value(side))
+
+    def GetSlope(self, side):
+        key = self._key()
+        if side == _symbol().iENVSIDE_IN:
+            return key[3]
+        return key[4]
+
+    def SetSlope(self, slope, side):
+        key = self._key()
+        if side != _symbol().iENVSIDE_OUT:
+            key[3] = slope
+        if side != _symbol().iENVSIDE_IN:
+            key[4] = slope
+
+    def SetSlopeType(self, slopeType, side):
+        self._key()
+
+    # -------- Private methods
+
+    def _setIndex(self, index):
+        if self._env is None or index is None or index < 0 or index >= len(self._env.keys):
+            raise LookupError
+        self._index = index
+
+    def _key(self):
+        if self._index is None:
+            raise LookupError
+        return self._env.keys[self._index]
+
+    def _value(self, side):
+        key = self._key()
+        if side == _symbol().iENVSIDE_IN:
+            return key[1]
+        return key[2]
+
+    def __new__(cls, source=None):
+        self = object.__new__(cls)
+        if isinstance(source, Envelope):
+            self._env = source._env
+        elif isinstance(source, Keyframe):
+            self._env = source._env
+        else:
+            self._env = None
+        self._index = None
+        return self
+
+    def __init__(self, source=None):
+        pass
+
+
+class storage(object):
+    """ Value storage buffer.
+    """
+
+    def setType(self, valueType):
+        self._type = valueType
+
+    def setSize(self, size):
+        self._values = (0,) * size
+
+    def set(self, values):
+        self._values = tuple(values)
+
+    def get(self):
+        return self._values
+
+    def __init__(self, valueType='f', size=1):
+        self._type = valueType
+        self._values = (0,) * size
+
+
+class Mesh(object):
+    """ Mesh interface, point and polygon ids are the same as their indices.
+    """
+
+    def test(self):
+        return self._data is not None
+
+    def PointCount(self):
+        return len(self._data.vertices)
+
+    def PolygonCount(self):
+        return len(self._data.polygons)
+
+    def PointAccessor(self):
+        return Point(self._data)
+
+    def PolygonAccessor(self):
+        return Polygon(self._data)
+
+    def MeshMapAccessor(self):
+        return MeshMap(self._data)
+
+    def __init__(self, source=None):
+        if isinstance(source, Mesh):
+            self._data = source._data
+        elif isinstance(source, MeshData):
+            self._data = source
+        else:
+            self._data = None
+
+
+class MeshMap(object):
+    """ Mesh map accessor, only weight maps are supported.
+
+    Map id is the map name.
+    """
+
+    def SelectByName(self, mapType, name):
+        if name not in self._data.weightMaps:
+            raise LookupError
+        self._name = name
+
+    def New(self, mapType, name):
+        self._data.addWeightMap(name)
+        self._name = name
+
+    def Remove(self):
+        del self._data.weightMaps[self._name]
+        self._name = None
+
+    def ID(self):
+        return self._name
+
+    def Name(self):
+        return self._name
+
+    def Type(self):
+        return _symbol().i_VMAP_WEIGHT
+
+    def Enumerate(self, mark, visitor, monitor):
+        for name in list(self._data.weightMaps.keys()):
+            self._name = name
+            visitor.vis_Evaluate()
+
+    def __init__(self, source=None):
+        if isinstance(source, MeshMap):
+            self._data = source._data
+        else:
+            self._data = source
+        self._name = None
+
+
+class Point(object):
+    """ Point accessor.
+    """
+
+    def Select(self, pointId):
+        self._index = pointId
+
+    def SelectByIndex(self, index):
+        if index < 0 or index >= len(self._data.vertices):
+            raise LookupError
+        self._index = index
+
+    def ID(self):
+        return self._index
+
+    def Index(self):
+        return self._index
+
+    def Pos(self):
+        return self._data.vertices[self._index]
+
+    def PolygonCount(self):
+        return len(self._data.getVertexPolygons(self._index))
+
+    def PolygonByIndex(self, index):
+        return self._data.getVertexPolygons(self._index)[index]
+
+    def MapValue(self, mapId, value):
+        try:
+            weight = self._data.weightMaps[mapId][self._index]
+        except KeyError:
+            return False
+        value.set((weight,))
+        return True
+
+    def SetMapValue(self, mapId, value):
+        self._data.weightMaps[mapId][self._index] = value.get()[0]
+
+    def ClearMapValue(self, mapId):
+        self._data.weightMaps[mapId].pop(self._index, None)
+
+    def __init__(self, source=None):
+        if isinstance(source, Point):
+            self._data = source._data
+        else:
+            self._data = source
+        self._index = None
+
+
+class Polygon(object):
+    """ Polygon accessor.
+    """
+
+    def Select(self, polygonId):
+        self._index = polygonId
+
+    def SelectByIndex(self, index):
+        self._index = index
+
+    def VertexCount(self):
+        return len(self._data.polygons[self._index])
+
+    def VertexByIndex(self, index):
+        return self._data.polygons[self._index][index]
+
+    def __init__(self, source=None):
+        if isinstance(source, Polygon):
+            self._data = source._data
+        else:
+            self._data = source
+        self._index = None
+
+
+class LayerScan(object):
+    """ Layer scan over a single mesh item.
+
+    Edits are applied directly to mesh data, number of applied scans is counted.
+    """
+
+    applyCount = 0
+
+    def test(self):
+        return self._mesh is not None
+
+    def Count(self):
+        return 1 if self._mesh is not None else 0
+
+    def MeshEdit(self, index):
+        return Mesh(self._mesh)
+
+    def MeshBase(self, index):
+        return Mesh(self._mesh)
+
+    def SetMeshChange(self, index, flags):
+        pass
+
+    def Apply(self):
+        LayerScan.applyCount += 1
+
+    def __new__(cls, source=None):
+        if isinstance(source, LayerScan):
+            return source
+        self = object.__new__(cls)
+        self._mesh = source
+        return self
+
+
+def _symbol():
+    import lx
+    return lx.symbol
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
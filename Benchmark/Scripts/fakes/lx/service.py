@@ -0,0 +1,22 @@
+
+""" Fake lx.service module.
+
+    Layer service allocates layer scans of single mesh items,
+    all other services are stubs.
+"""
+
+
+from fakebase import makeStub
+
+
+class Layer(object):
+
+    def ScanAllocateItem(self, item, flags):
+        from . import object
+        return object.LayerScan(item._data.mesh)
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
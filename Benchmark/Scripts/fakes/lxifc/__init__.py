@@ -0,0 +1,12 @@
+
+""" Fake lxifc module, all interfaces are stubs that can be subclassed.
+"""
+
+
+from fakebase import makeStub
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
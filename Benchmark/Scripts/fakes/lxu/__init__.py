@@ -0,0 +1,26 @@
+
+""" Fake lxu module.
+"""
+
+
+from fakebase import makeStub
+
+from . import utils
+from . import object
+from . import select
+from . import command
+from .utils import lxID4
+
+
+def lxID(name):
+    return lxID4(name)
+
+
+def decodeID(value):
+    return ''.join(chr((value >> shift) & 0xFF) for shift in (24, 16, 8, 0))
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
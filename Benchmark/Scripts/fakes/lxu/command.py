@@ -0,0 +1,45 @@
+
+""" Fake lxu.command module.
+"""
+
+
+from fakebase import Stub
+from fakebase import makeStub
+
+
+class BasicCommand(object):
+    """ Basic command with dynamic arguments that are never set.
+
+    It's not a stub class since modox.Command keeps its own
+    class attributes which a stub would resolve on its own.
+    """
+
+    def dyna_Add(self, name, datatype):
+        pass
+
+    def dyna_IsSet(self, index):
+        return False
+
+    def dyna_SetHint(self, index, hints):
+        pass
+
+    def basic_SetFlags(self, index, flags):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return makeStub(name)
+
+    def __init__(self):
+        pass
+
+
+class BasicHints(Stub):
+    pass
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
@@ -0,0 +1,7 @@
+
+""" Fake lxu.object module, wraps fake lx.object interfaces.
+"""
+
+
+from lx.object import *
+from lx.object import __getattr__
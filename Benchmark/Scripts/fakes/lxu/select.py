@@ -0,0 +1,28 @@
+
+""" Fake lxu.select module.
+"""
+
+
+from fakebase import Stub
+from fakebase import makeStub
+from fakescene import scene as sceneData
+
+
+class SceneSelection(Stub):
+
+    def current(self):
+        import lx.object
+        return lx.object.Scene()
+
+
+class ItemSelection(Stub):
+
+    def current(self):
+        import lx.object
+        return [lx.object.Item(sceneData.items[itemId]) for itemId in sceneData.selection]
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
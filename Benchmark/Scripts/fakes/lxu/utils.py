@@ -0,0 +1,21 @@
+
+""" Fake lxu.utils module.
+"""
+
+
+from fakebase import makeStub
+
+
+def lxID4(name):
+    """ Packs 4 character tag name into an integer the same way MODO does.
+    """
+    value = 0
+    for char in name[:4]:
+        value = (value << 8) | ord(char)
+    return value
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
@@ -0,0 +1,615 @@
+
+""" Fake modo module.
+
+    In-memory implementation of the parts of modo TD SDK that benchmarked code uses:
+    items with tags, channels, graphs and hierarchy, mesh geometry and math types.
+"""
+
+
+import math
+
+import lx
+import lx.object
+from lxu.utils import lxID4
+from fakebase import Stub
+from fakebase import makeStub
+from fakescene import scene as sceneData
+from fakescene import ItemData
+from fakescene import MeshData
+
+from . import constants
+from . import constants as c
+
+
+# -------- Math
+
+class Vector3(object):
+
+    @property
+    def values(self):
+        return tuple(self._v)
+
+    @property
+    def x(self):
+        return self._v[0]
+
+    @property
+    def y(self):
+        return self._v[1]
+
+    @property
+    def z(self):
+        return self._v[2]
+
+    def dot(self, other):
+        return self._v[0] * other[0] + self._v[1] * other[1] + self._v[2] * other[2]
+
+    def cross(self, other):
+        a = self._v
+        return Vector3(a[1] * other[2] - a[2] * other[1],
+                       a[2] * other[0] - a[0] * other[2],
+                       a[0] * other[1] - a[1] * other[0])
+
+    def length(self):
+        return math.sqrt(self.dot(self))
+
+    def normal(self):
+        length = self.length()
+        if length == 0.0:
+            return Vector3(self)
+        return Vector3(self._v[0] / length, self._v[1] / length, self._v[2] / length)
+
+    def __getitem__(self, index):
+        return self._v[index]
+
+    def __setitem__(self, index, value):
+        self._v[index] = float(value)
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter(self._v)
+
+    def __add__(self, other):
+        return Vector3(self._v[0] + other[0], self._v[1] + other[1], self._v[2] + other[2])
+
+    def __sub__(self, other):
+        return Vector3(self._v[0] - other[0], self._v[1] - other[1], self._v[2] - other[2])
+
+    def __mul__(self, scalar):
+        return Vector3(self._v[0] * scalar, self._v[1] * scalar, self._v[2] * scalar)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Vector3(-self._v[0], -self._v[1], -self._v[2])
+
+    def __eq__(self, other):
+        try:
+            return tuple(self._v) == (other[0], other[1], other[2])
+        except (TypeError, IndexError):
+            return False
+
+    def __repr__(self):
+        return 'Vector3(%f, %f, %f)' % tuple(self._v)
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            args = args[0]
+        if not args:
+            args = (0.0, 0.0, 0.0)
+        self._v = [float(args[0]), float(args[1]), float(args[2])]
+
+
+class Matrix3(object):
+
+    @property
+    def m(self):
+        return self._m
+
+    def __init__(self, source=None):
+        self._m = _matrixRows(source, 3)
+
+
+class Matrix4(Matrix3):
+
+    @property
+    def position(self):
+        return tuple(self._m[3][:3])
+
+    def scale(self):
+        return Vector3([Vector3(row[:3]).length() for row in self._m[:3]])
+
+    def inverted(self):
+        """ General 4x4 inverse with Gauss-Jordan elimination.
+        """
+        size = 4
+        a = [list(row) + [1.0 if x == y else 0.0 for x in range(size)] for y, row in enumerate(self._m)]
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda r: abs(a[r][col]))
+            a[col], a[pivot] = a[pivot], a[col]
+            p = a[col][col]
+            if p == 0.0:
+                raise ValueError('Matrix is singular')
+            a[col] = [v / p for v in a[col]]
+            for r in range(size):
+                if r != col:
+                    f = a[r][col]
+                    a[r] = [a[r][x] - f * a[col][x] for x in range(size * 2)]
+        return Matrix4([row[size:] for row in a])
+
+    def invert(self):
+        self._m = self.inverted()._m
+
+    def __mul__(self, other):
+        a = self._m
+        b = other.m
+        return Matrix4([[sum(a[r][k] * b[k][c] for k in range(4)) for c in range(4)] for r in range(4)])
+
+    def __init__(self, source=None):
+        self._m = _matrixRows(source, 4)
+
+
+def _matrixRows(source, size):
+    """ Gets matrix rows from other matrix, raw matrix object or sequence of rows.
+    """
+    if source is None:
+        return [[1.0 if x == y else 0.0 for x in range(size)] for y in range(size)]
+    try:
+        rows = source.m
+    except AttributeError:
+        try:
+            rows = source.Get4()
+        except AttributeError:
+            rows = source
+    return [[float(v) for v in row[:size]] for row in rows[:size]]
+
+
+# -------- Items
+
+def _getItemData(source):
+    if isinstance(source, ItemData):
+        return source
+    try:
+        return source._data
+    except AttributeError:
+        pass
+    if isinstance(source, str):
+        try:
+            return sceneData.items[source]
+        except KeyError:
+            raise LookupError
+    raise TypeError
+
+
+class Channel(object):
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def item(self):
+        return Item(self._data)
+
+    @property
+    def index(self):
+        return self._data.channelNames.index(self._name)
+
+    @property
+    def isAnimated(self):
+        return self._name in self._data.envelopes
+
+    def get(self, time=None, action=None):
+        return self._data.channelValues[self._name]
+
+    def set(self, value, time=None, key=False, action=None):
+        self._data.channelValues[self._name] = value
+
+    def __eq__(self, other):
+        try:
+            return self._data is other._data and self._name == other._name
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self._data.id, self._name))
+
+    def __init__(self, name, item):
+        self._data = _getItemData(item)
+        self._name = name
+
+
+class ItemGraph(object):
+
+    def forward(self, index=None):
+        return self._get(0, index)
+
+    def reverse(self, index=None):
+        return self._get(1, index)
+
+    def __rshift__(self, other):
+        sceneData.connect(self._name, self._data.id, other._data.id)
+
+    def __lshift__(self, other):
+        # Removes the link coming from the other item to this item.
+        forward = other._data.getGraphLinks(self._name)[0]
+        reverse = self._data.getGraphLinks(self._name)[1]
+        if self._data.id in forward:
+            forward.remove(self._data.id)
+        if other._data.id in reverse:
+            reverse.remove(other._data.id)
+
+    def _get(self, side, index):
+        links = self._data.getGraphLinks(self._name)[side]
+        if index is None:
+            return [Item(sceneData.items[itemId]) for itemId in links]
+        try:
+            return Item(sceneData.items[links[index]])
+        except IndexError:
+            raise LookupError
+
+    def __init__(self, item, graphName):
+        self._data = _getItemData(item)
+        self._name = graphName
+
+
+class Item(object):
+
+    @property
+    def id(self):
+        return self._data.id
+
+    @property
+    def name(self):
+        return self._data.name
+
+    @name.setter
+    def name(self, value):
+        self._data.name = value
+
+    @property
+    def type(self):
+        return self._data.type
+
+    @property
+    def superType(self):
+        return None
+
+    @property
+    def internalItem(self):
+        return lx.object.Item(self._data)
+
+    @property
+    def parent(self):
+        if self._data.parentId is None:
+            return None
+        return Item(sceneData.items[self._data.parentId])
+
+    def children(self, recursive=False):
+        result = []
+        for itemId in self._data.childIds:
+            child = Item(sceneData.items[itemId])
+            result.append(child)
+            if recursive:
+                result.extend(child.children(recursive=True))
+        return result
+
+    def readTag(self, tag):
+        try:
+            return self._data.tags[self._tagId(tag)]
+        except KeyError:
+            raise LookupError
+
+    def setTag(self, tag, value):
+        tagId = self._tagId(tag)
+        if value is None:
+            self._data.tags.pop(tagId, None)
+        else:
+            self._data.tags[tagId] = value
+
+    def hasTag(self, tag):
+        return self._tagId(tag) in self._data.tags
+
+    def channel(self, name):
+        if name not in self._data.channelValues:
+            return None
+        return Channel(name, self._data)
+
+    def channels(self, name=None):
+        return [Channel(channelName, self._data) for channelName in self._data.channelNames]
+
+    def channelNames(self):
+        return list(self._data.channelNames)
+
+    def itemGraph(self, graphName):
+        return ItemGraph(self._data, graphName)
+
+    def select(self, replace=False):
+        if replace:
+            sceneData.selection = []
+        if self._data.id not in sceneData.selection:
+            sceneData.selection.append(self._data.id)
+
+    def deselect(self):
+        if self._data.id in sceneData.selection:
+            sceneData.selection.remove(self._data.id)
+
+    def setParent(self, newParent=None, index=None):
+        parentId = None if newParent is None else newParent.id
+        sceneData.setParent(self._data.id, parentId)
+
+    # -------- Private methods
+
+    def _tagId(self, tag):
+        if isinstance(tag, str):
+            return lxID4(tag)
+        return tag
+
+    def __eq__(self, other):
+        try:
+            return self._data is _getItemData(other)
+        except (TypeError, LookupError):
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._data.id)
+
+    def __repr__(self):
+        return "modo.Item('%s')" % self._data.name
+
+    def __init__(self, item=None):
+        if item is None:
+            raise LookupError
+        self._data = _getItemData(item)
+
+
+class Locator(Item):
+    pass
+
+
+class Group(Item):
+    pass
+
+
+class Actor(Group):
+    pass
+
+
+class LocatorSuperType(Item):
+    pass
+
+
+# -------- Mesh
+
+class MeshVertex(object):
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def position(self):
+        return Vector3(self._mesh.vertices[self._index])
+
+    def __init__(self, vertex, geometry):
+        self._index = getattr(vertex, 'index', vertex)
+        self._mesh = geometry._mesh
+
+
+class MeshPolygon(object):
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def vertices(self):
+        return [MeshVertex(v, self._geo) for v in self._mesh.polygons[self._index]]
+
+    @property
+    def triangles(self):
+        """ Triangle fan of the polygon as tuples of 3 vertices.
+        """
+        verts = self.vertices
+        return [(verts[0], verts[x], verts[x + 1]) for x in range(1, len(verts) - 1)]
+
+    @property
+    def normal(self):
+        n, area = self._normalAndArea()
+        return n
+
+    @property
+    def area(self):
+        n, area = self._normalAndArea()
+        return area
+
+    def getTag(self, tagId):
+        try:
+            return self._mesh.polygonTags[self._index][tagId]
+        except KeyError:
+            raise LookupError
+
+    def setTag(self, tagId, value):
+        tags = self._mesh.polygonTags.setdefault(self._index, {})
+        if value is None:
+            tags.pop(tagId, None)
+            if not tags:
+                del self._mesh.polygonTags[self._index]
+        else:
+            tags[tagId] = value
+
+    def _normalAndArea(self):
+        positions = [Vector3(self._mesh.vertices[v]) for v in self._mesh.polygons[self._index]]
+        total = Vector3()
+        for x in range(1, len(positions) - 1):
+            total = total + (positions[x] - positions[0]).cross(positions[x + 1] - positions[0])
+        length = total.length()
+        return total.normal(), length * 0.5
+
+    def __init__(self, polygon, geometry):
+        self._index = getattr(polygon, 'index', polygon)
+        self._geo = geometry
+        self._mesh = geometry._mesh
+
+
+class MeshPolygons(object):
+
+    @property
+    def accessor(self):
+        return Stub()
+
+    def __len__(self):
+        return len(self._geo._mesh.polygons)
+
+    def __iter__(self):
+        for x in range(len(self._geo._mesh.polygons)):
+            yield MeshPolygon(x, self._geo)
+
+    def __getitem__(self, index):
+        return MeshPolygon(index, self._geo)
+
+    def __init__(self, geometry):
+        self._geo = geometry
+
+
+class MeshVertices(MeshPolygons):
+
+    def __len__(self):
+        return len(self._geo._mesh.vertices)
+
+    def __iter__(self):
+        for x in range(len(self._geo._mesh.vertices)):
+            yield MeshVertex(x, self._geo)
+
+    def __getitem__(self, index):
+        return MeshVertex(index, self._geo)
+
+
+class WeightMap(object):
+    """ Weight map, values are read and written one vertex at a time.
+    """
+
+    @property
+    def name(self):
+        return self._name
+
+    def __getitem__(self, index):
+        try:
+            return (self._mesh.weightMaps[self._name][index],)
+        except KeyError:
+            return None
+
+    def __setitem__(self, index, value):
+        if value is None:
+            self._mesh.weightMaps[self._name].pop(index, None)
+        else:
+            self._mesh.weightMaps[self._name][index] = value[0]
+
+    def __init__(self, name, mesh):
+        self._name = name
+        self._mesh = mesh
+
+
+class MeshMaps(object):
+
+    @property
+    def weightMaps(self):
+        return [WeightMap(name, self._mesh) for name in self._mesh.weightMaps]
+
+    def addWeightMap(self, name):
+        self._mesh.addWeightMap(name)
+        return WeightMap(name, self._mesh)
+
+    def __getitem__(self, name):
+        if name in self._mesh.weightMaps:
+            return [WeightMap(name, self._mesh)]
+        return []
+
+    def __init__(self, mesh):
+        self._mesh = mesh
+
+
+class MeshGeometry(object):
+
+    @property
+    def polygons(self):
+        return MeshPolygons(self)
+
+    @property
+    def vmaps(self):
+        return MeshMaps(self._mesh)
+
+    @property
+    def vertices(self):
+        return MeshVertices(self)
+
+    def setMeshEdits(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def __init__(self, mesh):
+        self._mesh = mesh
+
+
+class Mesh(Item):
+
+    @property
+    def geometry(self):
+        if self._data.mesh is None:
+            self._data.mesh = MeshData()
+        return MeshGeometry(self._data.mesh)
+
+
+# -------- Scene
+
+class Scene(object):
+
+    def items(self, itype=None, superType=True):
+        return [Item(data) for data in sceneData.items.values() if itype is None or data.type == itype]
+
+    def item(self, ident):
+        return Item(ident)
+
+    @property
+    def selected(self):
+        return [Item(sceneData.items[itemId]) for itemId in sceneData.selection]
+
+    @property
+    def sceneItem(self):
+        for data in sceneData.items.values():
+            if data.type == 'scene':
+                return Item(data)
+        return Item(sceneData.addItem('scene', 'Scene'))
+
+    def select(self, items, add=False):
+        if not add:
+            sceneData.selection = []
+        if not isinstance(items, (list, tuple)):
+            items = [items]
+        for modoItem in items:
+            modoItem.select()
+
+    def deselect(self, items=None):
+        sceneData.selection = []
+
+    def __init__(self, *args):
+        pass
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return makeStub(name)
@@ -0,0 +1,16 @@
+
+""" Fake modo.constants module.
+"""
+
+
+MESH_TYPE = 'mesh'
+LOCATOR_TYPE = 'locator'
+GROUPLOCATOR_TYPE = 'groupLocator'
+GROUP_TYPE = 'group'
+GENINFLUENCE_TYPE = 'genInfluence'
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return name.lower()
@@ -43,6 +43,7 @@ from .view import ViewUtils
 from .message import Message
 from .assm import Assembly
 from .vertMap import VertexMapUtils
+from .vertMap import WeightMatrix
 from .chan_modifier import CMTransformConstraint
 from .chan_modifier import TransformConstraintOperation
 from .cmd_region import CommandRegionPolygon
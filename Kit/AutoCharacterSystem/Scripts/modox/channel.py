@@ -1,9 +1,12 @@
 
 
+import hashlib
+
 import lx
 import modo
 
 from .run import run
+from . import channel_lxe
 
 
 class ChannelUtils(object):
@@ -638,4 +641,326 @@ class ChannelUtils(object):
             return False
         
         return True
-    
\ No newline at end of file
+    
+    @classmethod
+    def getItemsIntChannelValues(cls, modoItems, channelName, time=0.0, action=lx.symbol.s_ACTIONLAYER_SETUP):
+        """ Reads integer value of the same channel from a number of items.
+
+        Channel index is looked up once per item type and all values
+        are read with a single ChannelRead object.
+
+        Parameters
+        ----------
+        modoItems : [modo.Item]
+
+        channelName : str
+
+        Returns
+        -------
+        dict {str : int}
+            Key is item id. Items that do not have the channel are not in the dictionary.
+        """
+        values = {}
+        if not modoItems:
+            return values
+
+        scene = lx.object.Scene(modoItems[0].internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(action, time))
+        indexCache = {}
+
+        for modoItem in modoItems:
+            rawItem = modoItem.internalItem
+            index = cls._getChannelIndexCached(rawItem, channelName, indexCache)
+            if index is None:
+                continue
+            values[modoItem.id] = chanRead.Integer(rawItem, index)
+        return values
+
+    @classmethod
+    def setItemsIntChannelValue(cls, modoItems, channelName, value, time=0.0, action=lx.symbol.s_ACTIONLAYER_SETUP):
+        """ Sets integer value of the same channel on a number of items.
+
+        This is a lot faster than setting channels one by one with modo.Channel.set()
+        since channel index is looked up once per item type and all values
+        are written with a single ChannelWrite object.
+
+        Parameters
+        ----------
+        modoItems : [modo.Item]
+
+        channelName : str
+
+        value : int, bool
+
+        Returns
+        -------
+        int
+            Number of items the channel was set on.
+            Items that do not have the channel are skipped.
+        """
+        if not modoItems:
+            return 0
+
+        scene = lx.object.Scene(modoItems[0].internalItem.Context())
+        chanWrite = lx.object.ChannelWrite(scene.Channels(action, time))
+        indexCache = {}
+        value = int(value)
+        count = 0
+
+        for modoItem in modoItems:
+            rawItem = modoItem.internalItem
+            index = cls._getChannelIndexCached(rawItem, channelName, indexCache)
+            if index is None:
+                continue
+            chanWrite.Integer(rawItem, index, value)
+            count += 1
+        return count
+
+    @classmethod
+    def transferChannels(cls,
+                         sourceChannels,
+                         targetChannels,
+                         readAction=lx.symbol.s_ACTIONLAYER_EDIT,
+                         writeAction=lx.symbol.s_ACTIONLAYER_EDIT,
+                         time=None,
+                         envelopes=True,
+                         keyStaticValues=False):
+        """ Transfers values and envelopes from source to target channels.
+
+        This is a replacement for select.channel/channel.copy/channel.paste sequence.
+        All channels are transferred in one pass using single ChannelRead
+        and single ChannelWrite object, no commands are executed
+        apart from setting envelope interpolation when it differs from the default one.
+
+        Parameters
+        ----------
+        sourceChannels : [modo.Channel]
+
+        targetChannels : [modo.Channel]
+            Source channel is transferred to target channel with the same index in the list.
+
+        readAction : str
+            Action to read source channels from, one of lx.symbol.s_ACTIONLAYER_XXX.
+
+        writeAction : str
+            Action to write target channels to, one of lx.symbol.s_ACTIONLAYER_XXX.
+
+        time : float, None
+            Time to read and write values at. Pass None for current time.
+
+        envelopes : bool
+            When True animated source channels have their entire envelopes transferred.
+            When False only the value at given time is transferred.
+
+        keyStaticValues : bool
+            When True static values are set with a keyframe.
+
+        Returns
+        -------
+        int
+            Number of transferred channels.
+        """
+        count = min(len(sourceChannels), len(targetChannels))
+        if count == 0:
+            return 0
+
+        if time is None:
+            time = lx.service.Selection().GetTime()
+
+        scene = lx.object.Scene(sourceChannels[0].item.internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(readAction, time))
+        chanWrite = lx.object.ChannelWrite(scene.Channels(writeAction, time))
+        readUtils = channel_lxe.ChannelReadUtils()
+        # Write utils are not given channel read on purpose.
+        # Read happens in read action which may not be the write one,
+        # envelopes are always taken from channel write in such case.
+        writeUtils = channel_lxe.ChannelWriteUtils()
+
+        if envelopes:
+            readMode = channel_lxe.iCHAN_READMODE_ALL
+        else:
+            readMode = channel_lxe.iCHAN_READMODE_VALUE
+
+        if keyStaticValues:
+            writeMode = channel_lxe.iCHAN_WRITEMODE_FORCEKEY
+        else:
+            writeMode = channel_lxe.iCHAN_WRITEMODE_STATIC
+
+        transferred = 0
+        for x in range(count):
+            sourceChannel = sourceChannels[x]
+            targetChannel = targetChannels[x]
+            dataPack = readUtils.GetAsDataPack(chanRead,
+                                               sourceChannel.item.internalItem,
+                                               sourceChannel.index,
+                                               readMode)
+            if dataPack.value is None and dataPack.envelope_data_pack is None:
+                continue
+            writeUtils.SetFromDataPack(chanWrite,
+                                       targetChannel.item.internalItem,
+                                       targetChannel.index,
+                                       dataPack,
+                                       writeMode,
+                                       channel_lxe.iENV_WRITEMODE_REPLACE)
+            transferred += 1
+        return transferred
+
+    @classmethod
+    def getChannelsEnvelopeHash(cls, channels, action=lx.symbol.s_ACTIONLAYER_EDIT):
+        """ Gets hash of the animation that given channels have in a given action.
+
+        Time, values and slopes of every key of every animated channel
+        are hashed. Channels that are not animated contribute their value
+        to the hash. All channels are read with a single ChannelRead object.
+
+        Parameters
+        ----------
+        channels : [modo.Channel]
+
+        action : str
+            Name of the action to read channels from, edit action by default.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest. The same animation always gives the same digest
+            so it can be stored and compared between sessions.
+        """
+        digest = hashlib.md5()
+        if not channels:
+            return digest.hexdigest()
+
+        scene = lx.object.Scene(channels[0].item.internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(action, 0.0))
+        for channel in channels:
+            rawItem = channel.item.internalItem
+            index = channel.index
+            parts = [rawItem.Ident(), str(index)]
+
+            if chanRead.IsAnimated(rawItem, index):
+                env = lx.object.Envelope(chanRead.Envelope(rawItem, index))
+                isInt = env.IsInt()
+                key = lx.object.Keyframe(env.Enumerator())
+                try:
+                    key.First()
+                except LookupError:
+                    key = None
+
+                while key is not None:
+                    parts.append(cls._getKeyHashString(key, isInt))
+                    try:
+                        key.Next()
+                    except LookupError:
+                        key = None
+            else:
+                try:
+                    parts.append('%r' % chanRead.Double(rawItem, index))
+                except (LookupError, TypeError, RuntimeError):
+                    pass
+
+            digest.update(';'.join(parts).encode('utf-8'))
+        return digest.hexdigest()
+
+    @classmethod
+    def reduceKeys(cls, channels, tolerance=0.001, action=lx.symbol.s_ACTIONLAYER_EDIT):
+        """ Reduces keys on envelopes of given channels in one pass.
+
+        Keys are reduced in process on envelope data, no commands are run
+        so this is a lot faster than selecting channels and running channel.keyReduce
+        on each of them. See channel_lxe.EnvelopeUtils.ReduceKeys() for details.
+
+        Parameters
+        ----------
+        channels : [modo.Channel]
+
+        tolerance : float
+            Max difference between original and reduced animation.
+
+        action : str
+            Name of the action to reduce keys in, edit action by default.
+
+        Returns
+        -------
+        int, int
+            Total number of keys on all channels before and after reduction.
+            Channels that are not animated are skipped.
+        """
+        keysBefore = 0
+        keysAfter = 0
+        if not channels:
+            return keysBefore, keysAfter
+
+        scene = lx.object.Scene(channels[0].item.internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(action, 0.0))
+        chanWrite = lx.object.ChannelWrite(scene.Channels(action, 0.0))
+        for channel in channels:
+            rawItem = channel.item.internalItem
+            index = channel.index
+            if not chanRead.IsAnimated(rawItem, index):
+                continue
+            try:
+                env = chanWrite.Envelope(rawItem, index)
+            except LookupError:
+                continue
+            before, after = channel_lxe.EnvelopeUtils(env).ReduceKeys(tolerance)
+            keysBefore += before
+            keysAfter += after
+        return keysBefore, keysAfter
+
+    # -------- Private methods
+
+    @classmethod
+    def _getKeyHashString(cls, key, isInt):
+        """ Gets string describing current key of a keyframe enumerator.
+
+        Values and slopes that cannot be read from the key are skipped,
+        the same as when a key is read into a data pack.
+        """
+        parts = ['%r' % key.GetTime()]
+        for side in (lx.symbol.iENVSIDE_IN, lx.symbol.iENVSIDE_OUT):
+            try:
+                if isInt:
+                    parts.append('%d' % key.GetValueI(side))
+                else:
+                    parts.append('%r' % key.GetValueF(side))
+            except RuntimeError:
+                parts.append('')
+            if isInt:
+                continue
+            try:
+                parts.append('%r' % key.GetSlope(side))
+            except RuntimeError:
+                parts.append('')
+        return ':'.join(parts)
+
+    @classmethod
+    def _getChannelIndexCached(cls, rawItem, channelName, indexCache):
+        """ Gets channel index, caching it per item type.
+
+        Channel indexes are the same for all items of the same type
+        as long as the channel is not a user channel.
+        User channels are always looked up on the item itself.
+
+        Returns
+        -------
+        int, None
+        """
+        itemType = rawItem.Type()
+        try:
+            index = indexCache[itemType]
+        except KeyError:
+            index = None
+
+        if index is not None:
+            try:
+                if rawItem.ChannelName(index) == channelName:
+                    return index
+            except (LookupError, IndexError, RuntimeError):
+                pass
+
+        try:
+            index = rawItem.ChannelLookup(channelName)
+        except LookupError:
+            return None
+        indexCache[itemType] = index
+        return index
@@ -672,7 +672,7 @@ class ChannelWriteUtils:
 
             elif chan_type == lx.symbol.iCHANTYPE_STORAGE:
                 chan_storage_type = item.ChannelStorageType(chan_idx)
-                if chan_storage_type == lxe.symbol.sCHAN_STORAGE_TYPE_STRING:
+                if chan_storage_type == sCHAN_STORAGE_TYPE_STRING:
                     value = str(value)
                     chan_write.String(item, chan_idx, value)
         except:
@@ -1235,6 +1235,9 @@ class EnvelopeUtils:
         Also, doesn't change interpolation for integer (boolean) channels.
         """
         if self.chan_ident_string and not self.envelope.IsInt():
+            # Interpolation can only be set by command so skip it if it's already there.
+            if self.envelope.Interpolation() == interpolation_type:
+                return
             lx.eval('!channel.interpolation type:%d channel:{%s}' % (interpolation_type, self.chan_ident_string))
 
     def KeyCount(self):
@@ -1548,3 +1551,146 @@ class EnvelopeUtils:
         except:
             lx.out(traceback.format_exc())
             raise
+
+    def ReduceKeys(self, tolerance=0.001):
+        """ Delete keys that can be removed without changing envelope flow
+        by more than tolerance at any of the original key times.
+        Return number of keys before and after reduction.
+
+        Meant for dense baked envelopes (a key on every frame).
+        Keys are read once and reduced with Douglas-Peucker style fitting:
+        curve between two keys that are left is a Hermite spline
+        using slopes of these keys. To keep that shape once the keys
+        in between are gone slopes of keys next to deleted ones are set to manual.
+        Keys with broken values or slopes are never deleted.
+        On integer envelopes only keys that repeat previous key value are deleted.
+
+        Args:
+        tolerance -- max difference between original and reduced envelope,
+                     doesn't matter for int.
+        """
+        try:
+            if not self.envelope.test():
+                return 0, 0
+
+            is_int = self.envelope.IsInt()
+            side_in = lx.symbol.iENVSIDE_IN
+            side_out = lx.symbol.iENVSIDE_OUT
+
+            key = KeyframeExtended(self.envelope.Enumerator())
+            key.SetIsInt(is_int)
+
+            times = []
+            values_in = []
+            values_out = []
+            slopes_in = []
+            slopes_out = []
+            keep = []
+
+            try:
+                key.First()
+            except LookupError:
+                return 0, 0
+
+            # Read all keys in one go.
+            while True:
+                times.append(key.GetTime())
+                break_flags, value_side = key.GetBroken()
+                keep.append(break_flags != 0)
+                if is_int:
+                    values_in.append(key.GetValueI(side_in))
+                    values_out.append(key.GetValueI(side_out))
+                else:
+                    values_in.append(key.GetValueF(side_in))
+                    values_out.append(key.GetValueF(side_out))
+                    slopes_in.append(key.GetSlope(side_in))
+                    slopes_out.append(key.GetSlope(side_out))
+                try:
+                    key.Next()
+                except LookupError:
+                    break
+
+            count = len(times)
+            if count < 3:
+                return count, count
+
+            keep[0] = True
+            keep[-1] = True
+
+            if is_int:
+                for x in range(1, count - 1):
+                    if values_in[x] != values_out[x - 1]:
+                        keep[x] = True
+            else:
+                # Keys that have to stay split envelope into spans
+                # that are reduced separately.
+                spans = []
+                first = 0
+                for x in range(1, count):
+                    if keep[x]:
+                        spans.append((first, x))
+                        first = x
+
+                while spans:
+                    first, last = spans.pop()
+                    if last - first < 2:
+                        continue
+                    error, x = self._GetSpanMaxError(first, last, times, values_in, values_out,
+                                                     slopes_in, slopes_out)
+                    if error > tolerance:
+                        keep[x] = True
+                        spans.append((first, x))
+                        spans.append((x, last))
+
+                # Lock slopes of keys that will get new neighbours
+                # before anything is deleted so they are not recalculated.
+                for x in range(count):
+                    if not keep[x]:
+                        continue
+                    if (x > 0 and not keep[x - 1]) or (x < count - 1 and not keep[x + 1]):
+                        key.Find(times[x], lx.symbol.iENVSIDE_BOTH)
+                        key.SetSlopeType(lx.symbol.iSLOPE_MANUAL, side_in)
+                        key.SetSlope(slopes_in[x], side_in)
+                        key.SetSlopeType(lx.symbol.iSLOPE_MANUAL, side_out)
+                        key.SetSlope(slopes_out[x], side_out)
+
+            keys_deleted = 0
+            for x in range(count):
+                if keep[x]:
+                    continue
+                key.Find(times[x], lx.symbol.iENVSIDE_BOTH)
+                key.Delete()
+                keys_deleted += 1
+
+            return count, count - keys_deleted
+        except:
+            lx.out(traceback.format_exc())
+            raise
+
+    def _GetSpanMaxError(self, first, last, times, values_in, values_out, slopes_in, slopes_out):
+        """ Get max difference between keys inside the span and Hermite spline
+        going from first to last key of the span.
+        Return the error and index of the key where it is.
+        """
+        t0 = times[first]
+        p0 = values_out[first]
+        p1 = values_in[last]
+        span = times[last] - t0
+        m0 = slopes_out[first] * span
+        m1 = slopes_in[last] * span
+
+        max_error = -1.0
+        max_error_index = first + 1
+        for x in range(first + 1, last):
+            s = (times[x] - t0) / span
+            s2 = s * s
+            s3 = s2 * s
+            value = ((2.0 * s3 - 3.0 * s2 + 1.0) * p0 +
+                     (s3 - 2.0 * s2 + s) * m0 +
+                     (3.0 * s2 - 2.0 * s3) * p1 +
+                     (s3 - s2) * m1)
+            error = abs(value - values_in[x])
+            if error > max_error:
+                max_error = error
+                max_error_index = x
+        return max_error, max_error_index
@@ -8,7 +8,6 @@
     https://github.com/adamohern/commander
 """
 
-import time
 import traceback
 import operator
 
@@ -19,6 +18,10 @@ from .item import ItemUtils
 from .message import Message
 from .setup import SetupMode
 from .run import run
+from .util_time import getTime
+from .command_profile import CallType
+from .command_profile import commandProfiler
+from .command_profile import commandResultCache
 from functools import reduce
 
 
@@ -453,6 +456,32 @@ class Command(lxu.command.BasicCommand):
         """
         return False
 
+    def enableCacheOn(self):
+        """ Enable/disable caching of enable() results.
+
+        Cached result is reused until one of the command notifiers fires
+        or the cache is cleared. Results are cached per values of arguments that are set.
+        Turn it on only when notifiers() cover everything enable() depends on.
+
+        Returns
+        -------
+        bool
+            True to cache enable() results.
+        """
+        return False
+
+    def queryCacheOn(self):
+        """ Enable/disable caching of query() results.
+
+        Same rules as for enableCacheOn() apply.
+
+        Returns
+        -------
+        bool
+            True to cache query() results.
+        """
+        return False
+
     def restoreItemSelection(self):
         """ Restores item selection after command is executed.
         
@@ -524,13 +553,34 @@ class Command(lxu.command.BasicCommand):
         return self.icon()
 
     def basic_Enable(self, msg):
-        if self.enableTimersOn():
-            timeStart = time.clock()
-        msgWrap = Message(msg)
-        enabled = self.enable(msgWrap)
-        if self.enableTimersOn():
-            timeEnd = time.clock()
-            lx.out("ENABLE (%s) : %f s." % (self.NAME, (timeEnd - timeStart)))
+        profile = commandProfiler.enabled
+        timers = self.enableTimersOn()
+        if profile or timers:
+            timeStart = getTime()
+
+        if self.enableCacheOn():
+            key = (CallType.ENABLE, self._getArgumentValuesKey())
+            try:
+                enabled, messages = commandResultCache.get(self.NAME, key)
+            except KeyError:
+                msgWrap = _RecordedMessage(msg)
+                enabled = self.enable(msgWrap)
+                commandResultCache.set(self.NAME, key, (enabled, msgWrap.recorded))
+            else:
+                # Disable message has to be set again each time.
+                msgWrap = Message(msg)
+                for method, arguments in messages:
+                    method(msgWrap, *arguments)
+        else:
+            msgWrap = Message(msg)
+            enabled = self.enable(msgWrap)
+
+        if profile or timers:
+            duration = getTime() - timeStart
+            if profile:
+                commandProfiler.addSample(self.NAME, CallType.ENABLE, duration)
+            if timers:
+                lx.out("ENABLE (%s) : %f s." % (self.NAME, duration))
         return enabled
 
     def basic_ArgType(self, index):
@@ -656,8 +706,10 @@ class Command(lxu.command.BasicCommand):
             ItemUtils.autoFocusItemListOnSelection()
 
     def cmd_Query(self, index, vaQuery):
-        if self.queryTimersOn():
-            timeStart = time.clock()
+        profile = commandProfiler.enabled
+        timers = self.queryTimersOn()
+        if profile or timers:
+            timeStart = getTime()
 
         # Create the ValueArray object
         va = lx.object.ValueArray()
@@ -665,7 +717,15 @@ class Command(lxu.command.BasicCommand):
     
         # To keep things simpler for commander users, let them return
         # a value using only an index (no ValueArray nonsense)
-        commander_query_result = self.query(self._argumentsList[index])
+        if self.queryCacheOn():
+            key = (CallType.QUERY, index, self._getArgumentValuesKey())
+            try:
+                commander_query_result = commandResultCache.get(self.NAME, key)
+            except KeyError:
+                commander_query_result = self.query(self._argumentsList[index])
+                commandResultCache.set(self.NAME, key, commander_query_result)
+        else:
+            commander_query_result = self.query(self._argumentsList[index])
     
         # Need to add the proper datatype based on result from commander_query
 
@@ -690,9 +750,12 @@ class Command(lxu.command.BasicCommand):
             valRef = lx.object.ValueReference(va.AddEmptyValue())
             valRef.SetObject(commander_query_result)
 
-        if self.queryTimersOn():
-            timeEnd = time.clock()
-            lx.out("QUERY (%s) : %f s." % (self.NAME, (timeEnd - timeStart)))
+        if profile or timers:
+            duration = getTime() - timeStart
+            if profile:
+                commandProfiler.addSample(self.NAME, CallType.QUERY, duration)
+            if timers:
+                lx.out("QUERY (%s) : %f s." % (self.NAME, duration))
 
         return lx.result.OK
 
@@ -801,6 +864,13 @@ class Command(lxu.command.BasicCommand):
     def cmd_NotifyAddClient(self, argument, object):
         """Add notifier clients as needed.
         You should never need to touch this."""
+        # Client is wrapped so cached results can be cleared and
+        # notifier calls can be profiled before the client gets the event.
+        if self.enableCacheOn() or self.queryCacheOn() or commandProfiler.enabled:
+            wrapper = lx.object.Unknown(_NotifierClient(self.NAME, object))
+            self._notifierClients[object.__peekobj__()] = wrapper
+            object = wrapper
+
         for i, tup in enumerate(self._notifier_tuples):
             if self._notifiers[i] is None:
                 self._notifiers[i] = self.not_svc.Spawn (self._notifier_tuples[i][0], self._notifier_tuples[i][1])
@@ -810,12 +880,34 @@ class Command(lxu.command.BasicCommand):
     def cmd_NotifyRemoveClient(self, object):
         """Remove notifier clients as needed.
         You should never need to touch this."""
+        try:
+            object = self._notifierClients.pop(object.__peekobj__())
+        except KeyError:
+            pass
+
         for i, tup in enumerate(self._notifier_tuples):
             if self._notifiers[i] is not None:
                 self._notifiers[i].RemoveClient(object)
                 
     # -------- Private methods
     
+    def _getArgumentValuesKey(self):
+        """ Gets values of all arguments that are set as a key for caching results.
+
+        Returns
+        -------
+        tuple
+        """
+        key = []
+        for arg in self._argumentsList:
+            if not self.dyna_IsSet(arg.index):
+                continue
+            value = self.getArgumentValue(arg.index)
+            if isinstance(value, list):
+                value = tuple(value)
+            key.append((arg.index, value))
+        return tuple(key)
+
     def _resolveDefaultValue(self, defaultValue):
         """ Resolves default value in case default value is a function.
         """
@@ -939,6 +1031,7 @@ class Command(lxu.command.BasicCommand):
         self._name = ""
         self._argumentsList = []
         self._argumentsByName = {}
+        self._notifierClients = {}
         
         self._setupArgumentValuesCache()
         self._setupArguments()
@@ -946,6 +1039,48 @@ class Command(lxu.command.BasicCommand):
         self.init()
 
 
+class _RecordedMessage(Message):
+    """ Message that records what was set on it so it can be set again from cache.
+
+    Each recorded entry is Message method and the arguments it was called with.
+    """
+
+    def set(self, msgTable, msgKey, arguments=[]):
+        Message.set(self, msgTable, msgKey, arguments)
+        self.recorded.append((Message.set, (msgTable, msgKey, arguments)))
+
+    def setCode(self, code):
+        Message.setCode(self, code)
+        self.recorded.append((Message.setCode, (code,)))
+
+    def __init__(self, msg):
+        Message.__init__(self, msg)
+        self.recorded = []
+
+
+class _NotifierClient(lxifc.CommandEvent):
+    """ Passes notifier events to the actual client.
+
+    Cached enable/query results of the command are cleared before the client
+    gets the event so it does not refresh with stale results.
+    """
+
+    def cevt_Event(self, flags):
+        profile = commandProfiler.enabled
+        if profile:
+            timeStart = getTime()
+
+        commandResultCache.invalidateCommand(self._commandName)
+        self._client.Event(flags)
+
+        if profile:
+            commandProfiler.addSample(self._commandName, CallType.NOTIFY, getTime() - timeStart)
+
+    def __init__(self, commandName, client):
+        self._commandName = commandName
+        self._client = lx.object.CommandEvent(client)
+
+
 class FormCommandListClass(lxifc.UIValueHints):
     """Special class for creating Form Command Lists. This is instantiated
     by CommanderClass objects if an FCL argument provided.
@@ -0,0 +1,212 @@
+
+""" Profiling and result caching for command enable and query methods.
+
+    MODO calls enable() and query() of commands every time it refreshes forms.
+    The profiler aggregates how long these calls take per command so
+    the slowest commands can be found. The result cache lets commands that
+    opt in skip evaluating enable/query again until one of their notifiers fires.
+"""
+
+import lx
+
+from .util_time import getTime
+
+
+class CallType(object):
+    ENABLE = 'enable'
+    QUERY = 'query'
+    NOTIFY = 'notify'
+
+
+class CommandCallStats(object):
+    """ Aggregated latency statistics of one type of call to a single command.
+
+    Only a limited number of most recent samples is kept for computing percentiles.
+    """
+
+    SAMPLES_LIMIT = 512
+
+    @property
+    def average(self):
+        """
+        Returns
+        -------
+        float
+        """
+        if self.count == 0:
+            return 0.0
+        return self.total / float(self.count)
+
+    def percentile(self, percent):
+        """ Gets latency percentile computed from most recent samples.
+
+        Parameters
+        ----------
+        percent : float
+            Percentile in 0-100 range.
+
+        Returns
+        -------
+        float
+        """
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        index = int(round((len(samples) - 1) * percent / 100.0))
+        return samples[index]
+
+    def addSample(self, duration):
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+        if len(self._samples) < self.SAMPLES_LIMIT:
+            self._samples.append(duration)
+        else:
+            self._samples[self._nextSample] = duration
+            self._nextSample = (self._nextSample + 1) % self.SAMPLES_LIMIT
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples = []
+        self._nextSample = 0
+
+
+class CommandProfiler(object):
+    """ Aggregates latency of enable, query and notify calls per command.
+
+    Profiler is off by default, commands only measure their calls when it's enabled.
+    """
+
+    SORT_TOTAL = 'total'
+    SORT_COUNT = 'count'
+    SORT_P95 = 'p95'
+    SORT_MAX = 'max'
+
+    def addSample(self, commandName, callType, duration):
+        """ Adds single call duration to the statistics.
+
+        Parameters
+        ----------
+        commandName : str
+
+        callType : CallType
+
+        duration : float
+            Call duration in seconds.
+        """
+        key = (commandName, callType)
+        try:
+            stats = self._stats[key]
+        except KeyError:
+            stats = CommandCallStats()
+            self._stats[key] = stats
+        stats.addSample(duration)
+
+    def getStats(self, commandName, callType):
+        """ Gets statistics for a given command and call type.
+
+        Returns
+        -------
+        CommandCallStats
+
+        Raises
+        ------
+        LookupError
+            When there were no calls profiled for a given command and call type.
+        """
+        try:
+            return self._stats[(commandName, callType)]
+        except KeyError:
+            raise LookupError
+
+    def getReport(self, sortBy=SORT_TOTAL):
+        """ Gets report of all profiled calls.
+
+        Parameters
+        ----------
+        sortBy : str
+            One of SORT_ constants, report is sorted by this value, biggest first.
+
+        Returns
+        -------
+        [str]
+            Report lines.
+        """
+        sortKeys = {self.SORT_TOTAL: lambda entry: entry[1].total,
+                    self.SORT_COUNT: lambda entry: entry[1].count,
+                    self.SORT_P95: lambda entry: entry[1].percentile(95),
+                    self.SORT_MAX: lambda entry: entry[1].max}
+        entries = sorted(self._stats.items(), key=sortKeys.get(sortBy, sortKeys[self.SORT_TOTAL]), reverse=True)
+
+        lines = ['%-40s %-7s %8s %12s %12s %12s %12s' % ('Command', 'Call', 'Count', 'Total ms', 'Avg ms', 'P95 ms', 'Max ms')]
+        for key, stats in entries:
+            commandName, callType = key
+            lines.append('%-40s %-7s %8d %12.3f %12.3f %12.3f %12.3f' % (commandName,
+                                                                         callType,
+                                                                         stats.count,
+                                                                         stats.total * 1000.0,
+                                                                         stats.average * 1000.0,
+                                                                         stats.percentile(95) * 1000.0,
+                                                                         stats.max * 1000.0))
+        return lines
+
+    def outputReport(self, sortBy=SORT_TOTAL):
+        """ Outputs report to the event log.
+        """
+        for line in self.getReport(sortBy):
+            lx.out(line)
+
+    def reset(self):
+        """ Clears all the statistics.
+        """
+        self._stats = {}
+
+    def __init__(self):
+        self.enabled = False
+        self._stats = {}
+
+
+class CommandResultCache(object):
+    """ Stores results of command enable/query calls.
+
+    Results are stored per command name so all instances of a command share them.
+    Key of each result has to include everything the result depends on
+    apart from the scene state, typically the values of command arguments.
+    """
+
+    def get(self, commandName, key):
+        """ Gets cached result.
+
+        Raises
+        ------
+        KeyError
+            When there is no result cached.
+        """
+        return self._results[commandName][key]
+
+    def set(self, commandName, key, result):
+        try:
+            self._results[commandName][key] = result
+        except KeyError:
+            self._results[commandName] = {key: result}
+
+    def invalidateCommand(self, commandName):
+        """ Clears all results cached for a given command.
+        """
+        self._results.pop(commandName, None)
+
+    def invalidateAll(self):
+        """ Clears entire cache.
+        """
+        self._results = {}
+
+    def __init__(self):
+        self._results = {}
+
+
+commandProfiler = CommandProfiler()
+commandResultCache = CommandResultCache()
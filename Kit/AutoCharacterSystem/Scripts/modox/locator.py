@@ -1,5 +1,7 @@
 
 
+import math
+
 import lx
 import modo
 from . import const as c
@@ -17,6 +19,18 @@ class LocatorUtils(object):
 
     TransformType = TransformItemType
 
+    _TRANSFORM_CHANNEL_NAMES = {
+        TransformItemType.POSITION: (c.TransformChannels.PositionX,
+                                     c.TransformChannels.PositionY,
+                                     c.TransformChannels.PositionZ),
+        TransformItemType.ROTATION: (c.TransformChannels.RotationX,
+                                     c.TransformChannels.RotationY,
+                                     c.TransformChannels.RotationZ),
+        TransformItemType.SCALE: (c.TransformChannels.ScaleX,
+                                  c.TransformChannels.ScaleY,
+                                  c.TransformChannels.ScaleZ)
+    }
+
     def hasAnyZeroTransforms(self, modoItem):
         """ Tests whether given item has any zero transforms in the stack.
 
@@ -686,6 +700,187 @@ class LocatorUtils(object):
             raise LookupError
         xfrmItem.channel('order').set(order, None, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
 
+    @classmethod
+    def getZeroTransformItem(cls, modoItem, transformType):
+        """
+        Gets zero transform item of a given type.
+
+        Parameters
+        ----------
+        transformType : str
+            One of TransformType constants (POSITION or ROTATION).
+
+        Returns
+        -------
+        modo.Item, None
+            None is returned when item has no zero transform of given type.
+        """
+        return cls._getZeroTransformOfType(modoItem, transformType)
+
+    @classmethod
+    def getItemsMatrices(cls, modoItems, channelName='worldMatrix', time=None):
+        """
+        Reads evaluated matrix channel from a number of items in one go.
+
+        Parameters
+        ----------
+        modoItems : [modo.Item]
+
+        channelName : str
+            Name of the matrix channel, worldMatrix, wParentMatrix, localMatrix, etc.
+
+        time : float, None
+            Pass None for current time.
+
+        Returns
+        -------
+        [((float, float, float, float),) * 4]
+            Raw 4x4 matrices (rows), in the same order as items passed.
+            These can be passed to modo.Matrix4 constructor if needed.
+        """
+        if not modoItems:
+            return []
+
+        if time is None:
+            time = lx.service.Selection().GetTime()
+
+        scene = lx.object.Scene(modoItems[0].internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(None, time))
+        indexCache = {}
+
+        matrices = []
+        for modoItem in modoItems:
+            rawItem = modoItem.internalItem
+            itemType = rawItem.Type()
+            try:
+                index = indexCache[itemType]
+            except KeyError:
+                index = rawItem.ChannelLookup(channelName)
+                indexCache[itemType] = index
+            matrices.append(lx.object.Matrix(chanRead.ValueObj(rawItem, index)).Get4())
+        return matrices
+
+    @classmethod
+    def getItemsLocalTransformsFromWorld(cls, modoItems, time=None):
+        """
+        Calculates local transforms that put items where their world transforms currently are.
+
+        This is what item.apply command does but it is done for all items in one go
+        with a single evaluated channel read and without running any commands.
+        Local transform is calculated from item's world and parent world matrices
+        so it includes the effect of constraints and any other transform items
+        in the item's transform stack.
+
+        Parameters
+        ----------
+        modoItems : [modo.Item]
+
+        time : float, None
+            Pass None for current time.
+
+        Returns
+        -------
+        [(modo.Vector3, modo.Vector3, str, modo.Vector3)]
+            Local position, local rotation as euler angles in radians,
+            the rotation order the angles are in and local scale.
+            Rotation order is taken from item's primary rotation transform item.
+            Rotation is extracted from local matrix with scale removed
+            so it is correct for scaled items and parents.
+            Results are in the same order as items passed.
+        """
+        if not modoItems:
+            return []
+
+        if time is None:
+            time = lx.service.Selection().GetTime()
+
+        scene = lx.object.Scene(modoItems[0].internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(None, time))
+        indexCache = {}
+
+        result = []
+        for modoItem in modoItems:
+            rawItem = modoItem.internalItem
+            itemType = rawItem.Type()
+            try:
+                worldIndex, parentIndex = indexCache[itemType]
+            except KeyError:
+                worldIndex = rawItem.ChannelLookup('worldMatrix')
+                parentIndex = rawItem.ChannelLookup('wParentMatrix')
+                indexCache[itemType] = (worldIndex, parentIndex)
+
+            worldMtx = modo.Matrix4(chanRead.ValueObj(rawItem, worldIndex))
+            parentWorldMtx = modo.Matrix4(chanRead.ValueObj(rawItem, parentIndex))
+            localMtx = worldMtx * parentWorldMtx.inverted()
+
+            # Rotation rows are scaled by local scale,
+            # they need to be normalised before extracting euler angles.
+            rows = []
+            scale = []
+            for r in range(3):
+                row = localMtx.m[r]
+                length = math.sqrt(row[0] * row[0] + row[1] * row[1] + row[2] * row[2])
+                scale.append(length)
+                if length > 0.0:
+                    rows.append([row[0] / length, row[1] / length, row[2] / length])
+                else:
+                    rows.append([0.0, 0.0, 0.0])
+                    rows[r][r] = 1.0
+
+            order = cls.getPrimaryRotationOrder(modoItem)
+            rot = modo.Matrix3(rows).asEuler(degrees=False, order=order)
+            result.append((modo.Vector3(localMtx.position), modo.Vector3(rot), order, modo.Vector3(scale)))
+        return result
+
+    @classmethod
+    def setTransformItemsValues(cls, xfrmItemsValues, time=0.0, action=lx.symbol.s_ACTIONLAYER_SETUP):
+        """
+        Sets values on a number of transform items in one go.
+
+        All values are written with a single ChannelWrite object
+        which is a lot faster than setting transforms item by item.
+
+        Parameters
+        ----------
+        xfrmItemsValues : [(modo.Item, modo.Vector3)]
+            Transform item (position, rotation or scale one, can be zero transform item too)
+            and the values to set on its X, Y, Z channels.
+            Rotation values are in radians.
+
+        Returns
+        -------
+        int
+            Number of transform items values were set on.
+        """
+        if not xfrmItemsValues:
+            return 0
+
+        if action == lx.symbol.s_ACTIONLAYER_SETUP:
+            time = 0.0
+
+        scene = lx.object.Scene(xfrmItemsValues[0][0].internalItem.Context())
+        chanWrite = lx.object.ChannelWrite(scene.Channels(action, time))
+        indexCache = {}
+
+        count = 0
+        for xfrmItem, values in xfrmItemsValues:
+            rawItem = xfrmItem.internalItem
+            itemType = rawItem.Type()
+            try:
+                indexes = indexCache[itemType]
+            except KeyError:
+                try:
+                    channelNames = cls._TRANSFORM_CHANNEL_NAMES[xfrmItem.type]
+                except KeyError:
+                    continue
+                indexes = [rawItem.ChannelLookup(name) for name in channelNames]
+                indexCache[itemType] = indexes
+
+            for x in range(3):
+                chanWrite.Double(rawItem, indexes[x], values[x])
+            count += 1
+        return count
+
     # -------- Private methods
 
     def _mergeTransformsOfType(self, modoItem, xfrmType, removeZeroXfrmItem=True):
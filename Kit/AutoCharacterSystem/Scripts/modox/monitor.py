@@ -91,6 +91,32 @@ class Monitor(object):
         if missingTicks > 0:
             self._monitor.Increment(missingTicks)
 
+    def addPhaseTime(self, phaseName, duration):
+        """ Reports how long a phase of the monitored process took.
+
+        Monitor only collects these, it is up to the process owner
+        to output them once the process is finished.
+
+        Parameters
+        ----------
+        phaseName : str
+
+        duration : float
+            Phase duration in seconds.
+        """
+        self._phaseTimes.append((phaseName, duration))
+
+    @property
+    def phaseTimes(self):
+        """ Gets phase times reported to the monitor so far.
+
+        Returns
+        -------
+        [(str, float)]
+            Phase name and its duration in seconds, in the order they were reported.
+        """
+        return self._phaseTimes
+
     def release(self):
         """ Releases monitor.
         
@@ -102,6 +128,7 @@ class Monitor(object):
 
     def __init__ (self, ticksCount=None, title=None):
         self._monitor = lx.object.Monitor()
+        self._phaseTimes = []
         if ticksCount is not None and title is not None:
             self.setup(ticksCount, title)
 
@@ -80,37 +80,104 @@ class TimeUtils(object):
         ValueError
             When none of the channels is animated and has any time range.
         """
-        startTime = 1000000.0
-        endTime = -1000000.0
-        animatedChannels = False
-        
+        return cls._getTimeRange(cls.getChannelsTimeRanges(channels, action))
+
+    @classmethod
+    def getChannelsTimeRanges(cls, channels, action=lx.symbol.s_ACTIONLAYER_EDIT):
+        """ Gets start and end time of each channel from a given set.
+
+        All channels are read with a single ChannelRead object
+        and first and last key times are read straight from raw envelopes.
+
+        Parameters
+        ----------
+        channels : list of modo.Channel
+
+        action : lx.symbol.s_ACTIONLAYER_XXX
+            Action for which the time ranges should be read.
+
+        Returns
+        -------
+        list of (float, float), None
+            Start and end time for each channel, in the same order as channels.
+            None is returned for channels that are not animated.
+        """
+        if not channels:
+            return []
+
+        # Get envelopes in the read only format set to a given action.
+        # Can't use TD SDK for that as the envelope is always set
+        # write access on edit action.
+        scene = lx.object.Scene(channels[0].item.internalItem.Context())
+        chanRead = lx.object.ChannelRead(scene.Channels(action, 0.0))
+
+        ranges = []
         for channel in channels:
-            # Get envelope in the read only format set to a given action.
-            # Can't user TD SDK for that as the envelope is always set
-            # write access on edit action.
-            chanRead = channel.item.Context().Channels(action, 0.0)
-            if not chanRead.IsAnimated(channel.item, channel.index):
+            rawItem = channel.item.internalItem
+            index = channel.index
+            if not chanRead.IsAnimated(rawItem, index):
+                ranges.append(None)
                 continue
-            rawEnv = chanRead.Envelope(channel.item, channel.index)
-            env = modo.Envelope(rawEnv)
 
-            animatedChannels = True
-            keyframes = modo.Keyframes(env)
-            keyframes.first()
-            firstTime = keyframes.time
-            keyframes.last()
-            lastTime = keyframes.time
-            
-            if firstTime < startTime:
-                startTime = firstTime
-            
-            if lastTime > endTime:
-                endTime = lastTime
-        
-        if not animatedChannels:
-            raise ValueError
-        
-        return startTime, endTime
+            env = lx.object.Envelope(chanRead.Envelope(rawItem, index))
+            key = lx.object.Keyframe(env.Enumerator())
+            try:
+                key.First()
+                firstTime = key.GetTime()
+                key.Last()
+                lastTime = key.GetTime()
+            except LookupError:
+                ranges.append(None)
+                continue
+            ranges.append((firstTime, lastTime))
+        return ranges
+
+    @classmethod
+    def getActionsTimeRanges(cls, channels, actions):
+        """ Gets start and end time of a set of channels in each of given actions.
+
+        One ChannelRead object is used per action.
+
+        Parameters
+        ----------
+        channels : list of modo.Channel
+
+        actions : list of str
+            Names of actions to get time ranges for.
+
+        Returns
+        -------
+        dict {str : (float, float)}
+            Start and end time for each action name.
+            Actions in which none of the channels is animated are not in the dictionary.
+        """
+        result = {}
+        for action in actions:
+            try:
+                result[action] = cls._getTimeRange(cls.getChannelsTimeRanges(channels, action))
+            except ValueError:
+                continue
+        return result
+
+    @classmethod
+    def getActionsFrameRanges(cls, channels, actions):
+        """ Gets start and end frame of a set of channels in each of given actions.
+
+        Returns
+        -------
+        dict {str : (int, int)}
+            Start and end frame for each action name.
+            Actions in which none of the channels is animated are not in the dictionary.
+
+        See Also
+        --------
+        getActionsTimeRanges()
+        """
+        valueService = lx.service.Value()
+        result = {}
+        for action, timeRange in cls.getActionsTimeRanges(channels, actions).items():
+            result[action] = (valueService.TimeToFrame(timeRange[0]), valueService.TimeToFrame(timeRange[1]))
+        return result
 
     @classmethod
     def getChannelsFrameRange(cls, channels, action=lx.symbol.s_ACTIONLAYER_EDIT):
@@ -143,3 +210,32 @@ class TimeUtils(object):
         endFrame = valueService.TimeToFrame(endTime)
         
         return startFrame, endFrame
+
+    # -------- Private methods
+
+    @classmethod
+    def _getTimeRange(cls, ranges):
+        """ Merges a list of time ranges into a single one.
+
+        Raises
+        ------
+        ValueError
+            When there are no valid ranges in the list.
+        """
+        startTime = 1000000.0
+        endTime = -1000000.0
+        animatedChannels = False
+
+        for timeRange in ranges:
+            if timeRange is None:
+                continue
+            animatedChannels = True
+            if timeRange[0] < startTime:
+                startTime = timeRange[0]
+            if timeRange[1] > endTime:
+                endTime = timeRange[1]
+
+        if not animatedChannels:
+            raise ValueError
+
+        return startTime, endTime
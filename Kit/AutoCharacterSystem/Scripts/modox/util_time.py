@@ -0,0 +1,17 @@
+""" Time measuring utilities.
+"""
+
+import time
+
+
+def getTime():
+    """ Gets current time for measuring time intervals.
+
+    Returns
+    -------
+    float
+    """
+    try:
+        return time.perf_counter()
+    except AttributeError:
+        return time.clock()
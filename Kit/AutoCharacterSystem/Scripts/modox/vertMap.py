@@ -1,8 +1,10 @@
 
 import lx
+import lxifc
 import modo
 
 from . import const as c
+from .util_time import getTime
 
 
 class VertexMapUtils(object):
@@ -79,4 +81,938 @@ class VertexMapUtils(object):
                 if isEmpty:
                     lx.eval('vertMap.deleteByName wght {%s}' % wmapName)
 
-        monitor.tick(tick * 2.0)
+        if monitor:
+            monitor.tick(tick * 2.0)
+
+    @classmethod
+    def transferWeightsBatch(cls,
+                             meshFrom,
+                             meshTo,
+                             wmapsList,
+                             method=c.VertexMapTransferMethod.DISTANCE,
+                             skipEmptyMaps=True,
+                             monitor=None,
+                             ticks=0):
+        """ Transfers weights from the list between two meshes in one go.
+
+        Source weights are read once and only maps that have weights on the source
+        are interpolated. Closest point on the source surface is found once for each
+        target vertex and weights of all the maps are interpolated from the closest
+        triangle vertices. The result is written to target mesh in one mesh edit.
+        Positions are compared in local space of both meshes.
+
+        Raycast method is not batched, it falls back to transferWeights().
+
+        Parameters
+        ----------
+        meshFrom : modo.Item
+
+        meshTo : modo.Item
+
+        wmapsList : [str]
+
+        method : str
+            One of modox.VertexMapTransferMethod constants.
+
+        skipEmptyMaps : bool
+            When True weight maps that would remain empty on target mesh
+            are not added to it and the ones that were already there are removed.
+            When False all the maps from the list are on target mesh after the transfer,
+            including the ones that are empty or missing on source mesh.
+
+        monitor : modox.Monitor
+
+        ticks : float
+            Number of monitor ticks to spend on the transfer operation.
+
+        Returns
+        -------
+        WeightTransferReport
+        """
+        report = WeightTransferReport()
+        timeStart = getTime()
+
+        if method != c.VertexMapTransferMethod.DISTANCE:
+            cls.transferWeights(meshFrom, meshTo, wmapsList, method, skipEmptyMaps, monitor, ticks)
+            report.transferred = list(wmapsList)
+            report.times['transfer'] = getTime() - timeStart
+            # Emptiness is tested with one read instead of a command per map.
+            timeEmpty = getTime()
+            targetMaps = set(cls.getWeightMapNames(meshTo))
+            existing = [wmapName for wmapName in wmapsList if wmapName in targetMaps]
+            pointCount = _getReadOnlyMesh(meshTo.internalItem).PointCount()
+            totals = dict(WeightMatrix(meshTo, range(pointCount), existing).getMapTotals())
+            report.emptyMaps = [wmapName for wmapName in wmapsList if not totals.get(wmapName)]
+            report.times['empty'] = getTime() - timeEmpty
+            report.times['total'] = getTime() - timeStart
+            return report
+
+        if monitor is not None:
+            tick = float(ticks) / 4.0
+
+        # Read source weights once, skip maps that do not exist or have no weights.
+        sourceMaps = set(cls.getWeightMapNames(meshFrom))
+        report.skippedMissing = [wmapName for wmapName in wmapsList if wmapName not in sourceMaps]
+        sourceMesh = _getReadOnlyMesh(meshFrom.internalItem)
+        positions, triangles = _readGeometry(sourceMesh)
+        sourceWeights = WeightMatrix(meshFrom,
+                                     range(len(positions)),
+                                     [wmapName for wmapName in wmapsList if wmapName in sourceMaps])
+        nonEmpty = set([mapName for mapName, total in sourceWeights.getMapTotals() if total > 0.0])
+        report.skippedEmpty = [wmapName for wmapName in sourceWeights.mapNames if wmapName not in nonEmpty]
+        columns = [column for column, mapName in enumerate(sourceWeights.mapNames) if mapName in nonEmpty]
+        report.times['read'] = getTime() - timeStart
+
+        if monitor:
+            monitor.tick(tick)
+
+        # Closest point on source surface for every target vertex.
+        timeStep = getTime()
+        targetMesh = _getReadOnlyMesh(meshTo.internalItem)
+        targetPositions, targetTriangles = _readGeometry(targetMesh, triangles=False)
+        correspondences = []
+        if triangles and columns:
+            grid = _TriangleGrid(positions, triangles)
+            correspondences = [grid.getClosestPoint(position) for position in targetPositions]
+        report.times['correspondence'] = getTime() - timeStep
+
+        if monitor:
+            monitor.tick(tick)
+
+        # Interpolate weights of all maps with the same correspondences.
+        timeStep = getTime()
+        mapNames = sourceWeights.mapNames
+        targetRows = []
+        transferred = set()
+        sourceRows = [sourceWeights.getVertexWeights(vertexIndex) for vertexIndex in range(len(positions))]
+        for vertexIndices, barycentric in correspondences:
+            targetRow = {}
+            for n in range(3):
+                factor = barycentric[n]
+                if factor <= 0.0:
+                    continue
+                sourceRow = sourceRows[vertexIndices[n]]
+                for column in columns:
+                    try:
+                        weight = sourceRow[column] * factor
+                    except KeyError:
+                        continue
+                    try:
+                        targetRow[column] += weight
+                    except KeyError:
+                        targetRow[column] = weight
+            transferred.update(targetRow)
+            targetRows.append(targetRow)
+        report.times['interpolate'] = getTime() - timeStep
+
+        if monitor:
+            monitor.tick(tick)
+
+        # Write all maps in one mesh edit.
+        # Maps that end up empty on target are either removed from it
+        # or cleared and added when they are not on target yet.
+        timeStep = getTime()
+        if skipEmptyMaps:
+            written = [column for column in columns if column in transferred]
+        else:
+            written = columns
+        report.transferred = [mapNames[column] for column in written]
+        withWeights = set([mapNames[column] for column in transferred])
+        report.emptyMaps = [wmapName for wmapName in wmapsList if wmapName not in withWeights]
+
+        if skipEmptyMaps:
+            targetMaps = set(cls.getWeightMapNames(meshTo))
+            report.removed = [wmapName for wmapName in report.emptyMaps
+                              if wmapName in targetMaps and wmapName not in report.transferred]
+            cleared = []
+        else:
+            cleared = [wmapName for wmapName in report.emptyMaps if wmapName not in report.transferred]
+
+        cls._writeTransferredWeights(meshTo,
+                                     [(mapNames[column], column) for column in written],
+                                     targetRows,
+                                     cleared,
+                                     report.removed)
+        report.times['write'] = getTime() - timeStep
+
+        if monitor:
+            monitor.tick(tick)
+
+        report.times['total'] = getTime() - timeStart
+        return report
+
+    @classmethod
+    def getWeightMapNames(cls, meshModoItem):
+        """ Gets names of all weight maps of a mesh.
+
+        Parameters
+        ----------
+        meshModoItem : modo.Item
+
+        Returns
+        -------
+        [str]
+        """
+        mesh = _getReadOnlyMesh(meshModoItem.internalItem)
+        return _getWeightMapNames(lx.object.MeshMap(mesh.MeshMapAccessor()))
+
+    # -------- Private methods
+
+    @classmethod
+    def _writeTransferredWeights(cls, meshModoItem, mapsToWrite, rows, mapsToClear, mapsToRemove):
+        """ Replaces weights of all the vertices in given maps in one mesh edit.
+
+        Maps that are not on the mesh are added.
+
+        Parameters
+        ----------
+        mapsToWrite : [(str, int)]
+            Map names and their column indices in rows.
+
+        rows : [{int: float}]
+            Weights to write for each vertex of the mesh.
+
+        mapsToClear : [str]
+            Maps that should have all their values cleared.
+            The ones that are not on the mesh are added empty.
+
+        mapsToRemove : [str]
+            Maps that should be removed from the mesh.
+        """
+        if not mapsToWrite and not mapsToClear and not mapsToRemove:
+            return
+
+        layerService = lx.service.Layer()
+        layerScan = lx.object.LayerScan(layerService.ScanAllocateItem(meshModoItem.internalItem,
+                                                                      lx.symbol.f_LAYERSCAN_EDIT_VMAPS))
+        if not layerScan.test() or layerScan.Count() == 0:
+            return
+
+        mesh = lx.object.Mesh(layerScan.MeshEdit(0))
+        meshMap = lx.object.MeshMap(mesh.MeshMapAccessor())
+
+        existing = set(_getWeightMapNames(meshMap))
+        for mapName in mapsToRemove:
+            meshMap.SelectByName(lx.symbol.i_VMAP_WEIGHT, mapName)
+            meshMap.Remove()
+
+        clearIds = []
+        for mapName in mapsToClear:
+            if mapName in existing:
+                meshMap.SelectByName(lx.symbol.i_VMAP_WEIGHT, mapName)
+                clearIds.append(meshMap.ID())
+            else:
+                meshMap.New(lx.symbol.i_VMAP_WEIGHT, mapName)
+
+        columnMapIds = []
+        for mapName, column in mapsToWrite:
+            if mapName in existing:
+                meshMap.SelectByName(lx.symbol.i_VMAP_WEIGHT, mapName)
+                clearIds.append(meshMap.ID())
+            else:
+                meshMap.New(lx.symbol.i_VMAP_WEIGHT, mapName)
+            columnMapIds.append((column, meshMap.ID()))
+
+        point = lx.object.Point(mesh.PointAccessor())
+        value = lx.object.storage()
+        value.setType('f')
+        value.setSize(1)
+
+        for vertexIndex in range(mesh.PointCount()):
+            point.SelectByIndex(vertexIndex)
+            # Transferred weights replace the ones that were on the target.
+            for mapId in clearIds:
+                point.ClearMapValue(mapId)
+            if vertexIndex >= len(rows):
+                continue
+            row = rows[vertexIndex]
+            for column, mapId in columnMapIds:
+                try:
+                    weight = row[column]
+                except KeyError:
+                    continue
+                value.set((weight,))
+                point.SetMapValue(mapId, value)
+
+        layerScan.SetMeshChange(0, lx.symbol.f_MESHEDIT_MAP_OTHER)
+        layerScan.Apply()
+
+
+class WeightTransferReport(object):
+    """ Summary of weights transfer between two meshes.
+
+    Attributes
+    ----------
+    transferred : [str]
+        Names of maps that were written to target mesh.
+
+    skippedEmpty : [str]
+        Names of maps that were skipped because they are empty on source mesh.
+
+    skippedMissing : [str]
+        Names of maps that were skipped because they are not on source mesh.
+
+    emptyMaps : [str]
+        Names of maps that have no weights on target mesh after the transfer.
+
+    removed : [str]
+        Names of maps that were removed from target mesh because they ended up empty.
+
+    times : {str: float}
+        Duration of each transfer step in seconds.
+    """
+
+    @property
+    def summary(self):
+        """ Gets report as text lines ready for output to log.
+
+        Returns
+        -------
+        [str]
+        """
+        lines = ['Transferred %d maps, skipped %d empty and %d missing, removed %d empty maps.' % (len(self.transferred),
+                                                                                                  len(self.skippedEmpty),
+                                                                                                  len(self.skippedMissing),
+                                                                                                  len(self.removed))]
+        for step in sorted(self.times, key=self.times.get, reverse=True):
+            lines.append('%s: %f s.' % (step, self.times[step]))
+        return lines
+
+    def __init__(self):
+        self.transferred = []
+        self.skippedEmpty = []
+        self.skippedMissing = []
+        self.emptyMaps = []
+        self.removed = []
+        self.times = {}
+
+
+def _getReadOnlyMesh(rawItem):
+    """ Gets read only mesh of a mesh item.
+
+    Read only mesh is taken from the channel since mesh provider
+    does not give read access in setup mode.
+
+    Returns
+    -------
+    lx.object.Mesh
+    """
+    scene = lx.object.Scene(rawItem.Context())
+    chanRead = lx.object.ChannelRead(scene.Channels(lx.symbol.s_ACTIONLAYER_EDIT, 0.0))
+    return lx.object.Mesh(chanRead.ValueObj(rawItem, rawItem.ChannelLookup(lx.symbol.sICHAN_MESH_MESH)))
+
+
+def _getWeightMapNames(meshMap):
+    visitor = _WeightMapNamesVisitor(meshMap)
+    meshMap.Enumerate(lx.symbol.iMARK_ANY, visitor, 0)
+    return visitor.mapNames
+
+
+def _readGeometry(mesh, triangles=True):
+    """ Reads vertex positions and polygons split into triangle fans.
+
+    Returns
+    -------
+    [(float, float, float)], [(int, int, int)]
+        Triangles are tuples of vertex indices.
+    """
+    point = lx.object.Point(mesh.PointAccessor())
+    positions = []
+    for x in range(mesh.PointCount()):
+        point.SelectByIndex(x)
+        positions.append(tuple(point.Pos()))
+
+    result = []
+    if not triangles:
+        return positions, result
+
+    polygon = lx.object.Polygon(mesh.PolygonAccessor())
+    for x in range(mesh.PolygonCount()):
+        polygon.SelectByIndex(x)
+        indices = []
+        for v in range(polygon.VertexCount()):
+            point.Select(polygon.VertexByIndex(v))
+            indices.append(point.Index())
+        for v in range(1, len(indices) - 1):
+            result.append((indices[0], indices[v], indices[v + 1]))
+    return positions, result
+
+
+class _TriangleGrid(object):
+    """ Uniform grid of triangles for finding closest point on a mesh surface.
+
+    Parameters
+    ----------
+    positions : [(float, float, float)]
+
+    triangles : [(int, int, int)]
+    """
+
+    def getClosestPoint(self, position):
+        """ Gets closest point on the surface.
+
+        Returns
+        -------
+        (int, int, int), (float, float, float)
+            Vertex indices of the closest triangle and barycentric coordinates
+            of the closest point on the triangle.
+        """
+        cellSize = self._cellSize
+        center = self._getCell(position)
+        # All the grid cells are covered after that many rings, even if the point is outside of the grid.
+        maxRing = max([max(abs(center[axis] - self._cellMin[axis]), abs(center[axis] - self._cellMax[axis]))
+                       for axis in range(3)])
+        best = None
+        bestDistance = None
+        visited = set()
+        for ring in range(maxRing + 1):
+            for cell in self._getRingCells(center, ring):
+                try:
+                    cellTriangles = self._cells[cell]
+                except KeyError:
+                    continue
+                for triangleIndex in cellTriangles:
+                    if triangleIndex in visited:
+                        continue
+                    visited.add(triangleIndex)
+                    distance, barycentric = self._getClosestPointOnTriangle(position, self._corners[triangleIndex])
+                    if bestDistance is None or distance < bestDistance:
+                        bestDistance = distance
+                        best = (self._triangles[triangleIndex], barycentric)
+            # Triangles that were not visited yet are further away then the ring.
+            if bestDistance is not None and bestDistance <= (ring * cellSize) ** 2:
+                break
+        return best
+
+    # -------- Private methods
+
+    def _getCell(self, position):
+        cellSize = self._cellSize
+        return (int((position[0] - self._origin[0]) // cellSize),
+                int((position[1] - self._origin[1]) // cellSize),
+                int((position[2] - self._origin[2]) // cellSize))
+
+    def _getRingCells(self, center, ring):
+        if ring == 0:
+            return [center]
+        cx, cy, cz = center
+        cells = []
+        for dx in range(-ring, ring + 1):
+            for dy in range(-ring, ring + 1):
+                if abs(dx) == ring or abs(dy) == ring:
+                    dzRange = range(-ring, ring + 1)
+                else:
+                    dzRange = (-ring, ring)
+                for dz in dzRange:
+                    cells.append((cx + dx, cy + dy, cz + dz))
+        return cells
+
+    def _getClosestPointOnTriangle(self, p, corners):
+        """ Gets squared distance and barycentric coordinates of closest point on a triangle.
+
+        See Real-Time Collision Detection by Christer Ericson, 5.1.5.
+        """
+        a, b, c = corners
+        abx, aby, abz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+        acx, acy, acz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+        apx, apy, apz = p[0] - a[0], p[1] - a[1], p[2] - a[2]
+        d1 = abx * apx + aby * apy + abz * apz
+        d2 = acx * apx + acy * apy + acz * apz
+        if d1 <= 0.0 and d2 <= 0.0:
+            barycentric = (1.0, 0.0, 0.0)
+        else:
+            bpx, bpy, bpz = p[0] - b[0], p[1] - b[1], p[2] - b[2]
+            d3 = abx * bpx + aby * bpy + abz * bpz
+            d4 = acx * bpx + acy * bpy + acz * bpz
+            cpx, cpy, cpz = p[0] - c[0], p[1] - c[1], p[2] - c[2]
+            d5 = abx * cpx + aby * cpy + abz * cpz
+            d6 = acx * cpx + acy * cpy + acz * cpz
+            vc = d1 * d4 - d3 * d2
+            vb = d5 * d2 - d1 * d6
+            va = d3 * d6 - d5 * d4
+            if d3 >= 0.0 and d4 <= d3:
+                barycentric = (0.0, 1.0, 0.0)
+            elif vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0:
+                v = d1 / (d1 - d3)
+                barycentric = (1.0 - v, v, 0.0)
+            elif d6 >= 0.0 and d5 <= d6:
+                barycentric = (0.0, 0.0, 1.0)
+            elif vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0:
+                w = d2 / (d2 - d6)
+                barycentric = (1.0 - w, 0.0, w)
+            elif va <= 0.0 and (d4 - d3) >= 0.0 and (d5 - d6) >= 0.0:
+                w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+                barycentric = (0.0, 1.0 - w, w)
+            else:
+                denom = va + vb + vc
+                if denom == 0.0:
+                    # Degenerate triangle.
+                    barycentric = (1.0, 0.0, 0.0)
+                else:
+                    v = vb / denom
+                    w = vc / denom
+                    barycentric = (1.0 - v - w, v, w)
+
+        u, v, w = barycentric
+        dx = a[0] * u + b[0] * v + c[0] * w - p[0]
+        dy = a[1] * u + b[1] * v + c[1] * w - p[1]
+        dz = a[2] * u + b[2] * v + c[2] * w - p[2]
+        return dx * dx + dy * dy + dz * dz, barycentric
+
+    def __init__(self, positions, triangles):
+        self._triangles = triangles
+        self._corners = [(positions[t[0]], positions[t[1]], positions[t[2]]) for t in triangles]
+
+        mins = [min([p[axis] for p in positions]) for axis in range(3)]
+        maxs = [max([p[axis] for p in positions]) for axis in range(3)]
+        self._origin = mins
+
+        # Cell size is the average triangle size so each triangle covers only a few cells.
+        size = 0.0
+        for corners in self._corners:
+            size += max([max([p[axis] for p in corners]) - min([p[axis] for p in corners]) for axis in range(3)])
+        size /= float(len(triangles))
+        extent = max([maxs[axis] - mins[axis] for axis in range(3)])
+        self._cellSize = max(size, extent / 256.0, 0.000001)
+
+        self._cells = {}
+        for triangleIndex, corners in enumerate(self._corners):
+            cellMin = self._getCell([min([p[axis] for p in corners]) for axis in range(3)])
+            cellMax = self._getCell([max([p[axis] for p in corners]) for axis in range(3)])
+            for x in range(cellMin[0], cellMax[0] + 1):
+                for y in range(cellMin[1], cellMax[1] + 1):
+                    for z in range(cellMin[2], cellMax[2] + 1):
+                        try:
+                            self._cells[(x, y, z)].append(triangleIndex)
+                        except KeyError:
+                            self._cells[(x, y, z)] = [triangleIndex]
+
+        self._cellMin = self._getCell(mins)
+        self._cellMax = self._getCell(maxs)
+
+
+class _WeightMapNamesVisitor(lxifc.Visitor):
+    """ Collects names of all weight maps of a mesh.
+    """
+
+    def vis_Evaluate(self):
+        if self._meshMap.Type() != lx.symbol.i_VMAP_WEIGHT:
+            return
+        name = self._meshMap.Name()
+        if name:
+            self.mapNames.append(name)
+
+    def __init__(self, meshMap):
+        self._meshMap = meshMap
+        self.mapNames = []
+
+
+class WeightMatrix(object):
+    """ Sparse matrix of vertex weights in a number of weight maps of a mesh.
+
+    Weights are read from the mesh in a single pass. Operations are performed
+    on the matrix and only weights that changed are written back to the mesh
+    in a single mesh edit.
+    Each row of the matrix holds weights of one vertex as a dictionary of
+    map (column) index and weight. There is no entry if a vertex has
+    no value in a map.
+
+    Parameters
+    ----------
+    meshModoItem : modo.Item
+        Mesh item to read weights from.
+
+    vertexIndices : [int]
+        Indices of vertices to read and edit weights of.
+
+    mapNames : [str], None
+        Names of weight maps to read, None reads all weight maps of the mesh.
+        Note that normalization only accounts for the maps that were read.
+
+    neighbours : bool
+        When True weights of vertices that share an edge with the edited ones
+        are read as well so weights can be smoothed. Weights of neighbour
+        vertices that are not on the vertexIndices list are never edited.
+
+    Raises
+    ------
+    LookupError
+        When a weight map from the list is not on the mesh.
+    """
+
+    # Weights that differ less then that are considered unchanged when writing back.
+    _EPSILON = 0.000001
+
+    @property
+    def mapNames(self):
+        """ Gets names of weight maps in the order of matrix columns.
+
+        Returns
+        -------
+        [str]
+        """
+        return list(self._mapNames)
+
+    @property
+    def vertexIndices(self):
+        """ Gets indices of edited vertices in the order of matrix rows.
+
+        Returns
+        -------
+        [int]
+        """
+        return self._vertexIndices[:self._editCount]
+
+    def getWeight(self, vertexIndex, mapName):
+        """ Gets weight of a vertex in a given map.
+
+        Returns
+        -------
+        float, None
+            None when vertex has no value in the map.
+
+        Raises
+        ------
+        LookupError
+            When vertex or map is not in the matrix.
+        """
+        try:
+            row = self._rows[self._rowByVertex[vertexIndex]]
+        except KeyError:
+            raise LookupError
+        return row.get(self._getColumn(mapName))
+
+    def getVertexWeights(self, vertexIndex):
+        """ Gets all weights of a vertex.
+
+        Returns
+        -------
+        {int: float}
+            Map column index and weight for maps in which the vertex has a value.
+            This is the matrix row itself, do not modify it.
+
+        Raises
+        ------
+        LookupError
+            When vertex is not in the matrix.
+        """
+        try:
+            return self._rows[self._rowByVertex[vertexIndex]]
+        except KeyError:
+            raise LookupError
+
+    def getMapWeights(self, mapName):
+        """ Gets weights of all edited vertices in a given map.
+
+        Returns
+        -------
+        [float]
+            Weights in the order of vertexIndices. Vertices that have
+            no value in the map have weight of 0.
+        """
+        column = self._getColumn(mapName)
+        return [row.get(column, 0.0) for row in self._rows[:self._editCount]]
+
+    def getMapTotals(self, threshold=0.0):
+        """ Gets sum of weights of all edited vertices in each map.
+
+        Parameters
+        ----------
+        threshold : float
+            Weights below threshold are not added to the sum.
+
+        Returns
+        -------
+        [(str, float)]
+            Names and totals of maps that have at least one weight over
+            the threshold. Maps are in the order in which they were first
+            encountered when going through vertices and maps in matrix order.
+        """
+        totals = {}
+        order = []
+        for row in self._rows[:self._editCount]:
+            for column in sorted(row):
+                weight = row[column]
+                if weight < threshold:
+                    continue
+                try:
+                    totals[column] += weight
+                except KeyError:
+                    totals[column] = weight
+                    order.append(column)
+        return [(self._mapNames[column], totals[column]) for column in order]
+
+    def lockMaps(self, mapNames):
+        """ Locks weight maps, operations never change weights in locked maps.
+        """
+        for mapName in mapNames:
+            self._locked.add(self._getColumn(mapName))
+
+    def unlockMaps(self, mapNames=None):
+        """ Unlocks weight maps, all maps are unlocked when mapNames is None.
+        """
+        if mapNames is None:
+            self._locked = set()
+            return
+        for mapName in mapNames:
+            self._locked.discard(self._getColumn(mapName))
+
+    def setMapWeight(self, mapName, weight, normalize=False):
+        """ Sets the same weight for all edited vertices in a given map.
+
+        Weight is set even if the map is locked.
+
+        Parameters
+        ----------
+        normalize : bool
+            When True weights in other unlocked maps are scaled so
+            weights of each vertex sum up to 1.
+        """
+        column = self._getColumn(mapName)
+        fixed = set(self._locked)
+        fixed.add(column)
+        for row in self._rows[:self._editCount]:
+            row[column] = weight
+            if normalize:
+                self._normalizeRow(row, fixed)
+
+    def normalize(self):
+        """ Scales weights in unlocked maps so weights of each vertex sum up to 1.
+
+        Vertices that have no weights in unlocked maps are left as they are.
+        """
+        for row in self._rows[:self._editCount]:
+            self._normalizeRow(row, self._locked)
+
+    def prune(self, threshold=0.001):
+        """ Removes weights that are below threshold from unlocked maps.
+        """
+        locked = self._locked
+        for row in self._rows[:self._editCount]:
+            for column in [column for column, weight in row.items() if weight < threshold and column not in locked]:
+                del row[column]
+
+    def smooth(self, strength=0.5, iterations=1, normalize=True):
+        """ Blends weights in unlocked maps with the average weights of neighbour vertices.
+
+        Matrix needs to be read with neighbours.
+
+        Parameters
+        ----------
+        strength : float
+            0 leaves weights as they are, 1 replaces them with the average.
+
+        iterations : int
+
+        normalize : bool
+            When True weights are normalized after each iteration.
+
+        Raises
+        ------
+        TypeError
+            When matrix was read without neighbours.
+        """
+        if self._neighbours is None:
+            raise TypeError
+
+        locked = self._locked
+        for x in range(iterations):
+            # Every vertex is smoothed using weights from before the iteration.
+            source = [dict(row) for row in self._rows]
+            for rowIndex in range(self._editCount):
+                neighbours = self._neighbours[rowIndex]
+                if not neighbours:
+                    continue
+                factor = strength / float(len(neighbours))
+
+                row = self._rows[rowIndex]
+                sourceRow = source[rowIndex]
+                columns = set(sourceRow)
+                for neighbour in neighbours:
+                    columns.update(source[neighbour])
+                columns.difference_update(locked)
+
+                for column in columns:
+                    weight = sourceRow.get(column, 0.0)
+                    average = 0.0
+                    for neighbour in neighbours:
+                        average += source[neighbour].get(column, 0.0)
+                    row[column] = weight * (1.0 - strength) + average * factor
+
+                if normalize:
+                    self._normalizeRow(row, locked)
+
+    def write(self):
+        """ Writes weights that changed back to the mesh in a single mesh edit.
+
+        Returns
+        -------
+        int
+            Number of weights that were set or cleared.
+        """
+        epsilon = self._EPSILON
+        changes = []
+        for rowIndex in range(self._editCount):
+            row = self._rows[rowIndex]
+            original = self._original[rowIndex]
+            for column, weight in row.items():
+                previous = original.get(column)
+                if previous is None or abs(previous - weight) > epsilon:
+                    changes.append((self._vertexIndices[rowIndex], column, weight))
+            for column in original:
+                if column not in row:
+                    changes.append((self._vertexIndices[rowIndex], column, None))
+
+        if not changes:
+            return 0
+
+        layerService = lx.service.Layer()
+        layerScan = lx.object.LayerScan(layerService.ScanAllocateItem(self._rawItem, lx.symbol.f_LAYERSCAN_EDIT_VMAPS))
+        if not layerScan.test() or layerScan.Count() == 0:
+            return 0
+
+        mesh = lx.object.Mesh(layerScan.MeshEdit(0))
+        meshMap = lx.object.MeshMap(mesh.MeshMapAccessor())
+        mapIds = []
+        for mapName in self._mapNames:
+            meshMap.SelectByName(lx.symbol.i_VMAP_WEIGHT, mapName)
+            mapIds.append(meshMap.ID())
+
+        point = lx.object.Point(mesh.PointAccessor())
+        value = lx.object.storage()
+        value.setType('f')
+        value.setSize(1)
+
+        currentVertex = None
+        for vertexIndex, column, weight in changes:
+            if vertexIndex != currentVertex:
+                point.SelectByIndex(vertexIndex)
+                currentVertex = vertexIndex
+            if weight is None:
+                point.ClearMapValue(mapIds[column])
+            else:
+                value.set((weight,))
+                point.SetMapValue(mapIds[column], value)
+
+        layerScan.SetMeshChange(0, lx.symbol.f_MESHEDIT_MAP_OTHER)
+        layerScan.Apply()
+
+        self._original = [dict(row) for row in self._rows[:self._editCount]]
+        return len(changes)
+
+    # -------- Private methods
+
+    def _getColumn(self, mapName):
+        try:
+            return self._columnByName[mapName]
+        except KeyError:
+            raise LookupError
+
+    def _normalizeRow(self, row, fixedColumns):
+        fixedTotal = 0.0
+        freeTotal = 0.0
+        for column, weight in row.items():
+            if column in fixedColumns:
+                fixedTotal += weight
+            else:
+                freeTotal += weight
+        if freeTotal <= 0.0:
+            return
+        scale = max(0.0, 1.0 - fixedTotal) / freeTotal
+        for column in row:
+            if column not in fixedColumns:
+                row[column] *= scale
+
+    def _read(self, meshModoItem, vertexIndices, mapNames, neighbours):
+        self._rawItem = meshModoItem.internalItem
+        mesh = _getReadOnlyMesh(self._rawItem)
+        meshMap = lx.object.MeshMap(mesh.MeshMapAccessor())
+
+        if mapNames is None:
+            mapNames = _getWeightMapNames(meshMap)
+
+        mapIds = []
+        for mapName in mapNames:
+            try:
+                meshMap.SelectByName(lx.symbol.i_VMAP_WEIGHT, mapName)
+            except (LookupError, RuntimeError):
+                raise LookupError
+            mapIds.append(meshMap.ID())
+
+        self._mapNames = list(mapNames)
+        self._columnByName = dict([(mapName, column) for column, mapName in enumerate(self._mapNames)])
+
+        point = lx.object.Point(mesh.PointAccessor())
+
+        self._vertexIndices = []
+        self._rowByVertex = {}
+        for vertexIndex in vertexIndices:
+            if vertexIndex in self._rowByVertex:
+                continue
+            self._rowByVertex[vertexIndex] = len(self._vertexIndices)
+            self._vertexIndices.append(vertexIndex)
+        self._editCount = len(self._vertexIndices)
+
+        if neighbours:
+            self._neighbours = self._readNeighbours(mesh, point)
+        else:
+            self._neighbours = None
+
+        value = lx.object.storage()
+        value.setType('f')
+        value.setSize(1)
+        columns = list(enumerate(mapIds))
+
+        self._rows = []
+        for vertexIndex in self._vertexIndices:
+            point.SelectByIndex(vertexIndex)
+            row = {}
+            for column, mapId in columns:
+                if point.MapValue(mapId, value):
+                    row[column] = value.get()[0]
+            self._rows.append(row)
+
+        self._original = [dict(row) for row in self._rows[:self._editCount]]
+
+    def _readNeighbours(self, mesh, point):
+        """ Gets row indices of neighbour vertices for each edited vertex.
+
+        Neighbour vertices that are not edited are added to the end of the vertices list.
+
+        Returns
+        -------
+        [[int]]
+        """
+        polygon = lx.object.Polygon(mesh.PolygonAccessor())
+        neighbourPoint = lx.object.Point(mesh.PointAccessor())
+
+        result = []
+        for rowIndex in range(self._editCount):
+            point.SelectByIndex(self._vertexIndices[rowIndex])
+            pointId = point.ID()
+            neighbourRows = []
+            for x in range(point.PolygonCount()):
+                polygon.Select(point.PolygonByIndex(x))
+                count = polygon.VertexCount()
+                for v in range(count):
+                    if polygon.VertexByIndex(v) != pointId:
+                        continue
+                    # Vertices before and after on the polygon share an edge with this one.
+                    for neighbourId in (polygon.VertexByIndex((v - 1) % count), polygon.VertexByIndex((v + 1) % count)):
+                        neighbourPoint.Select(neighbourId)
+                        neighbourIndex = neighbourPoint.Index()
+                        try:
+                            neighbourRow = self._rowByVertex[neighbourIndex]
+                        except KeyError:
+                            neighbourRow = len(self._vertexIndices)
+                            self._rowByVertex[neighbourIndex] = neighbourRow
+                            self._vertexIndices.append(neighbourIndex)
+                        if neighbourRow not in neighbourRows:
+                            neighbourRows.append(neighbourRow)
+                    break
+            result.append(neighbourRows)
+        return result
+
+    def __init__(self, meshModoItem, vertexIndices, mapNames=None, neighbours=False):
+        self._locked = set()
+        self._read(meshModoItem, vertexIndices, mapNames, neighbours)
@@ -70,26 +70,60 @@ class TransformUtils(object):
         action : lx.symbol.s_ACTIONLAYER_XXX
             Action to store values on.
         """
+        position = None
+        if positionVector is not None:
+            position = positionVector.values
+
+        orientation = None
+        if orientationMat3 is not None:
+            orientation = cls.convertModoMatrix3ToRawMatrix(orientationMat3)
+
+        cls.applyTransforms([(modoItem, position, orientation, scaleVector)], mode=mode, action=action)
+
+    @classmethod
+    def applyTransforms(cls,
+        transforms,
+        mode=lx.symbol.iLOCATOR_LOCAL,
+        action=lx.symbol.s_ACTIONLAYER_SETUP):
+        """ Applies transforms to a number of items in one go.
+
+        All items are set using the same channel read and channel write objects.
+
+        Paramters
+        ---------
+        transforms : [(modo.Item, (float, float, float), raw matrix, (float, float, float))]
+            Each entry is modo item, position, orientation as raw SDK 3x3 matrix
+            (see convertModoMatrix3ToRawMatrix()) and scale.
+            Any of position, orientation and scale can be None to leave that part untouched.
+
+        mode : lx.symbol.iLOCATOR_LOCAL, lx.symbol.iLOCATOR_WORLD
+
+        action : lx.symbol.s_ACTIONLAYER_XXX
+            Action to store values on.
+        """
+        if not transforms:
+            return
+
         scene = modo.Scene().scene
         channelRead = scene.Channels(None, 0.0)
         channelWrite = scene.Channels(action, 0.0)
-    
-        loc = lx.object.Locator(modoItem.internalItem)
 
-        if positionVector is not None:
-            loc.SetPosition(channelRead, channelWrite, positionVector.values, mode, 0)
-        
-        if orientationMat3 is not None:
-            orientation = cls.convertModoMatrix3ToRawMatrix(orientationMat3)
-            loc.SetRotation(channelRead, channelWrite, orientation, mode, 0)
-
-        if scaleVector is not None:
-            scaleM4 = modo.Matrix4()
-            scaleM4.m[0][0] = scaleVector[0]
-            scaleM4.m[1][1] = scaleVector[1]
-            scaleM4.m[2][2] = scaleVector[2]
-            loc.SetScale(channelRead, channelWrite, scaleM4, mode, 0)
-        
+        for modoItem, position, orientation, scaleVector in transforms:
+            loc = lx.object.Locator(modoItem.internalItem)
+
+            if position is not None:
+                loc.SetPosition(channelRead, channelWrite, position, mode, 0)
+
+            if orientation is not None:
+                loc.SetRotation(channelRead, channelWrite, orientation, mode, 0)
+
+            if scaleVector is not None:
+                scaleM4 = modo.Matrix4()
+                scaleM4.m[0][0] = scaleVector[0]
+                scaleM4.m[1][1] = scaleVector[1]
+                scaleM4.m[2][2] = scaleVector[2]
+                loc.SetScale(channelRead, channelWrite, scaleM4, mode, 0)
+
     @classmethod
     def getRotationOrder(cls, rotationItem):
         """ Gets rotation order for rotation transform item.
@@ -75,6 +75,8 @@ from .naming_scheme import NamingScheme
 from .name_op import NameOperator as NamingSchemeOperator
 from .item_feature_op import ItemFeatureOperator as ItemFeatures
 from .item_utils import ItemUtils
+from .rig_index import rigIndex
+from .item_feature_settings import featureIndex
 from .event_handler import EventHandler
 from .guide import Guide
 from .attach_op import AttachOperator as Attachments
@@ -97,6 +99,7 @@ from .resolutions import Resolutions
 from .bake_op import BakeDescription
 from .bake_op import BakeOperator
 from .xfrm_in_mesh import TransformsInMesh
+from .scene_event import SceneEventQueue
 from .util import run
 from .util_select import SelectionUtils
 from .xfrm_link import TransformLink
@@ -138,6 +141,8 @@ from .events.guide import EventGuideApplyInit
 service.events.registerEvent(EventGuideApplyInit)
 from .events.guide import EventGuideApplyItemScan
 service.events.registerEvent(EventGuideApplyItemScan)
+from .events.guide import EventGuideApplyItemScanBatch
+service.events.registerEvent(EventGuideApplyItemScanBatch)
 from .events.guide import EventGuideApplyPre
 service.events.registerEvent(EventGuideApplyPre)
 from .events.guide import EventGuideApplyPost
@@ -244,6 +249,14 @@ from .controller_dyna_space import DynamicSpaceEventHandler
 service.events.registerHandler(DynamicSpaceEventHandler)
 from .rig_clay_op import RigClayEventHandler
 service.events.registerHandler(RigClayEventHandler)
+from .rig_index import RigIndexEventHandler
+service.events.registerHandler(RigIndexEventHandler)
+from .item_feature_settings import ItemFeatureIndexEventHandler
+service.events.registerHandler(ItemFeatureIndexEventHandler)
+from .item_settings import ItemSettingsEventHandler
+service.events.registerHandler(ItemSettingsEventHandler)
+from .controller_if import ControllerIndexEventHandler
+service.events.registerHandler(ControllerIndexEventHandler)
 
 # Contexts
 from .contexts.assembly import ContextAssembly
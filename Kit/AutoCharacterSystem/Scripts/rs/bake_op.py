@@ -17,6 +17,8 @@ from .item_utils import  ItemUtils
 from .deform_stack import DeformStack
 from .component_setup import ComponentSetup
 from .log import log
+from .debug import debug
+from .util import getTime
 
 
 class BakeActionChoice(object):
@@ -33,10 +35,15 @@ class BakeDescription(object):
     ----------
     actorName : str, None
         Set explicit baked actor name or None for using default name.
+
+    actionNames : [str], None
+        When set only actions with these names are baked out of actions
+        picked with the actions choice.
     """
     actions = BakeActionChoice.ALL
     meshes = True
     actorName = None
+    actionNames = None
     unlinkSource = False
 
 
@@ -56,6 +63,27 @@ class BakeOperator(object):
 
     ActionChoice = BakeActionChoice
 
+    @classmethod
+    def getActionHashes(cls, rig, actionNames):
+        """ Gets hashes of animation that rig actor has in given actions.
+
+        Hash is calculated from keys of all actor animation channels
+        so it changes whenever the action animation is edited.
+
+        Parameters
+        ----------
+        rig : Rig
+
+        actionNames : [str]
+
+        Returns
+        -------
+        {str: str}
+            Action name and its hash.
+        """
+        channels = rig.metaRig.getGroup(c.MetaGroupType.ACTOR).allAnimationChannels
+        return cls._getActionHashes(channels, actionNames)
+
     def bake(self, bakeDescription, monitor=None, monitorTicks=0.0):
         """ Bakes a set of actions on the bind skeleton shadow.
         
@@ -85,16 +113,46 @@ class BakeOperator(object):
             self._extractDeformersStack()
 
         setup.state = False
-        self._bakeAnimation(bakeDescription.actions, monitor, bakeTicks)
+        self._bakeAnimation(bakeDescription.actions, bakeDescription.actionNames, monitor, bakeTicks)
 
         if bakeDescription.unlinkSource:
             self._bindSkelShadow.unlinkFromSource()
 
         setup.restore()
 
+    @property
+    def bakeTimes(self):
+        """ Gets time it took to bake each of the actions.
+
+        Returns
+        -------
+        [(str, float)]
+            Action name and bake time in seconds, in the order actions were baked.
+        """
+        return self._bakeTimes
+
+    @property
+    def actionHashes(self):
+        """ Gets hashes of source animation of all baked actions.
+
+        Hashes are calculated the same way as with getActionHashes().
+
+        Returns
+        -------
+        {str: str}
+        """
+        return self._actionHashes
+
     # -------- Private methods
 
-    def _bakeAnimation(self, actionsChoice, monitor=None, monitorTicks=0.0):
+    @classmethod
+    def _getActionHashes(cls, channels, actionNames):
+        hashes = {}
+        for actionName in actionNames:
+            hashes[actionName] = modox.ChannelUtils.getChannelsEnvelopeHash(channels, actionName)
+        return hashes
+
+    def _bakeAnimation(self, actionsChoice, actionNames=None, monitor=None, monitorTicks=0.0):
         # If user chose not to bake actions, just leave early
         if actionsChoice == self.ActionChoice.NONE:
             if monitor is not None:
@@ -113,6 +171,10 @@ class BakeOperator(object):
         else:
             actions = []
 
+        if actionNames is not None:
+            actionNames = set(actionNames)
+            actions = [action for action in actions if action.name in actionNames]
+
         # Bail out if no actions to bake.
         # Remember about ticking monitor.
         if not actions:
@@ -127,13 +189,22 @@ class BakeOperator(object):
                 monitor.tick(monitorTicks)
             return
 
+        # Hashes need to be calculated before source actions get renamed.
+        self._actionHashes = self._getActionHashes(frameRangeChannels, [action.name for action in actions])
+
         if monitor is not None:
             step = monitorTicks / float(len(actions))
 
+        # Frame ranges for all actions are read up front,
+        # before source actions get renamed.
+        frameRanges = TimeUtils.getActionsFrameRanges(frameRangeChannels, [action.name for action in actions])
+        hierarchyRoots = self._bindSkelShadow.hierarchyRootModoItems
+
         for sourceAction in actions:
             if monitor is not None:
                 monitor.tick(step)
 
+            actionStart = getTime()
             targetActionName = sourceAction.name
             sourceAction.name += "_src"
             targetAction = self._targetActor.addAction(targetActionName)
@@ -147,17 +218,25 @@ class BakeOperator(object):
 
             # Bake only 2 frames if no animation is found.
             try:
-                frameStart, frameEnd = TimeUtils.getChannelsFrameRange(frameRangeChannels, sourceAction.name)
-            except LookupError:
-                frameStart = 0
-                frameEnd = 1
-            except ValueError:
+                frameStart, frameEnd = frameRanges[targetActionName]
+            except KeyError:
                 frameStart = 0
                 frameEnd = 1
 
-            for rootModoItem in self._bindSkelShadow.hierarchyRootModoItems:
+            for rootModoItem in hierarchyRoots:
                 lx.eval('item.bake frameS:%d frameE:%d remConstraints:false hierarchy:true item:{%s}' % (frameStart, frameEnd, rootModoItem.id))
 
+            self._bakeTimes.append((targetActionName, getTime() - actionStart))
+
+        self._reportBakeTimes()
+
+    def _reportBakeTimes(self):
+        if not debug.output:
+            return
+        for actionName, bakeTime in self._bakeTimes:
+            log.out('Action %s baked: %f' % (actionName, bakeTime))
+        log.out('Total actions bake: %f' % sum([bakeTime for actionName, bakeTime in self._bakeTimes]))
+
     def _renameSkeletonRoot(self):
         self._bindSkelShadow.skeletonRoot.name = self._bindSkelShadow.rig.name
 
@@ -258,4 +337,6 @@ class BakeOperator(object):
         
         self._bindSkelShadow = bindSkeletonShadow
         self._sourceActor = self._bindSkelShadow.rig.actor
-        self._targetActor = None
\ No newline at end of file
+        self._targetActor = None
+        self._bakeTimes = []
+        self._actionHashes = {}
\ No newline at end of file
@@ -6,6 +6,7 @@ import modox
 
 from .rig import Rig
 from .log import log
+from .debug import debug
 from .items.bind_loc import BindLocatorItem
 from .items.bind_mesh import BindMeshItem
 from .bind_map import BindMap
@@ -177,44 +178,29 @@ class Bind(object):
         wmapsWithDeformers = self._getWeightMapsWithDeformers(deformerModoItems)
         wmapsList = list(wmapsWithDeformers.keys())
 
-        if monitor is not None:
-            steps = len(wmapsList) + 4
-            tick = float(ticks) / float(steps)
-        
-        with modo.Mesh(bindMeshTo.modoItem).geometry as geo:
-            for wmapName in wmapsList:
-                if not geo.vmaps[wmapName]: # This returns empty list if vertex map is not on the item.
-                    geo.vmaps.addWeightMap(wmapName)
-            geo.setMeshEdits()
-        
-        if monitor:
-            monitor.tick(tick * 2.0)
-        
-        # Select mesh from first, then override it with mesh to.
-        # I think this puts the meshTo as active (foreground) mesh and puts
-        # meshFrom as background mesh.
-        # Seems to work correctly with the transfer weights command.
-        bindMeshFrom.modoItem.select(replace=True)
-        bindMeshTo.modoItem.select(replace=True)
-
-        for wmapName in wmapsList:
-            # Select weight map to which data will be transfered.
-            lx.eval('select.vertexMap %s wght replace' % wmapName)
-            lx.eval('vertMap.transfer {%s} weight local %s off true' % (wmapName, method))
-            if monitor:
-                monitor.tick(tick)
+        # Maps that would end up empty are not added so their deformers can be disconnected.
+        report = modox.VertexMapUtils.transferWeightsBatch(bindMeshFrom.modoItem,
+                                                           bindMeshTo.modoItem,
+                                                           wmapsList,
+                                                           method,
+                                                           skipUnusedDeformers,
+                                                           monitor,
+                                                           ticks)
+        if debug.output:
+            for line in report.summary:
+                log.out(line)
 
         # Make sure to set bind mesh as bound
         bindMeshTo.isBound = True
 
         # Optimize unused deformers.
         if skipUnusedDeformers:
-            self.disconnectDeformersWithNoInfluence(bindMeshTo)
+            deformed = modox.DeformedItem(bindMeshTo.modoItem)
+            for wmapName in report.emptyMaps:
+                deformed.disconnectDeformers(wmapsWithDeformers[wmapName])
 
         modox.VertexMapSelection().clear()
 
-        monitor.tick(tick * 2.0)
-
     def copy(self,
              bindMeshFrom,
              bindMeshTo,
@@ -9,7 +9,9 @@ from .items.bind_loc_shadow import BindLocatorShadow
 from .items.bind_loc import BindLocatorItem
 from .bind_skel import BindSkeleton
 from .log import log
+from .debug import debug
 from .util import run
+from .util import getTime
 from .module import Module
 
 
@@ -172,24 +174,29 @@ class BindSkeletonShadow(object):
     
             monitor.tick(tick)
         
+        phaseStart = getTime()
         self._shadowRoot = modo.Scene().addItem('groupLocator', '%s_Skeleton' % self._rig.name)
         self._shadowRoot.channel('visible').set(visible, time=0.0, action=lx.symbol.s_ACTIONLAYER_SETUP)
-        
+        phaseStart = self._reportPhaseTime('Shadow root', phaseStart, monitor)
+
         if monitor is not None:   
             monitor.tick(tick)
 
-        self._buildShadowHierarchy(description)
+        self._buildShadowHierarchy(description, monitor)
+        phaseStart = getTime()
 
         if monitor is not None:   
             monitor.tick(tick)
         
         self._matchShadowSkeletonToSource()
-        
+        phaseStart = self._reportPhaseTime('Match shadow to source', phaseStart, monitor)
+
         if monitor is not None:   
             monitor.tick(tick)
         
         if description.shadowType == self.Type.ANIMATED:
             self._linkShadowTransformsToSource(description.supportStretching)
+            phaseStart = self._reportPhaseTime('Link shadow to source', phaseStart, monitor)
 
         setup.restore()
     
@@ -348,101 +355,161 @@ class BindSkeletonShadow(object):
 
     # -------- Private methods
 
-    def _buildShadowHierarchy(self, description):
+    def _buildShadowHierarchy(self, description, monitor=None):
         """ Builds hierarchy of shadow bind locators.
         
         This is unified hierarchy that should link hierarchies from individual modules.
 
+        Building is done in phases. The parent of every shadow is resolved first in one pass
+        over the bind skeleton, then all the shadows are created in bulk and finally
+        they are parented in hierarchical order.
+
         Parameters
         ----------
         description : BindSkeletonShadowDescription
+
+        monitor : modox.Monitor, None
+            Time of each phase is reported to the monitor if it's passed.
         """
-        self._shadows = []
-        shadowsBySourceIdentifiers = {}
-        
-        bindSkeleton = BindSkeleton(self._rig)
-        bindLocators = bindSkeleton.itemsHierarchy # type : BindLocatorItem
-        shadowsWithExternalParents = []
+        phaseStart = getTime()
 
-        baseModule = self._rig.modules.baseModule
-        rootMotionShadow = None
+        bindSkeleton = BindSkeleton(self._rig)
+        # Skip hidden bind locators. We don't want them to be part of the shadow.
+        bindLocators = [bindloc for bindloc in bindSkeleton.itemsHierarchy
+                        if not bindloc.hidden and description.test(bindloc)]
+
+        # Parents are not needed with stretching since the hierarchy is flat.
+        if not description.supportStretching:
+            parentMap = self._getNonHiddenParentMap(bindLocators)
+        phaseStart = self._reportPhaseTime('Resolve shadow hierarchy', phaseStart, monitor)
+
+        # Create all the shadows.
+        names = [description.getName(bindloc) for bindloc in bindLocators]
+        self._shadows = BindLocatorShadow.newFromBindLocators(bindLocators, names)
+        shadowsBySourceIdentifiers = {}
+        for x, bindloc in enumerate(bindLocators):
+            shadowsBySourceIdentifiers[bindloc.modoItem.id] = self._shadows[x]
+        phaseStart = self._reportPhaseTime('Create shadows', phaseStart, monitor)
 
-        # The first loop creates all shadows and replicates the hierarchy.
-        # It also finds all the shadows that are roots within modules and that will need
-        # to be parented to some other shadow eventually to form a single skeleton hierarchy.
-        for bindloc in bindLocators:
-            # Skip hidden bind locators. We don't want them to be part of the shadow.
-            if bindloc.hidden:
-                continue
-            if not description.test(bindloc):
-                continue
+        # Parenting batches are lists of (shadow, parent modo item) pairs.
+        # Batches are parented one after another and pairs within batch are
+        # in hierarchical order so every parent is in place before its children.
+        parentingBatches = []
 
-            # Create shadow here
-            shadow = BindLocatorShadow.newFromBindLocator(bindloc, description.getName(bindloc))
-            self._shadows.append(shadow)
-            shadowsBySourceIdentifiers[shadow.identifier] = shadow
-
-            # Find root motion if we support stretching.
-            # We will need to parent all shadow bind locators to root motion.
-            if description.supportStretching and Module(bindloc.moduleRootItem) == baseModule:
-                rootMotionShadow = shadow
-
-            if description.supportStretching:
-                # With stretching we just need a flat hierarchy so parent every
-                # joint to the shadow root for now.
-                # If root motion is found we will parent to root motion in the next step.
-                shadow.modoItem.setParent(self._shadowRoot, -1)
-
-            else:
-                # Now we need to parent new shadow to its correct shadow parent.
-                # This only happens if new shadow bind locator has direct parent
-                # (another bind locator).
-                # If it has external parent, from another module we only cache parent
-                # and parenting will be done once all bind locators are processed.
-                parentBindLoc, external = shadow.sourceBindLocator.nonHiddenParentBindLocator
+        if description.supportStretching:
+            # With stretching we just need a flat hierarchy so parent every
+            # joint to the shadow root or to the root motion if one is found.
+            baseModule = self._rig.modules.baseModule
+            rootMotionShadow = None
+            for x, bindloc in enumerate(bindLocators):
+                if Module(bindloc.moduleRootItem) == baseModule:
+                    rootMotionShadow = self._shadows[x]
+
+            batch = []
+            for shadow in self._shadows:
+                if rootMotionShadow is None or shadow == rootMotionShadow:
+                    batch.append((shadow, self._shadowRoot))
+                else:
+                    batch.append((shadow, rootMotionShadow.modoItem))
+            parentingBatches.append(batch)
+        else:
+            # The first batch replicates hierarchies within modules.
+            # Shadows that are roots within modules go to the second batch,
+            # they need to be parented to some other shadow to form a single skeleton hierarchy.
+            moduleBatch = []
+            externalBatch = []
+            for x, bindloc in enumerate(bindLocators):
+                shadow = self._shadows[x]
+                parentBindLoc, external = parentMap[bindloc.modoItem.id]
 
                 # Bind locators with no parent means that shadow needs to be
                 # parented to root.
                 if parentBindLoc is None:
-                    shadow.modoItem.setParent(self._shadowRoot, -1)
+                    moduleBatch.append((shadow, self._shadowRoot))
                     continue
 
-                # Do direct parenting here.
-                # Note since we are iterating bind locators in hierarchical order
-                # this shadow parent shadow should already be on the list.
-                # If it's not then it's a problem.
-                if not external:
-                    try:
-                        parentShadow = shadowsBySourceIdentifiers[parentBindLoc.modoItem.id]
-                    except KeyError:
-                        continue
-                    shadow.modoItem.setParent(parentShadow.modoItem, -1)
-                else:
-                    # Store this shadow for setting up external parent later.
-                    shadowsWithExternalParents.append(shadow)
-
-        if description.supportStretching:
-            # parenting to root motion if one is found.
-            if rootMotionShadow is not None:
-                for shadow in self._shadows:
-                    if shadow == rootMotionShadow:
-                        continue
-                    shadow.modoItem.setParent(rootMotionShadow.modoItem, -1)
-        else:
-            # This is where fragments of hierarchies from separate modules
-            # are connected together into single bind skeleton hierarchy
-            for shadow in shadowsWithExternalParents:
-                parentBindLoc, external = shadow.sourceBindLocator.nonHiddenParentBindLocator
-                if not external:
-                    continue
                 try:
                     parentShadowModoItem = shadowsBySourceIdentifiers[parentBindLoc.modoItem.id].modoItem
                 except KeyError:
-                    parentShadowModoItem = self._shadowRoot
-                shadow.modoItem.setParent(parentShadowModoItem, -1)
+                    parentShadowModoItem = None
+
+                if not external:
+                    # Shadow parent should be on the list. If it's not then it's a problem
+                    # and the shadow is left where it is.
+                    if parentShadowModoItem is not None:
+                        moduleBatch.append((shadow, parentShadowModoItem))
+                else:
+                    if parentShadowModoItem is None:
+                        parentShadowModoItem = self._shadowRoot
+                    externalBatch.append((shadow, parentShadowModoItem))
+
+            parentingBatches.append(moduleBatch)
+            parentingBatches.append(externalBatch)
+
+        for batch in parentingBatches:
+            for shadow, parentModoItem in batch:
+                shadow.modoItem.setParent(parentModoItem, -1)
+
+        if not description.supportStretching and description.shadowType == BindSkeletonShadowType.ANIMATED:
+            self._applyBakedHierarchy(shadowsBySourceIdentifiers)
+
+        self._reportPhaseTime('Parent shadows', phaseStart, monitor)
+
+    def _getNonHiddenParentMap(self, bindLocators):
+        """ Gets first non hidden parent bind locator for each of given bind locators.
+
+        This gives the same results as calling nonHiddenParentBindLocator
+        on every bind locator but each parent bind locator is resolved only once.
+
+        Parameters
+        ----------
+        bindLocators : [BindLocatorItem]
+
+        Returns
+        -------
+        dict {str : (BindLocatorItem or None, bool)}
+            Keys are bind locator modo item ids.
+            Values are parent bind locator (None if there is no parent) and a flag
+            telling whether the parent comes from another module.
+        """
+        resolved = {}
+
+        def getNonHiddenParent(bindloc):
+            ident = bindloc.modoItem.id
+            try:
+                return resolved[ident]
+            except KeyError:
+                pass
+
+            parent, external = bindloc.getParentBindLocator()
+            if parent is not None and parent.hidden:
+                # once we reach first external parent every another parent
+                # is considered external
+                parent, nextExternal = getNonHiddenParent(parent)
+                external = external or nextExternal
+
+            resolved[ident] = (parent, external)
+            return parent, external
 
-            if description.shadowType == BindSkeletonShadowType.ANIMATED:
-                self._applyBakedHierarchy(shadowsBySourceIdentifiers)
+        for bindloc in bindLocators:
+            getNonHiddenParent(bindloc)
+        return resolved
+
+    def _reportPhaseTime(self, phaseName, phaseStart, monitor=None):
+        """ Reports time a phase of building shadow took.
+
+        Returns
+        -------
+        float
+            Current time which can be used as start time of the next phase.
+        """
+        now = getTime()
+        duration = now - phaseStart
+        if monitor is not None:
+            monitor.addPhaseTime(phaseName, duration)
+        if debug.output:
+            log.out('%s: %f' % (phaseName, duration))
+        return now
 
     def _matchShadowSkeletonToSource(self):
         """ Matches all bind skeleton shadows transforms to their bind locator counterparts.
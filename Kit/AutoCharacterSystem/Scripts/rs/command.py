@@ -14,6 +14,7 @@ from modox.command import ArgumentItemsContent
 from modox.command import ArgumentPopupContent
 from modox.command import ArgumentPopupEntry
 from modox.command import ArgumentValuesListType
+from modox.command_profile import commandResultCache
 from .items.root_item import RootItem
 from .items.module_root import ModuleRoot
 from .module_op import ModuleOperator
@@ -24,11 +25,32 @@ from .item import Item
 from .item_feature_op import ItemFeatureOperator
 from .item_feature import ItemFeature
 from .scene import Scene
+from .rig_index import rigIndex
+from .item_feature_settings import featureIndex
+from .module_map import ModuleMap
+from .item_settings import ItemSettings
 from .core import service
 from .log import log
 from . import const as c
 
 
+def _invalidateSceneCaches():
+    """ Drops rig and feature indexes, cached item settings and module graphs.
+
+    They can be out of sync after undo or manual scene edits.
+    """
+    rigIndex.invalidateAll()
+    featureIndex.invalidateAll()
+    ItemSettings.clearCache()
+    ModuleMap.invalidateGraphs()
+
+
+service.sceneListener.registerCallback(_invalidateSceneCaches)
+# Enable/query results are cached until notifiers fire but commands
+# may have no live notifier clients when scene is edited natively.
+service.sceneListener.registerCallback(commandResultCache.invalidateAll)
+
+
 class Command(modox.Command):
     
     def notifiers(self):
@@ -52,17 +74,76 @@ class Command(modox.Command):
         """
         return True
 
+    def dropSceneCaches(self):
+        """ Drops rig and feature indexes, cached item settings and module graphs before command is executed.
+
+        This is True by default. Commands that run very often and do not edit
+        the scene (such as item selection callbacks) can return False
+        to reuse indexes that scene listener keeps valid between commands.
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
+    def dropCommandResults(self):
+        """ Drops cached enable/query results of all commands after command is executed.
+
+        This is True by default since any rs command can change what
+        other commands return. Commands that do not edit the scene or
+        rigging system state in any way (UI only ones) can return False.
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
+    def deferSettingsSave(self):
+        """ Defers saving item settings until command execution is over.
+
+        This is True by default so all the item settings edits done during
+        command execution are saved to items once, at the end of the command.
+        Commands that read settings back from item tags while executing
+        (saving presets, duplicating modules) should return False.
+        Settings can also be written earlier via ItemSettings.flushWriteBack().
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
     def executeStart(self):
+        # Scene listener is paused for the command execution,
+        # indexes are kept in sync with rig events while command runs.
+        if self.dropSceneCaches():
+            _invalidateSceneCaches()
+        service.sceneListener.pause()
+
         if self.stopListeners():
             self._bkpListenToScene = service.listenToScene
             service.listenToScene = False
 
+        if self.deferSettingsSave():
+            ItemSettings.beginWriteBack()
+
         self._setContext(self.setContextPre())
         
     def executeEnd(self):
+        if self.deferSettingsSave():
+            ItemSettings.endWriteBack()
+
         if self.stopListeners():
             service.listenToScene = self._bkpListenToScene
 
+        service.sceneListener.resume()
+
+        # Any rs command can change what enable/query of other commands return.
+        if self.dropCommandResults():
+            commandResultCache.invalidateAll()
+
     def setContextPre(self):
         """ Allows for setting specific context before command execution.
         
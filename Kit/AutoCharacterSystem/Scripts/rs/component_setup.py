@@ -14,6 +14,7 @@ from .log import log as log
 from .debug import debug
 from . import const as c
 from .sys_component import SystemComponent
+from .item_settings import ItemSettings
 
 
 class ComponentSetup(SystemComponent):
@@ -634,6 +635,9 @@ class ComponentSetup(SystemComponent):
         if thumbObject is not None:
             thumbObject.capture()
 
+        # Settings have to be on items before they are saved with preset.
+        ItemSettings.flushWriteBack()
+
         if self.descOnCreateDropScript is not None:
             modox.ItemUtils.setCreateDropScript(self.rootModoItem, self.descOnCreateDropScript)
 
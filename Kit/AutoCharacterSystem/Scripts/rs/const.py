@@ -71,6 +71,7 @@ class EventTypes(object):
     CHANNEL_SET_ADDED = 'chanSetAdded'
     GUIDE_APPLY_INIT = 'gdAppInit'
     GUIDE_APPLY_ITEM_SCAN = 'gdAppItemScan'
+    GUIDE_APPLY_ITEM_SCAN_BATCH = 'gdAppItemScanBatch'
     GUIDE_APPLY_PRE = 'gdAppPre'
     GUIDE_APPLY_DO = 'gdAppDo'
     GUIDE_APPLY_POST = 'gdAppPost'
@@ -4,6 +4,7 @@
 
 
 import time
+from collections import OrderedDict
 
 import lx
 import lxu
@@ -14,6 +15,7 @@ from .core import service as service
 from . import const as c
 from . import context
 from .rig_structure import RigStructure
+from .element_set import ItemsElementSet
 
 
 class ContextOperator(object):
@@ -86,89 +88,8 @@ class ContextOperator(object):
         TypeError
             If newContext argument is incorrect.
         """
-        startTime = time.time()
-
-        currentContextId = self._getContextIdent()
-
-        # Grab new context object
-        try:
-            contextObject = self._getContextObject(newContext)
-        except TypeError:
-            raise TypeError
-
-        switchingToNewContext = contextObject.descIdentifier != currentContextId
-
-        self._leavePreviousContext(contextObject.descIdentifier)
-        
-        leaveTime = time.time()
-
-        if switchingToNewContext:
-            self._setSetupMode(contextObject)
-        
-        setupTime = time.time()
-        
-        try:
-            edit = contextObject.edit
-        except AttributeError:
-            edit = False
-        
-        # For edit context leave only current edit rig visible.
-        if edit:
-            rigsToHide = self._scene.rigs
-            editRig = self._scene.editRig
-            if editRig is not None:
-                for x in range(len(rigsToHide)):
-                    if editRig == rigsToHide[x]:
-                        rigsToHide.pop(x)
-                        break
-                rigsToShow = [editRig]
-            else:
-                rigsToShow = rigsToHide
-                rigsToHide = []
-        else:
-            rigsToHide = []
-            rigsToShow = self._scene.rigs
-        
-        for rig in rigsToHide:
-            rig.visible = c.ItemVisible.NO_CHILDREN
+        self._applyContext(newContext, incremental=True)
 
-        hideRigsTime = time.time()
-        
-        for rig in rigsToShow:
-            self._setHierarchyVisibility(contextObject, rig)
-            self._setElementsVisibility(contextObject, rig)
-            self._setElementsSelectability(contextObject, rig)
-
-        # If new context is different than previous one
-        # we do onSet().
-        # If it's the same context we do onRefresh()
-        if switchingToNewContext:
-            try:
-                contextObject.onSet()
-            except AttributeError:
-                pass
-            try:
-                contextObject.onSubcontextSet()
-            except AttributeError:
-                pass
-        else:
-            try:
-                contextObject.onRefresh()
-            except AttributeError:
-                pass
-
-        self._scene.sceneItem.setTag(self._TAG_CONTEXT, contextObject.descIdentifier)
-    
-        endTime = time.time()
-        if service.debug.output:
-            log.out('Setting context took: %f' % (endTime - startTime))
-            log.startChildEntries()
-            log.out('Leave previous context: %f' % (leaveTime - startTime))
-            log.out('Set setup mode time: %f' % (setupTime - leaveTime))
-            log.out('Hiding rigs time: %f' % (hideRigsTime - setupTime))
-            log.out('Showing rigs time: %f' % (endTime - hideRigsTime))
-            log.stopChildEntries()
-    
     def getSubcontext(self, contextid):
         """ Gets subcontext ident for a given context.
         
@@ -229,7 +150,7 @@ class ContextOperator(object):
             refresh = False
             
         if refresh and self.current == contextid:
-            self.refreshCurrent()
+            self.refreshCurrent(incremental=True)
             
     def resetChanges(self):
         """ Resets all the changes that current context does to scene.
@@ -242,13 +163,40 @@ class ContextOperator(object):
         """
         self._leavePreviousContext()
 
-    def refreshCurrent(self):
+    def refreshCurrent(self, incremental=False):
         """ Reapplies current context.
     
         This is to update rig elements states like visibility, selectability, etc.
+
+        Parameters
+        ----------
+        incremental : bool
+            By default the context is fully reapplied to all element sets
+            which is needed when contents of element sets changed.
+            When True only element sets which state is different from the one
+            applied last time are processed.
         """
-        currentContext = self.current
-        self.current = currentContext
+        self._applyContext(self.current, incremental=incremental)
+
+    @classmethod
+    def invalidateAppliedStates(cls, rigRootId=None):
+        """ Clears memorised element sets states so next context set fully reapplies the context.
+
+        This needs to be called whenever contents of rig element sets may have changed.
+
+        Parameters
+        ----------
+        rigRootId : str, None
+            Id of the root item of the rig to clear state for.
+            Pass None to clear state for all rigs.
+        """
+        if rigRootId is None:
+            cls._appliedStates = {}
+            return
+        try:
+            del cls._appliedStates[rigRootId]
+        except KeyError:
+            pass
 
     @property
     def isolateEditModule(self):
@@ -268,6 +216,120 @@ class ContextOperator(object):
         
     # -------- Private methods
 
+    # Element sets states applied by the last context set, keyed by rig root item id.
+    # Each state is a dictionary with the context identifier, hierarchy visibility state
+    # and element sets visibility/selectability values.
+    _appliedStates = {}
+
+    def _applyContext(self, newContext, incremental):
+        ItemsElementSet.beginHiddenStateCache()
+        self._itemsTouched = OrderedDict()
+        try:
+            self._setCurrent(newContext, incremental)
+        finally:
+            ItemsElementSet.endHiddenStateCache()
+
+    def _setCurrent(self, newContext, incremental):
+        startTime = time.time()
+
+        currentContextId = self._getContextIdent()
+
+        # Grab new context object
+        try:
+            contextObject = self._getContextObject(newContext)
+        except TypeError:
+            raise TypeError
+
+        switchingToNewContext = contextObject.descIdentifier != currentContextId
+
+        try:
+            edit = contextObject.edit
+        except AttributeError:
+            edit = False
+        
+        # For edit context leave only current edit rig visible.
+        if edit:
+            rigsToHide = self._scene.rigs
+            editRig = self._scene.editRig
+            if editRig is not None:
+                for x in range(len(rigsToHide)):
+                    if editRig == rigsToHide[x]:
+                        rigsToHide.pop(x)
+                        break
+                rigsToShow = [editRig]
+            else:
+                rigsToShow = rigsToHide
+                rigsToHide = []
+        else:
+            rigsToHide = []
+            rigsToShow = self._scene.rigs
+
+        # Rigs that were shown with the previous context and have known state
+        # can be updated incrementally, without resetting all their element sets first.
+        incrementalStates = {}
+        if incremental and currentContextId is not None:
+            for rig in rigsToShow:
+                state = self._getValidAppliedState(rig, currentContextId, contextObject)
+                if state is not None:
+                    incrementalStates[rig.rootModoItem.id] = state
+
+        self._leavePreviousContext(contextObject.descIdentifier, skipRigIds=list(incrementalStates.keys()))
+        
+        leaveTime = time.time()
+
+        if switchingToNewContext:
+            self._setSetupMode(contextObject)
+        
+        setupTime = time.time()
+        
+        for rig in rigsToHide:
+            rig.visible = c.ItemVisible.NO_CHILDREN
+
+        hideRigsTime = time.time()
+        
+        for rig in rigsToShow:
+            try:
+                state = incrementalStates[rig.rootModoItem.id]
+            except KeyError:
+                self._setHierarchyVisibility(contextObject, rig)
+                self._setElementsVisibility(contextObject, rig)
+                self._setElementsSelectability(contextObject, rig)
+            else:
+                self._updateRigIncrementally(state, contextObject, rig)
+            self._storeAppliedState(contextObject, rig)
+
+        # If new context is different than previous one
+        # we do onSet().
+        # If it's the same context we do onRefresh()
+        if switchingToNewContext:
+            try:
+                contextObject.onSet()
+            except AttributeError:
+                pass
+            try:
+                contextObject.onSubcontextSet()
+            except AttributeError:
+                pass
+        else:
+            try:
+                contextObject.onRefresh()
+            except AttributeError:
+                pass
+
+        self._scene.sceneItem.setTag(self._TAG_CONTEXT, contextObject.descIdentifier)
+    
+        endTime = time.time()
+        if service.debug.output:
+            log.out('Setting context took: %f' % (endTime - startTime))
+            log.startChildEntries()
+            log.out('Leave previous context: %f' % (leaveTime - startTime))
+            log.out('Set setup mode time: %f' % (setupTime - leaveTime))
+            log.out('Hiding rigs time: %f' % (hideRigsTime - setupTime))
+            log.out('Showing rigs time: %f' % (endTime - hideRigsTime))
+            for elsetId in self._itemsTouched:
+                log.out('%s element set items touched: %d' % (elsetId, self._itemsTouched[elsetId]))
+            log.stopChildEntries()
+
     def _getContextIdent(self, default=None):
         try:
             return self._scene.sceneItem.readTag(self._TAG_CONTEXT)
@@ -291,7 +353,7 @@ class ContextOperator(object):
             raise TypeError
         return contextObject
 
-    def _leavePreviousContext(self, newContextId=None):
+    def _leavePreviousContext(self, newContextId=None, skipRigIds=()):
         currentId = self._getContextIdent()
         if currentId is None:
             return
@@ -299,7 +361,11 @@ class ContextOperator(object):
         currentContext = service.systemComponent.get(context.Context.sysType(), currentId)
         
         for rig in self._scene.rigs:
+            rigRootId = rig.rootModoItem.id
+            if rigRootId in skipRigIds:
+                continue
             self._resetElements(currentContext, rig)
+            self.invalidateAppliedStates(rigRootId)
 
         if newContextId is None or newContextId != currentId:
             try:
@@ -339,7 +405,7 @@ class ContextOperator(object):
                 elset = rig[elsetId]
             except LookupError:
                 continue
-            elset.resetVisible()
+            self._countItemsTouched(elsetId, elset.resetVisible())
 
         resetVisTime = time.time()
         
@@ -353,7 +419,7 @@ class ContextOperator(object):
                 elset = rig[elsetId]
             except LookupError:
                 continue
-            elset.resetSelectable()
+            self._countItemsTouched(elsetId, elset.resetSelectable())
         
         endTime = time.time()
         if service.debug.output:
@@ -407,7 +473,7 @@ class ContextOperator(object):
                 elset = rig[elsetId]
             except LookupError:
                 continue
-            elset.setVisible(value)
+            self._countItemsTouched(elsetId, elset.setVisible(value))
 
     def _setElementsVisibilityForModules(self, elementsVisibility, rig):
         editMod = rig.modules.editModule
@@ -420,7 +486,7 @@ class ContextOperator(object):
                     continue
                 # elset is a list of items, not the element set.
                 elset.setModuleFilter(editMod)
-                elset.setVisible(value)
+                self._countItemsTouched(elsetId, elset.setVisible(value))
         else:
             # If there is no edit module just do the entire rig.
             self._setElementsVisibilityForRig(elementsVisibility, rig)
@@ -440,9 +506,145 @@ class ContextOperator(object):
                 elset = rig[elsetId]
             except LookupError:
                 continue
-            elset.setSelectable(value)
+            self._countItemsTouched(elsetId, elset.setSelectable(value))
+
+    def _getHierarchyState(self, context, rig):
+        """ Gets values that hierarchy visibility set for a rig depends on.
+        """
+        try:
+            vis = context.isHierarchyVisible
+        except AttributeError:
+            vis = True
+        return (vis, self._getModuleFilterId(context, rig))
+
+    def _getModuleFilterId(self, context, rig):
+        """ Gets id of a module that rig elements are filtered by or None if there is no filtering.
+        """
+        if context.isolateEditModule and self.isolateEditModule:
+            editMod = rig.modules.editModule
+            if editMod:
+                return editMod.rootModoItem.id
+        return None
+
+    def _storeAppliedState(self, context, rig):
+        state = {}
+        state['context'] = context.descIdentifier
+        state['hierarchy'] = self._getHierarchyState(context, rig)
+        state['vis'] = dict(context.getElementsVisibilityToProcess())
+        state['sel'] = dict(self._getElementsSelectabilityToProcess(context))
+        ContextOperator._appliedStates[rig.rootModoItem.id] = state
+
+    def _getValidAppliedState(self, rig, currentContextId, newContext):
+        """ Gets state applied to the rig last time if it can still be trusted.
+
+        State can't be used when context was changed in other way than
+        via context operator (undo for example) or when element sets
+        are filtered by a different module with the new context.
+        """
+        try:
+            state = ContextOperator._appliedStates[rig.rootModoItem.id]
+        except KeyError:
+            return None
+        if state['context'] != currentContextId:
+            return None
+        if state['hierarchy'][1] != self._getModuleFilterId(newContext, rig):
+            return None
+        return state
+
+    def _updateRigIncrementally(self, state, context, rig):
+        """ Updates rig to a new context touching only element sets which state changes.
+
+        Element sets can share items (all the sets based on the same meta group do)
+        so when one set from such group changes the entire group is processed
+        the same way as with full context application: reset first, then set.
+        """
+        if state['hierarchy'] != self._getHierarchyState(context, rig):
+            self._setHierarchyVisibility(context, rig)
+
+        filterModule = None
+        if state['hierarchy'][1] is not None:
+            filterModule = rig.modules.editModule
+
+        elementSets = {}
+
+        elementsVis = context.getElementsVisibilityToProcess()
+        dirtyVisGroups = self._getChangedOverlapGroups(state['vis'], elementsVis, rig, elementSets)
+        sendEvents = dirtyVisGroups or state['context'] != context.descIdentifier
+
+        for elsetId in list(state['vis'].keys()):
+            elset = elementSets.get(elsetId)
+            if elset is not None and self._getOverlapGroup(elset) in dirtyVisGroups:
+                self._countItemsTouched(elsetId, elset.resetVisible())
+
+        if sendEvents:
+            service.events.send(c.EventTypes.CONTEXT_RIG_VIS_RESET, context=context, rig=rig)
+
+        elementsSel = self._getElementsSelectabilityToProcess(context)
+        dirtySelGroups = self._getChangedOverlapGroups(state['sel'], elementsSel, rig, elementSets)
+
+        for elsetId in list(state['sel'].keys()):
+            elset = elementSets.get(elsetId)
+            if elset is not None and self._getOverlapGroup(elset) in dirtySelGroups:
+                self._countItemsTouched(elsetId, elset.resetSelectable())
+
+        for elsetId in list(elementsVis.keys()):
+            elset = elementSets.get(elsetId)
+            if elset is None or self._getOverlapGroup(elset) not in dirtyVisGroups:
+                continue
+            if filterModule is not None:
+                elset.setModuleFilter(filterModule)
+            self._countItemsTouched(elsetId, elset.setVisible(elementsVis[elsetId]))
+
+        if sendEvents:
+            service.events.send(c.EventTypes.CONTEXT_RIG_VIS_SET, context=context, rig=rig)
+
+        for elsetId in list(elementsSel.keys()):
+            elset = elementSets.get(elsetId)
+            if elset is None or self._getOverlapGroup(elset) not in dirtySelGroups:
+                continue
+            self._countItemsTouched(elsetId, elset.setSelectable(elementsSel[elsetId]))
+
+    def _getChangedOverlapGroups(self, previousValues, newValues, rig, elementSets):
+        """ Gets overlap groups of element sets which values are different between two states.
+
+        Parameters
+        ----------
+        elementSets : dict
+            Element sets cache, element sets that are looked up are added to it.
+
+        Returns
+        -------
+        set of str
+        """
+        dirtyGroups = set()
+        for elsetId in set(previousValues.keys()) | set(newValues.keys()):
+            if elsetId not in elementSets:
+                try:
+                    elementSets[elsetId] = rig[elsetId]
+                except LookupError:
+                    elementSets[elsetId] = None
+            elset = elementSets[elsetId]
+            if elset is None:
+                continue
+            if previousValues.get(elsetId) != newValues.get(elsetId):
+                dirtyGroups.add(self._getOverlapGroup(elset))
+        return dirtyGroups
+
+    def _getOverlapGroup(self, elset):
+        """ Gets key identifying a group of element sets that can share items.
+        """
+        try:
+            return elset.descMetaGroupIdentifier
+        except AttributeError:
+            return elset.descIdentifier
+
+    def _countItemsTouched(self, elsetId, count):
+        if not count:
+            return
+        self._itemsTouched[elsetId] = self._itemsTouched.get(elsetId, 0) + count
 
     def __init__(self, rsScene):
         if rsScene is None:
             raise TypeError
-        self._scene = rsScene
\ No newline at end of file
+        self._scene = rsScene
+        self._itemsTouched = OrderedDict()
\ No newline at end of file
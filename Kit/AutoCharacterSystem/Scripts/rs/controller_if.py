@@ -7,13 +7,19 @@ import modox
 from modox import TransformToolsUtils
 from modox import SetupMode
 
+from . import const as c
 from .item import Item
 from .item_feature import ItemFeature
+from .module import Module
 from .const import EventTypes as e
 from .core import service
 from .controller_ui import ChannelSet
 from .item_settings import SettingsTag
+from .event_handler import EventHandler
+from .rig_index import rigIndex
+from .component_setups.rig import RigComponentSetup
 from .util import run
+from .util import getTime
 from .log import log
 from .debug import debug
 
@@ -248,17 +254,32 @@ class Controller(ItemFeature):
 
     def onSelected(self):
         """ Call when controller is selected to perform one of predefined actions.
-        
-        Parameters
-        ----------
-        action : OnSelectedAction.XXX
+
+        Controller data that is needed here is taken from the controller index
+        so selecting controllers does not resolve rig items and read item tags each time.
+        Time spent in this method is added to selection latency stats of the index.
         """
-        if self.controlledChannels == self.ControlledChannels.TRANSFORM:
+        timeStart = getTime()
+        self._onSelected()
+        controllerIndex.addSelectionTime(getTime() - timeStart)
+
+    def _onSelected(self):
+        try:
+            record = controllerIndex.getRecord(self.modoItem)
+        except LookupError:
+            record = None
+
+        if record is not None:
+            controlledChannels = record.controlledChannels
+        else:
+            controlledChannels = self.controlledChannels
+
+        if controlledChannels == self.ControlledChannels.TRANSFORM:
             if SetupMode().state and not self.transformToolsEnabledInSetup:
                 pass
             else:
                 TransformToolsUtils().autoFromChannels(self.channelSetChannels)
-        elif self.controlledChannels == self.ControlledChannels.USER:
+        elif controlledChannels == self.ControlledChannels.USER:
             chanSet = self._getChannelSet(autoCreate=True)
             chanSet.open()
             return
@@ -268,37 +289,28 @@ class Controller(ItemFeature):
         # meaning we try to keep opened channel set current to the module that is being edited.
         # Set logErrors to False so we don't get output in log when the command is disabled.
         chanSetId = run('group.current ? type:chanset', logErrors=False)  # This is returning empty string when no current chan set
-        openNewPanel = False
+        if not chanSetId:
+            return
 
-        if chanSetId:
-            groupItem = modox.SceneUtils.findItemFast(chanSetId)
-            try:
-                currentChanSet = ChannelSet(modo.Group(groupItem))
-            except TypeError:
-                # This channel set doesn't belong to the ACS3 rig
-                # so we'll just open new panel for current module.
-                openNewPanel = True
-                currentChanSet = None
-
-            if currentChanSet is not None:
-                # If rig panel is open we need to see to which module it belongs.
-                # If it belongs to different module then the controller that was selected
-                # we are going to switch to different channel set.
-                currentChanSetSourceModoItem = currentChanSet.channelsSourceModoItem
-                try:
-                    rigItem = Item.getFromModoItem(currentChanSetSourceModoItem)
-                except TypeError:
-                    rigItem = None
-
-                if rigItem is not None:
-                    modRoot = rigItem.moduleRootItem
-                    thisModuleRootModoItem = self.item.moduleRootItem
-                    if modRoot != thisModuleRootModoItem:
-                        openNewPanel = True
-
-            # just fire command!
-            if openNewPanel:
-                lx.eval('rs.anim.panel')
+        try:
+            chanSetModuleRootId = controllerIndex.getChannelSetModuleRootId(chanSetId)
+        except LookupError:
+            # This channel set doesn't belong to the ACS3 rig
+            # so we'll just open new panel for current module.
+            lx.eval('rs.anim.panel')
+            return
+
+        # If rig panel is open we need to see to which module it belongs.
+        # If it belongs to different module then the controller that was selected
+        # we are going to switch to different channel set.
+        if record is not None:
+            thisModuleRootId = record.moduleRootId
+        else:
+            thisModuleRoot = self.item.moduleRootItem
+            thisModuleRootId = thisModuleRoot.modoItem.id if thisModuleRoot is not None else None
+
+        if chanSetModuleRootId != thisModuleRootId:
+            lx.eval('rs.anim.panel')
 
     @property
     def transformToolsEnabledInSetup(self):
@@ -389,6 +401,7 @@ class Controller(ItemFeature):
         chanSet = self._getChannelSet(autoCreate=False)
         if chanSet is not None:
             chanSet.selfDelete()
+            controllerIndex.invalidateItem(self.modoItem, reread=True)
 
     def _load(self):
         """ Loads channel states from item settings.
@@ -422,3 +435,454 @@ class Controller(ItemFeature):
 
         for key in deleteKeys:
             del self._channelStates[key]
+
+
+class ControllerRecord(object):
+    """ Cached data of a single controller.
+
+    Parameters
+    ----------
+    indexedItem : IndexedItem
+        Controller item from the rig index.
+
+    rigRootId : str
+        Id of the root item of the rig the controller belongs to.
+    """
+
+    __slots__ = ('modoItem',
+                 'id',
+                 'rigRootId',
+                 'moduleRootId',
+                 'controlledChannels',
+                 'channelSetId')
+
+    # -------- Private methods
+
+    def _readChannelSetId(self):
+        graph = self.modoItem.itemGraph(ChannelSet.CHAN_SET_GRAPH)
+        connectedSets = graph.reverse()
+        if len(connectedSets) > 0:
+            return connectedSets[0].id
+        return None
+
+    def __init__(self, indexedItem, rigRootId):
+        self.modoItem = indexedItem.modoItem
+        self.id = indexedItem.id
+        self.rigRootId = rigRootId
+        self.moduleRootId = indexedItem.moduleRootId
+
+        try:
+            self.controlledChannels = indexedItem.getRigItem().getChannelProperty(Controller.CHAN_CONTROLLED_CHANNELS)
+        except (TypeError, LookupError):
+            self.controlledChannels = None
+
+        self.channelSetId = self._readChannelSetId()
+
+
+class RigControllerTable(object):
+    """ Lookup table of all controllers in a single rig.
+
+    Table is built in one pass over rig modules, controllers are found
+    using module indexes from the rig index.
+
+    Parameters
+    ----------
+    rigRootModoItem : modo.Item
+    """
+
+    def getRecord(self, itemId):
+        """ Gets controller record by controller item id.
+
+        Returns
+        -------
+        ControllerRecord
+
+        Raises
+        ------
+        LookupError
+            When there is no controller with a given id in the rig.
+        """
+        try:
+            return self._records[itemId]
+        except KeyError:
+            raise LookupError
+
+    def updateRecord(self, itemId):
+        """ Rereads data of a controller that is already in the table.
+
+        Returns
+        -------
+        ControllerRecord
+
+        Raises
+        ------
+        LookupError
+            When there is no controller with a given id in the rig.
+        """
+        try:
+            indexedItem = self._indexedItems[itemId]
+        except KeyError:
+            raise LookupError
+        record = ControllerRecord(indexedItem, self.rigRootId)
+        self._records[itemId] = record
+        return record
+
+    @property
+    def records(self):
+        """ Gets records of all controllers in the rig.
+
+        Returns
+        -------
+        [ControllerRecord]
+        """
+        return list(self._records.values())
+
+    @property
+    def itemIds(self):
+        """ Gets ids of all the items of the rig modules, not only controllers.
+
+        Returns
+        -------
+        [str]
+        """
+        return self._itemIds
+
+    # -------- Private methods
+
+    def _build(self, rigRootModoItem):
+        self._records = {}
+        self._indexedItems = {}
+        self._itemIds = []
+
+        graph = rigRootModoItem.itemGraph(c.Graph.MODULES)
+        for moduleRoot in graph.reverse():
+            try:
+                module = Module(moduleRoot)
+            except TypeError:
+                continue
+            moduleIndex = rigIndex.getModuleIndex(module)
+            self._itemIds.extend(moduleIndex.itemIds)
+            for indexedItem in moduleIndex.getItemsWithFeature(c.ItemFeatureType.CONTROLLER):
+                self._indexedItems[indexedItem.id] = indexedItem
+                self._records[indexedItem.id] = ControllerRecord(indexedItem, self.rigRootId)
+
+    def __init__(self, rigRootModoItem):
+        self.rigRootId = rigRootModoItem.id
+        self._build(rigRootModoItem)
+
+
+class ControllerIndex(object):
+    """ Scene wide index of rig controllers.
+
+    Keeps a lookup table per rig mapping item ids to controller data.
+    Tables are built lazily when a controller of a rig is first queried.
+    Item added/removed events drop the table of the rig the item belongs to,
+    item changed events reread a single controller.
+    Changes that don't send any events (undo, native edits) clear the index
+    via scene listener.
+
+    The index also measures time spent in controller selection callback
+    and counts selections that went over the latency budget.
+
+    Attributes
+    ----------
+    selectionLatencyBudget : float
+        Time in seconds controller selection callback should fit in.
+    """
+
+    selectionLatencyBudget = 0.016
+
+    def getRecord(self, modoItem):
+        """ Gets controller record for a given item.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+
+        Returns
+        -------
+        ControllerRecord
+
+        Raises
+        ------
+        LookupError
+            When item is not a controller of any rig.
+        """
+        itemId = modoItem.id
+        try:
+            rigRootId = self._rigByItemId[itemId]
+        except KeyError:
+            rigRootId = self._buildRigTableForItem(modoItem)
+
+        return self._rigs[rigRootId].getRecord(itemId)
+
+    def getChannelSetModuleRootId(self, chanSetId):
+        """ Gets id of the root item of the module which controller owns given channel set.
+
+        Parameters
+        ----------
+        chanSetId : str
+            Id of channel set group item.
+
+        Returns
+        -------
+        str, None
+            None is returned when channel set owner is not in any module.
+
+        Raises
+        ------
+        LookupError
+            When channel set is not linked to any item.
+        """
+        try:
+            ownerId, moduleRootId = self._channelSetOwners[chanSetId]
+        except KeyError:
+            ownerId, moduleRootId = self._resolveChannelSetOwner(chanSetId)
+            self._channelSetOwners[chanSetId] = (ownerId, moduleRootId)
+
+        if ownerId is None:
+            raise LookupError
+        return moduleRootId
+
+    def invalidateItem(self, modoItem, reread=False):
+        """ Invalidates part of the index that the item belongs to.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+
+        reread : bool
+            When True and the item is an indexed controller only its record is reread
+            instead of dropping the whole rig table.
+        """
+        self._channelSetOwners = {}
+        if not self._rigs:
+            return
+
+        itemId = modoItem.id
+        try:
+            rigRootId = self._rigByItemId[itemId]
+        except KeyError:
+            rigRootId = None
+
+        if rigRootId is not None and reread:
+            try:
+                self._rigs[rigRootId].updateRecord(itemId)
+                return
+            except LookupError:
+                pass
+
+        if rigRootId is None:
+            try:
+                rigRootId = RigComponentSetup(modoItem).rootModoItem.id
+            except TypeError:
+                return
+
+        self.invalidateRig(rigRootId)
+
+    def invalidateRig(self, rigRootId):
+        """ Drops controller table of a rig with a given root item id.
+        """
+        self._channelSetOwners = {}
+        try:
+            table = self._rigs.pop(rigRootId)
+        except KeyError:
+            return
+        for itemId in table.itemIds:
+            self._rigByItemId.pop(itemId, None)
+
+    def invalidateAll(self):
+        """ Clears entire index.
+        """
+        self._rigs = {}
+        self._rigByItemId = {}
+        self._channelSetOwners = {}
+
+    def addSelectionTime(self, timeSpent):
+        """ Adds time spent in a single controller selection callback to selection stats.
+        """
+        self._selectionCount += 1
+        self._selectionTotalTime += timeSpent
+        if timeSpent > self._selectionMaxTime:
+            self._selectionMaxTime = timeSpent
+        if timeSpent > self.selectionLatencyBudget:
+            self._selectionOverBudget += 1
+            if debug.output:
+                log.out('Controller selection took %f s, latency budget is %f s.' % (timeSpent, self.selectionLatencyBudget), log.MSG_WARNING)
+
+    @property
+    def selectionStats(self):
+        """ Gets controller selection latency stats.
+
+        Returns
+        -------
+        (int, float, float, int)
+            Number of selections, total and max time spent in selection callback in seconds
+            and number of selections that went over the latency budget.
+        """
+        return (self._selectionCount,
+                self._selectionTotalTime,
+                self._selectionMaxTime,
+                self._selectionOverBudget)
+
+    def resetSelectionStats(self):
+        """ Clears controller selection latency stats.
+        """
+        self._selectionCount = 0
+        self._selectionTotalTime = 0.0
+        self._selectionMaxTime = 0.0
+        self._selectionOverBudget = 0
+
+    def logSelectionStats(self):
+        """ Outputs controller selection latency stats to log.
+        """
+        count, totalTime, maxTime, overBudget = self.selectionStats
+        log.out('-------- Controller Selection Stats')
+        log.startChildEntries()
+        log.out('Selections: %d' % count)
+        if count:
+            log.out('Average time: %f s' % (totalTime / count))
+        log.out('Max time: %f s' % maxTime)
+        log.out('Over %f s budget: %d' % (self.selectionLatencyBudget, overBudget))
+        log.stopChildEntries()
+
+    # -------- Private methods
+
+    def _buildRigTableForItem(self, modoItem):
+        """ Builds controller table for the rig given item belongs to.
+
+        Returns
+        -------
+        str
+            Rig root item id.
+
+        Raises
+        ------
+        LookupError
+            When item does not belong to any rig.
+        """
+        try:
+            rigRootModoItem = RigComponentSetup(modoItem).rootModoItem
+        except TypeError:
+            raise LookupError
+
+        rigRootId = rigRootModoItem.id
+        # Rig table exists but the item is not in it
+        # so it has to be added to the rig without any event being sent.
+        self.invalidateRig(rigRootId)
+
+        table = RigControllerTable(rigRootModoItem)
+        self._rigs[rigRootId] = table
+        for itemId in table.itemIds:
+            self._rigByItemId[itemId] = rigRootId
+        # Item that is not part of any rig module is stored as well
+        # so querying it again doesn't rebuild the table.
+        self._rigByItemId[modoItem.id] = rigRootId
+        return rigRootId
+
+    def _resolveChannelSetOwner(self, chanSetId):
+        """ Finds the item channel set is linked to and its module.
+
+        Returns
+        -------
+        str, str
+            Owner item id and owner module root id, either can be None.
+        """
+        for table in self._rigs.values():
+            for record in table.records:
+                if record.channelSetId == chanSetId:
+                    return record.id, record.moduleRootId
+
+        groupItem = modox.SceneUtils.findItemFast(chanSetId)
+        if groupItem is None:
+            return None, None
+        try:
+            chanSet = ChannelSet(modo.Group(groupItem))
+        except TypeError:
+            return None, None
+
+        ownerModoItem = chanSet.channelsSourceModoItem
+        try:
+            record = self.getRecord(ownerModoItem)
+        except LookupError:
+            record = None
+        if record is not None:
+            return record.id, record.moduleRootId
+
+        try:
+            rigItem = Item.getFromModoItem(ownerModoItem)
+        except TypeError:
+            return ownerModoItem.id, None
+        moduleRoot = rigItem.moduleRootItem
+        if moduleRoot is None:
+            return ownerModoItem.id, None
+        return ownerModoItem.id, moduleRoot.modoItem.id
+
+    def __init__(self):
+        self._rigs = {}
+        self._rigByItemId = {}
+        self._channelSetOwners = {}
+        self.resetSelectionStats()
+
+
+controllerIndex = ControllerIndex()
+service.sceneListener.registerCallback(controllerIndex.invalidateAll)
+
+
+class ControllerIndexEventHandler(EventHandler):
+    """ Keeps controller index in sync with changes to rig items.
+    """
+
+    descIdentifier = 'ctrlindex'
+    descUsername = 'Controller Index'
+
+    @property
+    def eventCallbacks(self):
+        return {e.ITEM_ADDED: self.event_itemAdded,
+                e.ITEM_REMOVED: self.event_itemRemoved,
+                e.ITEM_CHANGED: self.event_itemChanged,
+                e.MODULE_DELETE_PRE: self.event_moduleDeletePre,
+                e.CHANNEL_SET_ADDED: self.event_channelSetAdded
+                }
+
+    def event_itemAdded(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        controllerIndex.invalidateItem(modoItem)
+
+    def event_itemRemoved(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        controllerIndex.invalidateItem(modoItem)
+
+    def event_itemChanged(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        controllerIndex.invalidateItem(modoItem, reread=True)
+
+    def event_moduleDeletePre(self, **kwargs):
+        try:
+            module = kwargs['module']
+        except KeyError:
+            return
+        rigRoot = module.rigRootItem
+        if rigRoot is None:
+            return
+        controllerIndex.invalidateRig(rigRoot.modoItem.id)
+
+    def event_channelSetAdded(self, **kwargs):
+        try:
+            group = kwargs['group']
+        except KeyError:
+            return
+        try:
+            chanSet = ChannelSet(group)
+        except TypeError:
+            return
+        controllerIndex.invalidateItem(chanSet.channelsSourceModoItem, reread=True)
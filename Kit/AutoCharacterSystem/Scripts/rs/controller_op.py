@@ -84,11 +84,7 @@ class ControllerOperator(object):
             This is useful for standardizing the rig - channel sets are freed from the rig
             so they don't get removed when controller feature is removed from rig item.
         """
-        for ctrlModoItem in self._rig.getElements(c.ElementSetType.CONTROLLERS):
-            try:
-                ctrl = ControllerItemFeature(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in ControllerItemFeature.getFromItems(self._rig.getElements(c.ElementSetType.CONTROLLERS)):
             # It's enough to query for channel set and it'll get created
             # when controller is set to channels and the set hasn't been created yet.
             try:
@@ -100,11 +96,7 @@ class ControllerOperator(object):
                 chanSet.freeFromRig()
 
     def createModuleChannelSets(self, module):
-        for ctrlModoItem in module.getElementsFromSet(c.ElementSetType.CONTROLLERS):
-            try:
-                ctrl = ControllerItemFeature(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in ControllerItemFeature.getFromItems(module.getElementsFromSet(c.ElementSetType.CONTROLLERS)):
             # It's enough to query for channel set and it'll get created
             # when controller is set to channels and the set hasn't been created yet.
             try:
@@ -113,19 +105,11 @@ class ControllerOperator(object):
                 pass
 
     def updateModuleChannelSetNames(self, module):
-        for ctrlModoItem in module.getElementsFromSet(c.ElementSetType.CONTROLLERS):
-            try:
-                ctrl = ControllerItemFeature(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in ControllerItemFeature.getFromItems(module.getElementsFromSet(c.ElementSetType.CONTROLLERS)):
             ctrl.updateChannelSetName()
 
     def deleteModuleChannelSets(self, module):
-        for ctrlModoItem in module.getElementsFromSet(c.ElementSetType.CONTROLLERS):
-            try:
-                ctrl = ControllerItemFeature(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in ControllerItemFeature.getFromItems(module.getElementsFromSet(c.ElementSetType.CONTROLLERS)):
             # It's enough to query for channel set and it'll get created
             # when controller is set to channels and the set hasn't been created yet
             try:
@@ -138,11 +122,7 @@ class ControllerOperator(object):
         """
         Updates names for all channel sets belonging to the rig.
         """
-        for ctrlModoItem in self._rig.getElements(c.ElementSetType.CONTROLLERS):
-            try:
-                ctrl = ControllerItemFeature(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in ControllerItemFeature.getFromItems(self._rig.getElements(c.ElementSetType.CONTROLLERS)):
             ctrl.updateChannelSetName()
 
     def purgeChannelsSets(self):
@@ -16,6 +16,7 @@ from . import notifier
 from . import path
 from . import core_buffer
 from . import session_listen
+from . import scene_listen
 from . import debug
 from . import const as c
 from .log import log
@@ -97,6 +98,16 @@ class Service (object):
     def events(self):
         return self._eventsOp
 
+    @property
+    def sceneListener(self):
+        """ Gets scene listener that reports scene changes done outside of rs commands.
+
+        Returns
+        -------
+        SceneListener
+        """
+        return self._sceneListener
+
     def notify(self, notifierIdent, flags):
         """ Sends command notification.
         
@@ -164,4 +175,6 @@ class Service (object):
         self._sessionListener = session_listen.SessionListener()
         self._sessionListener.registerCallback(session_listen.SessionListener.Event.ON_SYSTEM_READY, self._onSystemReady)
 
+        self._sceneListener = scene_listen.SceneListener()
+
 service = Service()
\ No newline at end of file
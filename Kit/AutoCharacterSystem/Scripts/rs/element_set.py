@@ -122,6 +122,22 @@ class ItemsElementSet(ElementSet):
                 filtered.append(el)
         return filtered
 
+    @classmethod
+    def beginHiddenStateCache(cls):
+        """ Starts caching items hidden state.
+
+        Use this when many element sets are going to be processed in one go
+        (such as when switching context) so hidden state of each item is read only once.
+        Call endHiddenStateCache() when done.
+        """
+        cls._hiddenStateCache = {}
+
+    @classmethod
+    def endHiddenStateCache(cls):
+        """ Stops caching items hidden state and clears the cache.
+        """
+        cls._hiddenStateCache = None
+
     def setVisible(self, state):
         """ Sets all set items visibility to a given state.
         
@@ -132,26 +148,29 @@ class ItemsElementSet(ElementSet):
         ----------
         state : const.ItemVisible
             One of four possible visibility values.
-        """
-        for item in self._elementsWithFiltering:
-            visChan = item.channel('visible')
-            if visChan is not None:
 
-                # If state is to show an item and the item is set to hidden in rig properties
-                # we skip this item (we assume it has default vis state and is not visible).
-                if state == c.ItemVisible.YES and Item.isHiddenFast(item):
-                    continue
+        Returns
+        -------
+        int
+            Number of items which visibility was set.
+        """
+        items = self._elementsWithFiltering
 
-                visChan.set(state, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
+        # If state is to show an item and the item is set to hidden in rig properties
+        # we skip this item (we assume it has default vis state and is not visible).
+        if state == c.ItemVisible.YES:
+            hidden = self._getHiddenStates(items)
+            items = [item for item in items if not hidden.get(item.id, False)]
 
-            else:
-                if debug.output:
-                    log.out('%s item has no "visible" channel!' % item.name, log.MSG_ERROR)
+        count = modox.ChannelUtils.setItemsIntChannelValue(items, 'visible', state)
+        if count < len(items) and debug.output:
+            log.out('%d items have no "visible" channel!' % (len(items) - count), log.MSG_ERROR)
+        return count
 
     def resetVisible(self):
         """ Resets all items visibility to default set in descVisibleDefault.
         """
-        self.setVisible(self.descVisibleDefault)
+        return self.setVisible(self.descVisibleDefault)
     
     def setSelectable(self, state):
         """ Sets all set items selectability to a given state.
@@ -163,14 +182,44 @@ class ItemsElementSet(ElementSet):
         ----------
         state : const.TriState
             One of three possible constants.
+
+        Returns
+        -------
+        int
+            Number of items which selectability was set.
         """
-        for item in self._elementsWithFiltering:
-            item.channel('select').set(state, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
+        return modox.ChannelUtils.setItemsIntChannelValue(self._elementsWithFiltering, 'select', state)
 
     def resetSelectable(self):
         """ Resets all items selectability to default set in descSelectableDefault.
         """
-        self.setSelectable(self.descSelectableDefault)
+        return self.setSelectable(self.descSelectableDefault)
+
+    # -------- Private methods
+
+    _hiddenStateCache = None
+
+    def _getHiddenStates(self, modoItems):
+        """ Gets hidden state for given items.
+
+        This is batched equivalent of calling Item.isHiddenFast() on each item.
+
+        Returns
+        -------
+        dict {str : bool}
+            Key is item id.
+        """
+        cache = ItemsElementSet._hiddenStateCache
+        if cache is None:
+            values = modox.ChannelUtils.getItemsIntChannelValues(modoItems, 'rsHidden', action=lx.symbol.s_ACTIONLAYER_EDIT)
+            return dict([(itemId, bool(values[itemId])) for itemId in values])
+
+        itemsToRead = [item for item in modoItems if item.id not in cache]
+        if itemsToRead:
+            values = modox.ChannelUtils.getItemsIntChannelValues(itemsToRead, 'rsHidden', action=lx.symbol.s_ACTIONLAYER_EDIT)
+            for item in itemsToRead:
+                cache[item.id] = bool(values.get(item.id, False))
+        return cache
 
 
 class ElementSetFromMetaGroupItems(ItemsElementSet):
@@ -223,13 +272,20 @@ class ElementSetFromMetaGroupItems(ItemsElementSet):
         Parameters
         ----------
         state : const.TriState
+
+        Returns
+        -------
+        int
+            Always 0 since no items are touched directly.
         """
         self._metaGroup.membersSelectable = state
+        return 0
 
     def resetSelectable(self):
         """ Resets all items selectability to default set in the meta group.
         """
         self._metaGroup.membersSelectable = self._metaGroup.descSelectableDefault
+        return 0
 
     def setRender(self, state):
         self._metaGroup.membersRender = state
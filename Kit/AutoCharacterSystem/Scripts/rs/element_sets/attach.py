@@ -1,6 +1,7 @@
 
 
 import lx
+import modox
 
 from ..element_set import ElementSetFromMetaGroupItems
 from ..const import MetaGroupType
@@ -54,9 +55,8 @@ class ResolutionRigidMeshesElementSet(ElementSetFromMetaGroupItems):
         return filteredElements
 
     def resetVisible(self):
-        for item in super(ResolutionRigidMeshesElementSet, self).elements:
-            item.channel('visible').set(self.descVisibleDefault, time=0.0, key=False,
-                                        action=lx.symbol.s_ACTIONLAYER_SETUP)
+        items = super(ResolutionRigidMeshesElementSet, self).elements
+        return modox.ChannelUtils.setItemsIntChannelValue(items, 'visible', self.descVisibleDefault)
 
 
 class BindProxiesElementSet(ElementSetFromMetaGroupItems):
@@ -104,5 +104,5 @@ class ResolutionBindProxiesElementSet(ElementSetFromMetaGroupItems):
         return filteredElements
 
     def resetVisible(self):
-        for item in super(ResolutionBindProxiesElementSet, self).elements:
-            item.channel('visible').set(self.descVisibleDefault, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
+        items = super(ResolutionBindProxiesElementSet, self).elements
+        return modox.ChannelUtils.setItemsIntChannelValue(items, 'visible', self.descVisibleDefault)
@@ -28,11 +28,9 @@ class ControllersElementSet(ElementSetFromMetaGroupItems):
         """ Override set visible so it edits the in context channel as well.
         """
         val = IN_CONTEXT_VALUE[state]
-        ElementSetFromMetaGroupItems.setVisible(self, state)
-        for item in self._elementsWithFiltering:
-            contextChan = item.channel(CHAN_IN_CONTEXT)
-            if contextChan is not None:
-                contextChan.set(val, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
+        count = ElementSetFromMetaGroupItems.setVisible(self, state)
+        modox.ChannelUtils.setItemsIntChannelValue(self._elementsWithFiltering, CHAN_IN_CONTEXT, val)
+        return count
 
 
 class ControllersFromSetElementSet(ElementSetFromMetaGroupItems):
@@ -52,13 +50,9 @@ class ControllersFromSetElementSet(ElementSetFromMetaGroupItems):
             # In default set all items that have visible in default set
             # set to True should be returned.
             filteredElements = []
-            for modoItem in elements:
-                try:
-                    ctrl = ControllerIF(modoItem)
-                except TypeError:
-                    continue
+            for ctrl in ControllerIF.getFromItems(elements):
                 if ctrl.isVisibleInDefaultSet:
-                    filteredElements.append(modoItem)
+                    filteredElements.append(ctrl.modoItem)
             return filteredElements
         
         filteredElements = []
@@ -72,11 +66,9 @@ class ControllersFromSetElementSet(ElementSetFromMetaGroupItems):
         """ Override set visible so it edits the in context channel as well.
         """
         val = IN_CONTEXT_VALUE[state]
-        ElementSetFromMetaGroupItems.setVisible(self, state)
-        for item in self._elementsWithFiltering:
-            contextChan = item.channel(CHAN_IN_CONTEXT)
-            if contextChan is not None:
-                contextChan.set(val, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
+        count = ElementSetFromMetaGroupItems.setVisible(self, state)
+        modox.ChannelUtils.setItemsIntChannelValue(self._elementsWithFiltering, CHAN_IN_CONTEXT, val)
+        return count
 
     def resetVisible(self):
         """ Override standard reset visible as we need reset to work on ALL element set elements.
@@ -84,9 +76,7 @@ class ControllersFromSetElementSet(ElementSetFromMetaGroupItems):
         Crappy implementation, needs to be reworked at some point.
         """
         contextVal = IN_CONTEXT_VALUE[self.descVisibleDefault]
-        for item in super(ControllersFromSetElementSet, self).elements:
-            visChan = item.channel('visible')
-            if visChan is None:
-                continue
-            visChan.set(self.descVisibleDefault, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
-            item.channel(CHAN_IN_CONTEXT).set(contextVal, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
\ No newline at end of file
+        items = super(ControllersFromSetElementSet, self).elements
+        count = modox.ChannelUtils.setItemsIntChannelValue(items, 'visible', self.descVisibleDefault)
+        modox.ChannelUtils.setItemsIntChannelValue(items, CHAN_IN_CONTEXT, contextVal)
+        return count
\ No newline at end of file
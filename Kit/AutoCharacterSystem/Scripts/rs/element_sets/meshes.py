@@ -1,6 +1,7 @@
 
 
 import lx
+import modox
 
 from ..element_set import ElementSetFromMetaGroupItems
 from ..const import MetaGroupType
@@ -55,5 +56,5 @@ class ResolutionBindMeshesElementSet(ElementSetFromMetaGroupItems):
         return filteredElements
 
     def resetVisible(self):
-        for item in super(ResolutionBindMeshesElementSet, self).elements:
-            item.channel('visible').set(self.descVisibleDefault, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
\ No newline at end of file
+        items = super(ResolutionBindMeshesElementSet, self).elements
+        return modox.ChannelUtils.setItemsIntChannelValue(items, 'visible', self.descVisibleDefault)
\ No newline at end of file
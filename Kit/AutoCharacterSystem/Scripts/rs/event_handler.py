@@ -30,8 +30,8 @@ class EventHandler(object):
         """ Defines what event types are handled by this handler.
 
         This property needs to return a dictionary of event type code/callback pairs.
-        When parsing an event system will query this property to see if an event
-        has a callback assigned and if it has - it'll call it.
+        The property is queried only once, when the handler is registered,
+        so the set of callbacks needs to be static.
         """
         return {}
     
@@ -15,10 +15,25 @@ class ContextOperatorEventHandler(EventHandler):
 
     @property
     def eventCallbacks(self):
-        return {e.EDIT_RIG_CHANGED: self.event_editRigChanged
+        return {e.EDIT_RIG_CHANGED: self.event_editRigChanged,
+                e.ITEM_ADDED: self.event_rigContentsChanged,
+                e.ITEM_REMOVED: self.event_rigContentsChanged,
+                e.ITEM_CHANGED: self.event_rigContentsChanged,
+                e.MODULE_NEW: self.event_rigContentsChanged,
+                e.MODULE_LOAD_POST: self.event_rigContentsChanged,
+                e.MODULE_DELETE_PRE: self.event_rigContentsChanged,
+                e.PIECE_LOAD_POST: self.event_rigContentsChanged,
+                e.RIG_DROPPED: self.event_rigContentsChanged,
+                e.MESH_RES_RENAMED: self.event_rigContentsChanged,
+                e.MESH_RES_REMOVED: self.event_rigContentsChanged
                 }
 
     def event_editRigChanged(self, **kwargs):
         contextOp = ContextOperator(Scene())
         if contextOp.current.edit:
-            contextOp.refreshCurrent()
\ No newline at end of file
+            contextOp.refreshCurrent()
+
+    def event_rigContentsChanged(self, **kwargs):
+        """ Element sets contents may be different now so context needs to be fully reapplied next time.
+        """
+        ContextOperator.invalidateAppliedStates()
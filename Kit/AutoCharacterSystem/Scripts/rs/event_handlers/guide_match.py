@@ -24,7 +24,7 @@ class MatchToGuideEventHandler(EventHandler):
     @property
     def eventCallbacks(self):
         return {e.GUIDE_APPLY_INIT: self.event_guideApplyInit,
-                e.GUIDE_APPLY_ITEM_SCAN: self.event_guideApplyItemScan,
+                e.GUIDE_APPLY_ITEM_SCAN_BATCH: self.event_guideApplyItemScanBatch,
                 e.GUIDE_APPLY_PRE: self.event_guideApplyPre,
                 e.GUIDE_APPLY_DO: self.event_guideApplyDo,
                 e.GUIDE_APPLY_POST: self.event_guideApplyPost}
@@ -42,16 +42,17 @@ class MatchToGuideEventHandler(EventHandler):
         self._ik23bar = IK23Bar()
         self._symmtery = GuideSymmetry()
     
-    def event_guideApplyItemScan(self, **kwargs):
+    def event_guideApplyItemScanBatch(self, **kwargs):
         try:
-            modoItem = kwargs['item']
+            modoItems = kwargs['items']
         except KeyError:
             return
         
-        self._matcher.scanItem(modoItem)
-        self._fbik.scanItem(modoItem)
-        self._ik23bar.scanItem(modoItem)
-        self._symmtery.scanItem(modoItem)
+        for modoItem in modoItems:
+            self._matcher.scanItem(modoItem)
+            self._fbik.scanItem(modoItem)
+            self._ik23bar.scanItem(modoItem)
+            self._symmtery.scanItem(modoItem)
 
     def event_guideApplyPre(self, **kwargs):
         self._fbik.disable()
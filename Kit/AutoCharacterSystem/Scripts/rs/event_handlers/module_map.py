@@ -28,6 +28,7 @@ class ModulesMapEventHandler(EventHandler):
                 e.MODULE_LOAD_POST: self.event_moduleLoadPost,
                 e.PLUG_CONNECTED: self.event_plugConnected,
                 e.PLUG_DISCONNECTED: self.event_plugDisconnected,
+                e.MODULE_DELETE_PRE: self.event_moduleDeletePre,
                 e.RIG_ITEM_SELECTED: self.event_rigItemSelected
                 }
 
@@ -61,6 +62,8 @@ class ModulesMapEventHandler(EventHandler):
         targetModule = Module(socket.moduleRootItem)
 
         modMap = ModuleMap(plug.rigRootItem)
+        # Plug links changed so cached dependencies are not valid anymore.
+        ModuleMap.invalidateGraphs(plug.rigRootItem.modoItem.id)
         modMap.addModuleDependency(module, targetModule)
         modulesList = modMap.map
         self._updateModulesItemListOrder(modulesList)
@@ -82,10 +85,20 @@ class ModulesMapEventHandler(EventHandler):
         targetModule = Module(socket.moduleRootItem)
     
         modMap = ModuleMap(plug.rigRootItem)
+        ModuleMap.invalidateGraphs(plug.rigRootItem.modoItem.id)
         modMap.clearModuleDependency(module, targetModule)
         modulesList = modMap.map
         self._updateModulesItemListOrder(modulesList)
     
+    def event_moduleDeletePre(self, **kwargs):
+        """ Called before a module is deleted.
+        """
+        try:
+            module = kwargs['module']
+        except KeyError:
+            return
+        ModuleMap.invalidateGraphs(module.rigRootItem.modoItem.id)
+
     def event_rigItemSelected(self, **kwargs):
         """ Called when rig item was selected.
         """
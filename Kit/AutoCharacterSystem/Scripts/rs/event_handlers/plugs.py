@@ -21,7 +21,7 @@ class PlugsEventHandler(EventHandler):
     @property
     def eventCallbacks(self):
         return {e.GUIDE_APPLY_INIT: self.event_GuideApplyInit,
-                e.GUIDE_APPLY_ITEM_SCAN: self.event_guideApplyItemScan,
+                e.GUIDE_APPLY_ITEM_SCAN_BATCH: self.event_guideApplyItemScanBatch,
                 e.GUIDE_APPLY_PRE: self.event_guideApplyPre,
                 e.GUIDE_APPLY_POST: self.event_guideApplyPost}
 
@@ -29,25 +29,27 @@ class PlugsEventHandler(EventHandler):
         self._allLinks = []
         self._allPlugs = []
 
-    def event_guideApplyItemScan(self, **kwargs):
+    def event_guideApplyItemScanBatch(self, **kwargs):
         try:
-            modoItem = kwargs['item']
+            byItemType = kwargs['byItemType']
         except KeyError:
             return
 
-        try:
-            plug = PlugItem(modoItem)
-        except TypeError:
-            return
+        # Only plugs are of interest here so there's no need to test every item.
+        for modoItem in byItemType.get(PlugItem.descType, []):
+            try:
+                plug = PlugItem(modoItem)
+            except TypeError:
+                continue
 
-        self._allPlugs.append(plug)
+            self._allPlugs.append(plug)
 
-        try:
-            xfrmLink = TransformLink(modoItem)
-        except TypeError:
-            return
-        
-        self._allLinks.append(xfrmLink)
+            try:
+                xfrmLink = TransformLink(modoItem)
+            except TypeError:
+                continue
+            
+            self._allLinks.append(xfrmLink)
             
     def event_guideApplyPre(self, **kwargs):
         for xfrmLink in self._allLinks:
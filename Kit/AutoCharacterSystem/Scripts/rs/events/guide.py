@@ -40,6 +40,30 @@ class EventGuideApplyItemScan(Event):
     descUsername = 'Guide Apply Item Scan'
 
 
+class EventGuideApplyItemScanBatch(Event):
+    """ Event sent once during guide apply initialisation process with all the items to scan.
+
+    This is batched version of the item scan event.
+    Handlers that subscribe to this event do not get item scan event at all.
+    Items are pregrouped by rig item type and item features so handlers
+    interested in specific items only do not have to test each item themselves.
+
+    Callback
+    --------
+    items : [modo.Item]
+        List of all items that should be scanned/prepared.
+
+    byItemType : dict {str : [modo.Item]}
+        Items grouped by rig item type.
+
+    byFeature : dict {str : [modo.Item]}
+        Items grouped by item feature identifier.
+    """
+
+    descType = c.EventTypes.GUIDE_APPLY_ITEM_SCAN_BATCH
+    descUsername = 'Guide Apply Item Scan Batch'
+
+
 class EventGuideApplyPre(Event):
     """ Event sent after item scanning but before applying guide to rig.
     
@@ -5,8 +5,11 @@
 """
 
 
+from collections import OrderedDict
+
 from .log import log as log
 from .debug import debug
+from .util import getTime
 
 
 class EventsOperator (object):
@@ -48,7 +51,17 @@ class EventsOperator (object):
                 log.out('Even handler with the same id has already been registered!', log.MSG_ERROR)
             return False
         
-        self._eventHandlers[eventHandlerClass.descIdentifier] = eventHandlerClass()
+        eventHandler = eventHandlerClass()
+        self._eventHandlers[eventHandlerClass.descIdentifier] = eventHandler
+
+        # Callbacks are resolved once so sending an event
+        # doesn't need to query each handler's callbacks.
+        callbacks = eventHandler.eventCallbacks
+        self._handlerCallbacks[eventHandlerClass.descIdentifier] = callbacks
+        for eventType in callbacks:
+            self._dispatchTable.setdefault(eventType, []).append(callbacks[eventType])
+            self._subscribers.setdefault(eventType, set()).add(eventHandlerClass.descIdentifier)
+
         if debug.output:
             log.out('Event handler subscribed: %s' % eventHandlerClass.descUsername)
         return True
@@ -77,15 +90,129 @@ class EventsOperator (object):
             Keyword arguments required by the event. This will be different for different events.
             Lookup information in the given event interface.
         """
-        for eventHandler in list(self._eventHandlers.values()):
+        try:
+            callbacks = self._dispatchTable[eventType]
+        except KeyError:
+            return
+
+        if self._statsEnabled:
+            timeStart = getTime()
+
+        for callback in callbacks:
+            callback(**kwargs)
+
+        if self._statsEnabled:
+            self._addStats(eventType, getTime() - timeStart)
+
+    def sendBatch(self, batchEventType, itemEventType, items, **kwargs):
+        """ Sends batch event with a list of items to all handlers.
+
+        Handlers that subscribe to the batch event get one call with the full list of items.
+        Handlers that only subscribe to the per item event get that event sent
+        for each item separately, exactly as if items were sent one by one.
+
+        Parameters
+        ----------
+        batchEventType : str
+            Type of the batch event. Batch callback gets items list
+            as the 'items' argument plus any extra kwargs.
+
+        itemEventType : str
+            Type of the per item event. Per item callback gets a single item
+            as the 'item' argument.
+
+        items : list
+            List of items to send.
+
+        **kwargs : dict
+            Extra keyword arguments for the batch event.
+        """
+        if self._statsEnabled:
+            timeStart = getTime()
+
+        batchSubscribers = self._subscribers.get(batchEventType, set())
+        for callback in self._dispatchTable.get(batchEventType, []):
+            callback(items=items, **kwargs)
+
+        for identifier in self._handlerCallbacks:
+            if identifier in batchSubscribers:
+                continue
             try:
-                callback = eventHandler.eventCallbacks[eventType]
+                callback = self._handlerCallbacks[identifier][itemEventType]
             except KeyError:
                 continue
-            callback(**kwargs)
+            for item in items:
+                callback(item=item)
+
+        if self._statsEnabled:
+            self._addStats(batchEventType, getTime() - timeStart)
+
+    @property
+    def statsEnabled(self):
+        """ Tests whether events statistics are collected.
+
+        Returns
+        -------
+        bool
+        """
+        return self._statsEnabled
+
+    @statsEnabled.setter
+    def statsEnabled(self, state):
+        """ Enables/disables collecting events statistics.
+
+        When enabled, number of times each event type was sent and total
+        time spent in its callbacks is recorded.
+        """
+        self._statsEnabled = state
+
+    @property
+    def stats(self):
+        """ Gets collected events statistics.
+
+        Returns
+        -------
+        dict {str : (int, float)}
+            Key is event type, value is number of times the event was sent
+            and total time spent in all its callbacks in seconds.
+        """
+        stats = {}
+        for eventType in self._stats:
+            stats[eventType] = tuple(self._stats[eventType])
+        return stats
+
+    def resetStats(self):
+        """ Clears all collected events statistics.
+        """
+        self._stats = {}
+
+    def logStats(self):
+        """ Outputs collected events statistics to log, most time consuming events first.
+        """
+        eventTypes = sorted(list(self._stats.keys()), key=lambda eventType: self._stats[eventType][1], reverse=True)
+        log.out('-------- Events Stats')
+        log.startChildEntries()
+        for eventType in eventTypes:
+            count, totalTime = self._stats[eventType]
+            log.out('%s: %d calls, %f s' % (eventType, count, totalTime))
+        log.stopChildEntries()
 
     # -------- Private methods
 
+    def _addStats(self, eventType, timeSpent):
+        try:
+            entry = self._stats[eventType]
+        except KeyError:
+            entry = [0, 0.0]
+            self._stats[eventType] = entry
+        entry[0] += 1
+        entry[1] += timeSpent
+
     def __init__ (self):
         self._events = {}
-        self._eventHandlers = {}
+        self._eventHandlers = OrderedDict()
+        self._handlerCallbacks = OrderedDict()
+        self._dispatchTable = {}
+        self._subscribers = {}
+        self._statsEnabled = False
+        self._stats = {}
@@ -3,6 +3,8 @@
 
 import os
 import shutil
+import json
+import hashlib
 
 import lx
 import modo
@@ -13,8 +15,13 @@ from . import bake_op
 from . import const as c
 from . import sys_component
 from . import notifier
+from .core import service
+from .rig import Rig
+from .bind_skel import BindSkeleton
 from .log import log
+from .debug import debug
 from .util import run
+from .util import getTime
 
 
 class NotifierGameExport(notifier.Notifier):
@@ -109,7 +116,7 @@ class GameExportOperator(object):
         exportPath = rig.rootItem.getChannelProperty(rig.rootItem.PropertyChannels.CHAN_GAME_EXPORT_FOLDER)
         return os.path.isdir(exportPath)
 
-    def do(self, commandClass, monitor=None, ticksCount=0.0):
+    def do(self, commandClass, monitor=None, ticksCount=0.0, actionNames=None):
         """ Perform export process
 
         Parameters
@@ -123,26 +130,61 @@ class GameExportOperator(object):
         ticksCount : float, int
             Number of ticks available for the entire export process.
             Monitor will be increased by this number of ticks.
+
+        actionNames : [str], None
+            When set only actions with these names are baked and exported
+            out of actions that the command exports.
         """
         cmd = commandClass(self._rig)
 
         bindSkelTicks = ticksCount * 0.45
         bakeTicks = ticksCount * 0.45
 
+        self._phaseTimes = []
+        self._bakeTimes = []
+
+        phaseStart = getTime()
         self._preExportCommon()
         cmd.preProcess()
         self._buildBindSkeletonShadow(monitor, bindSkelTicks)
-        self._bake(cmd, monitor, bakeTicks)
+        phaseStart = self._addPhaseTime('shadow', phaseStart)
+
+        self._bake(cmd, monitor, bakeTicks, actionNames)
+        self._bakeTimes = self._bakeOp.bakeTimes
+        phaseStart = self._addPhaseTime('bake', phaseStart)
 
         cmd.postProcess(self._bindSkelShadow)
         cmd.setSelection(self._bindSkelShadow)
         cmd.save()
+        self._addPhaseTime('save', phaseStart)
 
         self._postExportCommon()
 
         if monitor is not None:
             monitor.progress = ticksCount
 
+    @property
+    def phaseTimes(self):
+        """ Gets time each of the phases of the last export took.
+
+        Returns
+        -------
+        [(str, float)]
+            Phase name and its time in seconds.
+        """
+        return self._phaseTimes
+
+    @property
+    def bakeTimes(self):
+        """ Gets bake time of each action baked during the last export.
+
+        Returns
+        -------
+        [(str, float)]
+            Action name and its bake time in seconds.
+        """
+        return self._bakeTimes
+
     # -------- Private methods
 
     def _export(self, monitor=None):
@@ -164,6 +206,13 @@ class GameExportOperator(object):
         # if I leave preset selected here.
         run('game.sceneSettings fbxPreset:(none)')
 
+    def _addPhaseTime(self, phaseName, phaseStart):
+        phaseEnd = getTime()
+        self._phaseTimes.append((phaseName, phaseEnd - phaseStart))
+        if debug.output:
+            log.out('%s export %s: %f' % (self._rig.name, phaseName, phaseEnd - phaseStart))
+        return phaseEnd
+
     def _buildBindSkeletonShadow(self, monitor=None, availableTicks=1):
         shadowDesc = bind_skel_shadow.BakeShadowDescription()
         shadowDesc.supportStretching = self._rig.rootItem.settings.get(self._rig.rootItem.SETTING_STRETCH, False)
@@ -173,18 +222,474 @@ class GameExportOperator(object):
                                    monitor=monitor,
                                    availableTicks=availableTicks)
 
-    def _bake(self, cmd, monitor=None, availableTicks=1):
+    def _bake(self, cmd, monitor=None, availableTicks=1, actionNames=None):
         bakeDesc = bake_op.BakeDescription()
         bakeDesc.actions = cmd.exportActions
         bakeDesc.meshes = cmd.exportMeshes
         bakeDesc.actorName = self._rig.name + "_baked"
         bakeDesc.unlinkSource = True
+        bakeDesc.actionNames = actionNames
 
-        self._bake = bake_op.BakeOperator(self._bindSkelShadow)
-        self._bake.bake(bakeDesc, monitor=monitor, monitorTicks=availableTicks)
+        self._bakeOp = bake_op.BakeOperator(self._bindSkelShadow)
+        self._bakeOp.bake(bakeDesc, monitor=monitor, monitorTicks=availableTicks)
 
     def __init__(self, rig):
         self._rig = rig
+        self._bakeOp = None
+        self._phaseTimes = []
+        self._bakeTimes = []
+
+
+class GameExportQueueEntry(object):
+    """ Single rig export in game export queue.
+
+    Parameters
+    ----------
+    rigIdent : str
+        Identifier of the rig root item.
+
+    commandId : str
+        One of GameExportCommandId constants. Command is taken from
+        the game export set that is chosen on the rig.
+
+    actionNames : [str], None
+        Names of actions to export, None exports all actions the command exports.
+    """
+
+    @property
+    def rigIdent(self):
+        return self._rigIdent
+
+    @property
+    def commandId(self):
+        return self._commandId
+
+    @property
+    def actionNames(self):
+        return self._actionNames
+
+    def serialize(self):
+        """ Gets entry as dictionary that can be saved to json.
+
+        Returns
+        -------
+        dict
+        """
+        return {'rig': self._rigIdent,
+                'command': self._commandId,
+                'actions': self._actionNames}
+
+    @classmethod
+    def newFromSerialized(cls, data):
+        """ Creates new entry from a dictionary returned by serialize().
+
+        Raises
+        ------
+        TypeError
+            When data is not a valid queue entry.
+        """
+        try:
+            return cls(data['rig'], data['command'], data.get('actions'))
+        except (KeyError, TypeError, AttributeError):
+            raise TypeError
+
+    def __init__(self, rigIdent, commandId, actionNames=None):
+        self._rigIdent = rigIdent
+        self._commandId = commandId
+        if actionNames is not None:
+            actionNames = list(actionNames)
+        self._actionNames = actionNames
+
+
+class GameExportQueue(object):
+    """ Exports a number of rigs in one go.
+
+    Queue can be saved to and loaded from a json file so the same
+    batch export can be repeated on a scene later.
+
+    Each entry is exported by its own command that is undone right after export
+    so every entry is exported from the scene in its original state.
+
+    Each rig's bind skeleton shadow is built once for all the actions
+    that are exported with the rig. When a command saves each action
+    to its own fbx file actions that have not changed since previous export
+    are not baked nor saved again. Changes are detected by comparing
+    hash of action animation with the hash stored in the export manifest.
+    Action is exported again anyway when its fbx file is missing or when
+    rig hash changed. Rig hash covers fbx presets used by the command,
+    bind skeleton hierarchy and its rest pose.
+
+    Export manifest is a json file in rig's game export folder.
+    It keeps per rig and per action export timings and action hashes.
+    """
+
+    MANIFEST_FILENAME = 'rs_game_export.json'
+    ENTRY_COMMAND = 'rs.rig.gameExportQueueEntry'
+
+    _running = None
+
+    @classmethod
+    def exportRunningQueueEntry(cls, index):
+        """ Exports single entry of the queue that is currently being exported.
+
+        This is called from the queue entry export command.
+
+        Parameters
+        ----------
+        index : int
+            Index of the entry in the queue.
+
+        Raises
+        ------
+        LookupError
+            When there is no queue being exported or index is out of range.
+        """
+        queue = cls._running
+        if queue is None:
+            raise LookupError
+        try:
+            entry = queue._entries[index]
+        except IndexError:
+            raise LookupError
+        queue._entryReport = queue._exportEntry(entry, queue._incremental, queue._monitor, queue._entryTicks)
+
+    @property
+    def entries(self):
+        """ Gets all entries in the queue.
+
+        Returns
+        -------
+        [GameExportQueueEntry]
+        """
+        return self._entries
+
+    def add(self, rig, commandId, actionNames=None):
+        """ Adds rig export to the queue.
+
+        Parameters
+        ----------
+        rig : Rig, str
+            Rig or identifier of the rig root item.
+
+        commandId : str
+            One of GameExportCommandId constants.
+
+        actionNames : [str], None
+            Optional subset of actions to export.
+
+        Returns
+        -------
+        GameExportQueueEntry
+        """
+        if isinstance(rig, Rig):
+            rig = rig.rootModoItem.id
+        entry = GameExportQueueEntry(rig, commandId, actionNames)
+        self._entries.append(entry)
+        return entry
+
+    def clear(self):
+        self._entries = []
+
+    def save(self, filename):
+        """ Saves the queue to a json file.
+        """
+        data = [entry.serialize() for entry in self._entries]
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=4)
+
+    def load(self, filename):
+        """ Loads the queue from a json file, replacing current entries.
+
+        Raises
+        ------
+        LookupError
+            When the file cannot be read or its contents is not a valid queue.
+        """
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            raise LookupError
+
+        entries = []
+        for entryData in data:
+            try:
+                entries.append(GameExportQueueEntry.newFromSerialized(entryData))
+            except TypeError:
+                raise LookupError
+        self._entries = entries
+
+    def do(self, monitor=None, ticksCount=0.0, incremental=True):
+        """ Exports all rigs in the queue.
+
+        Parameters
+        ----------
+        monitor : modox.Monitor
+            Optional progress monitor.
+
+        ticksCount : float, int
+            Number of ticks available for the entire batch.
+
+        incremental : bool
+            When False all actions are exported even if they did not change.
+
+        Returns
+        -------
+        dict
+            Batch manifest with per rig and per action timings.
+        """
+        batchStart = getTime()
+        rigsReport = []
+
+        if self._entries:
+            self._entryTicks = ticksCount / float(len(self._entries))
+        else:
+            self._entryTicks = 0.0
+        self._incremental = incremental
+        self._monitor = monitor
+
+        batchTicks = 0.0
+        GameExportQueue._running = self
+        try:
+            for index in range(len(self._entries)):
+                self._entryReport = None
+                # Export command undoes all the changes it did to the scene
+                # so next entry can be exported from the scene in its original state.
+                run('!%s index:%d' % (self.ENTRY_COMMAND, index))
+
+                report = self._entryReport
+                if report is not None:
+                    rigsReport.append(report)
+                    self._updateManifest(report)
+
+                batchTicks += self._entryTicks
+                if monitor is not None:
+                    monitor.progress = batchTicks
+        finally:
+            GameExportQueue._running = None
+            self._monitor = None
+
+        totalTime = getTime() - batchStart
+        if debug.output:
+            log.out('Batch game export of %d rigs: %f' % (len(rigsReport), totalTime))
+
+        return {'time': totalTime,
+                'rigs': rigsReport}
+
+    # -------- Private methods
+
+    def _exportEntry(self, entry, incremental, monitor=None, ticksCount=0.0):
+        """ Exports single rig from the queue.
+
+        Returns
+        -------
+        dict, None
+            Rig export report or None if rig could not be exported.
+        """
+        try:
+            rig = Rig(entry.rigIdent)
+        except TypeError:
+            log.out("Rig %s from export queue is not in the scene!" % entry.rigIdent, log.MSG_ERROR)
+            self._tickMonitor(monitor, ticksCount)
+            return None
+
+        gameExId = GameExportSet.getGameExportSetFromRig(rig)
+        try:
+            gameExportSet = service.systemComponent.get(c.SystemComponentType.GAME_EXPORT_SET, gameExId)
+            commandClass = gameExportSet.descExportCommands[entry.commandId]
+        except (LookupError, KeyError):
+            log.out("Unknown game export command for %s rig!" % rig.name, log.MSG_ERROR)
+            self._tickMonitor(monitor, ticksCount)
+            return None
+
+        if not GameExportOperator.testExportPath(rig):
+            log.out("Invalid game export path for %s rig!" % rig.name, log.MSG_ERROR)
+            self._tickMonitor(monitor, ticksCount)
+            return None
+
+        rigStart = getTime()
+
+        # Hashes have to be calculated before baking,
+        # source actions get renamed when rig is baked.
+        actionHashes = self._getActionHashes(rig, commandClass.exportActions, entry.actionNames)
+        rigHash = self._getRigHash(rig, commandClass)
+        previousReport = self._readManifest(rig).get(self._getManifestKey(rig, entry.commandId), {})
+        previousActions = previousReport.get('actions', {})
+
+        skipUnchanged = (incremental and
+                         commandClass.separateActionFiles and
+                         previousReport.get('rigHash') == rigHash)
+        if skipUnchanged:
+            cmd = commandClass(rig)
+
+        actionsToExport = []
+        actionsSkipped = []
+        for actionName, actionHash in actionHashes:
+            try:
+                previousHash = previousActions[actionName]['hash']
+            except KeyError:
+                previousHash = None
+            if (skipUnchanged and
+                    previousHash == actionHash and
+                    os.path.isfile(cmd.getActionFbxOutputFilename(actionName))):
+                actionsSkipped.append(actionName)
+            else:
+                actionsToExport.append(actionName)
+
+        report = {'rig': rig.name,
+                  'rigIdent': entry.rigIdent,
+                  'rigHash': rigHash,
+                  'command': entry.commandId,
+                  'exportFolder': rig.rootItem.getChannelProperty(rig.rootItem.PropertyChannels.CHAN_GAME_EXPORT_FOLDER),
+                  'phases': {},
+                  'actions': {}}
+
+        for actionName in actionsSkipped:
+            actionReport = dict(previousActions[actionName])
+            actionReport['skipped'] = True
+            report['actions'][actionName] = actionReport
+
+        if actionsToExport or commandClass.exportMeshes:
+            exportOp = GameExportOperator(rig)
+            exportOp.do(commandClass,
+                        monitor,
+                        ticksCount,
+                        actionNames=[name for name, actionHash in actionHashes if name in actionsToExport])
+            for phaseName, phaseTime in exportOp.phaseTimes:
+                report['phases'][phaseName] = phaseTime
+            bakeTimes = dict(exportOp.bakeTimes)
+        else:
+            bakeTimes = {}
+            self._tickMonitor(monitor, ticksCount)
+
+        hashes = dict(actionHashes)
+        for actionName in actionsToExport:
+            report['actions'][actionName] = {'hash': hashes[actionName],
+                                             'bakeTime': bakeTimes.get(actionName, 0.0),
+                                             'skipped': False}
+
+        report['time'] = getTime() - rigStart
+        if debug.output:
+            log.out('%s rig exported: %f, actions exported: %d, skipped: %d' % (rig.name,
+                                                                                 report['time'],
+                                                                                 len(actionsToExport),
+                                                                                 len(actionsSkipped)))
+        return report
+
+    def _getActionHashes(self, rig, actionsChoice, actionNames=None):
+        """ Gets animation hashes of rig actions that will be exported.
+
+        Returns
+        -------
+        [(str, str)]
+            Action name and its hash.
+        """
+        if actionsChoice == GameExportCommand.Actions.NONE:
+            return []
+
+        actor = rig.actor
+        if actor is None:
+            return []
+
+        if actionsChoice == GameExportCommand.Actions.CURRENT:
+            currentAction = actor.currentAction
+            actions = [currentAction] if currentAction is not None else []
+        else:
+            actions = actor.actions
+
+        if actionNames is not None:
+            actionNames = set(actionNames)
+            actions = [action for action in actions if action.name in actionNames]
+        if not actions:
+            return []
+
+        names = [action.name for action in actions]
+        hashes = bake_op.BakeOperator.getActionHashes(rig, names)
+        return [(name, hashes[name]) for name in names]
+
+    def _getRigHash(self, rig, commandClass):
+        """ Gets hash of everything apart from action animation that affects exported actions.
+
+        Hash covers fbx presets the command uses, stretching support,
+        bind skeleton hierarchy and bind skeleton rest pose.
+
+        Returns
+        -------
+        str
+        """
+        presetNames = [commandClass.fbxPresetName,
+                       getattr(commandClass, 'skeletalFbxPresetName', ''),
+                       getattr(commandClass, 'actionFbxPresetName', '')]
+        stretch = rig.rootItem.settings.get(rig.rootItem.SETTING_STRETCH, False)
+
+        joints = sorted(BindSkeleton(rig).modoItems, key=lambda modoItem: modoItem.id)
+        hierarchy = []
+        restPoseChannels = []
+        for joint in joints:
+            parent = joint.parent
+            hierarchy.append('%s>%s' % (joint.name, parent.id if parent is not None else ''))
+            restPoseChannels.extend(modox.LocatorUtils.getTransformChannels(joint))
+        restPoseHash = modox.ChannelUtils.getChannelsEnvelopeHash(restPoseChannels, lx.symbol.s_ACTIONLAYER_SETUP)
+
+        digest = hashlib.md5()
+        digest.update(json.dumps([presetNames, stretch, hierarchy, restPoseHash]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _getManifestKey(self, rig, commandId):
+        return rig.rootModoItem.id + '/' + commandId
+
+    def _getManifestFilename(self, exportFolder):
+        return os.path.join(exportFolder, self.MANIFEST_FILENAME)
+
+    def _readManifest(self, rig):
+        """ Reads export manifest from rig's export folder.
+
+        Returns
+        -------
+        dict
+            Manifest reports keyed by rig and command, empty if there is no manifest yet.
+        """
+        exportFolder = rig.rootItem.getChannelProperty(rig.rootItem.PropertyChannels.CHAN_GAME_EXPORT_FOLDER)
+        try:
+            with open(self._getManifestFilename(exportFolder), 'r') as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict):
+            return {}
+        return manifest.get('exports', {})
+
+    def _updateManifest(self, report):
+        """ Stores rig export report in the manifest in rig's export folder.
+        """
+        filename = self._getManifestFilename(report['exportFolder'])
+        try:
+            with open(filename, 'r') as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            manifest = {}
+        if not isinstance(manifest, dict):
+            manifest = {}
+
+        exports = manifest.setdefault('exports', {})
+        exports[report['rigIdent'] + '/' + report['command']] = report
+
+        try:
+            with open(filename, 'w') as f:
+                json.dump(manifest, f, indent=4, sort_keys=True)
+        except (IOError, OSError):
+            log.out("Cannot write game export manifest to %s!" % filename, log.MSG_ERROR)
+
+    def _tickMonitor(self, monitor, ticks):
+        if monitor is not None:
+            monitor.tick(ticks)
+
+    def __init__(self):
+        self._entries = []
+        self._incremental = True
+        self._monitor = None
+        self._entryTicks = 0.0
+        self._entryReport = None
 
 
 class GameExportCommand(object):
@@ -192,6 +697,13 @@ class GameExportCommand(object):
     Game Export Command gets executed to perform export process.
 
     You need to implement the command for particular export set to have it called from UI.
+
+    Attributes
+    ----------
+    separateActionFiles : bool
+        True when each action is saved to its own fbx file.
+        Batch export skips baking and saving actions that did not change
+        since previous export only for such commands.
     """
 
     Actions = bake_op.BakeActionChoice
@@ -199,6 +711,7 @@ class GameExportCommand(object):
     fbxPresetName = ''
     exportMeshes = True
     exportActions = Actions.ALL
+    separateActionFiles = False
 
     @property
     def fbxFilename(self):
@@ -297,6 +810,33 @@ class GameExportCommand(object):
         # by user accidentaly.
         run('preset.fbx (revert)')
 
+    def getFbxActionName(self, actionName):
+        """
+        Gets name of the fbx file that given action is saved to
+        by commands that save each action to its own file.
+
+        Parameters
+        ----------
+        actionName : str
+
+        Returns
+        -------
+        str
+            Name of the fbx file without extension.
+        """
+        return actionName
+
+    def getActionFbxOutputFilename(self, actionName):
+        """
+        Gets full path of the fbx file that given action is saved to
+        by commands that save each action to its own file.
+
+        Returns
+        -------
+        str
+        """
+        return self._getFbxOutputFilename(self.getFbxActionName(actionName))
+
     def exportFbxFile(self, fbxFilename):
         """
         Exports rig to given fbx file.
@@ -377,6 +917,7 @@ class ExportAllActionsCommand(GameExportCommand):
 
     exportActions = GameExportCommand.Actions.ALL
     exportMeshes = False
+    separateActionFiles = True
 
     def postProcess(self, bakedSkeleton):
         """
@@ -414,6 +955,7 @@ class ExportAllSeparateCommand(GameExportCommand):
 
     exportActions = GameExportCommand.Actions.ALL
     exportMeshes = True
+    separateActionFiles = True
 
     skeletalFbxPresetName = ''
     actionFbxPresetName = ''
@@ -6,6 +6,8 @@ import modo
 import modox
 
 from .rig import Rig
+from .rig_index import IndexedItem
+from .rig_index import rigIndex
 from .core import service
 from .const import EventTypes as e
 from .xfrm_in_mesh import TransformsInMesh
@@ -15,6 +17,7 @@ from .item_feature_op import ItemFeatureOperator
 from .item_features.item_link import ItemLinkFeature
 from .log import log
 from .debug import debug
+from .util import getTime
 from .module_guide import ModuleGuide
 from .debug import debug
 from . import const as c
@@ -31,6 +34,13 @@ class Guide(object):
         Either rig object or its root rig item or root modo item.
     """
 
+    STAGE_INIT = 'INIT'
+    STAGE_SCAN = 'SCAN'
+    STAGE_PRE = 'PRE'
+    STAGE_DO = 'DO'
+    STAGE_POST = 'POST'
+    STAGE_POST2 = 'POST2'
+
     @classmethod
     def isEditableFast(cls, rigRootItem):
         """ Tests whether guide is editable on a rig.
@@ -77,30 +87,65 @@ class Guide(object):
             log.out('-------- Apply Guide')
             log.startChildEntries()
         
+        self._stageTimes = OrderedDict()
+        stageStart = getTime()
+
         setup = modox.SetupMode()
         setup.state = True
         modox.TransformUtils.applyEdit()
 
         service.events.send(e.ITEM_CHAN_EDIT_BATCH_PRE, rig=self._rig) # This is to unlock channels
         service.events.send(e.GUIDE_APPLY_INIT, rig=self._rig)
+        stageStart = self._storeStageTime(self.STAGE_INIT, stageStart)
         
+        self._scannedItems = []
         if modules is None:
-            self._rig.iterateOverItems(self._sendItemScanEvent)
+            self._rig.iterateOverItems(self._collectItemToScan)
+            scannedModules = self._rig.modules.allModules
         else:
             if type(modules) not in (list, tuple):
                 modules = [modules]
             for module in modules:
-                module.iterateOverItems(self._sendItemScanEvent)
+                module.iterateOverItems(self._collectItemToScan)
+            scannedModules = modules
+
+        byItemType, byFeature = self._groupScannedItems(self._scannedItems, scannedModules)
+        service.events.sendBatch(e.GUIDE_APPLY_ITEM_SCAN_BATCH,
+                                 e.GUIDE_APPLY_ITEM_SCAN,
+                                 self._scannedItems,
+                                 byItemType=byItemType,
+                                 byFeature=byFeature)
+        del self._scannedItems
+        stageStart = self._storeStageTime(self.STAGE_SCAN, stageStart)
 
         service.events.send(e.GUIDE_APPLY_PRE)
+        stageStart = self._storeStageTime(self.STAGE_PRE, stageStart)
         service.events.send(e.GUIDE_APPLY_DO)
+        stageStart = self._storeStageTime(self.STAGE_DO, stageStart)
         service.events.send(e.GUIDE_APPLY_POST, rig=self._rig)
+        stageStart = self._storeStageTime(self.STAGE_POST, stageStart)
         service.events.send(e.GUIDE_APPLY_POST2, rig=self._rig)
         service.events.send(e.ITEM_CHAN_EDIT_BATCH_POST) # This is to lock them again
+        self._storeStageTime(self.STAGE_POST2, stageStart)
 
         if debug.output:
+            for stage in self._stageTimes:
+                log.out('%s stage time: %f' % (stage, self._stageTimes[stage]))
+            log.out('Total apply time: %f' % sum(self._stageTimes.values()))
             log.stopChildEntries()
 
+    @property
+    def applyStageTimes(self):
+        """ Gets time each stage of the last guide application took.
+
+        Returns
+        -------
+        OrderedDict {str : float}
+            Key is one of Guide.STAGE_XXX constants, value is time in seconds.
+            Dictionary is empty if guide was not applied yet.
+        """
+        return self._stageTimes
+
     def setToPosition(self, position, modules=None):
         """ Apply world space offset to the guide.
         
@@ -196,6 +241,7 @@ class Guide(object):
         guides = self._rig.getElements(c.ElementSetType.GUIDES)
         nameTokens = [c.NameToken.MODULE_NAME, c.NameToken.SIDE, c.NameToken.BASE_NAME]
 
+        itemsToEmbed = []
         for modoItem in guides:
             try:
                 guideFeature = ControllerGuideItemFeature(modoItem)
@@ -207,10 +253,12 @@ class Guide(object):
                 continue
             
             identifier = guideFeature.item.renderNameFromTokens(nameTokens)
-            positionSource = embedGuideFeature.positionSource
-            if xfrmInMesh.embedItemPosition(modoItem, identifier, positionSource=positionSource):
-                if debug.output:
-                    log.out('Embedded %s' % identifier)
+            itemsToEmbed.append((modoItem, identifier, embedGuideFeature.positionSource))
+
+        embedded = xfrmInMesh.embedItemsPositions(itemsToEmbed)
+        if debug.output:
+            for identifier in embedded:
+                log.out('Embedded %s' % identifier)
     
     def setFromMesh(self, meshModoItem):
         """ Extracts and applies guide data from a given mesh.
@@ -388,8 +436,41 @@ class Guide(object):
             return
         self._guides.append(modoItem)
 
-    def _sendItemScanEvent(self, modoItem):
-        service.events.send(e.GUIDE_APPLY_ITEM_SCAN, item=modoItem)
+    def _collectItemToScan(self, modoItem):
+        self._scannedItems.append(modoItem)
+
+    def _groupScannedItems(self, modoItems, modules):
+        """ Groups items by rig item type and item features.
+
+        Item data is taken from module indexes, tags are only read
+        for the few items that are not part of any module.
+
+        Returns
+        -------
+        dict {str : [modo.Item]}, dict {str : [modo.Item]}
+        """
+        records = {}
+        for module in modules:
+            for record in rigIndex.getModuleIndex(module).setupItems:
+                records[record.id] = record
+
+        byItemType = {}
+        byFeature = {}
+        for modoItem in modoItems:
+            try:
+                record = records[modoItem.id]
+            except KeyError:
+                record = IndexedItem(modoItem, None)
+            if record.itemType is not None:
+                byItemType.setdefault(record.itemType, []).append(modoItem)
+            for feature in record.features:
+                byFeature.setdefault(feature, []).append(modoItem)
+        return byItemType, byFeature
+
+    def _storeStageTime(self, stage, stageStart):
+        now = getTime()
+        self._stageTimes[stage] = now - stageStart
+        return now
 
     def __init__(self, rig):
         if not isinstance(rig, Rig):
@@ -399,4 +480,5 @@ class Guide(object):
                 raise
         if not isinstance(rig, Rig):
             raise TypeError
-        self._rig = rig
\ No newline at end of file
+        self._rig = rig
+        self._stageTimes = OrderedDict()
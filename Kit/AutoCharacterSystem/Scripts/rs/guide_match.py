@@ -54,76 +54,7 @@ class GuideMatcher(object):
 
         local = True
         if local:
-            if self.DEBUG:
-                log.out('Applying transforms to buffer guides:')
-                log.startChildEntries()
-            
-            # Local matching
-            for guideItem in self._bufferGuides:
-                modoItem = guideItem.modoItem
-                ident = modoItem.id
-                if self.DEBUG:
-                    log.out('Applying transforms to buffer guide: %s' % modoItem.name)
-                run('item.apply pos {%s}' % ident)
-                run('item.apply rot {%s}' % ident)
-
-            if self.DEBUG:
-                log.stopChildEntries()
-                log.out('Copying local transforms from buffer guides:')
-                log.startChildEntries()
-
-            zeroVec = modo.Vector3(0.0, 0.0, 0.0)
-            for feature in self._guidedItemsFeatures:
-                guidedModoItem = feature.modoItem
-                
-                guideItem = feature.guide
-                
-                # Local transforms need to be grabbed from edit action because that's where
-                # the applied transforms went. It's either that or apply edit first and then
-                # get values from setup action.
-                pos = modox.LocatorUtils.getItemPosition(guideItem.modoItem, action=lx.symbol.s_ACTIONLAYER_EDIT)
-                rot = modox.LocatorUtils.getItemRotation(guideItem.modoItem, action=lx.symbol.s_ACTIONLAYER_EDIT)
-
-                # set either primary or zero positions
-                if feature.zeroTransforms:
-                    # We have to guarantee that zero transform items are present on the guided item.
-                    # So first we set guided transforms on primary transform items
-                    # then we zero these transforms - this will create zero transforms if needed.
-                    modo.Scene().select(guidedModoItem)
-                    if not modox.LocatorUtils.hasZeroPosition(guidedModoItem):
-                        modox.LocatorUtils.setItemPosition(guidedModoItem, pos, action=lx.symbol.s_ACTIONLAYER_SETUP)
-                        run('transform.zero translation')
-
-                    if not modox.LocatorUtils.hasZeroRotation(guidedModoItem):
-                        modox.LocatorUtils.setItemRotation(guidedModoItem, rot, action=lx.symbol.s_ACTIONLAYER_SETUP)
-                        run('transform.zero rotation')
-
-                    # This is crucial. We have to guarantee that the zero transform rotation order and reference guide
-                    # transform rotation order are the same.
-                    # If they are different the zeroed transforms will be translated wrong when taken from
-                    # zeroed out primary transform.
-                    # For this reason we set zero rotation to exact same values as on the reference guide manually
-                    # (knowing that zero rotation now exists for sure) and then we also make sure the zero transform
-                    # rotation order is the same as in the reference guide.
-
-                    # Note that it's not guaranteed zero transforms will be in place here
-                    # because if the matched transforms are zero vectors MODO will not create zero transforms.
-                    # So I still need to check that zero transforms exist.
-                    if modox.LocatorUtils.hasZeroPosition(guidedModoItem):
-                        modox.LocatorUtils.setZeroPosition(guidedModoItem, pos, action=lx.symbol.s_ACTIONLAYER_SETUP)
-                    if modox.LocatorUtils.hasZeroRotation(guidedModoItem):
-                        modox.LocatorUtils.setZeroRotation(guidedModoItem, rot, action=lx.symbol.s_ACTIONLAYER_SETUP)
-                        order = modox.LocatorUtils.getPrimaryRotationOrder(guideItem.modoItem)
-                        modox.LocatorUtils.setZeroRotationOrder(guidedModoItem, order)
-                else:
-                    modox.LocatorUtils.setItemPosition(guidedModoItem, pos, action=lx.symbol.s_ACTIONLAYER_SETUP)
-                    modox.LocatorUtils.setItemRotation(guidedModoItem, rot, action=lx.symbol.s_ACTIONLAYER_SETUP)
-
-                if self.DEBUG:
-                    log.out('Transforms copied: %s ---> %s' % (guideItem.modoItem.name, guidedModoItem.name))
-
-            if self.DEBUG:
-                log.stopChildEntries()
+            self._matchLocal()
         else:
             
             # World matching
@@ -174,6 +105,139 @@ class GuideMatcher(object):
 
     # -------- Private methods
 
+    def _matchLocal(self):
+        """ Matches guided items to buffer guides using local transforms.
+
+        Buffer guide local transforms are calculated from their world transforms
+        for all guides in one go, this is the equivalent of applying their transforms
+        with item.apply commands. Guided items transforms are then set
+        with a single channel write sweep.
+        Commands are only used for buffer guides that have zero transforms
+        and for guided items that need zero transforms to be created.
+        """
+        if self.DEBUG:
+            log.out('Applying transforms to buffer guides:')
+            log.startChildEntries()
+
+        guideTransforms = self._applyBufferGuidesTransforms()
+
+        if self.DEBUG:
+            log.stopChildEntries()
+            log.out('Copying local transforms from buffer guides:')
+            log.startChildEntries()
+
+        setupValues = []
+        zeroRotationOrders = []
+        xfrmPosType = modox.LocatorUtils.TransformType.POSITION
+        xfrmRotType = modox.LocatorUtils.TransformType.ROTATION
+
+        for feature in self._guidedItemsFeatures:
+            guidedModoItem = feature.modoItem
+            guideModoItem = feature.guide.modoItem
+
+            try:
+                pos, rot, order = guideTransforms[guideModoItem.id]
+            except KeyError:
+                # Guide that is not one of buffer guides, its transforms were not applied.
+                pos = modox.LocatorUtils.getItemPosition(guideModoItem, action=lx.symbol.s_ACTIONLAYER_EDIT)
+                rot = modox.LocatorUtils.getItemRotation(guideModoItem, action=lx.symbol.s_ACTIONLAYER_EDIT)
+                order = modox.LocatorUtils.getPrimaryRotationOrder(guideModoItem)
+
+            # set either primary or zero positions
+            if feature.zeroTransforms:
+                zeroPos = modox.LocatorUtils.getZeroTransformItem(guidedModoItem, xfrmPosType)
+                zeroRot = modox.LocatorUtils.getZeroTransformItem(guidedModoItem, xfrmRotType)
+
+                # We have to guarantee that zero transform items are present on the guided item.
+                # So first we set guided transforms on primary transform items
+                # then we zero these transforms - this will create zero transforms if needed.
+                # This is the only case where commands are needed.
+                if zeroPos is None or zeroRot is None:
+                    modo.Scene().select(guidedModoItem)
+                    if zeroPos is None:
+                        modox.LocatorUtils.setItemPosition(guidedModoItem, pos, action=lx.symbol.s_ACTIONLAYER_SETUP)
+                        run('transform.zero translation')
+                        zeroPos = modox.LocatorUtils.getZeroTransformItem(guidedModoItem, xfrmPosType)
+                    if zeroRot is None:
+                        modox.LocatorUtils.setItemRotation(guidedModoItem, rot, action=lx.symbol.s_ACTIONLAYER_SETUP)
+                        run('transform.zero rotation')
+                        zeroRot = modox.LocatorUtils.getZeroTransformItem(guidedModoItem, xfrmRotType)
+
+                # This is crucial. We have to guarantee that the zero transform rotation order and reference guide
+                # transform rotation order are the same.
+                # If they are different the zeroed transforms will be translated wrong when taken from
+                # zeroed out primary transform.
+                # For this reason we set zero rotation to exact same values as on the reference guide
+                # and we also make sure the zero transform rotation order is the same as in the reference guide.
+
+                # Note that it's not guaranteed zero transforms will be in place here
+                # because if the matched transforms are zero vectors MODO will not create zero transforms.
+                if zeroPos is not None:
+                    setupValues.append((zeroPos, pos))
+                if zeroRot is not None:
+                    setupValues.append((zeroRot, rot))
+                    zeroRotationOrders.append((guidedModoItem, order))
+            else:
+                setupValues.append((modox.LocatorUtils.getTransformItem(guidedModoItem, modox.c.TransformType.POSITION), pos))
+                setupValues.append((modox.LocatorUtils.getTransformItem(guidedModoItem, modox.c.TransformType.ROTATION), rot))
+
+            if self.DEBUG:
+                log.out('Transforms copied: %s ---> %s' % (guideModoItem.name, guidedModoItem.name))
+
+        modox.LocatorUtils.setTransformItemsValues(setupValues, action=lx.symbol.s_ACTIONLAYER_SETUP)
+        for guidedModoItem, order in zeroRotationOrders:
+            modox.LocatorUtils.setZeroRotationOrder(guidedModoItem, order)
+
+        if self.DEBUG:
+            log.stopChildEntries()
+
+    def _applyBufferGuidesTransforms(self):
+        """ Applies transforms to all buffer guides.
+
+        Buffer guides local transforms are calculated from their world transforms
+        and set in edit action, the same way item.apply command would do it.
+        Guides that have zero transforms are applied with commands
+        since their primary transforms cannot be derived from local matrix alone.
+
+        Returns
+        -------
+        dict {str : (modo.Vector3, modo.Vector3, str)}
+            Applied local position, rotation and rotation order keyed by buffer guide item id.
+        """
+        solvedGuides = []
+        guideTransforms = {}
+        for guideItem in self._bufferGuides:
+            modoItem = guideItem.modoItem
+            if self.DEBUG:
+                log.out('Applying transforms to buffer guide: %s' % modoItem.name)
+            if (modox.LocatorUtils.hasZeroPosition(modoItem) or
+                    modox.LocatorUtils.hasZeroRotation(modoItem)):
+                run('item.apply pos {%s}' % modoItem.id)
+                run('item.apply rot {%s}' % modoItem.id)
+                # Local transforms need to be grabbed from edit action because that's where
+                # the applied transforms went.
+                pos = modox.LocatorUtils.getItemPosition(modoItem, action=lx.symbol.s_ACTIONLAYER_EDIT)
+                rot = modox.LocatorUtils.getItemRotation(modoItem, action=lx.symbol.s_ACTIONLAYER_EDIT)
+                order = modox.LocatorUtils.getPrimaryRotationOrder(modoItem)
+                guideTransforms[modoItem.id] = (pos, rot, order)
+            else:
+                solvedGuides.append(modoItem)
+
+        # All world transforms have to be read before any of the guides is changed.
+        localTransforms = modox.LocatorUtils.getItemsLocalTransformsFromWorld(solvedGuides)
+
+        editValues = []
+        for x, modoItem in enumerate(solvedGuides):
+            pos, rot, order, scale = localTransforms[x]
+            guideTransforms[modoItem.id] = (pos, rot, order)
+            editValues.append((modox.LocatorUtils.getTransformItem(modoItem, modox.c.TransformType.POSITION), pos))
+            editValues.append((modox.LocatorUtils.getTransformItem(modoItem, modox.c.TransformType.ROTATION), rot))
+
+        modox.LocatorUtils.setTransformItemsValues(editValues,
+                                                   time=lx.service.Selection().GetTime(),
+                                                   action=lx.symbol.s_ACTIONLAYER_EDIT)
+        return guideTransforms
+
     def _zeroTransforms(self):
         """
         Zeroing transforms for all items that have Zero Transforms on in guide reference feature properties.
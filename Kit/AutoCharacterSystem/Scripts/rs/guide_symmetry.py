@@ -1,5 +1,7 @@
 
 
+import math
+
 import lx
 import modo
 import modox
@@ -62,14 +64,13 @@ class GuideSymmetry(object):
         if not self._guides:
             return False
 
-        xfrms = []
-        for guide in self._guides:
-            xfrms.append(self._calculateFlippedTransform(guide.modoItem, guide.modoItem))
+        modoItems = [guide.modoItem for guide in self._guides]
+        xfrms = self._calculateFlippedTransforms(modoItems, modoItems)
+        self._applyFlippedTransforms(modoItems, xfrms)
 
-        for x in range(len(self._guides)):
-            self._applyFlippedTransform(self._guides[x].modoItem, xfrms[x])
-            if debug.output:
-                log.out('Applying flipped transform to guide during mirror: %s' % self._guides[x].modoItem.name)
+        if debug.output:
+            for modoItem in modoItems:
+                log.out('Applying flipped transform to guide during mirror: %s' % modoItem.name)
         
         return True
 
@@ -94,42 +95,47 @@ class GuideSymmetry(object):
                 log.out("No symmetric guides to apply symmetry to!", log.MSG_ERROR)
             return False
         
-        xfrms = []
         space = lx.symbol.iLOCATOR_LOCAL
-        for guide in symmetryGuides:
-            xfrms.append(self._calculateFlippedTransform(guide.symmetricGuide.modoItem, guide.modoItem, space=space))
+        sourceModoItems = [guide.symmetricGuide.modoItem for guide in symmetryGuides]
+        targetModoItems = [guide.modoItem for guide in symmetryGuides]
+        xfrms = self._calculateFlippedTransforms(sourceModoItems, targetModoItems, space=space)
+        self._applyFlippedTransforms(targetModoItems, xfrms, space=space)
 
-        for x in range(len(symmetryGuides)):
-            self._applyFlippedTransform(symmetryGuides[x].modoItem, xfrms[x], space=space)
-            if debug.output:
-                log.out('Applying flipped transform to guide during applySym: %s' % self._guides[x].modoItem.name)
+        if debug.output:
+            for modoItem in targetModoItems:
+                log.out('Applying flipped transform to guide during applySym: %s' % modoItem.name)
             
         return True
 
     # -------- Private methods
 
-    def _calculateFlippedTransform(self,
-                                   sourceModoItem=None,
-                                   targetModoItem=None,
-                                   space=lx.symbol.iLOCATOR_LOCAL):
-        """ Calculates transform flipped on x from given item's world transform.
+    def _calculateFlippedTransforms(self,
+                                    sourceModoItems,
+                                    targetModoItems,
+                                    space=lx.symbol.iLOCATOR_LOCAL):
+        """ Calculates transforms flipped on x from given items world transforms.
         
         The alignment is not mirrored.
-        This method calculates new local transform matrix4 and stores it.
-        
+        Transforms of all items are read in one go and flipped in a single pass.
+
+        Flipped transform is negative X scale matrix applied on both sides
+        of the reference transform: S * M * S. Since S is its own inverse
+        the flipped local transform S * W * S * inverse(S * P * S) is the same as S * (W * inverse(P)) * S
+        so world matrix is multiplied by inverted parent matrix first and only the result is flipped.
+        Flipping itself is just negating elements that are in either first row or first column
+        (but not both).
+
         Parameters
         ----------
-        sourceModoItem : modo.Item, optional
-            Modo item which world transform will be taken as reference.
-            If item is not set the guide itself will be used as reference.
-            This allows for flipping the item itself, with no reference.
+        sourceModoItems : [modo.Item]
+            Modo items which world transforms will be taken as reference.
+            Pass the same list as targets to flip items themselves, with no reference.
             
-        targetModoItem : modo.Item, optional
-            The item to which the flipped transform is going to be applied.
-            It's important that this item is known because the flipped transform
+        targetModoItems : [modo.Item]
+            The items to which flipped transforms are going to be applied.
+            It's important that these items are known because the flipped transform
             will be in world space instead of local space if target item has
             inherit pos/rot off.
-            When not set this is the same as the source item.
 
         space : int
             lx.symbol.iLOCATOR_XXX
@@ -137,60 +143,129 @@ class GuideSymmetry(object):
 
         Returns
         -------
-        modo.Matrix4
+        [[[float]]]
+            Flipped 4x4 matrices, one for each source/target items pair.
         """
-        if sourceModoItem is None:
-            return
-        if targetModoItem is None:
-            targetModoItem = sourceModoItem
+        worldMatrices = modox.LocatorUtils.getItemsMatrices(sourceModoItems, 'worldMatrix')
 
-        # Negative X scale matrix is used.
-        negativeScaleMtx = modo.Matrix4()
-        negativeScaleMtx.m[0][0] = -1.0
-
-        refMtxObject = sourceModoItem.channel('worldMatrix').get() # this gets lx.unknown
-        refWorldMtx = modo.Matrix4(refMtxObject)
-        flippedWorldMtx = negativeScaleMtx * refWorldMtx * negativeScaleMtx
-        
         # Checking for inherit position/rotation is iffy now.
         # It assumes that either none of these or all of these are switched.
         # TODO: Make it more robust to work with individual switches being turned on/off.
-        inheritPos = bool(targetModoItem.channel('inheritPos').get())
-        inheritRot = bool(targetModoItem.channel('inheritRot').get())
-        
-        if space == lx.symbol.iLOCATOR_LOCAL and inheritPos and inheritRot:
-            refMtxObject = sourceModoItem.channel('wParentMatrix').get()
-            refParentMtx = modo.Matrix4(refMtxObject)
-                    
-            # We are flipping both world and parent matrices on X.
-    
-            flippedParentMtx = negativeScaleMtx * refParentMtx * negativeScaleMtx
-            # Parent matrix is inverted as well as we want go get local transforms.
-            flippedParentMtx.invert()
-        else:
-            flippedParentMtx = modo.Matrix4()
-        
-        return flippedWorldMtx * flippedParentMtx
-    
-    def _applyFlippedTransform(self, modoItem, xfrmMatrix4, space=lx.symbol.iLOCATOR_LOCAL):
-        """ Applies previously calculated flipped transform.
-        
-        This methods works only when the calculate method above was already called.
+        localFlags = [False] * len(targetModoItems)
+        if space == lx.symbol.iLOCATOR_LOCAL:
+            time = lx.service.Selection().GetTime()
+            inheritPos = modox.ChannelUtils.getItemsIntChannelValues(
+                targetModoItems, 'inheritPos', time=time, action=lx.symbol.s_ACTIONLAYER_EDIT)
+            inheritRot = modox.ChannelUtils.getItemsIntChannelValues(
+                targetModoItems, 'inheritRot', time=time, action=lx.symbol.s_ACTIONLAYER_EDIT)
+            localFlags = [bool(inheritPos.get(modoItem.id)) and bool(inheritRot.get(modoItem.id))
+                          for modoItem in targetModoItems]
+
+        parentMatrices = [None] * len(sourceModoItems)
+        if any(localFlags):
+            localSourceItems = [sourceModoItems[x] for x in range(len(sourceModoItems)) if localFlags[x]]
+            localParentMatrices = modox.LocatorUtils.getItemsMatrices(localSourceItems, 'wParentMatrix')
+            localParentMatrices.reverse()
+            for x in range(len(sourceModoItems)):
+                if localFlags[x]:
+                    parentMatrices[x] = localParentMatrices.pop()
+
+        flippedMatrices = []
+        for x in range(len(worldMatrices)):
+            if parentMatrices[x] is not None:
+                mtx = self._multiplyByInvertedAffine(worldMatrices[x], parentMatrices[x])
+            else:
+                mtx = [list(row) for row in worldMatrices[x]]
+            row0 = mtx[0]
+            row0[1] = -row0[1]
+            row0[2] = -row0[2]
+            row0[3] = -row0[3]
+            mtx[1][0] = -mtx[1][0]
+            mtx[2][0] = -mtx[2][0]
+            mtx[3][0] = -mtx[3][0]
+            flippedMatrices.append(mtx)
+        return flippedMatrices
+
+    def _multiplyByInvertedAffine(self, mtxA, mtxB):
+        """ Multiplies matrix A by inverted matrix B.
+
+        Both matrices are assumed to be affine transforms (last column is 0, 0, 0, 1)
+        which is always the case for item transform matrices.
+        That allows for inverting B as 3x3 matrix and a translation
+        which is a lot cheaper than a general 4x4 inverse.
+
+        Returns
+        -------
+        [[float]]
+            4x4 matrix as list of rows.
+        """
+        (b00, b01, b02, b03), (b10, b11, b12, b13), (b20, b21, b22, b23), (tx, ty, tz, b33) = mtxB
+
+        # Inverted 3x3 part from cofactors.
+        c00 = b11 * b22 - b12 * b21
+        c01 = b02 * b21 - b01 * b22
+        c02 = b01 * b12 - b02 * b11
+        c10 = b12 * b20 - b10 * b22
+        c11 = b00 * b22 - b02 * b20
+        c12 = b02 * b10 - b00 * b12
+        c20 = b10 * b21 - b11 * b20
+        c21 = b01 * b20 - b00 * b21
+        c22 = b00 * b11 - b01 * b10
+        det = b00 * c00 + b01 * c10 + b02 * c20
+        if det == 0.0:
+            # Degenerate parent transform, treat it as identity.
+            return [list(row) for row in mtxA]
+        invDet = 1.0 / det
+        i00 = c00 * invDet
+        i01 = c01 * invDet
+        i02 = c02 * invDet
+        i10 = c10 * invDet
+        i11 = c11 * invDet
+        i12 = c12 * invDet
+        i20 = c20 * invDet
+        i21 = c21 * invDet
+        i22 = c22 * invDet
+        # Inverted translation is -t * inverted 3x3.
+        i30 = -(tx * i00 + ty * i10 + tz * i20)
+        i31 = -(tx * i01 + ty * i11 + tz * i21)
+        i32 = -(tx * i02 + ty * i12 + tz * i22)
+
+        result = []
+        for a0, a1, a2, a3 in mtxA:
+            result.append([a0 * i00 + a1 * i10 + a2 * i20 + a3 * i30,
+                           a0 * i01 + a1 * i11 + a2 * i21 + a3 * i31,
+                           a0 * i02 + a1 * i12 + a2 * i22 + a3 * i32,
+                           a3])
+        return result
+
+    def _applyFlippedTransforms(self, modoItems, xfrmMatrices, space=lx.symbol.iLOCATOR_LOCAL):
+        """ Applies previously calculated flipped transforms.
         
         Parameters
         ----------
-        modoItem : modo.Item
-        xfrmMatrix4 : modo.Matrix4
+        modoItems : [modo.Item]
+
+        xfrmMatrices : [[[float]]]
+            Matrices returned by _calculateFlippedTransforms().
         """
-        position = modo.Vector3(xfrmMatrix4.position)
-        orientation = modo.Matrix3(xfrmMatrix4)
-        scale = xfrmMatrix4.scale() # This is function and returns modo.Vector3 not tuple for some reason
-        modox.TransformUtils.applyTransform(modoItem,
-                                            position,
-                                            orientation,
-                                            scale,
-                                            mode=space,
-                                            action=lx.symbol.s_ACTIONLAYER_SETUP)
+        transforms = []
+        for x in range(len(modoItems)):
+            m = xfrmMatrices[x]
+            position = (m[3][0], m[3][1], m[3][2])
+            # Raw SDK matrix is transposed 3x3 part of the transform.
+            # It includes scale the same way it was when modo.Matrix3 was passed
+            # to modox.TransformUtils.applyTransform().
+            orientation = [[m[0][0], m[1][0], m[2][0]],
+                           [m[0][1], m[1][1], m[2][1]],
+                           [m[0][2], m[1][2], m[2][2]]]
+            scale = (math.sqrt(m[0][0] * m[0][0] + m[0][1] * m[0][1] + m[0][2] * m[0][2]),
+                     math.sqrt(m[1][0] * m[1][0] + m[1][1] * m[1][1] + m[1][2] * m[1][2]),
+                     math.sqrt(m[2][0] * m[2][0] + m[2][1] * m[2][1] + m[2][2] * m[2][2]))
+            transforms.append((modoItems[x], position, orientation, scale))
+
+        modox.TransformUtils.applyTransforms(transforms,
+                                             mode=space,
+                                             action=lx.symbol.s_ACTIONLAYER_SETUP)
     
     def __init__(self):
         self.init()
@@ -22,6 +22,7 @@ from .component_setups.module import ModuleComponentSetup
 from .item_settings import ItemSettings
 from .item_feature_settings import ItemFeatureSettings
 from .item_cache import ItemCache
+from .rig_index import rigIndex
 from .util import run
 
 
@@ -606,6 +607,7 @@ class Item(sys_component.SystemComponent):
         elif ident is not None:
             return
         self.modoItem.setTag(self._TAG_IDENTIFIER, ident)
+        rigIndex.invalidateItem(self.modoItem, reindex=True)
 
     @property
     def identifierOrName(self):
@@ -887,7 +889,7 @@ class Item(sys_component.SystemComponent):
                 value = c.ItemVisible.NO
         self._modoItem.channel('visible').set(value, time=0.0, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
 
-    def renderAndSetName(self):
+    def renderAndSetName(self, nameOp=None):
         """ Renders and sets full item name.
 
         Name will be set according to a name scheme used by
@@ -896,21 +898,55 @@ class Item(sys_component.SystemComponent):
         TODO: This method doesn't work when item does not
         belong to a rig. It should still work, only rig name
         and module names parts should not be added to the name.
+
+        Parameters
+        ----------
+        nameOp : NameOperator, optional
+            Name operator for the rig naming scheme.
+            Pass it when renaming many items of the same rig
+            so it's not created again for each item.
+
+        Returns
+        -------
+        bool, None
+            True when item name was changed, False when rendered name
+            is the same as the current one or there is no naming scheme.
+            None when item name is not rendered at all.
         """
         if not self.descSynthName or self.rigRootItem is None:
-            return
+            return None
 
-        nameScheme = self.rigRootItem.namingScheme
-        if nameScheme is None:
-            return False
-        
-        nameOp = name_op.NameOperator(nameScheme)
+        if nameOp is None:
+            nameScheme = self.rigRootItem.namingScheme
+            if nameScheme is None:
+                return False
+            nameOp = name_op.NameOperator(nameScheme)
 
         components = self._nameComponents
         newName = nameOp.renderName(components)
+        if newName == self.modoItem.name:
+            return False
         self.modoItem.name = newName
         return True
 
+    def cacheRootItems(self, rigRootItem, moduleRootItem):
+        """ Sets rig and module root items that are already known.
+
+        Root items are then not looked up again by this item object.
+        Use it only for batch operations on short lived item objects
+        during which rig and module structure does not change.
+
+        Parameters
+        ----------
+        rigRootItem : RootItem
+
+        moduleRootItem : ModuleRoot, None
+            None when the item does not belong to any module.
+        """
+        self.__rigRootItem = rigRootItem
+        self.__moduleRootItem = moduleRootItem
+        self.__moduleRootCached = True
+
     @property
     def type(self):
         """ Gets rig item type as string.
@@ -931,10 +967,10 @@ class Item(sys_component.SystemComponent):
         ModuleRoot
             Or None if item doesn't belong to any module
         """
-        # TODO: I could potentially cache the resulting module
-        # if the lookup is slow. Rendering and setting name
-        # needs to get module twice for example, might be slowing
-        # it down.
+        # Module root is only cached for batch operations, see cacheRootItems().
+        if self.__moduleRootCached:
+            return self.__moduleRootItem
+
         try:
             setup = ModuleComponentSetup(self.modoItem)
         except TypeError:
@@ -1268,6 +1304,8 @@ class Item(sys_component.SystemComponent):
         self._modoItem = modoItem
         self.__settings = None
         self.__rigRootItem = None # cache rig root item
+        self.__moduleRootItem = None
+        self.__moduleRootCached = False
         self.init()
         
     def __eq__(self, other):
@@ -2,11 +2,15 @@
 
 import json
 
+import lx
+import lxu
+import modo
 import modox
 
 from .item import Item
 from .sys_component import SystemComponent
 from .item_feature_settings import ItemFeatureSettings
+from .item_feature_settings import featureIndex
 from . import const as c
 
 
@@ -148,6 +152,56 @@ class ItemFeature(SystemComponent):
         """
         return ItemFeatureSettings.isFeatureAddedFast(cls.descIdentifier, rawItem)
 
+    @classmethod
+    def getFromItems(cls, items):
+        """ Gets feature interfaces of all the items from the list that have the feature added.
+
+        Items are tested against ids of items with the feature from the feature index
+        so items without the feature are skipped before rig items are resolved for them.
+
+        Parameters
+        ----------
+        items : [modo.Item], [lx.object.Item]
+
+        Returns
+        -------
+        [ItemFeature]
+        """
+        itemIds = featureIndex.getItemIdsWithFeature(cls.descIdentifier)
+        features = []
+        for item in items:
+            if isinstance(item, modo.Item):
+                itemId = item.id
+            else:
+                itemId = item.Ident()
+            if itemId not in itemIds:
+                continue
+            try:
+                rigItem = Item.getFromOther(item)
+            except TypeError:
+                continue
+            features.append(cls.getFromRigItemFast(rigItem))
+        return features
+
+    @classmethod
+    def getFromRigItemFast(cls, rigItem):
+        """ Initialises feature on a rig item without testing whether the feature is added to it.
+
+        Use it only when features of the item are already known,
+        for example from the feature index.
+
+        Parameters
+        ----------
+        rigItem : Item
+
+        Returns
+        -------
+        ItemFeature
+        """
+        featureObj = cls.__new__(cls)
+        featureObj._initWithRigItem(rigItem)
+        return featureObj
+
     # -------- Public methods
 
     @property
@@ -163,15 +217,31 @@ class ItemFeature(SystemComponent):
     # -------- Private methods
 
     def __init__(self, item):
+        # Feature is tested once in the feature index. modo and raw items that
+        # don't have the feature are rejected before a rig item is resolved for them.
+        featureTested = False
+        if isinstance(item, modo.Item):
+            if not featureIndex.hasFeature(item, self.descIdentifier):
+                raise TypeError
+            featureTested = True
+        elif isinstance(item, (lx.object.Item, lxu.object.Item)):
+            if not featureIndex.hasFeatureRaw(item, self.descIdentifier):
+                raise TypeError
+            featureTested = True
+
         try:
             rigItem = Item.getFromOther(item)
         except TypeError:
             raise
+
+        if not featureTested and not featureIndex.hasFeature(rigItem.modoItem, self.descIdentifier):
+            raise TypeError
         
+        self._initWithRigItem(rigItem)
+
+    def _initWithRigItem(self, rigItem):
         self._item = rigItem
         self._settings = ItemFeatureSettings(self._item.modoItem)
-        if not self.descIdentifier in self._settings.featureIdentifiers:
-            raise TypeError
         
         try:
             self.init()
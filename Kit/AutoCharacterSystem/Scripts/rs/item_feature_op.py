@@ -8,6 +8,7 @@ import modo
 from . import const as c
 from .item_feature import ItemFeature
 from .item_feature_settings import ItemFeatureSettings
+from .item_feature_settings import featureIndex
 from .item import Item
 from .item_cache import ItemCache
 from .core import service
@@ -143,7 +144,7 @@ class ItemFeatureOperator(object):
         Boolean
             True if feature is present on an item, False otherwise.
         """
-        return identifier in self._settings.featureIdentifiers
+        return featureIndex.hasFeature(self.modoItem, identifier)
 
     def getFeature(self, identifier):
         """ Returns feature with a given ident.
@@ -168,27 +169,34 @@ class ItemFeatureOperator(object):
             raise LookupError
         return featureObj
 
+    @property
+    def featureIdentifiers(self):
+        """ Gets identifiers of all features added to the item.
+
+        Returns
+        -------
+        list : str
+        """
+        return self._settings.featureIdentifiers
+
     @property
     def allFeatures(self):
         """ Gets list of all features on the item.
+
+        Features are taken from the item's feature set in the feature index
+        so they are not tested against the item again when initialised.
         
         Returns
         -------
         list : ItemFeature.
         """
-        featureIdents = self._settings.featureIdentifiers
         features = []
-        for identifier in featureIdents:
+        for identifier in featureIndex.getItemFeatures(self.modoItem):
             try:
                 featureClass = service.systemComponent.get(c.SystemComponentType.ITEM_FEATURE, identifier)
             except LookupError:
                 continue
-            try:
-                featureObj = featureClass(self._item)
-            except TypeError:
-                continue
-            
-            features.append(featureObj)
+            features.append(featureClass.getFromRigItemFast(self._item))
         
         return features
 
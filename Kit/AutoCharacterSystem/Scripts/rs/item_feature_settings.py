@@ -2,8 +2,226 @@
 
 import lx
 import lxu
+import lxu.select
 import modo
 
+from . import const as c
+from .event_handler import EventHandler
+
+
+class ItemFeatureIndex(object):
+    """ Scene wide index of item features.
+
+    Index maps item ids to sets of features added to items and feature identifiers
+    to sets of ids of items that have a given feature. It's built with a single sweep
+    over features tags of all scene items on first query so querying features
+    of an item or items with a feature is a dictionary lookup.
+    Index is updated when features are set with ItemFeatureSettings and
+    when rig items are added or removed. Undo and manual scene edits do not
+    go through ItemFeatureSettings so the index is cleared by scene listener
+    and at the start of rs commands.
+    Items added since the index was built are read from their tag on first query.
+    """
+
+    def getItemFeatures(self, modoItem):
+        """ Gets identifiers of features added to an item.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+
+        Returns
+        -------
+        tuple of str
+            Identifiers in the order they are stored on the item.
+        """
+        return self._getModoItemEntry(modoItem)[0]
+
+    def hasFeature(self, modoItem, identifier):
+        """ Tests whether item has feature with a given identifier added.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+
+        identifier : str
+
+        Returns
+        -------
+        bool
+        """
+        return identifier in self._getModoItemEntry(modoItem)[1]
+
+    def hasFeatureRaw(self, rawItem, identifier):
+        """ Tests whether raw item has feature with a given identifier added.
+
+        Parameters
+        ----------
+        rawItem : lx.object.Item
+
+        identifier : str
+
+        Returns
+        -------
+        bool
+        """
+        return identifier in self._getItemEntry(rawItem.Ident(), rawItem)[1]
+
+    def getItemIdsWithFeature(self, identifier):
+        """ Gets ids of all scene items that have a given feature added.
+
+        Parameters
+        ----------
+        identifier : str
+
+        Returns
+        -------
+        set of str
+            Do not modify the returned set, it's the set stored in the index.
+        """
+        if not self._built:
+            self._build()
+        return self._itemsByFeature.get(identifier, self._EMPTY)
+
+    def updateItem(self, itemId, tagValue):
+        """ Updates index after features tag was set on an item.
+
+        Parameters
+        ----------
+        itemId : str
+
+        tagValue : str, None
+            New value of features tag, None when the tag was cleared.
+        """
+        if self._built:
+            self._setItemTag(itemId, tagValue)
+
+    def updateItemFromTag(self, modoItem):
+        """ Rereads features tag of an item into the index.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+        """
+        if self._built:
+            self._setItemTag(modoItem.id, modoItem.internalItem.GetTag(ItemFeatureSettings._TAG_ITEM_FEATURES_CODE))
+
+    def removeItem(self, itemId):
+        """ Removes item from the index.
+
+        Parameters
+        ----------
+        itemId : str
+        """
+        if self._built:
+            self._setItemTag(itemId, None)
+            del self._itemFeatures[itemId]
+
+    def invalidateAll(self):
+        """ Clears entire index.
+        """
+        self._itemFeatures = {}
+        self._itemsByFeature = {}
+        self._built = False
+
+    # -------- Private methods
+
+    _EMPTY = frozenset()
+
+    def _getModoItemEntry(self, modoItem):
+        """ Gets parsed features of a modo item.
+
+        Raw item is only needed when item is not in the index yet.
+        """
+        if not self._built:
+            self._build()
+        try:
+            return self._itemFeatures[modoItem.id]
+        except KeyError:
+            pass
+        return self._getItemEntry(modoItem.id, modoItem.internalItem)
+
+    def _getItemEntry(self, itemId, rawItem):
+        """ Gets parsed features of an item, reads its tag if item is not in the index.
+
+        Returns
+        -------
+        (tuple, frozenset)
+            Feature identifiers in order and as a set.
+        """
+        if not self._built:
+            self._build()
+        try:
+            return self._itemFeatures[itemId]
+        except KeyError:
+            pass
+        # Tag value is None if there is no tag.
+        return self._setItemTag(itemId, rawItem.GetTag(ItemFeatureSettings._TAG_ITEM_FEATURES_CODE))
+
+    def _parseTag(self, tagValue):
+        """ Gets parsed features tag value.
+
+        Items share parsed values since rigs have only a handful of distinct feature sets.
+
+        Returns
+        -------
+        (tuple, frozenset)
+        """
+        try:
+            return self._parsedTags[tagValue]
+        except KeyError:
+            pass
+
+        if tagValue:
+            identifiers = tuple(tagValue.split(ItemFeatureSettings._SEPARATOR))
+        else:
+            identifiers = ()
+        parsed = (identifiers, frozenset(identifiers))
+        self._parsedTags[tagValue] = parsed
+        return parsed
+
+    def _setItemTag(self, itemId, tagValue):
+        try:
+            previous = self._itemFeatures[itemId]
+        except KeyError:
+            previous = None
+        if previous is not None:
+            for identifier in previous[1]:
+                try:
+                    self._itemsByFeature[identifier].discard(itemId)
+                except KeyError:
+                    pass
+
+        parsed = self._parseTag(tagValue)
+        self._itemFeatures[itemId] = parsed
+        for identifier in parsed[1]:
+            try:
+                self._itemsByFeature[identifier].add(itemId)
+            except KeyError:
+                self._itemsByFeature[identifier] = set([itemId])
+        return parsed
+
+    def _build(self):
+        """ Builds index with a single sweep over features tags of all scene items.
+        """
+        self._itemFeatures = {}
+        self._itemsByFeature = {}
+        self._parsedTags = {}
+
+        scene = lx.object.Scene(lxu.select.SceneSelection().current())
+        tagCode = ItemFeatureSettings._TAG_ITEM_FEATURES_CODE
+        for x in range(scene.ItemCount(lx.symbol.iTYPE_ANY)):
+            rawItem = scene.ItemByIndex(lx.symbol.iTYPE_ANY, x)
+            self._setItemTag(rawItem.Ident(), rawItem.GetTag(tagCode))
+
+        self._built = True
+
+    def __init__(self):
+        self._parsedTags = {}
+        self._itemFeatures = {}
+        self._itemsByFeature = {}
+        self._built = False
+
 
 class ItemFeatureSettings(object):
     """ Use this class to get/set feature list on an item.
@@ -30,22 +248,13 @@ class ItemFeatureSettings(object):
             
         rawItem : lx.object.Item
         """
-        # Val will be None if there is no tag?
-        val = rawItem.GetTag(cls._TAG_ITEM_FEATURES_CODE)
-        if val is None:
-            return False
-
-        return identifier in val.split(cls._SEPARATOR)
+        return featureIndex.hasFeatureRaw(rawItem, identifier)
 
     # -------- Public methods
     
     @property
     def featureIdentifiers(self):
-        try:
-            val = self._modoItem.readTag(self._TAG_ITEM_FEATURES)
-        except LookupError:
-            return []
-        return val.split(self._SEPARATOR)
+        return list(featureIndex.getItemFeatures(self._modoItem))
     
     @featureIdentifiers.setter
     def featureIdentifiers(self, identsList):
@@ -66,6 +275,7 @@ class ItemFeatureSettings(object):
         else:
             tagVal = None
         self._modoItem.setTag(self._TAG_ITEM_FEATURES, tagVal)
+        featureIndex.updateItem(self._modoItem.id, tagVal)
 
     def addFeatureIdent(self, identifier):
         idents = self.featureIdentifiers
@@ -92,4 +302,41 @@ class ItemFeatureSettings(object):
         return v[:-1]
 
     def __init__(self, modoItem):
-        self._modoItem = modoItem
\ No newline at end of file
+        self._modoItem = modoItem
+
+
+featureIndex = ItemFeatureIndex()
+
+
+class ItemFeatureIndexEventHandler(EventHandler):
+    """ Keeps item feature index in sync with rig items being added and removed.
+    """
+
+    descIdentifier = 'featindex'
+    descUsername = 'Item Feature Index'
+
+    @property
+    def eventCallbacks(self):
+        return {c.EventTypes.ITEM_ADDED: self.event_itemAdded,
+                c.EventTypes.ITEM_REMOVED: self.event_itemRemoved,
+                c.EventTypes.MODULE_LOAD_POST: self.event_loadPost,
+                c.EventTypes.PIECE_LOAD_POST: self.event_loadPost
+                }
+
+    def event_itemAdded(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        featureIndex.updateItemFromTag(modoItem)
+
+    def event_itemRemoved(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        featureIndex.removeItem(modoItem.id)
+
+    def event_loadPost(self, **kwargs):
+        # Loaded items come with their features tags already set.
+        featureIndex.invalidateAll()
@@ -9,6 +9,21 @@ import lx
 import lxu
 import modo
 
+from . import const as c
+from .event_handler import EventHandler
+
+def _copyValue(value):
+    """ Copies settings value.
+
+    Settings are json compatible so only dicts and lists need to be copied,
+    this is a lot faster than copy.deepcopy().
+    """
+    if type(value) is dict:
+        return dict([(key, _copyValue(item)) for key, item in value.items()])
+    if type(value) is list:
+        return [_copyValue(item) for item in value]
+    return value
+
 
 class ItemSettings(object):
     """ Item settings.
@@ -27,11 +42,91 @@ class ItemSettings(object):
     Settings are saved to item each time any setting or group is set.
     Use batchEdit property to change multiple settings and save only once
     at the end.
+
+    Parsed settings are cached per item id so constructing settings object
+    for the same item again does not read and parse tags again. Cache entry is
+    replaced each time settings are saved and the entire cache is cleared by
+    scene listener and at the start of rs commands so changes made to tags
+    behind the scenes (undo for example) are picked up.
+    Settings objects share parsed settings with the cache until they are about
+    to change them, a private copy is made then (copy-on-write). So read only
+    settings objects are cheap and changes are not visible to other settings
+    objects until they are saved.
+
+    Write-back mode defers saving settings to items until the mode is ended.
+    All the changes done to settings of an item while the mode is on
+    are saved to that item once with a single write per tag.
     """
 
     TAG_SINGLE = 'RSIS'
     TAG_GROUPS = 'RSIG'
 
+    _cache = {}
+    _writeBackDepth = 0
+    _pendingWrites = {}
+
+    # -------- Class methods
+
+    @classmethod
+    def beginWriteBack(cls):
+        """ Starts write-back mode.
+
+        Calls can be nested, settings are written to items
+        when the outermost write-back block ends.
+        """
+        cls._writeBackDepth += 1
+
+    @classmethod
+    def endWriteBack(cls):
+        """ Ends write-back mode and writes all pending settings to items.
+        """
+        if cls._writeBackDepth == 0:
+            return
+        cls._writeBackDepth -= 1
+        if cls._writeBackDepth == 0:
+            cls.flushWriteBack()
+
+    @classmethod
+    def flushWriteBack(cls):
+        """ Writes all pending settings to items without ending write-back mode.
+
+        Call this before anything that reads settings tags directly
+        such as saving presets or duplicating items.
+
+        Returns
+        -------
+        int
+            Number of items settings were written to.
+        """
+        pending = cls._pendingWrites
+        cls._pendingWrites = {}
+        count = 0
+        for settings in list(pending.values()):
+            # Item may have been deleted or changed its type since settings were edited.
+            try:
+                settings._write()
+            except (LookupError, RuntimeError):
+                continue
+            count += 1
+        return count
+
+    @classmethod
+    def clearCache(cls):
+        """ Clears parsed settings cache.
+
+        Pending writes are not affected, settings of items with pending writes
+        stay in the cache since their tags are not written yet.
+        """
+        cls._cache = dict([(key, cls._cache[key]) for key in cls._pendingWrites if key in cls._cache])
+
+    @classmethod
+    def clearItemCache(cls, modoItem):
+        """ Removes settings of a single item from the cache.
+        """
+        key = cls._getCacheKey(modoItem)
+        if key is not None and key not in cls._pendingWrites:
+            cls._cache.pop(key, None)
+
     @property
     def batchEdit(self):
         return self._batchMode
@@ -56,10 +151,11 @@ class ItemSettings(object):
             Group of settings as dictionary of setting key/value pairs.
             Empty dictionary is returned when settings group does not exist.
         """
-        try:
-            return self._settingGroups[groupKey]
-        except KeyError:
+        if groupKey not in self._settingGroups:
             return {}
+        # Returned group can be edited by the caller.
+        self._makeOwn()
+        return self._settingGroups[groupKey]
 
     def get(self, settingKey, defaultValue=None):
         """ Gets a single setting by its key.
@@ -74,9 +170,14 @@ class ItemSettings(object):
             will be returned (None by default).
         """
         try:
-            return self._singleSettings[settingKey]
+            value = self._singleSettings[settingKey]
         except KeyError:
             return defaultValue
+        if self._shared and type(value) in (dict, list):
+            # Lists and dicts can be edited by the caller.
+            self._makeOwn()
+            value = self._singleSettings[settingKey]
+        return value
 
     def getFromGroup(self, groupKey, settingKey, defaultValue=None):
         """ Gets a single setting from a group.
@@ -90,9 +191,13 @@ class ItemSettings(object):
             Setting value or default value when setting cannot be found.
         """
         try:
-            return self._settingGroups[groupKey][settingKey]
+            value = self._settingGroups[groupKey][settingKey]
         except KeyError:
             return defaultValue
+        if self._shared and type(value) in (dict, list):
+            self._makeOwn()
+            value = self._settingGroups[groupKey][settingKey]
+        return value
 
     def set(self, settingKey, value):
         """ Sets a single setting by its key.
@@ -105,11 +210,13 @@ class ItemSettings(object):
         value :
             Setting value to be stored on an item.
         """
+        self._makeOwn()
         self._singleSettings[settingKey] = value
         if not self._batchMode:
             self.save()
 
     def setInGroup(self, groupKey, settingKey, value):
+        self._makeOwn()
         try:
             settings = self._settingGroups[groupKey]
         except KeyError:
@@ -131,6 +238,7 @@ class ItemSettings(object):
         settingsDict : dict
             Settings group has to be a dictionary of setting key/value pairs.
         """
+        self._makeOwn()
         self._settingGroups[groupKey] = settingsDict
         if not self._batchMode:
             self.save()
@@ -139,6 +247,7 @@ class ItemSettings(object):
         """ Deletes single setting by its key.
         """
         if settingKey in self._singleSettings:
+            self._makeOwn()
             del self._singleSettings[settingKey]
             if not self._batchMode:
                 self.save()
@@ -147,6 +256,7 @@ class ItemSettings(object):
 
     def deleteGroup(self, groupKey):
         if groupKey in self._settingGroups:
+            self._makeOwn()
             del self._settingGroups[groupKey]
             if not self._batchMode:
                 self.save()
@@ -155,9 +265,11 @@ class ItemSettings(object):
     
     def deleteInGroup(self, groupKey, settingKey):
         try:
-            del self._settingGroups[groupKey][settingKey]
+            self._settingGroups[groupKey][settingKey]
         except KeyError:
             return False
+        self._makeOwn()
+        del self._settingGroups[groupKey][settingKey]
         if not self._batchMode:
             self.save()
         return True
@@ -171,45 +283,140 @@ class ItemSettings(object):
 
     def save(self):
         """ Saves all settings and setting groups to the item.
+
+        In write-back mode the item is only marked for saving
+        and the actual save happens when write-back mode ends.
         """
+        if self._writeBackDepth > 0 and self._cacheKey is not None:
+            # Other settings objects created for this item before write-back
+            # ends need to get the pending values from the cache.
+            self._cacheSettings()
+            self._pendingWrites[self._cacheKey] = self
+            return
+        self._write()
+
+    # -------- Private methods
+
+    def _write(self):
         if (self._singleSettings):
-            tagVal = json.dumps(self._singleSettings)
+            singleTagVal = json.dumps(self._singleSettings)
         else:
-            tagVal = None
-        self._modoItem.setTag(self.TAG_SINGLE, tagVal)
+            singleTagVal = None
+        self._modoItem.setTag(self.TAG_SINGLE, singleTagVal)
 
         if (self._settingGroups):
-            tagVal = json.dumps(self._settingGroups)
+            groupsTagVal = json.dumps(self._settingGroups)
         else:
-            tagVal = None
-        self._modoItem.setTag(self.TAG_GROUPS, tagVal)
+            groupsTagVal = None
+        self._modoItem.setTag(self.TAG_GROUPS, groupsTagVal)
 
-    # -------- Private methods
+        if self._cacheKey is not None:
+            self._cacheSettings()
+
+    def _cacheSettings(self):
+        """ Puts current settings in the cache, they're shared with the cache from now on.
+        """
+        self._cache[self._cacheKey] = (self._singleSettings, self._settingGroups)
+        self._shared = True
+
+    def _makeOwn(self):
+        """ Makes private copy of settings shared with the cache before they're changed.
+        """
+        if not self._shared:
+            return
+        self._singleSettings = _copyValue(self._singleSettings)
+        self._settingGroups = _copyValue(self._settingGroups)
+        self._shared = False
 
     def _reset(self):
         self._singleSettings = {}
         self._settingGroups = {}
+        self._shared = False
+
+    def _readTag(self, tag):
+        try:
+            return self._modoItem.readTag(tag)
+        except LookupError:
+            pass
+        return None
 
     def _load(self):
         self._reset()
+
+        if self._cacheKey is not None:
+            try:
+                self._singleSettings, self._settingGroups = self._cache[self._cacheKey]
+                self._shared = True
+                return
+            except KeyError:
+                pass
+
+        singleTagVal = self._readTag(self.TAG_SINGLE)
+        if singleTagVal is not None:
+            self._singleSettings = json.loads(singleTagVal)
+        groupsTagVal = self._readTag(self.TAG_GROUPS)
+        if groupsTagVal is not None:
+            self._settingGroups = json.loads(groupsTagVal)
+
+        if self._cacheKey is not None:
+            self._cacheSettings()
+
+    @classmethod
+    def _getCacheKey(cls, modoItem):
+        """ Gets the key under which item settings are cached.
+
+        Settings can be stored on scene as well as on an item.
+
+        Returns
+        -------
+        str, None
+            None is returned when key cannot be established, settings are not cached then.
+        """
         try:
-            self._singleSettings = json.loads(self._modoItem.readTag(self.TAG_SINGLE))
-        except LookupError:
+            return modoItem.id
+        except AttributeError:
             pass
-            
         try:
-            self._settingGroups = json.loads(self._modoItem.readTag(self.TAG_GROUPS))
-        except LookupError:
+            return modoItem.sceneItem.id
+        except AttributeError:
             pass
+        return None
 
     def __init__(self, modoItem):
         self._modoItem = modoItem
+        self._cacheKey = self._getCacheKey(modoItem)
         self._singleSettings = {}
         self._settingGroups = {}
+        self._shared = False
         self._batchMode = False
         self._load()
 
 
+
+class ItemSettingsEventHandler(EventHandler):
+    """ Drops cached settings of items that are removed or replaced by loaded ones.
+    """
+
+    descIdentifier = 'itemsettings'
+    descUsername = 'Item Settings Cache'
+
+    @property
+    def eventCallbacks(self):
+        return {c.EventTypes.ITEM_REMOVED: self.event_itemRemoved,
+                c.EventTypes.MODULE_LOAD_POST: self.event_clearCache,
+                c.EventTypes.PIECE_LOAD_POST: self.event_clearCache
+                }
+
+    def event_itemRemoved(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        ItemSettings.clearItemCache(modoItem)
+
+    def event_clearCache(self, **kwargs):
+        ItemSettings.clearCache()
+
 class SettingsTag(object):
     """ Allows for storing a set of settings on a tag.
     
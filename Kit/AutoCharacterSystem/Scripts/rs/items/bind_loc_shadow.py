@@ -24,30 +24,54 @@ class BindLocatorShadow(Item):
     descPackages = ['rs.pkg.generic']
     descSynthName = False
 
+    # Shape channels are set with item.channel command which works on all selected items
+    # so shapes for many shadows can be set with just a few commands.
+    _SHAPE_CHANNELS = (('drawShape', 'custom'),
+                       ('isShape', 'circle'),
+                       ('isAlign', 'true'),
+                       ('isRadius', '0.005'),
+                       ('link', 'custom'),
+                       ('lsShape', 'box'),
+                       ('lsSolid', 'true'),
+                       ('lsAuto', 'true'))
+
+    # When True onAdd() skips setting up item shape.
+    # This is used when shadows are added in bulk and shapes are set for all of them at once.
+    _deferShapeSetup = False
+
     def onAdd(self, subtype):
-        modoItem = self.modoItem
-        ident = modoItem.id
-
-        if not modoItem.internalItem.PackageTest("glItemShape"):
-            modoItem.PackageAdd("glItemShape")
-
-        if not modoItem.internalItem.PackageTest("glLinkShape"):
-            modoItem.PackageAdd("glLinkShape")
-
-        # Set shape
-        lx.eval('!channel.value custom channel:{%s:drawShape}' % ident)
-        lx.eval('!channel.value circle channel:{%s:isShape}' % ident)
-        lx.eval('!channel.value true channel:{%s:isAlign}' % ident)
-        lx.eval('!channel.value 0.005 channel:{%s:isRadius}' % ident)
-
-        # Set link shape
-        lx.eval('!channel.value custom channel:{%s:link}' % ident)
-        lx.eval('!channel.value box channel:{%s:lsShape}' % ident)
-        lx.eval('!channel.value true channel:{%s:lsSolid}' % ident)
-        lx.eval('!channel.value true channel:{%s:lsAuto}' % ident)
-        
+        if self._deferShapeSetup:
+            return
+        self.setupShapes([self.modoItem])
+
+    @classmethod
+    def setupShapes(cls, modoItems):
+        """ Sets up item and link shapes and color for a number of shadow items.
+
+        The cost of this method doesn't depend on the number of items much
+        since commands are applied to all items at once.
+
+        Parameters
+        ----------
+        modoItems : [modo.Item]
+        """
+        if not modoItems:
+            return
+
+        for modoItem in modoItems:
+            if not modoItem.internalItem.PackageTest("glItemShape"):
+                modoItem.PackageAdd("glItemShape")
+
+            if not modoItem.internalItem.PackageTest("glLinkShape"):
+                modoItem.PackageAdd("glLinkShape")
+
+        modo.Scene().select(modoItems)
+
+        # Set shape and link shape
+        for channelName, value in cls._SHAPE_CHANNELS:
+            lx.eval('!item.channel locator$%s %s' % (channelName, value))
+
         # Set item color.
-        lx.eval('select.item {%s} set' % ident)
         lx.eval('item.editorColor orange')
 
     @property
@@ -94,4 +118,37 @@ class BindLocatorShadow(Item):
         shadow = cls.new(name)
         shadow.identifier = bindloc.modoItem.id
         shadow.sourceBindLocator = bindloc
-        return shadow
\ No newline at end of file
+        return shadow
+
+    @classmethod
+    def newFromBindLocators(cls, bindlocs, names):
+        """ Creates new bind locator shadows for a number of source bind locators.
+
+        This is a lot faster than creating shadows one by one with newFromBindLocator()
+        because shapes are set up for all new shadows in one go.
+
+        Parameters
+        ----------
+        bindlocs : [BindLocatorItem]
+
+        names : [str]
+            Names for new shadows, one for each bind locator.
+
+        Returns
+        -------
+        [BindLocatorShadow]
+            Shadows in the same order as source bind locators.
+        """
+        shadows = []
+        cls._deferShapeSetup = True
+        try:
+            for x, bindloc in enumerate(bindlocs):
+                shadow = cls.new(names[x])
+                shadow.identifier = bindloc.modoItem.id
+                shadow.sourceBindLocator = bindloc
+                shadows.append(shadow)
+        finally:
+            cls._deferShapeSetup = False
+
+        cls.setupShapes([shadow.modoItem for shadow in shadows])
+        return shadows
\ No newline at end of file
@@ -39,10 +39,10 @@ class BindProxyItem(MeshItem):
         if not relatedControllers:
             return
 
-        try:
-            ctrl = ControllerItemFeature(relatedControllers[0])
-        except TypeError:
+        ctrls = ControllerItemFeature.getFromItems(relatedControllers[:1])
+        if not ctrls:
             return
+        ctrl = ctrls[0]
         xitem = modox.Item(ctrl.modoItem.internalItem)
         itemCmd = xitem.itemCommand
         color = bindloc.regionColorRGB
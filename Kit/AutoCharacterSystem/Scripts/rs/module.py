@@ -25,6 +25,7 @@ from .component_setups.module import ModuleComponentSetup
 from .preset_thumbs.module import ModulePresetThumbnail
 from .item_features.identifier import IdentifierFeature
 from .item_feature_op import ItemFeatureOperator
+from .rig_index import rigIndex
 from .core import service
 from .util import run
 
@@ -606,15 +607,12 @@ class Module(Component):
         LookupError
             When item cannot be found.
         """
-        self._keyItem = None
-        self._key = itemIdentifierOrName
-        self.iterateOverHierarchy(self._isKeyItemWithIdent)
-        
-        if self._keyItem is None:
+        indexedItem = rigIndex.getModuleIndex(self).getHierarchyItemWithIdentifier(itemIdentifierOrName)
+        try:
+            return indexedItem.getRigItem()
+        except TypeError:
             raise LookupError
 
-        return self._keyItem
-
     def getRigItemsOfType(self, rigItemType):
         """
         Gets a list of rig items of a given type.
@@ -623,18 +621,18 @@ class Module(Component):
         -------
         [Item]
         """
-        self._tmpItems = []
-        self._tmpType = rigItemType
-        self.iterateOverItems(self._storeRigItemOfType)
-        return self._tmpItems
+        rigItems = []
+        for indexedItem in rigIndex.getModuleIndex(self).getItemsOfRigType(rigItemType):
+            try:
+                rigItems.append(indexedItem.getRigItem())
+            except TypeError:
+                continue
+        return rigItems
 
     def getModoItemsOfType(self, modoItemType):
         """ Gets a list of modo items with a given type in a module.
         """
-        self._tmpItems = []
-        self._tmpType = modoItemType
-        self.iterateOverItems(self._storeModoItemOfType)
-        return self._tmpItems
+        return [indexedItem.modoItem for indexedItem in rigIndex.getModuleIndex(self).getItemsOfModoType(modoItemType)]
 
     def getItemFeaturesByIdentifier(self, identifier):
         """
@@ -649,11 +647,13 @@ class Module(Component):
         except LookupError:
             return []
 
-        self._tmpFeatures = []
-        self._tmpClass = featureClass
-
-        self.iterateOverItems(self._storeItemFeaturesOfType)
-        return self._tmpFeatures
+        features = []
+        for indexedItem in rigIndex.getModuleIndex(self).getItemsWithFeature(identifier):
+            try:
+                features.append(featureClass(indexedItem.getRigItem()))
+            except TypeError:
+                continue
+        return features
 
     @property
     def keyItems(self):
@@ -1108,17 +1108,6 @@ class Module(Component):
             return True
         return False
         
-    def _isKeyItemWithIdent(self, modoItem):
-        """ Use this to get first item with given identifier.
-        """
-        try:
-            rigItem = item.Item.getFromModoItem(modoItem)
-        except TypeError:
-            return
-        if rigItem.identifier == self._key:
-            self._keyItem = rigItem
-            return True
-    
     def _isKeyItem(self, modoItem):
         """ Use this to get any key item.
         """
@@ -1130,24 +1119,6 @@ class Module(Component):
         if identifier:
             self._keyItems[identifier] = rigItem
         
-    def _storeModoItemOfType(self, modoItem):
-        if modoItem.type == self._tmpType:
-            self._tmpItems.append(modoItem)
-
-    def _storeRigItemOfType(self, modoItem):
-        try:
-            rigItem = Item.getFromModoItem(modoItem)
-        except TypeError:
-            return
-        if rigItem.type == self._tmpType:
-            self._tmpItems.append(rigItem)
-
-    def _storeItemFeaturesOfType(self, modoItem):
-        try:
-            self._tmpFeatures.append(self._tmpClass(modoItem))
-        except TypeError:
-            pass
-
     def _renameItem(self, itemToRename):
         try:
             rigItem = item.Item.getFromModoItem(itemToRename)
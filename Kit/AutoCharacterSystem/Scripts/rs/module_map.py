@@ -1,5 +1,7 @@
 
 
+from collections import deque
+
 import modox
 
 from . import const as c
@@ -8,6 +10,171 @@ from .items.root_item import RootItem
 from .items.plug import PlugItem
 
 
+class ModuleDependencyGraph(object):
+    """ Dependency graph of all the modules of a single rig.
+
+    Graph is built in a single pass over the modules map graph.
+    Dependency order, dependent modules queries and cycle detection
+    are all linear in number of modules and connections.
+    Plug to socket links that decide whether a module really depends
+    on another one are read lazily, once per module.
+
+    Parameters
+    ----------
+    rigRootModoItem : modo.Item
+    """
+
+    @property
+    def order(self):
+        """ Gets module root items in dependency order.
+
+        Each module comes after all the modules it depends on.
+        Modules that are part of dependency cycles are appended at the end.
+
+        Returns
+        -------
+        [modo.Item]
+        """
+        return self._order
+
+    @property
+    def cycleItems(self):
+        """ Gets module root items that are part of or depend on a dependency cycle.
+
+        Returns
+        -------
+        [modo.Item]
+            Empty list when there are no cycles in the graph.
+        """
+        return self._cycleItems
+
+    def getChildren(self, rootModoItem):
+        """ Gets root items of modules that are directly connected to a given module in the map.
+
+        Returns
+        -------
+        [modo.Item]
+        """
+        return self._children.get(rootModoItem.id, [])
+
+    def isDependent(self, rootModoItem, otherRootModoItem):
+        """ Tests if one module is dependent on another module.
+
+        This is the same test as ModuleMap.isModuleDependentOnOtherModule()
+        but plugs of each module are read only once.
+
+        Returns
+        -------
+        bool
+        """
+        targets = self._getPlugTargets(rootModoItem)
+        if None in targets:
+            return False
+        otherId = otherRootModoItem.id
+        for targetId in targets:
+            if targetId != otherId:
+                return False
+        return True
+
+    def getDependentItems(self, rootModoItem, recursive=False):
+        """ Gets root items of modules that depend on a given module.
+
+        Returns
+        -------
+        [modo.Item]
+        """
+        dependent = []
+        visited = set([rootModoItem.id])
+        stack = [rootModoItem]
+        while stack:
+            parent = stack.pop()
+            children = [child for child in self.getChildren(parent)
+                        if child.id not in visited and self.isDependent(child, parent)]
+            for child in children:
+                visited.add(child.id)
+                dependent.append(child)
+            if not recursive:
+                break
+            stack.extend(reversed(children))
+        return dependent
+
+    # -------- Private methods
+
+    def _build(self, rigRootModoItem):
+        self._children = {}
+        rootId = rigRootModoItem.id
+        discovered = [rigRootModoItem]
+        visited = set([rootId])
+        indegree = {}
+
+        queue = deque([rigRootModoItem])
+        while queue:
+            modoItem = queue.popleft()
+            children = modox.ItemUtils.getReverseGraphConnections(modoItem, ModuleMap.GRAPH_NAME)
+            self._children[modoItem.id] = children
+            for child in children:
+                indegree[child.id] = indegree.get(child.id, 0) + 1
+                if child.id not in visited:
+                    visited.add(child.id)
+                    discovered.append(child)
+                    queue.append(child)
+
+        # Topological sort, stack is used so modules that form a tree
+        # are ordered depth first, the same way module map always did.
+        self._order = []
+        emitted = set([rootId])
+        stack = [rigRootModoItem]
+        while stack:
+            modoItem = stack.pop()
+            if modoItem.id != rootId:
+                self._order.append(modoItem)
+            ready = []
+            for child in self._children[modoItem.id]:
+                indegree[child.id] -= 1
+                if indegree[child.id] == 0 and child.id not in emitted:
+                    emitted.add(child.id)
+                    ready.append(child)
+            stack.extend(reversed(ready))
+
+        # Whatever is left could not be sorted because of dependency cycle.
+        self._cycleItems = [modoItem for modoItem in discovered if modoItem.id not in emitted]
+        self._order.extend(self._cycleItems)
+
+    def _getPlugTargets(self, rootModoItem):
+        """ Gets ids of module roots that given module plugs are connected to.
+
+        Plugs connected to base module are skipped.
+
+        Returns
+        -------
+        list of str, None
+            None is in the list for each plug that is not connected.
+        """
+        try:
+            return self._plugTargets[rootModoItem.id]
+        except KeyError:
+            pass
+
+        targets = []
+        module = Module(rootModoItem)
+        for modoItem in module.getElementsFromSet(c.ElementSetType.PLUGS):
+            socket = PlugItem(modoItem).socket
+            if socket is None:
+                targets.append(None)
+                continue
+            # TODO: We're special casing connecting to base here, think if there's better way to solve it.
+            socketModuleRoot = socket.moduleRootItem
+            if socketModuleRoot.identifier == c.ModuleIdentifier.BASE:
+                continue
+            targets.append(socketModuleRoot.modoItem.id)
+        self._plugTargets[rootModoItem.id] = targets
+        return targets
+
+    def __init__(self, rigRootModoItem):
+        self._plugTargets = {}
+        self._build(rigRootModoItem)
+
+
 class ModuleMap(object):
     """ Module map allows for creating and maintaining dependencies between modules.
     
@@ -18,6 +185,41 @@ class ModuleMap(object):
     
     GRAPH_NAME = 'rs.modulesMap'
 
+    @classmethod
+    def invalidateGraphs(cls, rigRootId=None):
+        """ Clears cached dependency graphs.
+
+        Parameters
+        ----------
+        rigRootId : str, None
+            Id of the root item of the rig to clear graph for.
+            Pass None to clear graphs for all rigs.
+        """
+        if rigRootId is None:
+            cls._graphs = {}
+            return
+        try:
+            del cls._graphs[rigRootId]
+        except KeyError:
+            pass
+
+    @property
+    def graph(self):
+        """ Gets dependency graph for the rig, builds it if necessary.
+
+        Returns
+        -------
+        ModuleDependencyGraph
+        """
+        rigRootId = self._rigRoot.modoItem.id
+        try:
+            return ModuleMap._graphs[rigRootId]
+        except KeyError:
+            pass
+        graph = ModuleDependencyGraph(self._rigRoot.modoItem)
+        ModuleMap._graphs[rigRootId] = graph
+        return graph
+
     def addModuleToMap(self, module):
         """ Adds module to a map.
         
@@ -26,6 +228,7 @@ class ModuleMap(object):
         """
         modox.ItemUtils.clearForwardGraphConnections(module.rootModoItem, self.GRAPH_NAME)
         modox.ItemUtils.addForwardGraphConnections(module.rootModoItem, self._rigRoot.modoItem, self.GRAPH_NAME)
+        self.invalidateGraphs(self._rigRoot.modoItem.id)
     
     def addModuleDependency(self, module, targetModule):
         """ Adds dependency between modules.
@@ -37,6 +240,7 @@ class ModuleMap(object):
         """
         modox.ItemUtils.clearForwardGraphConnections(module.rootModoItem, self.GRAPH_NAME, self._rigRoot.modoItem)
         modox.ItemUtils.addForwardGraphConnections(module.rootModoItem, targetModule.rootModoItem, self.GRAPH_NAME)
+        self.invalidateGraphs(self._rigRoot.modoItem.id)
     
     def clearModuleDependency(self, module, targetModule=None):
         """ Clears dependency between modules.
@@ -52,6 +256,7 @@ class ModuleMap(object):
         if targetModule:
             targetItem = targetModule.rootModoItem
             modox.ItemUtils.clearForwardGraphConnections(module.rootModoItem, self.GRAPH_NAME, [targetItem])
+            self.invalidateGraphs(self._rigRoot.modoItem.id)
         
         # This should be done only if module is not depenend on any other modules
         if self.isModuleIndependent(module):
@@ -92,11 +297,20 @@ class ModuleMap(object):
     @property
     def map(self):
         """ Returns modules in dependency order.
+
+        Each module comes after all the modules it depends on.
+        """
+        return [Module(item) for item in self.graph.order]
+
+    @property
+    def hasCycles(self):
+        """ Tests whether there are dependency cycles between modules.
+
+        Returns
+        -------
+        bool
         """
-        tree = []
-        self._traverseMap(self._rigRoot.modoItem, tree)
-        modulesMap = [Module(item) for item in tree]
-        return modulesMap
+        return bool(self.graph.cycleItems)
     
     def getDependentModules(self, module, recursive=False):
         """ Gets modules that depend on a given module.
@@ -105,62 +319,11 @@ class ModuleMap(object):
         -------
         list of Module
         """
-        dependentModules = []
-        if recursive:
-            tree = []
-            self._traverseDependentModules(module, tree)
-            dependentModules = tree
-        else:
-            moduleRoots = modox.ItemUtils.getReverseGraphConnections(module.rootModoItem, self.GRAPH_NAME)
-            modules = [Module(rootModoItem) for rootModoItem in moduleRoots]
-            filteredModules = []
-            for mod in modules:
-                if self.isModuleDependentOnOtherModule(mod, module):
-                    filteredModules.append(mod)
-            dependentModules = filteredModules
-        return dependentModules
+        rootItems = self.graph.getDependentItems(module.rootModoItem, recursive=recursive)
+        return [Module(rootModoItem) for rootModoItem in rootItems]
     
     # -------- Private methods
 
-    def _traverseMap(cls, modoItem, tree):
-        """ Traverses map to find all modules starting with give one.
-        
-        Parameters
-        ----------
-        modoItem : modo.Item
-            Root of a module that traversal starts with.
-            
-        tree : list of modo.Item
-            Results will be appended to this list.
-            The list will be modules root modo items.
-        """
-        children = modox.ItemUtils.getReverseGraphConnections(modoItem, cls.GRAPH_NAME)
-        if children:
-            for child in children:
-                if child not in tree:
-                    tree.append(child)
-                cls._traverseMap(child, tree)
-
-    def _traverseDependentModules(self, module, tree):
-        """ Traverses map to find all modules dependent on a module that function starts with.
-        
-        Parameters
-        ----------
-        module : Module
-            The module the traversal starts with.
-        
-        tree : list of Module
-            Results will be appended to the list.
-        """
-        children = modox.ItemUtils.getReverseGraphConnections(module.rootModoItem, self.GRAPH_NAME)
-        if children:
-            for child in children:
-                childModule = Module(child)
-                if self.isModuleDependentOnOtherModule(childModule, module):
-                    if child not in tree:
-                        tree.append(childModule)
-                    self._traverseDependentModules(childModule, tree)
-
     def _isRelatedToTargetModule(self, module, targetModule):
         """ Tests if a module is related to the target module.
         
@@ -177,6 +340,8 @@ class ModuleMap(object):
                 return True # if there is a plug that is connected to the target module.
         return False
 
+    _graphs = {}
+
     def __init__(self, initItem):
         if isinstance(initItem, Module):
             initItem = initItem.rigRootItem
@@ -7,6 +7,30 @@ from .core import service as service
 
 
 class NameOperator(object):
+    """ Renders item names according to a naming scheme.
+
+    Rendered names are memoised per name format and name components
+    so when names of many items are rendered with the same operator
+    (renaming entire rig for example) the same name is never rendered twice.
+
+    Parameters
+    ----------
+    nameSchemeObject : NamingScheme
+    """
+
+    _NAME_COMPONENTS = (n.RIG_NAME,
+                        n.MODULE_NAME,
+                        n.BASE_NAME,
+                        n.ITEM_TYPE,
+                        n.ITEM_FEATURE,
+                        n.MODO_ITEM_TYPE,
+                        n.SIDE)
+    _CACHE_LIMIT = 20000
+
+    _PART_LITERAL = 0
+    _PART_COMPONENT = 1
+    _PART_LOOKUP = 2
+    _PART_FEATURES = 3
 
     def renderName(self, components):
         """ Renders name from given name components.
@@ -25,7 +49,7 @@ class NameOperator(object):
             except KeyError:
                 pass
 
-        return self._renderName(nameFormat, components)
+        return self._renderNameCached(nameFormat, components)
 
     def renderNameMeta(self, components):
         """ Renders name for meta rig item from given components.
@@ -39,90 +63,108 @@ class NameOperator(object):
             except KeyError:
                 pass
 
-        return self._renderName(nameFormat, components)
+        return self._renderNameCached(nameFormat, components)
 
-    def _renderName(self, nameFormat, components):
-        """ Renders full item name using given naming format and name components.
+    # -------- Private methods
+
+    def _renderNameCached(self, nameFormat, components):
+        """ Gets rendered name from cache or renders it and caches it.
         """
-        itemTypes = self._nameScheme.itemTypeTokens
+        get = components.get
+        # Item features come as a list.
+        features = get(n.ITEM_FEATURE)
+        if features is not None:
+            features = tuple(features)
+        key = (id(nameFormat),
+               get(n.RIG_NAME),
+               get(n.MODULE_NAME),
+               get(n.BASE_NAME),
+               get(n.ITEM_TYPE),
+               features,
+               get(n.MODO_ITEM_TYPE),
+               get(n.SIDE))
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        name = self._renderName(nameFormat, components)
+        if len(self._cache) >= self._CACHE_LIMIT:
+            self._cache = {}
+        self._cache[key] = name
+        return name
 
-        name = ''
-        nameComponents = [n.RIG_NAME,
-                          n.MODULE_NAME,
-                          n.BASE_NAME,
-                          n.ITEM_TYPE,
-                          n.ITEM_FEATURE,
-                          n.MODO_ITEM_TYPE,
-                          n.SIDE]
-
-        side = {c.Side.CENTER: self._nameScheme.centerToken,
-                c.Side.LEFT: self._nameScheme.leftToken,
-                c.Side.RIGHT: self._nameScheme.rightToken}
+    def _getCompiledFormat(self, nameFormat):
+        """ Gets name format with each token already resolved to the way it is rendered.
 
-        currentTokenResolved = False
-        for token in nameFormat:
-            previousTokenResolved = currentTokenResolved
-            currentTokenResolved = False
+        Returns
+        -------
+        [(int, str, dict)]
+            Part type, token and the token lookup table of the naming scheme
+            (None for literals and plain name components).
+        """
+        try:
+            return self._formats[id(nameFormat)]
+        except KeyError:
+            pass
 
+        compiled = []
+        for token in nameFormat:
             if token == n.ITEM_TYPE:
-                try:
-                    itemType = components[n.ITEM_TYPE]
-                except KeyError:
-                    continue
-
-                # resolve type ident with the types.
-                try:
-                    resolvedPart = self._nameScheme.itemTypeTokens[itemType]
-                except KeyError:
-                    continue
-
+                part = (self._PART_LOOKUP, token, self._nameScheme.itemTypeTokens)
             elif token == n.MODO_ITEM_TYPE:
-                try:
-                    modoItemType = components[n.MODO_ITEM_TYPE]
-                except KeyError:
-                    continue
-
-                try:
-                    resolvedPart = self._nameScheme.modoItemTypeTokens[modoItemType]
-                except KeyError:
-                    continue
-
-            elif token == n.ITEM_FEATURE:
-                allFeatures = ''
-
-                try:
-                    featureIdents = components[n.ITEM_FEATURE]
-                except KeyError:
-                    resolvedPart = None
-                else:
-                    for featureIdent in featureIdents:
-                        try:
-                            resolvedPart = self._nameScheme.itemFeatureTokens[featureIdent]
-                        except KeyError:
-                            resolvedPart = None
-                        if resolvedPart is not None:
-                            allFeatures += resolvedPart
-                    resolvedPart = allFeatures
-
+                part = (self._PART_LOOKUP, token, self._nameScheme.modoItemTypeTokens)
             elif token == n.SIDE:
-                try:
-                    resolvedPart = side[components[n.SIDE]]
-                except KeyError:
-                    continue
-
+                part = (self._PART_LOOKUP, token, self._sideTokens)
+            elif token == n.ITEM_FEATURE:
+                part = (self._PART_FEATURES, token, self._nameScheme.itemFeatureTokens)
             # This is for tokens that do not require any extra processing.
             # Note that if that token is not present in components it's
             # simply skipped when the name is rendered.
-            elif token in nameComponents:
+            elif token in self._NAME_COMPONENTS:
+                part = (self._PART_COMPONENT, token, None)
+            else:
+                # This for literal string
+                part = (self._PART_LITERAL, token, None)
+            compiled.append(part)
+
+        # Format list is kept with the compiled format so its id is not reused.
+        self._formats[id(nameFormat)] = compiled
+        self._formatsRefs.append(nameFormat)
+        return compiled
+
+    def _renderName(self, nameFormat, components):
+        """ Renders full item name using given naming format and name components.
+        """
+        name = ''
+        currentTokenResolved = False
+        for partType, token, lookup in self._getCompiledFormat(nameFormat):
+            previousTokenResolved = currentTokenResolved
+            currentTokenResolved = False
+
+            if partType == self._PART_LITERAL:
+                resolvedPart = token
+            else:
                 try:
-                    resolvedPart = components[token]
+                    value = components[token]
                 except KeyError:
                     continue
 
-            else:
-                # This for literal string
-                resolvedPart = token
-     
+                if partType == self._PART_COMPONENT:
+                    resolvedPart = value
+                elif partType == self._PART_LOOKUP:
+                    try:
+                        resolvedPart = lookup[value]
+                    except KeyError:
+                        continue
+                else:
+                    resolvedPart = ''
+                    for featureIdent in value:
+                        featureToken = lookup.get(featureIdent)
+                        if featureToken is not None:
+                            resolvedPart += featureToken
+
             if resolvedPart:
                 # If the string starts with '<' it means that it depends
                 # on previous token. Previous token needs to be successfully resolved
@@ -136,6 +178,12 @@ class NameOperator(object):
                 currentTokenResolved = True
 
         return name
-        
+
     def __init__(self, nameSchemeObject):
-        self._nameScheme = nameSchemeObject
\ No newline at end of file
+        self._nameScheme = nameSchemeObject
+        self._sideTokens = {c.Side.CENTER: nameSchemeObject.centerToken,
+                            c.Side.LEFT: nameSchemeObject.leftToken,
+                            c.Side.RIGHT: nameSchemeObject.rightToken}
+        self._cache = {}
+        self._formats = {}
+        self._formatsRefs = []
@@ -9,6 +9,8 @@ from .util import run
 from .core import service
 from .log import log
 from .item import Item
+from .rig_index import rigIndex
+from .item_settings import ItemSettings
 from .transmit import ConnectionsCache
 from .items.module_sub import GuideAssembly
 
@@ -390,6 +392,7 @@ class Piece(object):
             filename = service.path.generateFullFilenamePath(c.Path.PIECES, filename)
 
         service.events.send(c.EventTypes.PIECE_SAVE_PRE, piece=self)
+        ItemSettings.flushWriteBack()
         modox.Assembly.save(self.assemblyModoItem, filename, 'ACS Piece')
         
         if self.cacheOnSave:
@@ -418,6 +421,8 @@ class Piece(object):
         
         Don't use its object afterwards.
         """
+        # Assembly is deleted without sending item removed events.
+        rigIndex.invalidateAll()
         modox.Assembly.delete(self._assmItem.modoItem)
         
     # -------- Private methods
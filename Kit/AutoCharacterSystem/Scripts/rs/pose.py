@@ -287,11 +287,7 @@ class Pose(object):
     def _getAllControllers(self):
         controllersElementSet = self._rig[c.ElementSetType.CONTROLLERS]
         ctrls = []
-        for ctrlModoItem in controllersElementSet.elements:
-            try:
-                ctrl = ControllerItemFeature(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in ControllerItemFeature.getFromItems(controllersElementSet.elements):
             if ctrl.isStoredInPose:
                 ctrls.append(ctrl)
         return ctrls
@@ -523,6 +523,8 @@ class Preset(sys_component.SystemComponent):
                 log.out('%s' % chanid)
             log.stopChildEntries()
 
+        channelsToApply = []
+        channelsToApplyTo = []
         for channel in sourceChannels:
             channelUsername = modox.ChannelUtils.getChannelUsername(channel)
             try:
@@ -531,10 +533,13 @@ class Preset(sys_component.SystemComponent):
                 if debug.output:
                     log.out('No matching target channel!')
                 continue
-            self._applyValues(channel, targetChannel)
+            channelsToApply.append(channel)
+            channelsToApplyTo.append(targetChannel)
             if debug.output:
                 log.out('apply channel %s' % channel.name)
 
+        self._applyValues(channelsToApply, channelsToApplyTo)
+
         if debug.output:
             log.out('channels in preset: %d' % len(sourceChannels))
 
@@ -627,6 +632,8 @@ class Preset(sys_component.SystemComponent):
         channelsToSave = self.channels
         #chanSelection = modox.ChannelSelection()
         channelsDict = self._storeChannelsByPresetIdent(channelsToSave)
+        sourceChannels = []
+        destChannels = []
         for key in list(channelsDict.keys()):
             channel = channelsDict[key]
             username = key
@@ -639,22 +646,37 @@ class Preset(sys_component.SystemComponent):
                 if debug.output:
                     log.out('User channel %s was not created, it will not be stored in a preset.' % key, log.MSG_ERROR)
                 continue
-            self._storeValues(channel, userChan, self.descValuesType)
-            
+            sourceChannels.append(channel)
+            destChannels.append(userChan)
+
+        self._storeValues(sourceChannels, destChannels, self.descValuesType)
         #modox.TransformUtils.applyEdit()
         return contentItem
 
-    def _storeValues(self, sourceChannel, destChannel, valueType):
+    def _storeValues(self, sourceChannels, destChannels, valueType):
         """ Stores values into the preset.
+
+        All channels are transferred in one go without using channel copy/paste commands.
+
+        Parameters
+        ----------
+        sourceChannels : [modo.Channel]
+
+        destChannels : [modo.Channel]
+            Preset content item channels, in the same order as source ones.
         """
         if valueType == self.ValuesType.ENVELOPE:
-            run('select.channel {%s:%s} mode:set' % (sourceChannel.item.id, sourceChannel.name))
-            run('channel.copy')
-            run('select.channel {%s:%s} mode:set' % (destChannel.item.id, destChannel.name))
-            run('channel.paste')
+            modox.ChannelUtils.transferChannels(sourceChannels,
+                                                destChannels,
+                                                readAction=lx.symbol.s_ACTIONLAYER_EDIT,
+                                                writeAction=lx.symbol.s_ACTIONLAYER_EDIT,
+                                                envelopes=True)
         elif valueType == self.ValuesType.STATIC:
-            value = modox.ChannelUtils.getRawChannelValue(sourceChannel, None, self.descSourceAction)  # eval action.
-            destChannel.set(value, time=None, key=False, action=lx.symbol.s_ACTIONLAYER_SETUP)
+            modox.ChannelUtils.transferChannels(sourceChannels,
+                                                destChannels,
+                                                readAction=self.descSourceAction,
+                                                writeAction=lx.symbol.s_ACTIONLAYER_SETUP,
+                                                envelopes=False)
 
     def _storeSettings(self, contentItem):
         settings = self.descSettings
@@ -663,29 +685,36 @@ class Preset(sys_component.SystemComponent):
         iset = ItemSettings(contentItem)
         iset.setGroup(self._SETTINGS_GROUP, settings)
 
-    def _applyValues(self, sourceChannel, destChannel):
+    def _applyValues(self, sourceChannels, destChannels):
         """ Applies values from preset to the scene.
-        """
-        if sourceChannel.isAnimated:
-            # Copy envelope
-            run('select.channel {%s:%s} mode:set' % (sourceChannel.item.id, sourceChannel.name))
-            run('channel.copy')
-            run('select.channel {%s:%s} mode:set' % (destChannel.item.id, destChannel.name))
-            run('channel.paste')
-        else:
-            # Copy static value.
-            # We copy from edit action, that'll be good because we're copying from preset.
-            # We store on the designated target action setting the key only if target action
-            # is not setup and the relevant attribute is set to True.
-            value = modox.ChannelUtils.getRawChannelValue(sourceChannel, None, lx.symbol.s_ACTIONLAYER_EDIT)
-            setKey = self.descKeyStaticValue
-            if self.descTargetAction == lx.symbol.s_ACTIONLAYER_SETUP:
-                setKey = False
-            destChannel.set(value, time=None, key=setKey, action=self.descTargetAction)
+
+        Envelopes are copied as they are, static values are written
+        to the preset's target action and keyed only if target action
+        is not setup and the relevant attribute is set to True.
+        We always read from edit action, that'll be good because we're reading from preset.
+
+        Parameters
+        ----------
+        sourceChannels : [modo.Channel]
+            Preset content item channels.
+
+        destChannels : [modo.Channel]
+            Scene channels, in the same order as source ones.
+        """
+        setKey = self.descKeyStaticValue
+        if self.descTargetAction == lx.symbol.s_ACTIONLAYER_SETUP:
+            setKey = False
+        modox.ChannelUtils.transferChannels(sourceChannels,
+                                            destChannels,
+                                            readAction=lx.symbol.s_ACTIONLAYER_EDIT,
+                                            writeAction=self.descTargetAction,
+                                            envelopes=True,
+                                            keyStaticValues=setKey)
 
     def _save(self, contentItem, filename):
         """ Performs the actual save.
         """
+        ItemSettings.flushWriteBack()
         contentItem.select(replace=True)
         cmd = '!item.selPresetSave type:locator filename:{%s} desc:{%s}' % (filename, self.descPresetDescription)
         run(cmd)
@@ -9,10 +9,13 @@ import modox
 
 from .rig import Rig
 from .util import run
+from .util import getTime
 from .item import Item
 from .core import service
 from .item_features.controller import ControllerItemFeature
+from .retarget_map import RetargetNameIndex
 from .log import log
+from .debug import debug
 
 
 class Retargeting(object):
@@ -20,6 +23,7 @@ class Retargeting(object):
     Retargeting implementation. Works in tandem with the retargeting module.
     """
 
+    # Default mapping profile for the joint name index.
     # Lists of matching bvh items need to be all lowercase.
     # We skip hips.
     _RETARGET_MAP = collections.OrderedDict()
@@ -117,8 +121,49 @@ class Retargeting(object):
         'LPinky_3'
     ]
 
+    _USER_VALUE_NAME_PROFILES = 'rs.retargetNameProfiles'
+
+    # Max difference between baked and reduced animation,
+    # radians for rotation and meters for root position.
+    _REDUCE_TOLERANCE = 0.001
+
+    _nameIndex = None
+    _nameIndexProfiles = None
+
     RetargetRigIdentifier = _RETARGET_RIG_ID
 
+    @classmethod
+    def getNameIndex(cls):
+        """ Gets joint name index used to link source skeletons with retarget skeleton.
+
+        Index is compiled from the built-in mapping and mapping profile files
+        listed in the rs.retargetNameProfiles user value (separated with ';').
+        It is compiled once and reused until the list of profile files changes.
+
+        Returns
+        -------
+        RetargetNameIndex
+        """
+        profiles = service.userValue.get(cls._USER_VALUE_NAME_PROFILES)
+        if not profiles:
+            profiles = ''
+        if cls._nameIndex is not None and cls._nameIndexProfiles == profiles:
+            return cls._nameIndex
+
+        nameIndex = RetargetNameIndex(cls._RETARGET_MAP)
+        for filename in profiles.split(';'):
+            filename = filename.strip()
+            if not filename:
+                continue
+            try:
+                nameIndex.addProfileFromFile(filename)
+            except LookupError:
+                log.out('Retarget mapping profile %s cannot be loaded.' % filename, log.MSG_ERROR)
+
+        cls._nameIndex = nameIndex
+        cls._nameIndexProfiles = profiles
+        return nameIndex
+
     @classmethod
     def isRetargetingRig(cls, rig):
         """
@@ -336,28 +381,47 @@ class Retargeting(object):
         self._removeSetupFromRetargetSkeleton()
         run('group.current {%s} actr' % self._rig.actor.id)
 
-    def reduceKeys(self):
+    def reduceKeys(self, tolerance=None):
         """
-        Runs the hidden reduce keys command on all retarget skeleton animated channels.
+        Reduces keys on all retarget skeleton animated channels.
+
+        Keys are reduced in process in a single pass over all skeleton channels.
+
+        Parameters
+        ----------
+        tolerance : float, None
+            Max difference between baked and reduced animation.
+            When None the default reduce tolerance is used.
+
+        Returns
+        -------
+        int, int
+            Number of keys before and after reduction.
         """
-        channels = self._getSkeletonChannels()
-        for channel in channels:
-            run('!select.channel {%s:%s} mode:set' % (channel.item.id, channel.name))
-            run('!channel.keyReduce')
+        if tolerance is None:
+            tolerance = self._REDUCE_TOLERANCE
+
+        if debug.output:
+            timeStart = getTime()
+
+        reduceChannels, clearChannels = self._getSkeletonChannels()
+        keysBefore, keysAfter = modox.ChannelUtils.reduceKeys(reduceChannels, tolerance)
+
+        if debug.output:
+            log.out('Retarget keys reduced from %d to %d in: %f' % (keysBefore, keysAfter, getTime() - timeStart))
+        return keysBefore, keysAfter
 
     def setLinks(self):
         """
         Tries to find links between source and retarget skeleton joints automatically.
         """
-        sourceSkeletonJointsByRefName = self._collectSourceJointsByReferenceName()
-        mapKeys = list(self._RETARGET_MAP.keys())
-        sourceSkeletonKeys = list(sourceSkeletonJointsByRefName.keys())
-        connected = []
+        sourceJointsByName = {}
+        for joint in self.sourceSkeletonItems:
+            sourceJointsByName[joint.name] = joint
 
-        # Links have to be set in an order set by the _RETARGET_MAP keys order.
-        # This is crucial for correct linking with various naming conventions.
-        # First we create retarget map where we put all retarget skeleton joints
-        # mapped by their ref names.
+        nameIndex = self.getNameIndex()
+
+        # Retarget skeleton joints mapped by their ref names.
         retargetSkeletonMap = {}
         skeletonRoot = self._skeletonRoot.modoItem
         for retargetJoint in self.skeletonItems:
@@ -365,31 +429,28 @@ class Retargeting(object):
             if retargetJoint.modoItem == skeletonRoot:
                 continue
             refName = retargetJoint.getReferenceName(side=True, moduleName=False, basename=True)
-            if refName not in mapKeys:
+            if refName not in nameIndex.refNames:
                 continue
             retargetSkeletonMap[refName] = retargetJoint
 
-        # Now we go through all the keys in retarget map
-        # meaning all retarget skeleton joints and we try to match a link for them.
-        for mapKey in mapKeys:
-            for match in self._RETARGET_MAP[mapKey]:
-                if match not in sourceSkeletonKeys:
-                    continue
+        # Links come in the order of the mapping, this is crucial
+        # for correct linking with various naming conventions.
+        # Each retarget joint gets a list of source joints to try,
+        # if link with the best match cannot be made the next one is tried.
+        links = nameIndex.resolveLinks(list(sourceJointsByName.keys()), set(retargetSkeletonMap.keys()))
+        connected = set()
+        for refName, sourceNames in links.items():
+            targetModoItem = retargetSkeletonMap[refName].modoItem
+            for sourceName in sourceNames:
                 # If connection was already made on some other item - skip it.
                 # This is used for spine joints where with different naming
                 # conventions if a chest connection was made a spine1
                 # connection to the same joint won't be made.
-                if match in connected:
-                    continue
-
-                # Need to skip non-existent references.
-                # That's because the spine maybe shorter and missing one joint.
-                try:
-                    if self._setLink(sourceSkeletonJointsByRefName[match], retargetSkeletonMap[mapKey].modoItem):
-                        connected.append(match)
-                        break
-                except KeyError:
+                if sourceName in connected:
                     continue
+                if self._setLink(sourceJointsByName[sourceName], targetModoItem):
+                    connected.add(sourceName)
+                    break
         return True
 
     def clearMapping(self):
@@ -443,38 +504,42 @@ class Retargeting(object):
         Removes keyframes from position and scale channels.
         Position is not removed from root item only.
         """
-        skeletonHierarchy = modox.ItemUtils.getHierarchyRecursive(self._skeletonRoot.modoItem, includeRoot=True)
-        skeletonRootModoItem = self._skeletonRoot.modoItem
-
-        for joint in skeletonHierarchy:
-            if joint != skeletonRootModoItem:
-                for channelName in modox.c.TransformChannels.PositionAll:
-                    xfrmItem = modox.LocatorUtils.getTransformItem(joint, modox.c.TransformType.POSITION)
-                    srcChannel = xfrmItem.channel(channelName)
-                    modox.ChannelUtils.clearAnimation(srcChannel)
-
-            for channelName in modox.c.TransformChannels.ScaleAll:
-                xfrmItem = modox.LocatorUtils.getTransformItem(joint, modox.c.TransformType.SCALE)
-                srcChannel = xfrmItem.channel(channelName)
-                modox.ChannelUtils.clearAnimation(srcChannel)
+        reduceChannels, clearChannels = self._getSkeletonChannels()
+        modox.ChannelUtils.clearAnimation(clearChannels)
 
     def _getSkeletonChannels(self):
-        channels = []
-        skeletonHierarchy = modox.ItemUtils.getHierarchyRecursive(self._skeletonRoot.modoItem, includeRoot=True)
+        """
+        Gets retarget skeleton channels in a single hierarchy walk.
+
+        Returns
+        -------
+        [modo.Channel], [modo.Channel]
+            Channels that keep baked animation (rotation and root position)
+            and channels which animation is removed after baking (the rest of position and scale).
+        """
+        reduceChannels = []
+        clearChannels = []
+        skeletonRootModoItem = self._skeletonRoot.modoItem
+        skeletonHierarchy = modox.ItemUtils.getHierarchyRecursive(skeletonRootModoItem, includeRoot=True)
         for joint in skeletonHierarchy:
-            # Add position for root item only
-            if joint == self._skeletonRoot.modoItem:
-                xfrmItem = modox.LocatorUtils.getTransformItem(joint, modox.c.TransformType.POSITION)
-                channels.append(xfrmItem.channel(modox.c.TransformChannels.PositionX))
-                channels.append(xfrmItem.channel(modox.c.TransformChannels.PositionY))
-                channels.append(xfrmItem.channel(modox.c.TransformChannels.PositionZ))
+            # Keep position for root item only
+            xfrmItem = modox.LocatorUtils.getTransformItem(joint, modox.c.TransformType.POSITION)
+            if joint == skeletonRootModoItem:
+                positionChannels = reduceChannels
+            else:
+                positionChannels = clearChannels
+            for channelName in modox.c.TransformChannels.PositionAll:
+                positionChannels.append(xfrmItem.channel(channelName))
 
             xfrmItem = modox.LocatorUtils.getTransformItem(joint, modox.c.TransformType.ROTATION)
-            channels.append(xfrmItem.channel(modox.c.TransformChannels.RotationX))
-            channels.append(xfrmItem.channel(modox.c.TransformChannels.RotationY))
-            channels.append(xfrmItem.channel(modox.c.TransformChannels.RotationZ))
+            for channelName in modox.c.TransformChannels.RotationAll:
+                reduceChannels.append(xfrmItem.channel(channelName))
 
-        return channels
+            xfrmItem = modox.LocatorUtils.getTransformItem(joint, modox.c.TransformType.SCALE)
+            for channelName in modox.c.TransformChannels.ScaleAll:
+                clearChannels.append(xfrmItem.channel(channelName))
+
+        return reduceChannels, clearChannels
 
     def _setIK(self, rootModoItem):
         """ Set IK on the retarget skeleton.
@@ -567,37 +632,6 @@ class Retargeting(object):
         else:
             return True
 
-    def _collectSourceJointsByReferenceName(self):
-        """
-        Scans source skeleton and puts joints into dictionary keyed by reference name.
-
-        This name will be used to match retarget skeleton to source skeleton automatically.
-        """
-        collection = {}
-        for joint in self.sourceSkeletonItems:
-            name = joint.name
-
-            # Chuck off what comes before ':'
-            # This will remove rig name in Mixamo skeleton
-            nameTmp = name.split(':')
-            nameTmp = nameTmp[-1]
-
-            # Do the same as above with the '-' character
-            nameTmp = nameTmp.split('-')
-            nameTmp = nameTmp[-1]
-
-            # If we have parenthesis we take everything prior to parenthesis
-            nameTmp = nameTmp.split('(')[0]
-
-            # Remove spaces and underscores.
-            nameTmp = nameTmp.replace(' ', '')
-            nameTmp = nameTmp.replace(' ', '')
-
-            # Convert name to all lowercase.
-            nameKey = str(nameTmp).lower()
-            collection[nameKey] = joint
-        return collection
-
     def __init__(self, rigInitializer):
         if not isinstance(rigInitializer, Rig):
             try:
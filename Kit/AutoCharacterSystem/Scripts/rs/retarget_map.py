@@ -0,0 +1,482 @@
+
+""" Matching source skeleton joint names to retarget skeleton joints.
+"""
+
+import re
+import json
+import collections
+
+
+class JointSide(object):
+    CENTER = 0
+    LEFT = 1
+    RIGHT = 2
+
+
+class JointName(object):
+    """ Joint name broken into tokens that are used for matching.
+
+    Parameters
+    ----------
+    name : str
+        Either raw joint name from source skeleton or a name
+        from mapping profile.
+
+    Attributes
+    ----------
+    key : str
+        Normalised name that is used for exact matching.
+        It's lowercase name with namespaces, separators and
+        parenthesis suffix removed.
+
+    side : int
+        One of JointSide constants.
+
+    tokens : frozenset of str
+        Words that the name consists of, without side, number and noise words.
+
+    number : int, None
+        Numeric suffix of the name if there is one.
+    """
+
+    # Words that are used to segment names written without separators,
+    # such as 'righthandthumb1'. Longer words are matched first.
+    WORDS = ('abdomen', 'ankle', 'arm', 'back', 'ball', 'base', 'big', 'calf', 'carpal',
+             'chest', 'clavicle', 'collar', 'distal', 'elbow', 'end', 'finger', 'foot',
+             'fore', 'forearm', 'hand', 'head', 'heel', 'hip', 'hips', 'index', 'intermediate',
+             'jaw', 'knee', 'leg', 'little', 'low', 'lower', 'medial', 'meta', 'metacarpal',
+             'middle', 'mid', 'neck', 'pelvis', 'pinky', 'proximal', 'ring', 'root',
+             'shin', 'shldr', 'shoulder', 'spine', 'thigh', 'thumb', 'toe', 'toes', 'top',
+             'up', 'upper', 'waist', 'wrist')
+
+    # Words that do not say anything about the joint itself.
+    NOISE_WORDS = frozenset(('bip', 'bn', 'bone', 'def', 'drv', 'jnt', 'joint', 'mixamorig', 'sk', 'skel'))
+
+    SIDE_WORDS = {'left': JointSide.LEFT,
+                  'lft': JointSide.LEFT,
+                  'lt': JointSide.LEFT,
+                  'l': JointSide.LEFT,
+                  'right': JointSide.RIGHT,
+                  'rgt': JointSide.RIGHT,
+                  'rt': JointSide.RIGHT,
+                  'r': JointSide.RIGHT}
+
+    _SPLIT_CASE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+    _WORDS_BY_LENGTH = sorted(WORDS, key=len, reverse=True)
+    _WORDS_SET = frozenset(WORDS)
+
+    @classmethod
+    def normalize(cls, name):
+        """ Gets normalised name used for exact matching.
+
+        Returns
+        -------
+        str
+        """
+        name = cls._stripName(name)
+        for separator in (' ', '_', '.'):
+            name = name.replace(separator, '')
+        return str(name).lower()
+
+    # -------- Private methods
+
+    @classmethod
+    def _stripName(cls, name):
+        # Chuck off what comes before ':', '|' or '-'.
+        # This removes rig name in Mixamo skeleton or parent path
+        # in names coming from fbx files for example.
+        name = name.split(':')[-1]
+        name = name.split('|')[-1]
+        name = name.split('-')[-1]
+        # If we have parenthesis we take everything prior to parenthesis.
+        return name.split('(')[0]
+
+    @classmethod
+    def _segment(cls, chunk):
+        """ Splits lowercase chunk of letters into known words.
+
+        Returns
+        -------
+        [str], None
+            None when the chunk cannot be split into known words entirely.
+        """
+        words = []
+        position = 0
+        while position < len(chunk):
+            for word in cls._WORDS_BY_LENGTH:
+                if chunk.startswith(word, position):
+                    words.append(word)
+                    position += len(word)
+                    break
+            else:
+                return None
+        return words
+
+    @classmethod
+    def _tokenize(cls, name):
+        """ Splits name into side, words and number.
+
+        Words are segmented from all the letters of the name joined together
+        so names written in camel case (ForeArm), with separators (fore_arm)
+        or without any (forearm) give the same words.
+        """
+        name = cls._stripName(name)
+
+        rawTokens = []
+        for part in re.split(r'[^A-Za-z0-9]+', name):
+            rawTokens.extend(cls._SPLIT_CASE.findall(part))
+
+        side = JointSide.CENTER
+        number = None
+        letterTokens = []
+        afterNoise = False
+        for rawToken in rawTokens:
+            token = rawToken.lower()
+
+            if token.isdigit():
+                # Numbers that follow noise words (Bip01) are part of the noise.
+                if not afterNoise:
+                    number = int(token)
+                afterNoise = False
+                continue
+
+            afterNoise = False
+            if token in cls.NOISE_WORDS:
+                afterNoise = True
+                continue
+
+            if token in cls.SIDE_WORDS:
+                side = cls.SIDE_WORDS[token]
+                continue
+
+            letterTokens.append(token)
+
+        tokenSide, words = cls._segmentWithSide(''.join(letterTokens))
+        if words is None:
+            # Name has words that are not known, each token is used as it is then.
+            words = []
+            for token in letterTokens:
+                sideFromToken, segmented = cls._segmentWithSide(token)
+                if segmented is None:
+                    words.append(token)
+                    continue
+                if sideFromToken != JointSide.CENTER:
+                    side = sideFromToken
+                words.extend(segmented)
+        elif tokenSide != JointSide.CENTER:
+            side = tokenSide
+
+        return side, frozenset(words), number
+
+    @classmethod
+    def _segmentWithSide(cls, chunk):
+        """ Segments chunk into known words, taking side that is glued to the beginning into account.
+
+        Returns
+        -------
+        int, [str]
+            Side and list of words, words are None if chunk cannot be segmented.
+        """
+        if not chunk:
+            return JointSide.CENTER, []
+
+        words = cls._segment(chunk)
+        if words is not None:
+            return JointSide.CENTER, words
+
+        # Side glued to the name as in lshldr, rthigh or righthand.
+        for sideWord in ('l', 'r', 'left', 'right'):
+            if len(chunk) > len(sideWord) and chunk.startswith(sideWord):
+                words = cls._segment(chunk[len(sideWord):])
+                if words is not None:
+                    return cls.SIDE_WORDS[sideWord], words
+        return JointSide.CENTER, None
+
+    def __init__(self, name):
+        self.name = name
+        self.key = self.normalize(name)
+        self.side, self.tokens, self.number = self._tokenize(name)
+
+
+class RetargetNameIndex(object):
+    """ Precompiled index of mapping between retarget skeleton joints and source joint names.
+
+    Mapping profiles are ordered dictionaries of retarget joint reference names
+    and lists of source joint names that can be linked to the joint.
+    Profile names are compiled once when profile is added so the index
+    can be used to resolve links for any number of source skeletons.
+    Source joint names are compiled once as well, skeletons that come from
+    the same source use the same names.
+
+    Parameters
+    ----------
+    mapping : collections.OrderedDict, None
+        Initial mapping profile.
+
+    minScore : float
+        Minimum score that fuzzy match needs to have for the link to be made.
+    """
+
+    _CACHE_LIMIT = 20000
+
+    def addProfile(self, mapping, first=True):
+        """ Adds mapping profile to the index.
+
+        Parameters
+        ----------
+        mapping : collections.OrderedDict, [(str, [str])]
+            Retarget joint reference names and source joint names to match with them.
+            Order of retarget joints matters, links are resolved in that order.
+
+        first : bool
+            When True names from this profile are tried before names
+            that are already in the index.
+        """
+        if isinstance(mapping, dict):
+            mapping = mapping.items()
+
+        for refName, names in mapping:
+            compiled = [JointName(name) for name in names]
+            try:
+                existing = self._candidates[refName]
+            except KeyError:
+                self._candidates[refName] = compiled
+                continue
+            if first:
+                self._candidates[refName] = compiled + existing
+            else:
+                existing.extend(compiled)
+
+        self._refNames = frozenset(self._candidates.keys())
+        self._refTokens = {}
+        self._refKeys = collections.OrderedDict()
+        for refName, candidates in self._candidates.items():
+            # Exact keys without duplicates so a source joint is never listed twice.
+            keys = []
+            for candidate in candidates:
+                if candidate.key not in keys:
+                    keys.append(candidate.key)
+            self._refKeys[refName] = tuple(keys)
+            self._refTokens[refName] = frozenset([(candidate.side, token)
+                                                  for candidate in candidates
+                                                  for token in candidate.tokens])
+        self._fuzzyScores = {}
+
+    def addProfileFromFile(self, filename, first=True):
+        """ Adds mapping profile from a json file.
+
+        File needs to have a single object with retarget joint reference names as keys
+        and lists of source joint names as values.
+
+        Raises
+        ------
+        LookupError
+            When the file cannot be read or it's not a valid mapping profile.
+        """
+        try:
+            with open(filename, 'r') as f:
+                mapping = json.load(f, object_pairs_hook=collections.OrderedDict)
+        except (IOError, OSError, ValueError):
+            raise LookupError
+
+        if not isinstance(mapping, dict):
+            raise LookupError
+        for names in mapping.values():
+            if not isinstance(names, list):
+                raise LookupError
+
+        self.addProfile(mapping, first)
+
+    @property
+    def refNames(self):
+        """ Gets reference names of all retarget joints in the index.
+
+        Returns
+        -------
+        frozenset of str
+        """
+        return self._refNames
+
+    def resolveLinks(self, sourceNames, refNames=None):
+        """ Resolves links between retarget joints and source skeleton joints.
+
+        Exact matches of normalised names are resolved first for all joints,
+        following the order of the mapping. Joints that did not get exact match
+        get the best scoring fuzzy match among source joints that are not linked yet.
+
+        Parameters
+        ----------
+        sourceNames : [str]
+            Names of source skeleton joints.
+
+        refNames : set of str, None
+            Reference names of joints that retarget skeleton actually has.
+            Joints missing from the skeleton do not take source joints away
+            from other joints. None means all joints from the index.
+
+        Returns
+        -------
+        collections.OrderedDict
+            Retarget joint reference names and lists of source names to try linking
+            with the joint, best match first. Retarget joints without matches
+            are not included.
+        """
+        sourceByKey = {}
+        for name in sourceNames:
+            sourceByKey[self._getJointName(name).key] = name
+
+        links = collections.OrderedDict()
+        connected = set()
+        unmatched = []
+
+        getSource = sourceByKey.get
+        for refName, keys in self._refKeys.items():
+            if refNames is not None and refName not in refNames:
+                continue
+            matches = []
+            for key in keys:
+                sourceName = getSource(key)
+                if sourceName is None or sourceName in connected:
+                    continue
+                matches.append(sourceName)
+            if matches:
+                links[refName] = matches
+                connected.add(matches[0])
+            else:
+                unmatched.append(refName)
+
+        if not unmatched:
+            return links
+
+        # Inverted index of source joints that are not linked yet
+        # by side and word so each retarget joint is only scored
+        # against source joints that share at least one word with it.
+        sourceJoints = {}
+        byToken = {}
+        for name in sourceByKey.values():
+            if name in connected:
+                continue
+            joint = self._getJointName(name)
+            sourceJoints[name] = joint
+            for token in joint.tokens:
+                byToken.setdefault((joint.side, token), set()).add(name)
+
+        for refName in unmatched:
+            names = set()
+            for sideToken in self._refTokens[refName]:
+                names.update(byToken.get(sideToken, ()))
+            names -= connected
+
+            bestName = None
+            bestKey = None
+            for name in names:
+                score, rank = self._getFuzzyScore(refName, sourceJoints[name])
+                if score < self._minScore:
+                    continue
+                # Equal scores are resolved by the order of names in the mapping
+                # and then by source name so links do not depend on set order.
+                key = (-score, rank, name)
+                if bestKey is None or key < bestKey:
+                    bestKey = key
+                    bestName = name
+            if bestName is not None:
+                links[refName] = [bestName]
+                connected.add(bestName)
+
+        # Keep the order of links the same as the order of the mapping.
+        ordered = collections.OrderedDict()
+        for refName in self._candidates:
+            if refName in links:
+                ordered[refName] = links[refName]
+        return ordered
+
+    def resolveLinksBatch(self, sourceNamesLists, refNames=None):
+        """ Resolves links for a number of source skeletons using the same index.
+
+        Parameters
+        ----------
+        sourceNamesLists : [[str]]
+            List of joint names lists, one list per source skeleton.
+
+        refNames : set of str, None
+            Reference names of joints that retarget skeleton has.
+
+        Returns
+        -------
+        [collections.OrderedDict]
+            Links for each of the skeletons, see resolveLinks().
+        """
+        return [self.resolveLinks(sourceNames, refNames) for sourceNames in sourceNamesLists]
+
+    # -------- Private methods
+
+    def _getJointName(self, name):
+        """ Gets compiled source joint name from cache or compiles it.
+        """
+        try:
+            return self._sourceJoints[name]
+        except KeyError:
+            pass
+        joint = JointName(name)
+        if len(self._sourceJoints) >= self._CACHE_LIMIT:
+            self._sourceJoints = {}
+        self._sourceJoints[name] = joint
+        return joint
+
+    def _getFuzzyScore(self, refName, sourceJoint):
+        """ Gets best score of source joint against all names mapped to retarget joint.
+
+        Returns
+        -------
+        float, int
+            Best score and index of the mapping name that gave it.
+        """
+        key = (refName, sourceJoint.name)
+        try:
+            return self._fuzzyScores[key]
+        except KeyError:
+            pass
+
+        result = (0.0, 0)
+        for rank, candidate in enumerate(self._candidates[refName]):
+            score = self._score(candidate, sourceJoint)
+            if score > result[0]:
+                result = (score, rank)
+
+        if len(self._fuzzyScores) >= self._CACHE_LIMIT:
+            self._fuzzyScores = {}
+        self._fuzzyScores[key] = result
+        return result
+
+    def _score(self, candidate, sourceJoint):
+        """ Scores how well source joint name matches mapping name.
+
+        Returns
+        -------
+        float
+            0.0 for no match, 1.0 for perfect match.
+        """
+        if candidate.side != sourceJoint.side:
+            return 0.0
+        if candidate.number != sourceJoint.number:
+            if candidate.number is not None and sourceJoint.number is not None:
+                return 0.0
+            numberFactor = 0.9
+        else:
+            numberFactor = 1.0
+
+        common = len(candidate.tokens & sourceJoint.tokens)
+        if common == 0:
+            return 0.0
+        return numberFactor * common / float(len(candidate.tokens | sourceJoint.tokens))
+
+    def __init__(self, mapping=None, minScore=0.75):
+        self._candidates = collections.OrderedDict()
+        self._refNames = frozenset()
+        self._refTokens = {}
+        self._refKeys = collections.OrderedDict()
+        self._fuzzyScores = {}
+        self._minScore = minScore
+        self._sourceJoints = {}
+        if mapping is not None:
+            self.addProfile(mapping)
@@ -20,6 +20,7 @@ from .const import EventTypes as e
 from . import const as c
 from . import item
 from . import module_op
+from . import name_op
 from .component_setups.rig import RigComponentSetup
 from . import meta_rig_factory
 from . import meta_rig
@@ -29,6 +30,7 @@ from .resolutions import Resolutions
 from .item_feature_op import ItemFeatureOperator
 from .rig_assm_op import RigAssemblyOperator
 from .util import getTime
+from .rig_index import rigIndex
 
 
 class RigAccessLevel(object):
@@ -87,7 +89,7 @@ class Rig(object):
         """
         oldName = self._root.name
         self._root.name = newName
-        self._rigSetup.iterateOverItems(self._renderRigItemName)
+        self.renderNames()
         self._rigMeta.renderNames()
         service.events.send(c.EventTypes.RIG_NAME_CHANGED, rig=self, oldName=oldName, newName=newName)
 
@@ -286,6 +288,58 @@ class Rig(object):
     def iterateOverHierarchy(self, callback):
         self._rigSetup.iterateOverHierarchy(callback)
 
+    def renderNames(self):
+        """ Renders and sets names of all the rig items in a single pass.
+
+        Module items are taken from rig index so module each item belongs to
+        is known without looking it up per item. Rig and module root items
+        are resolved once and all items are rendered with the same name operator
+        that memoises rendered names. Item name is only set when it changes.
+
+        Meta rig names are not rendered, see MetaRig.renderNames().
+
+        Returns
+        -------
+        int
+            Number of items which names changed.
+        """
+        nameScheme = self._root.namingScheme
+        if nameScheme is None:
+            return 0
+
+        timeStart = getTime()
+
+        nameOp = name_op.NameOperator(nameScheme)
+        processedIds = set()
+        changedCount = 0
+        itemsCount = 0
+
+        for module in self.modules.allModules:
+            moduleRoot = module.rootItem
+            for indexedItem in rigIndex.getModuleIndex(module).setupItems:
+                processedIds.add(indexedItem.id)
+                if indexedItem.itemType is None:
+                    continue
+                itemsCount += 1
+                if self._renderItemNameInBatch(indexedItem.modoItem, nameOp, self._root, moduleRoot):
+                    changedCount += 1
+
+        # Items that are not part of any module.
+        # Module assemblies and all their subassemblies are already processed.
+        rigModoItems = []
+        self._rigSetup.iterateOverItems(rigModoItems.append,
+                                        assmTestCallback=lambda assmModoItem: assmModoItem.id not in processedIds)
+        for modoItem in rigModoItems:
+            if modoItem.id in processedIds:
+                continue
+            itemsCount += 1
+            if self._renderItemNameInBatch(modoItem, nameOp, self._root, None):
+                changedCount += 1
+
+        if debug.output:
+            log.out("Rendered %d rig item names, %d changed in: %f s." % (itemsCount, changedCount, getTime() - timeStart))
+        return changedCount
+
     def removeSetup(self):
         """ Removes the entire rig schematic setup from scene.
         
@@ -425,13 +479,20 @@ class Rig(object):
 
     # -------- Private methods
 
-    def _renderRigItemName(self, itemToRename):
+    def _renderItemNameInBatch(self, modoItem, nameOp, rigRoot, moduleRoot):
+        """ Renders and sets rig item name as part of renaming entire rig.
+
+        Returns
+        -------
+        bool
+            True if item name changed.
+        """
         try:
-            rigItem = item.Item.getFromModoItem(itemToRename)
+            rigItem = item.Item.getFromModoItem(modoItem)
         except TypeError:
-            return
-
-        rigItem.renderAndSetName()
+            return False
+        rigItem.cacheRootItems(rigRoot, moduleRoot)
+        return bool(rigItem.renderAndSetName(nameOp))
 
     @property
     def _rigSetup(self):
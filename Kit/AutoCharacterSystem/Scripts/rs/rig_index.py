@@ -0,0 +1,406 @@
+
+""" Rig index.
+
+    Scene level cache of rig items data.
+    Module lookups such as getting key items, items of a given type
+    or item features are answered from this index instead of walking
+    the entire component setup and reading item tags on every call.
+"""
+
+
+import modox
+
+from . import const as c
+from .const import EventTypes as e
+from .core import service
+from .event_handler import EventHandler
+from .item_feature_settings import ItemFeatureSettings
+from .component_setups.module import ModuleComponentSetup
+
+
+class IndexedItem(object):
+    """ Cached rig related data of a single item.
+
+    Parameters
+    ----------
+    modoItem : modo.Item
+
+    moduleRootId : str
+        Id of the module root item the item belongs to.
+    """
+
+    _TAG_ITEM = 'RSIT'
+    _TAG_IDENTIFIER = 'RSID'
+
+    __slots__ = ('modoItem', 'id', 'modoItemType', 'itemType', 'identifier', 'features', 'moduleRootId')
+
+    def getRigItem(self):
+        """ Gets rig item object for the indexed item.
+
+        Returns
+        -------
+        Item
+
+        Raises
+        ------
+        TypeError
+            When indexed item is not a rig item of any registered type.
+        """
+        if self.itemType is None:
+            raise TypeError
+        try:
+            itemClass = service.systemComponent.get(c.SystemComponentType.ITEM, self.itemType)
+        except LookupError:
+            raise TypeError
+        return itemClass(self.modoItem)
+
+    # -------- Private methods
+
+    def __init__(self, modoItem, moduleRootId):
+        self.modoItem = modoItem
+        self.id = modoItem.id
+        self.modoItemType = modoItem.type
+        self.moduleRootId = moduleRootId
+
+        try:
+            self.itemType = modoItem.readTag(self._TAG_ITEM)
+        except LookupError:
+            self.itemType = None
+
+        try:
+            self.identifier = modoItem.readTag(self._TAG_IDENTIFIER)
+        except LookupError:
+            self.identifier = None
+
+        # Features can only be initialised on rig items so there's
+        # no point in reading the features tag from other items.
+        if self.itemType is not None:
+            self.features = frozenset(ItemFeatureSettings(modoItem).featureIdentifiers)
+        else:
+            self.features = frozenset()
+
+
+class ModuleIndex(object):
+    """ Index of all the items that are part of a single module setup.
+
+    Index is built in a single pass over module setup assemblies
+    and a single pass over module setup hierarchy.
+
+    Parameters
+    ----------
+    setup : ModuleComponentSetup
+    """
+
+    def getItemsOfRigType(self, rigItemType):
+        """ Gets indexed items of a given rig item type, in setup iteration order.
+
+        Returns
+        -------
+        [IndexedItem]
+        """
+        return self._byItemType.get(rigItemType, [])
+
+    def getItemsOfModoType(self, modoItemType):
+        """ Gets indexed items of a given modo item type, in setup iteration order.
+
+        Returns
+        -------
+        [IndexedItem]
+        """
+        return self._byModoItemType.get(modoItemType, [])
+
+    def getItemsWithFeature(self, featureIdentifier):
+        """ Gets indexed items that have a given item feature added.
+
+        Returns
+        -------
+        [IndexedItem]
+        """
+        return self._byFeature.get(featureIdentifier, [])
+
+    def getHierarchyItemWithIdentifier(self, identifier):
+        """ Gets first item in setup hierarchy that has given identifier.
+
+        Returns
+        -------
+        IndexedItem
+
+        Raises
+        ------
+        LookupError
+        """
+        try:
+            return self._hierarchyByIdentifier[identifier]
+        except KeyError:
+            raise LookupError
+
+    @property
+    def setupItems(self):
+        """ Gets indexed items that are in module setup, in setup iteration order.
+
+        Returns
+        -------
+        [IndexedItem]
+        """
+        return [self._items[itemId] for itemId in self._itemsOrder]
+
+    def getItem(self, itemId):
+        """ Gets indexed item with a given id.
+
+        Returns
+        -------
+        IndexedItem
+
+        Raises
+        ------
+        LookupError
+        """
+        try:
+            return self._items[itemId]
+        except KeyError:
+            raise LookupError
+
+    @property
+    def itemIds(self):
+        """ Gets ids of all the items in the index.
+
+        Returns
+        -------
+        set of str
+        """
+        return set(self._items.keys())
+
+    def updateItem(self, modoItem):
+        """ Rereads data of an item that is already in the index.
+
+        Returns
+        -------
+        bool
+            False if the item is not in the index.
+        """
+        if modoItem.id not in self._items:
+            return False
+        # Rebuilding lookups is cheap compared to reading tags
+        # so we reread single item and redo the dictionaries.
+        self._items[modoItem.id] = IndexedItem(modoItem, self._moduleRootId)
+        self._buildLookups()
+        return True
+
+    # -------- Private methods
+
+    def _build(self, setup):
+        self._items = {}
+        self._itemsOrder = []
+        self._hierarchyOrder = []
+
+        setup.iterateOverItems(self._indexItem)
+
+        for modoItem in modox.ItemUtils.getHierarchyRecursive(setup.rootModoItem):
+            itemId = modoItem.id
+            if itemId not in self._items:
+                self._items[itemId] = IndexedItem(modoItem, self._moduleRootId)
+            self._hierarchyOrder.append(itemId)
+
+        self._buildLookups()
+
+    def _indexItem(self, modoItem):
+        itemId = modoItem.id
+        if itemId in self._items:
+            return
+        self._items[itemId] = IndexedItem(modoItem, self._moduleRootId)
+        self._itemsOrder.append(itemId)
+
+    def _buildLookups(self):
+        self._byItemType = {}
+        self._byModoItemType = {}
+        self._byFeature = {}
+        self._hierarchyByIdentifier = {}
+
+        for itemId in self._itemsOrder:
+            record = self._items[itemId]
+            if record.itemType is not None:
+                self._byItemType.setdefault(record.itemType, []).append(record)
+            self._byModoItemType.setdefault(record.modoItemType, []).append(record)
+            for feature in record.features:
+                self._byFeature.setdefault(feature, []).append(record)
+
+        for itemId in self._hierarchyOrder:
+            record = self._items[itemId]
+            if record.itemType is None or not record.identifier:
+                continue
+            if record.identifier not in self._hierarchyByIdentifier:
+                self._hierarchyByIdentifier[record.identifier] = record
+
+    def __init__(self, setup):
+        self._moduleRootId = setup.rootModoItem.id
+        self._build(setup)
+
+
+class RigIndex(object):
+    """ Scene wide index of rig items.
+
+    Module indexes are built lazily on first query and are kept
+    until one of the indexed items changes.
+    Item added/removed/changed events invalidate relevant parts of the index.
+    Undo and manual edits in item list do not send any rig events so the index
+    is also cleared by scene listener when scene is changed outside of rs commands
+    and at the start of every rs command execution.
+    """
+
+    def getModuleIndex(self, module):
+        """ Gets index for a given module, builds it if necessary.
+
+        Parameters
+        ----------
+        module : Module
+
+        Returns
+        -------
+        ModuleIndex
+        """
+        try:
+            return self._modules[module.rootModoItem.id]
+        except KeyError:
+            pass
+        return self._indexModule(module.setup)
+
+    def getIndexedItem(self, modoItem):
+        """ Gets indexed data of a given item, builds index of its module if necessary.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+
+        Returns
+        -------
+        IndexedItem
+
+        Raises
+        ------
+        LookupError
+            When item is not part of any module.
+        """
+        itemId = modoItem.id
+        try:
+            moduleIndex = self._modules[self._moduleByItemId[itemId]]
+        except KeyError:
+            setup = ModuleComponentSetup.getSetupFromModoItem(modoItem)
+            if setup is None:
+                raise LookupError
+            try:
+                moduleIndex = self._modules[setup.rootModoItem.id]
+            except KeyError:
+                moduleIndex = self._indexModule(setup)
+        return moduleIndex.getItem(itemId)
+
+    def invalidateModule(self, moduleRootId):
+        """ Drops the index for a module with a given root item id.
+        """
+        try:
+            moduleIndex = self._modules.pop(moduleRootId)
+        except KeyError:
+            return
+        for itemId in moduleIndex.itemIds:
+            try:
+                del self._moduleByItemId[itemId]
+            except KeyError:
+                pass
+
+    def invalidateItem(self, modoItem, reindex=False):
+        """ Invalidates part of the index that the item belongs to.
+
+        Parameters
+        ----------
+        modoItem : modo.Item
+
+        reindex : bool
+            When True and the item is already indexed only that item's data is reread
+            instead of dropping the whole module index.
+        """
+        if not self._modules:
+            return
+
+        try:
+            moduleRootId = self._moduleByItemId[modoItem.id]
+        except KeyError:
+            moduleRootId = None
+
+        if moduleRootId is not None and reindex:
+            if self._modules[moduleRootId].updateItem(modoItem):
+                return
+
+        # Item that is not indexed yet can be added to one of the indexed modules.
+        if moduleRootId is None:
+            setup = ModuleComponentSetup.getSetupFromModoItem(modoItem)
+            if setup is None:
+                return
+            moduleRootId = setup.rootModoItem.id
+
+        self.invalidateModule(moduleRootId)
+
+    def invalidateAll(self):
+        """ Clears entire index.
+        """
+        self._modules = {}
+        self._moduleByItemId = {}
+
+    # -------- Private methods
+
+    def _indexModule(self, setup):
+        moduleIndex = ModuleIndex(setup)
+        rootId = setup.rootModoItem.id
+        self._modules[rootId] = moduleIndex
+        for itemId in moduleIndex.itemIds:
+            self._moduleByItemId[itemId] = rootId
+        return moduleIndex
+
+    def __init__(self):
+        self._modules = {}
+        self._moduleByItemId = {}
+
+
+rigIndex = RigIndex()
+
+
+class RigIndexEventHandler(EventHandler):
+    """ Keeps rig index in sync with changes to rig items.
+    """
+
+    descIdentifier = 'rigindex'
+    descUsername = 'Rig Index'
+
+    @property
+    def eventCallbacks(self):
+        return {e.ITEM_ADDED: self.event_itemAdded,
+                e.ITEM_REMOVED: self.event_itemRemoved,
+                e.ITEM_CHANGED: self.event_itemChanged,
+                e.MODULE_DELETE_PRE: self.event_moduleDeletePre
+                }
+
+    def event_itemAdded(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        rigIndex.invalidateItem(modoItem)
+
+    def event_itemRemoved(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        rigIndex.invalidateItem(modoItem)
+
+    def event_itemChanged(self, **kwargs):
+        try:
+            modoItem = kwargs['item']
+        except KeyError:
+            return
+        rigIndex.invalidateItem(modoItem, reindex=True)
+
+    def event_moduleDeletePre(self, **kwargs):
+        try:
+            module = kwargs['module']
+        except KeyError:
+            return
+        rigIndex.invalidateModule(module.rootModoItem.id)
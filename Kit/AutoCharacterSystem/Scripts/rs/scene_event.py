@@ -1,7 +1,5 @@
 
 
-import time
-
 import lx
 import modo
 import modox
@@ -12,17 +10,55 @@ from .log import log
 from .component_setup import ComponentSetup
 from .item_utils import ItemUtils
 from .util import run
+from .util import getTime
 from .core import service
+from .debug import debug
+from . import name_op
 
 
 class SceneEvent(sys_component.SystemComponent):
+    """ Scene event is processed on idle, after it was queued by the scene listener.
+
+    Attributes
+    ----------
+    descCoalesce : bool
+        When True queued events of this type are coalesced into batches,
+        see SceneEventQueue. Otherwise each event is processed on its own,
+        in the order it was queued.
+    """
     
     descIdentifier = ''
     descUsername = ''
+    descCoalesce = False
     
     def process(self, arguments):
         pass
 
+    def processBatch(self, argumentsList):
+        """ Processes a number of queued events of this type in one go.
+
+        Default implementation simply processes events one by one.
+        Implement it when events can be processed faster together.
+
+        Parameters
+        ----------
+        argumentsList : [[str]]
+            Arguments of each event in the order events were queued.
+        """
+        for arguments in argumentsList:
+            self.process(arguments)
+
+    def getBatchKey(self, arguments):
+        """ Gets the key by which events of this type are grouped into batches.
+
+        Returns
+        -------
+        str, None
+            Events with the same key are processed together in one batch.
+            None puts all the events of this type into one batch.
+        """
+        return None
+
     @classmethod
     def sysType(cls):
         return c.SystemComponentType.SCENE_EVENT
@@ -64,6 +100,7 @@ class event_ItemParented(SceneEvent):
     
     descIdentifier = 'itemParent'
     descUsername = 'Item Parented'
+    descCoalesce = True
     
     def process(self, arguments):
         """ Processes item parented event.
@@ -74,27 +111,187 @@ class event_ItemParented(SceneEvent):
             0: identifier of the item that was parented.
             1: identifier of the rig root item
         """
-        s = time.time()
-    
-        scene = modo.Scene()
+        return self.processBatch([arguments])
+
+    def getBatchKey(self, arguments):
+        """ Item parented events are batched per rig.
+        """
         try:
-            itemToAdd = scene.item(arguments[0])
-        except LookupError:
-            return False
-
-        hrchSetup = ComponentSetup.getSetupFromItemInSetupHierarchy(itemToAdd)
-        if hrchSetup is None:
-            return False
-        hrchSetup.addItem(itemToAdd, addHierarchy=True)
-
-        # Refresh all added item names, if they're rig items.
-        hierarchy = modox.ItemUtils.getHierarchyRecursive(itemToAdd, includeRoot=True)
-        for item in hierarchy:
+            return arguments[1]
+        except IndexError:
+            return None
+
+    def processBatch(self, argumentsList):
+        """ Processes a number of item parented events at once.
+
+        Items are processed from the top of the hierarchy down.
+        Items which ancestor from the batch was already added to rig are skipped
+        as they were added together with the ancestor's hierarchy.
+        This way each parented hierarchy is walked and renamed once only.
+        """
+        scene = modo.Scene()
+        itemsToAdd = []
+        itemIds = set()
+        for arguments in argumentsList:
             try:
-                rigItem = ItemUtils.getItemFromModoItem(item)
-            except TypeError:
-                pass
+                modoItem = scene.item(arguments[0])
+            except (LookupError, IndexError):
+                continue
+            if modoItem.id in itemIds:
+                continue
+            itemIds.add(modoItem.id)
+            itemsToAdd.append((self._getDepth(modoItem), len(itemsToAdd), modoItem))
+        itemsToAdd.sort(key=lambda entry: entry[:2])
+
+        nameOps = {}
+        addedIds = set()
+        for depth, order, itemToAdd in itemsToAdd:
+            if self._isAncestorInSet(itemToAdd, addedIds):
+                continue
+
+            hrchSetup = ComponentSetup.getSetupFromItemInSetupHierarchy(itemToAdd)
+            if hrchSetup is None:
+                continue
+            hrchSetup.addItem(itemToAdd, addHierarchy=True)
+            addedIds.add(itemToAdd.id)
+
+            # Refresh all added item names, if they're rig items.
+            hierarchy = modox.ItemUtils.getHierarchyRecursive(itemToAdd, includeRoot=True)
+            for item in hierarchy:
+                try:
+                    rigItem = ItemUtils.getItemFromModoItem(item)
+                except TypeError:
+                    continue
+                rigItem.renderAndSetName(self._getNameOperator(rigItem, nameOps))
+        return True
+
+    # -------- Private methods
+
+    def _isAncestorInSet(self, modoItem, itemIds):
+        parent = modoItem.parent
+        while parent is not None:
+            if parent.id in itemIds:
+                return True
+            parent = parent.parent
+        return False
+
+    def _getDepth(self, modoItem):
+        depth = 0
+        parent = modoItem.parent
+        while parent is not None:
+            depth += 1
+            parent = parent.parent
+        return depth
+
+    def _getNameOperator(self, rigItem, nameOps):
+        """ Gets name operator for the rig of a given item.
+
+        Returns
+        -------
+        NameOperator, None
+            None when item's rig has no naming scheme.
+        """
+        rigRoot = rigItem.rigRootItem
+        if rigRoot is None:
+            return None
+        rigRootId = rigRoot.modoItem.id
+        try:
+            return nameOps[rigRootId]
+        except KeyError:
+            pass
+        nameScheme = rigRoot.namingScheme
+        nameOp = None
+        if nameScheme is not None:
+            nameOp = name_op.NameOperator(nameScheme)
+        nameOps[rigRootId] = nameOp
+        return nameOp
+
+
+class SceneEventQueue(object):
+    """ Scene events queue.
+
+    Queue string is a list of events separated with ';'.
+    Each event is its identifier optionally followed by ':'
+    and a list of comma separated arguments.
+
+    Consecutive events that support coalescing are grouped by identifier
+    and by batch key that the event gives for its arguments, duplicate events
+    are dropped and each group is processed with a single processBatch() call.
+    Groups are processed in the order in which their first event appears
+    in the queue. Other events are processed one by one, in queue order.
+    Such event is an ordering boundary, coalesced events queued before it
+    are processed before it and the ones queued after it are processed after it.
+
+    Parameters
+    ----------
+    queue : str
+    """
+
+    @property
+    def batches(self):
+        """ Gets coalesced events.
+
+        Returns
+        -------
+        [(SceneEvent, [[str]])]
+            List of scene event and arguments of all the events in the batch.
+        """
+        return self._batches
+
+    def process(self):
+        """ Processes all the queued events.
+        """
+        for eventObj, argumentsList in self._batches:
+            timeStart = getTime()
+            eventObj.processBatch(argumentsList)
+            if debug.output:
+                log.out('Scene event %s batch of %d processed in: %f s.' % (eventObj.descIdentifier,
+                                                                             len(argumentsList),
+                                                                             getTime() - timeStart))
+
+    # -------- Private methods
+
+    def _parse(self, queue):
+        self._batches = []
+        batchesByKey = {}
+        queued = set()
+
+        for event in queue.split(';'):
+            if not event:
+                continue
+            e = event.split(':')
+
+            identifier = e[0]
+            if len(e) > 1:
+                arguments = e[1].split(',')
             else:
-                rigItem.renderAndSetName()
+                arguments = []
+
+            try:
+                eventObj = service.systemComponent.get(c.SystemComponentType.SCENE_EVENT, identifier)
+            except LookupError:
+                if debug.output:
+                    log.out('Unrecognised scene event!', log.MSG_ERROR)
+                continue
+
+            if not eventObj.descCoalesce:
+                self._batches.append((eventObj, [arguments]))
+                # Events queued after this one cannot be merged into batches started before it.
+                batchesByKey = {}
+                queued = set()
+                continue
+
+            if (identifier, tuple(arguments)) in queued:
+                continue
+            queued.add((identifier, tuple(arguments)))
+
+            key = (identifier, eventObj.getBatchKey(arguments))
+            try:
+                batchesByKey[key].append(arguments)
+            except KeyError:
+                argumentsList = [arguments]
+                batchesByKey[key] = argumentsList
+                self._batches.append((eventObj, argumentsList))
 
-        log.out('Items added to rig event processing time: %f' % (time.time() - s))
+    def __init__(self, queue):
+        self._parse(queue)
@@ -0,0 +1,86 @@
+
+import lxifc
+import lx
+
+
+class SceneListener(lxifc.SceneItemListener, lxifc.SelectionListener):
+    """ Scene listener is used to drop scene caches when scene is changed outside of rs commands.
+
+    Undo, native item deletion, editing in item list or switching scenes
+    do not send any rig events so caches such as rig index or cached command
+    results would go stale without it.
+
+    rs commands pause the listener for the time of their execution.
+    They drop caches themselves when they start and keep them
+    in sync with rig events while they run.
+    """
+
+    def registerCallback(self, callback):
+        """ Registers new callback function.
+
+        Callback is called with no arguments each time scene is changed
+        in a way that can invalidate scene caches.
+
+        Parameters
+        ----------
+        callback : function
+        """
+        self._callbacks.append(callback)
+
+    def pause(self):
+        """ Pauses calling callbacks, calls can be nested.
+        """
+        self._pauseDepth += 1
+
+    def resume(self):
+        if self._pauseDepth > 0:
+            self._pauseDepth -= 1
+
+    def sil_SceneCreate(self, scene):
+        self._sceneChanged()
+
+    def sil_SceneDestroy(self, scene):
+        self._sceneChanged()
+
+    def sil_SceneClear(self, scene):
+        self._sceneChanged()
+
+    def sil_ItemAdd(self, item):
+        self._sceneChanged()
+
+    def sil_ItemRemove(self, item):
+        self._sceneChanged()
+
+    def sil_ItemParent(self, item):
+        self._sceneChanged()
+
+    def sil_ItemTag(self, item):
+        self._sceneChanged()
+
+    def sil_LinkAdd(self, graph, itemFrom, itemTo):
+        self._sceneChanged()
+
+    def sil_LinkRemAfter(self, graph, itemFrom, itemTo):
+        self._sceneChanged()
+
+    def selevent_Current(self, selType):
+        if selType == self._sceneSelType:
+            self._sceneChanged()
+
+    # -------- Private methods
+
+    def _sceneChanged(self):
+        if self._pauseDepth > 0:
+            return
+        for callback in self._callbacks:
+            callback()
+
+    def __init__(self):
+        self._callbacks = []
+        self._pauseDepth = 0
+        self._sceneSelType = lx.service.Selection().LookupType(lx.symbol.sSELTYP_SCENE)
+        self.COM = lx.object.Unknown(self)
+        lx.service.Listener().AddListener(self.COM)
+
+    def __del__(self):
+        lx.service.Listener().RemoveListener(self.COM)
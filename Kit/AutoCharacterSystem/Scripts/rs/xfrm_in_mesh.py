@@ -31,8 +31,242 @@ class HitDataPack(object):
     triangleIndex = -1
     baryCoords = modo.Vector3()
     coefficient = 0.0 # t for linear interpo in raycast and distance/polygon area in closest.
-    
-    
+
+
+class EmbeddedDataIndex(object):
+    """ Compact index of all the data embedded in a mesh.
+
+    Hit records are stored in polygon tags but scanning all the polygons of a dense mesh
+    to find the few that have data on them is very slow.
+    Index keeps all the records in a single tag on the mesh item, keyed by identifier,
+    so embedded data can be read without touching polygons at all.
+
+    Parameters
+    ----------
+    meshModoItem : modo.Mesh
+    """
+
+    TAG = 'RSGI'
+
+    @property
+    def exists(self):
+        """ Tests whether the mesh has the index stored.
+
+        Meshes with data embedded before the index was introduced have no index.
+
+        Returns
+        -------
+        bool
+        """
+        return self._records is not None
+
+    @property
+    def records(self):
+        """ Gets all embedded records.
+
+        Returns
+        -------
+        dict {str : [dict]}
+            Key is identifier, value is a list of hit records embedded under that identifier.
+        """
+        if self._records is None:
+            return {}
+        return self._records
+
+    @property
+    def polygonIndices(self):
+        """ Gets indices of all the polygons that have data embedded.
+
+        Returns
+        -------
+        set of int
+        """
+        indices = set()
+        for recordsList in list(self.records.values()):
+            for record in recordsList:
+                indices.add(record['pix'])
+        return indices
+
+    def addRecord(self, record):
+        """ Adds hit record to the index.
+
+        Index needs to be saved for the change to be stored on the mesh.
+        """
+        if self._records is None:
+            self._records = {}
+        self._records.setdefault(record['id'], []).append(record)
+
+    def save(self):
+        """ Stores index on the mesh.
+        """
+        if self._records is None:
+            return
+        self._mesh.setTag(self.TAG, json.dumps(self._records))
+
+    def clear(self):
+        """ Clears all the records from the index.
+
+        Empty index is still stored on the mesh so it's known
+        that there is no data embedded in polygons either.
+        """
+        self._records = {}
+        self.save()
+
+    # -------- Private methods
+
+    def __init__(self, meshModoItem):
+        self._mesh = meshModoItem
+        try:
+            self._records = json.loads(meshModoItem.readTag(self.TAG))
+        except LookupError:
+            self._records = None
+
+
+class MeshTrianglesCache(object):
+    """ Caches polygon triangles and vertex positions of a mesh geometry.
+
+    Each polygon and vertex is read from the mesh once only,
+    no matter how many hits are solved against it.
+
+    Parameters
+    ----------
+    geo : modo.Mesh.geometry
+    """
+
+    def getTriangles(self, polygonIndex):
+        """ Gets triangles of a polygon as tuples of 3 vertex positions.
+
+        Returns
+        -------
+        [((float, float, float), (float, float, float), (float, float, float))]
+        """
+        try:
+            return self._triangles[polygonIndex]
+        except KeyError:
+            pass
+
+        polygon = modo.MeshPolygon(polygonIndex, self._geo)
+        triangles = []
+        for triangle in polygon.triangles:
+            triangles.append((self._getVertexPosition(triangle[0]),
+                              self._getVertexPosition(triangle[1]),
+                              self._getVertexPosition(triangle[2])))
+        self._triangles[polygonIndex] = triangles
+        return triangles
+
+    def getNormalAndArea(self, polygonIndex):
+        """ Gets polygon normal and area.
+
+        Returns
+        -------
+        (float, float, float), float
+        """
+        try:
+            return self._normalAndArea[polygonIndex]
+        except KeyError:
+            pass
+        polygon = modo.MeshPolygon(polygonIndex, self._geo)
+        n = polygon.normal
+        value = ((n[0], n[1], n[2]), polygon.area)
+        self._normalAndArea[polygonIndex] = value
+        return value
+
+    # -------- Private methods
+
+    def _getVertexPosition(self, vertex):
+        key = getattr(vertex, 'index', vertex)
+        try:
+            return self._vertexPositions[key]
+        except KeyError:
+            pass
+        pos = modo.MeshVertex(vertex, self._geo).position
+        pos = (pos[0], pos[1], pos[2])
+        self._vertexPositions[key] = pos
+        return pos
+
+    def __init__(self, geo):
+        self._geo = geo
+        self._triangles = {}
+        self._normalAndArea = {}
+        self._vertexPositions = {}
+
+
+def solveBarycentricBatch(trianglesCache, hits):
+    """ Finds hit triangles and barycentric coordinates for a batch of hits.
+
+    Parameters
+    ----------
+    trianglesCache : MeshTrianglesCache
+
+    hits : [(int, (float, float, float))]
+        List of polygon index and hit point position pairs.
+
+    Returns
+    -------
+    [(int, (float, float, float)) or None]
+        Triangle index and barycentric coordinates for each hit, in the same order as hits.
+        None is in place of hits for which triangle could not be found.
+    """
+    results = []
+    for polygonIndex, point in hits:
+        result = None
+        triangles = trianglesCache.getTriangles(polygonIndex)
+        for x in range(len(triangles)):
+            P0, P1, P2 = triangles[x]
+            coords = barycentricCoordinates(P0, P1, P2, point)
+            if coords is None:
+                continue
+            u, v, w = coords
+            if (0.0 <= u <= 1.0 and 0.0 <= v <= 1.0 and 0.0 <= w <= 1.0):
+                result = (x, coords)
+                break
+        results.append(result)
+    return results
+
+
+def barycentricCoordinates(P0, P1, P2, P):
+    """ Calculates barycentric coordinates of a point against a triangle.
+
+    This is the same math as TransformsInMesh._barycentricCoordinates()
+    but it works on plain tuples which is a lot faster than doing it with modo.Vector3.
+
+    Returns
+    -------
+    (float, float, float), None
+        None is returned for degenerate triangles.
+    """
+    v0x = P1[0] - P0[0]; v0y = P1[1] - P0[1]; v0z = P1[2] - P0[2]
+    v1x = P2[0] - P0[0]; v1y = P2[1] - P0[1]; v1z = P2[2] - P0[2]
+    v2x = P[0] - P0[0]; v2y = P[1] - P0[1]; v2z = P[2] - P0[2]
+
+    d00 = v0x * v0x + v0y * v0y + v0z * v0z
+    d01 = v0x * v1x + v0y * v1y + v0z * v1z
+    d11 = v1x * v1x + v1y * v1y + v1z * v1z
+    d20 = v2x * v0x + v2y * v0y + v2z * v0z
+    d21 = v2x * v1x + v2y * v1y + v2z * v1z
+
+    denom = d00 * d11 - d01 * d01
+    if denom == 0.0:
+        return None
+    v = (d11 * d20 - d01 * d21) / denom
+    w = (d00 * d21 - d01 * d20) / denom
+    u = 1.0 - v - w
+    return u, v, w
+
+
+def pointFromBarycentric(triangle, coords):
+    """ Gets point position from triangle and barycentric coordinates.
+
+    Returns
+    -------
+    (float, float, float)
+    """
+    P0, P1, P2 = triangle
+    return (P0[0] * coords[0] + P1[0] * coords[1] + P2[0] * coords[2],
+            P0[1] * coords[0] + P1[1] * coords[1] + P2[1] * coords[2],
+            P0[2] * coords[0] + P1[2] * coords[1] + P2[2] * coords[2])
+
+
 class TransformsInMesh(object):
     """ Allows for embeding transform into meshes.
     
@@ -48,15 +282,31 @@ class TransformsInMesh(object):
     
     def clearEmbeddedData(self):
         """ Clears all the embedded data from mesh.
+
+        When the mesh has embedded data index only polygons listed in the index are cleared.
+        Full polygon scan is done for meshes that were embedded without the index.
         """
+        index = EmbeddedDataIndex(self._mesh)
+
         with self._mesh.geometry as geo:
-            for polygon in geo.polygons:
-                try:
-                    val = polygon.getTag(self.TAG_ID)
-                except LookupError:
-                    continue
-    
-                polygon.setTag(self.TAG_ID, None)
+            if index.exists:
+                for polygonIndex in index.polygonIndices:
+                    try:
+                        polygon = modo.MeshPolygon(polygonIndex, geo)
+                        polygon.getTag(self.TAG_ID)
+                    except LookupError:
+                        continue
+                    polygon.setTag(self.TAG_ID, None)
+            else:
+                for polygon in geo.polygons:
+                    try:
+                        val = polygon.getTag(self.TAG_ID)
+                    except LookupError:
+                        continue
+        
+                    polygon.setTag(self.TAG_ID, None)
+
+        index.clear()
         
     def embedItemPosition(self, modoItem, identifier, positionSource=EmbedPositionSource.AXIS_X):
         """ Embeds given modo item's position into the mesh.
@@ -78,60 +328,77 @@ class TransformsInMesh(object):
         bool
             True if embedding was successfull, False otherwise.
         """
-        xfrm = modox.LocatorUtils.getItemWorldTransform(modoItem)
-        pos = modo.Vector3(xfrm.position)
-        rot = modo.Matrix3(xfrm)
-        
-        if positionSource == EmbedPositionSource.CLOSEST:
-            self._storeHitByClosest(identifier, pos, rot)
-        else:
-            axis = positionSource # This is based on fact that position source 0,1,2 is the same as axis constant.
-            # Prepare rays for casting towards outisde of the mesh.
-            rayDir = modo.Vector3(rot.m[axis])
-            rayDirOpposite = modo.Vector3(rayDir)
-            rayDirOpposite *= -1.0
-    
-            with self._mesh.geometry as geo:
-                try:
-                    hitData = self._calculateHit(geo, pos, rayDir)
-                except ValueError:
-                    return False
-                
-                try:
-                    oppositeHitData = self._calculateHit(geo, pos, rayDirOpposite)
-                except ValueError:
-                    return False
-            
-                # Calculate where on the line between first and second hit point given position is.
-                AB = hitData.hitPoint - oppositeHitData.hitPoint
-                AP = pos - oppositeHitData.hitPoint
-                
-                t = AP.length() / AB.length()
-                
-                hitData.coefficient = t
-                oppositeHitData.coefficient = None
-                
-                hitData.identifier = identifier
-                oppositeHitData.identifier = identifier
-                
-                self._storeTag(geo, hitData)
-                self._storeTag(geo, oppositeHitData)
-            
-        return True
+        return bool(self.embedItemsPositions([(modoItem, identifier, positionSource)]))
 
-    def _storeHitByClosest(self, identifier, pos, rot):
-        """ Does Closest hit and stores hit data to tag.
+    def embedItemsPositions(self, itemsToEmbed):
+        """ Embeds positions of a number of items into the mesh in one go.
+
+        Mesh geometry is opened once, all the hits are calculated first
+        and barycentric coordinates for all of them are solved in a single batch.
+        Each polygon tag is then written once only, no matter how many hits are on it.
+
+        Parameters
+        ----------
+        itemsToEmbed : [(modo.Item, str, int)]
+            List of tuples, each containing item to embed, identifier under which
+            data will be embedded and position source (one of EmbedPositionSource.XXX).
+
+        Returns
+        -------
+        [str]
+            List of identifiers that were embedded successfully.
         """
+        hitGroups = []
+
         with self._mesh.geometry as geo:
-            try:
-                hitData = self._calculateHitByClosest(geo, pos)
-            except ValueError:
-                return False
-            
-            hitData.identifier = identifier
-            
-            self._storeTag(geo, hitData)
-        
+            for modoItem, identifier, positionSource in itemsToEmbed:
+                xfrm = modox.LocatorUtils.getItemWorldTransform(modoItem)
+                pos = modo.Vector3(xfrm.position)
+                rot = modo.Matrix3(xfrm)
+
+                try:
+                    hitGroups.append(self._calculateItemHits(geo, identifier, pos, rot, positionSource))
+                except ValueError:
+                    continue
+
+            # Solve all the hits at once.
+            trianglesCache = MeshTrianglesCache(geo)
+            hits = []
+            for group in hitGroups:
+                for hitData in group:
+                    hits.append((hitData.polygonIndex, hitData.hitPoint.values))
+            solved = solveBarycentricBatch(trianglesCache, hits)
+
+            index = EmbeddedDataIndex(self._mesh)
+            # Mesh can have data embedded before index was introduced,
+            # it needs to be added to index or it'd be lost on reading.
+            if not index.exists:
+                for recordsList in list(self._scanPolygonRecords(geo).values()):
+                    for record in recordsList:
+                        index.addRecord(record)
+            recordsByPolygon = {}
+            embedded = []
+            x = 0
+            for group in hitGroups:
+                groupSolved = solved[x:x + len(group)]
+                x += len(group)
+                # Item is only embedded when all of its hits could be solved.
+                if None in groupSolved:
+                    continue
+                for hitData, solution in zip(group, groupSolved):
+                    hitData.triangleIndex, hitData.baryCoords = solution
+                    record = self._hitDataToRecord(hitData)
+                    recordsByPolygon.setdefault(hitData.polygonIndex, []).append(record)
+                    index.addRecord(record)
+                embedded.append(group[0].identifier)
+
+            for polygonIndex in recordsByPolygon:
+                self._storeRecords(geo, polygonIndex, recordsByPolygon[polygonIndex])
+
+        if embedded:
+            index.save()
+        return embedded
+
     def embedOrientation(self, modoItem):
         pass
     
@@ -144,29 +411,22 @@ class TransformsInMesh(object):
             key is item identifier as it is within the mesh.
             value is the modo item itself.
         """
+        index = EmbeddedDataIndex(self._mesh)
+
         with self._mesh.geometry as geo:
-            points = {}
-            for polygon in geo.polygons:
-                try:
-                    val = polygon.getTag(self.TAG_ID)
-                except LookupError:
-                    continue
-    
-                valuesList = json.loads(val)
-                for hitd in valuesList:
-                    #hitd = 
-                    if hitd['id'] not in points:
-                        points[hitd['id']] = []
-                        
-                    points[hitd['id']].append(hitd)
-    
-            scene = modo.Scene()
-    
+            if index.exists:
+                points = index.records
+            else:
+                points = self._scanPolygonRecords(geo)
+
+            # Get all the positions first, mesh geometry does not change
+            # when items are moved so positions can be evaluated in one go.
+            trianglesCache = MeshTrianglesCache(geo)
+            positions = []
+
             log.out('----------')
             # Items need to be processed in hierarchical order.
             for key in list(itemsToSet.keys()):
-                targetItem = itemsToSet[key]
-    
                 log.out('Reading embedded position: %s' % key)
                 
                 if key not in points:
@@ -182,46 +442,83 @@ class TransformsInMesh(object):
                     elif record['tp'] == HitType.CLOSEST:
                         closestRecords.append(record)
                 
+                P = None
                 if raycastRecords:
-                    self._applyRaycastRecord(geo, targetItem, raycastRecords)
+                    P = self._getPositionFromRaycastRecords(trianglesCache, raycastRecords)
                 elif closestRecords:
-                    self._applyClosestRecord(geo, targetItem, closestRecords)
-    
-    def _applyClosestRecord(self, geo, targetItem, closestRecords):
-        """ Applies closest records to a given item.
+                    P = self._getPositionFromClosestRecords(trianglesCache, closestRecords)
+                if P is not None:
+                    positions.append((itemsToSet[key], P))
+
+        for targetItem, P in positions:
+            log.out('applying point at: %s' % str(P))
+            targetItem.select(replace=True)
+            lx.eval('item.setPosition x:%f y:%f z:%f mode:world' % (P[0], P[1], P[2]))
+
+    # -------- Private methods
+
+    def _scanPolygonRecords(self, geo):
+        """ Reads embedded records by scanning all mesh polygons.
+
+        This is used for meshes that had data embedded before index was introduced.
+
+        Returns
+        -------
+        dict {str : [dict]}
+        """
+        points = {}
+        for polygon in geo.polygons:
+            try:
+                val = polygon.getTag(self.TAG_ID)
+            except LookupError:
+                continue
+
+            valuesList = json.loads(val)
+            for hitd in valuesList:
+                if hitd['id'] not in points:
+                    points[hitd['id']] = []
+                    
+                points[hitd['id']].append(hitd)
+        return points
+
+    def _getPositionFromClosestRecords(self, trianglesCache, closestRecords):
+        """ Gets position from closest records.
+
+        Returns
+        -------
+        (float, float, float), None
         """
         points = []
         for r in closestRecords:
-            P = self._getPointPositionFromTriangle(geo, r['pix'], r['tix'], r['coords'])
+            P = self._getPointPositionFromTriangle(trianglesCache, r['pix'], r['tix'], r['coords'])
             if P is None:
                 continue
             
             # Offset the point along polygon normal by distance T multiplied by polygon area.
-            polygon = modo.MeshPolygon(r['pix'], geo)
-            n = polygon.normal
-            O = modo.Vector3(n[0], n[1], n[2]) * r['t'] * polygon.area
-            points.append(P + O)
-        
-        P = modo.Vector3()
-        for point in points:
-            P = P + point
-        
+            n, area = trianglesCache.getNormalAndArea(r['pix'])
+            scale = r['t'] * area
+            points.append((P[0] + n[0] * scale, P[1] + n[1] * scale, P[2] + n[2] * scale))
+
+        if not points:
+            return None
+
         # Add all points from all records together.
-        P = P * (1.0 / float(len(points)))
-        
-        log.out('applying point from closest at: %s' % str(P.values))
-    
-        targetItem.select(replace=True)
-        lx.eval('item.setPosition x:%f y:%f z:%f mode:world' % (P.values[0], P.values[1], P.values[2]))
-        
-    def _applyRaycastRecord(self, geo, targetItem, raycastRecords):
-        """
-        Parameters:
+        count = float(len(points))
+        return (sum([p[0] for p in points]) / count,
+                sum([p[1] for p in points]) / count,
+                sum([p[2] for p in points]) / count)
+
+    def _getPositionFromRaycastRecords(self, trianglesCache, raycastRecords):
+        """ Gets position from raycast records.
+
+        Returns
+        -------
+        (float, float, float), None
         """
         # Forced raycast compatibility.
         if len(raycastRecords) != 2:
             log.out('Bad polygon set entry')
-            return
+            return None
         
         data = raycastRecords[0]
         if data['t'] is None:
@@ -232,27 +529,27 @@ class TransformsInMesh(object):
             secondary = raycastRecords[0]
         
         # POINT FROM
-        PA = self._getPointPositionFromTriangle(geo, primary['pix'], primary['tix'], primary['coords'])
+        PA = self._getPointPositionFromTriangle(trianglesCache, primary['pix'], primary['tix'], primary['coords'])
 
         # POINT TO
-        PB = self._getPointPositionFromTriangle(geo, secondary['pix'], secondary['tix'], secondary['coords'])
+        PB = self._getPointPositionFromTriangle(trianglesCache, secondary['pix'], secondary['tix'], secondary['coords'])
     
+        if PA is None or PB is None:
+            return None
+
         # Get t
         t = secondary['t']
 
-        P = PA + ((PB - PA) * t)
-
-        log.out('applying point at: %s' % str(P.values))
+        return (PA[0] + (PB[0] - PA[0]) * t,
+                PA[1] + (PB[1] - PA[1]) * t,
+                PA[2] + (PB[2] - PA[2]) * t)
 
-        targetItem.select(replace=True)
-        lx.eval('item.setPosition x:%f y:%f z:%f mode:world' % (P.values[0], P.values[1], P.values[2]))
-
-    def _getPointPositionFromTriangle(self, geo, polygonIndex, triangleIndex, barycoords):
+    def _getPointPositionFromTriangle(self, trianglesCache, polygonIndex, triangleIndex, barycoords):
         """ Gets a position for a point from data coming from a mesh.
         
         Parameters
         ----------
-        geo : modo.Geometry
+        trianglesCache : MeshTrianglesCache
         
         polygonIndex : int
         
@@ -263,52 +560,87 @@ class TransformsInMesh(object):
             
         Returns
         -------
-        modo.Vector3, None
+        (float, float, float), None
         """
-        polygon = modo.MeshPolygon(polygonIndex, geo)
-        triangles = polygon.triangles
+        triangles = trianglesCache.getTriangles(polygonIndex)
         if triangleIndex >= len(triangles):
             return None
-        verts = triangles[triangleIndex]
-        
-        vert = modo.MeshVertex(verts[0], geo)
-        P0 = modo.Vector3(vert.position)
-        vert = modo.MeshVertex(verts[1], geo)
-        P1 = modo.Vector3(vert.position)
-        vert = modo.MeshVertex(verts[2], geo)
-        P2 = modo.Vector3(vert.position)
+        return pointFromBarycentric(triangles[triangleIndex], barycoords)
 
-        P = P0 * barycoords[0] + P1 * barycoords[1] + P2 * barycoords[2]
-        return P
+    def _calculateItemHits(self, geo, identifier, pos, rot, positionSource):
+        """ Calculates all the hits needed to embed single item position.
 
-    # -------- Private methods
-    
-    def _storeTag(self, geo, hitData):
-        """ Stores given hit data as polygon tag.
-        
-        This methods needs to append to existing tag as it's possible that
-        multiple hit data records are on the same polygon.
+        Hits are returned without triangle and barycentric coordinates,
+        these are solved later for all items at once.
+
+        Returns
+        -------
+        [HitDataPack]
+
+        Raises
+        ------
+        ValueError
+            If any of the hits was not successfull.
+        """
+        if positionSource == EmbedPositionSource.CLOSEST:
+            hitData = self._calculateHitByClosest(geo, pos)
+            hitData.identifier = identifier
+            return [hitData]
+
+        axis = positionSource # This is based on fact that position source 0,1,2 is the same as axis constant.
+        # Prepare rays for casting towards outisde of the mesh.
+        rayDir = modo.Vector3(rot.m[axis])
+        rayDirOpposite = modo.Vector3(rayDir)
+        rayDirOpposite *= -1.0
+
+        hitData = self._calculateHit(geo, pos, rayDir)
+        oppositeHitData = self._calculateHit(geo, pos, rayDirOpposite)
+
+        # Calculate where on the line between first and second hit point given position is.
+        AB = hitData.hitPoint - oppositeHitData.hitPoint
+        AP = pos - oppositeHitData.hitPoint
         
+        t = AP.length() / AB.length()
         
-        Parameters
-        ----------
-        geo : modo.Mesh.geometry
+        hitData.coefficient = t
+        oppositeHitData.coefficient = None
         
-        hitData : HitData
+        hitData.identifier = identifier
+        oppositeHitData.identifier = identifier
+        return [hitData, oppositeHitData]
+
+    def _hitDataToRecord(self, hitData):
+        """ Converts hit data pack into a record that can be stored as json.
+
+        Returns
+        -------
+        dict
         """
-        polygon = modo.MeshPolygon(hitData.polygonIndex, geo)
-        
         values = {}
-        
         values['tp'] = hitData.type
         values['id'] = hitData.identifier
         values['coords'] = hitData.baryCoords
         values['pix'] = hitData.polygonIndex
         values['tix'] = hitData.triangleIndex
         values['t'] = hitData.coefficient
-    
-        log.out(str(values))
+        return values
 
+    def _storeRecords(self, geo, polygonIndex, records):
+        """ Stores given records as polygon tag.
+        
+        This methods needs to append to existing tag as it's possible that
+        polygon already has some records stored on it.
+        
+        Parameters
+        ----------
+        geo : modo.Mesh.geometry
+        
+        polygonIndex : int
+
+        records : [dict]
+        """
+        polygon = modo.MeshPolygon(polygonIndex, geo)
+        
         try:
             rawTagVal = polygon.getTag(self.TAG_ID)
             val = json.loads(rawTagVal)
@@ -316,9 +648,9 @@ class TransformsInMesh(object):
             val = None
             
         if val is None:
-            val = [values]
+            val = list(records)
         else:
-            val.append(values)
+            val.extend(records)
         polygon.setTag(self.TAG_ID, json.dumps(val))
     
     def _calculateHitByClosest(self, geo, pos):
@@ -344,36 +676,9 @@ class TransformsInMesh(object):
             lx.out('No closest hit.')
             raise ValueError
         
-        hitPoint = modo.Vector3(hitPos)
-
-        hitPolyIndex = rawPolygons.Index()
-        polygon = modo.MeshPolygon(hitPolyIndex, geo)
-
-        try:
-            triangleIndex, baryCoords = self._calculateHitTriangleAndCoordinates(geo, polygon, hitPoint)
-        except ValueError:
-            raise
-
-        hitData.hitPoint = hitPoint
-        hitData.polygonIndex = hitPolyIndex
-        hitData.triangleIndex =triangleIndex
-        hitData.baryCoords = baryCoords
+        hitData.hitPoint = modo.Vector3(hitPos)
+        hitData.polygonIndex = rawPolygons.Index()
         hitData.coefficient = dist / rawPolygons.Area()
-    
-        # debug
-        #loc = modo.Scene().addItem('locator', 'HitPoint')
-        #loc.position.x.set(hitData.hitPoint.x)
-        #loc.position.y.set(hitData.hitPoint.y)
-        #loc.position.z.set(hitData.hitPoint.z)
-        
-        #target = hitData.hitPoint + (modo.Vector3(normal) * dist)
-        #loc = modo.Scene().addItem('locator', 'Hit Target')
-        #loc.position.x.set(target.x)
-        #loc.position.y.set(target.y)
-        #loc.position.z.set(target.z)
-        
-        hitData.hitPoint
-        
         return hitData
 
     def _calculateHit(self, geo, pos, rayDir):
@@ -405,98 +710,9 @@ class TransformsInMesh(object):
             lx.out('Cannot embed the point')
             raise ValueError
         
-        hitPoint = pos + (rayDir * dist)
-
-        hitPolyIndex = rawPolygons.Index()
-        polygon = modo.MeshPolygon(hitPolyIndex, geo)
-
-        try:
-            triangleIndex, baryCoords = self._calculateHitTriangleAndCoordinates(geo, polygon, hitPoint)
-        except ValueError:
-            raise
-            
-        hitData.hitPoint = hitPoint
-        hitData.polygonIndex = hitPolyIndex
-        hitData.triangleIndex =triangleIndex
-        hitData.baryCoords = baryCoords
-        
+        hitData.hitPoint = pos + (rayDir * dist)
+        hitData.polygonIndex = rawPolygons.Index()
         return hitData
 
-    def _calculateHitTriangleAndCoordinates(self, geo, polygon, hitPoint):
-        """ Calculates barycentric coordinates of a point on a polygon.
-        
-        Parameters
-        ----------
-        polygon : modo.MeshPolygon
-        
-        Returns
-        -------
-        triangle Index : int
-        baryCoods : tuple of 3 floats
-        """
-        # Find triangle which was hit by the ray.
-        # This is done using barycentric coords.
-        triangles = polygon.triangles
-        baryCoords = None
-        triangleIndex = -1
-        for x in range(len(triangles)):
-            triangle = triangles[x]
-
-            ix = triangle[0]
-            vert = modo.MeshVertex(ix, geo)
-            P0 = modo.Vector3(vert.position)
-            
-            ix = triangle[1]
-            vert = modo.MeshVertex(ix, geo)
-            P1 = modo.Vector3(vert.position)
-
-            ix = triangle[2]
-            vert = modo.MeshVertex(ix, geo)
-            P2 = modo.Vector3(vert.position)
-                        
-            u, v, w = self._barycentricCoordinates(P0, P1, P2, hitPoint)
-            
-            # This is the triangle
-            if (0.0 <= u <= 1.0 and 0.0 <= v <= 1.0 and 0.0 <= w <= 1.0):
-                baryCoords = (u, v, w)
-                triangleIndex = x
-                return triangleIndex, baryCoords
-        
-        raise ValueError
-
-    def _barycentricCoordinates(self, P0, P1, P2, P):
-        """
-        Parameters
-        ----------
-        P0 : modo.Vector3
-        P1 : modo.Vector3
-        P2 : modo.Vector3
-        P  : modo.Vector3
-     
-        Returns the barycentric coords of P
-        
-        Transcribed from Christer Ericson's Real-Time Collision Detection (which, incidentally, is an excellent book)
-        This is effectively Cramer's rule for solving a linear system
-        """
-        v0 = P1 - P0
-        v1 = P2 - P0
-        v2 = P - P0
-     
-        # dot products
-        d00 = v0.dot(v0)
-        d01 = v0.dot(v1)
-        d11 = v1.dot(v1)
-        d20 = v2.dot(v0)
-        d21 = v2.dot(v1)
-        
-        denom = d00 * d11 - d01 * d01
-        v = (d11 * d20 - d01 * d21) / denom
-        w = (d00 * d21 - d01 * d20) / denom
-        u = 1.0 - v - w
-     
-        return u, v, w
-
     def __init__(self, meshModoItem):
         self._mesh = meshModoItem
-
-
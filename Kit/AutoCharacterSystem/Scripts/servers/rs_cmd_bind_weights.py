@@ -264,46 +264,17 @@ class CmdBindSelectNextWeightMap(rs.Command):
             Key is name of weight map, value is the strength amount being the sum
             of influences on all vertices.
         """
-        # Lists defining weight maps that are under mouse pointer/selection
-        wmapsToChooseFrom = []
-        wmapNamesToChooseFrom = []
-        # Dictionary that will contain strength for each weight map.
-        wmapStrengthByName = {}
-
         # Pick the first mesh from vertices list as the one that we want to work on.
-        meshToRead = verts[0][0] # tyoe : modo.Mesh
-        wmaps = meshToRead.geometry.vmaps.weightMaps
-
-        # generate a list of weight maps that have values above threshold set
-        # for the selected vertices
-        # Also calculates strength of each map by adding weights for all the
-        # vertices that we are scanning.
-        for x in range(len(verts)):
-            mesh = verts[x][0]
-            vertex = verts[x][1]
-            vertIndex = vertex.index
-
-            if mesh != meshToRead:
-                continue
+        meshToRead = verts[0][0] # type : modo.Mesh
+        vertIndices = [vertex.index for mesh, vertex in verts if mesh == meshToRead]
 
-            for wmap in wmaps:
-                weight = wmap[vertIndex]
-                if weight is None:
-                    continue
-                if weight[0] < 0.09:  # fixed threshold for now
-                    continue
-
-                if wmap.name not in wmapNamesToChooseFrom:
-                    wmapsToChooseFrom.append(wmap)
-                    wmapNamesToChooseFrom.append(wmap.name)
-
-                # Be sure to add weight for each processed vertex
-                # but only add it to maps that will be considered
-                # for selecting.
-                if wmap.name in wmapNamesToChooseFrom:
-                    if wmap.name not in wmapStrengthByName:
-                        wmapStrengthByName[wmap.name] = 0.0
-                    wmapStrengthByName[wmap.name] += weight[0]
+        # Weight maps that have values above threshold set for the vertices.
+        # Strength of each map is the sum of these values.
+        weights = modox.WeightMatrix(meshToRead, vertIndices)
+        mapTotals = weights.getMapTotals(threshold=0.09) # fixed threshold for now
+
+        wmapNamesToChooseFrom = [mapName for mapName, total in mapTotals]
+        wmapStrengthByName = dict(mapTotals)
 
         return wmapNamesToChooseFrom, wmapStrengthByName
 
@@ -452,40 +423,28 @@ class CmdBindShiftWeights(rs.RigCommand):
             vmapSelection = modox.VertexMapSelection()
             sel = vmapSelection.get(lx.symbol.i_VMAP_WEIGHT)
             mesh = vertSelection[0][0] # We assume all vertices come from the same mesh for performance reasons.
-            weightMaps = mesh.geometry.vmaps.weightMaps
-            filteredMaps = [map for map in weightMaps if map.name in sel]
-
-            for wmap in filteredMaps:
-
-                lowest = 1.0
-                highest = 0.0
-
-                total = 0.0
-
-                for v in vertSelection:
-                    vertIndex = v[1].index
-                    weight = wmap[vertIndex]
-                    if weight is None:
-                        lowest = 0.0
-                        continue
-                    weight = weight[0] # weight value is a vector
-                    if weight < lowest:
-                        lowest = weight
-                    if weight > highest:
-                        highest = weight
-                    total += weight
-
-                # apply here
+            vertIndices = [v[1].index for v in vertSelection if v[0] == mesh]
+
+            # All maps are read so weights can be normalized,
+            # everything is written back in one mesh edit at the end.
+            weights = modox.WeightMatrix(mesh, vertIndices)
+            filteredMaps = [mapName for mapName in weights.mapNames if mapName in sel]
+
+            for mapName in filteredMaps:
+                mapWeights = weights.getMapWeights(mapName)
+
                 val = None
                 if mode == 0: # average
-                    val = total / len(vertSelection)
+                    val = sum(mapWeights) / len(mapWeights)
                 elif mode == 1: # highest
-                    val = highest
+                    val = max([0.0] + mapWeights)
                 elif mode == 2: # lowest
-                    val = lowest
+                    val = min([1.0] + mapWeights)
 
                 if val is not None:
-                    vmapSelection.setByCommand(wmap.name, lx.symbol.i_VMAP_WEIGHT, modox.SelectionMode.REPLACE)
-                    rs.run('rs.bind.setWeights %f normalize:1 additive:0' % val)
+                    weights.setMapWeight(mapName, val, normalize=True)
+                    weights.prune(0.001)
+
+            weights.write()
 
 rs.cmd.bless(CmdBindShiftWeights, "rs.bind.shiftWeights")
\ No newline at end of file
@@ -95,11 +95,7 @@ class CmdBindLocatorControllerPopup(rs.Command):
         
         controllers = []
         
-        for ctrlModoItem in ctrlsSet.elements:
-            try:
-                ctrl = rs.Controller(ctrlModoItem)
-            except TypeError:
-                continue
+        for ctrl in rs.Controller.getFromItems(ctrlsSet.elements):
             if ctrl.item.moduleRootItem == moduleRoot:
                 controllers.append(ctrl)
         
@@ -102,12 +102,7 @@ class CmdSelectDynamicParentControllers(rs.RigCommand):
         list of Controllers or empty list
         """
         controllers = []
-        for item in modox.ItemSelection().getRaw():
-            try:
-                ctrl = rs.Controller(item)
-            except TypeError:
-                continue
-
+        for ctrl in rs.Controller.getFromItems(modox.ItemSelection().getRaw()):
             if ctrl.animationSpace != rs.Controller.AnimationSpace.DYNAMIC:
                 continue
 
@@ -195,12 +190,7 @@ class CmdControllerSetDynamicParent(rs.RigCommand):
         -------
         Controller
         """
-        for item in modox.ItemSelection().getRaw():
-            try:
-                ctrl = rs.Controller(item)
-            except TypeError:
-                continue
-
+        for ctrl in rs.Controller.getFromItems(modox.ItemSelection().getRaw()):
             dynaSpaceOp = controller_dyna_space_op.ControllerDynamicSpaceOperator(ctrl)
             if not dynaSpaceOp.hasDynamicSpace or not dynaSpaceOp.animatedDynamicSpace:
                 continue
@@ -351,12 +341,7 @@ class CmdControllerRemoveParent(rs.RigCommand):
         -------
         Controller
         """
-        for item in modox.ItemSelection().getRaw():
-            try:
-                ctrl = rs.Controller(item)
-            except TypeError:
-                continue
-
+        for ctrl in rs.Controller.getFromItems(modox.ItemSelection().getRaw()):
             dynaSpaceOp = controller_dyna_space_op.ControllerDynamicSpaceOperator(ctrl)
             if not dynaSpaceOp.hasDynamicSpace or not dynaSpaceOp.animatedDynamicSpace:
                 continue
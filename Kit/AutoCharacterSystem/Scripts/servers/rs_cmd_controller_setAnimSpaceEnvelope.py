@@ -71,12 +71,7 @@ class CmdControllerSetAnimationSpaceEnvelope(rs.Command):
         list of Controllers or empty list
         """
         controllers = []
-        for item in modox.ItemSelection().getRaw():
-            try:
-                ctrl = rs.Controller(item)
-            except TypeError:
-                continue
-
+        for ctrl in rs.Controller.getFromItems(modox.ItemSelection().getRaw()):
             # Either switcher or needs to have dynamic space.
             if (ctrl.item.type == rs.c.RigItemType.SPACE_SWITCHER or
                     ctrl.animationSpace == rs.Controller.AnimationSpace.DYNAMIC):
@@ -62,13 +62,17 @@ class CmdTransferWeights(modox.Command):
         monitor = modox.Monitor(ticks, "Transfer Weight Maps")
 
         for meshTo in meshesTo:
-            modox.VertexMapUtils.transferWeights(meshFrom,
-                                                 meshTo,
-                                                 wmaps,
-                                                 transferMethod,
-                                                 skipEmptyMaps,
-                                                 monitor,
-                                                 ticks)
+            report = modox.VertexMapUtils.transferWeightsBatch(meshFrom,
+                                                               meshTo,
+                                                               wmaps,
+                                                               transferMethod,
+                                                               skipEmptyMaps,
+                                                               monitor,
+                                                               ticks)
+            if rs.debug.output:
+                rs.log.out('Weights transfer to %s:' % meshTo.name)
+                for line in report.summary:
+                    rs.log.out(line)
 
         monitor.release()
 
@@ -12,31 +12,61 @@ class CmdItemCommand(rs.Command):
     def enable(self, msg):
         return True
 
+    def dropSceneCaches(self):
+        # This command runs on every item selection and doesn't edit the scene
+        # so it reuses rig index that is kept valid by scene listener.
+        return False
+
     def execute(self, msg, flags):
         itemSel = modox.ItemSelection()
         itemToTest = itemSel.getLastModo()
         if itemToTest is None:
             return
-            
+
+        # Rig item type and features are taken from the rig index
+        # so selecting an item doesn't have to read its tags each time.
         try:
-            rigItem = rs.ItemUtils.getItemFromModoItem(itemToTest)
-        except TypeError:
-            return
-        
+            indexedItem = rs.rigIndex.getIndexedItem(itemToTest)
+        except LookupError:
+            indexedItem = None
+
+        if indexedItem is not None:
+            try:
+                rigItem = indexedItem.getRigItem()
+            except TypeError:
+                return
+            featureIdents = indexedItem.features
+        else:
+            try:
+                rigItem = rs.ItemUtils.getItemFromModoItem(itemToTest)
+            except TypeError:
+                return
+            featureIdents = rs.ItemFeatures(rigItem).featureIdentifiers
+
         # Try to call onSelected() on the item.
         try:
             rigItem.onSelected()
         except AttributeError:
             pass
 
-        # Try to call onSelected() on all item features.
-        featureop = rs.ItemFeatures(rigItem.modoItem)
-        for feature in featureop.allFeatures:
+        # Call onSelected() on item features that implement it.
+        # Features without the callback are not initialised at all.
+        for ident in featureIdents:
+            try:
+                featureClass = rs.service.systemComponent.get(rs.c.SystemComponentType.ITEM_FEATURE, ident)
+            except LookupError:
+                continue
+            if not hasattr(featureClass, 'onSelected'):
+                continue
+            try:
+                feature = featureClass(rigItem)
+            except TypeError:
+                continue
             try:
                 feature.onSelected()
             except AttributeError:
                 pass
-        
+
         rs.service.events.send(rs.c.EventTypes.RIG_ITEM_SELECTED, item=rigItem)
 
 rs.cmd.bless(CmdItemCommand, 'rs.item.command')
\ No newline at end of file
@@ -32,6 +32,10 @@ class CmdDuplicateModule(rs.base_OnModuleCommand):
 
         return [offX, offY, offZ] + superArgs
 
+    def deferSettingsSave(self):
+        # Module is duplicated via preset so settings are read from item tags.
+        return False
+
     def execute(self, msg, flags):
         module = self.moduleToQuery
         if module is None:
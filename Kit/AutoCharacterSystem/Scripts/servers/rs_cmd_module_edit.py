@@ -41,6 +41,10 @@ class CmdEditModulePopup(rs.Command):
 
             return 0
 
+    def queryCacheOn(self):
+        # Notifiers cover all the changes that can affect the edit module index.
+        return True
+
     def execute(self, msg, flags):
         identIndex = self.getArgumentValue(self.ARG_LIST)
         if identIndex < 0:
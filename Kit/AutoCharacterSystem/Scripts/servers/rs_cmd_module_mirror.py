@@ -92,6 +92,10 @@ class CmdMirrorModule(rs.base_OnModuleCommand):
 
         return modox.Message.getMessageTextFromTable(rs.c.MessageTable.CMDTOOLTIP, key)
 
+    def deferSettingsSave(self):
+        # Module is duplicated via preset so settings are read from item tags.
+        return False
+
     def execute(self, msg, flags):
         mirrorAll = self.getArgumentValue(self.ARG_ALL)
         modulesToMirror = []
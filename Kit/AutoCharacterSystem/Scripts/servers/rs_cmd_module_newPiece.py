@@ -98,6 +98,10 @@ class CmdSavePiece(rs.Command):
         
         return [assm]
     
+    def deferSettingsSave(self):
+        # Settings are read from item tags when piece is saved.
+        return False
+
     def execute(self, msg, flags):
         scene = rs.Scene()
         scene.contexts.resetChanges()
@@ -64,6 +64,10 @@ class RSCmdModuleSave(rs.base_OnModuleCommand):
             return False
         return True
 
+    def deferSettingsSave(self):
+        # Settings are read from item tags when module is saved.
+        return False
+
     def execute(self, msg, flags):
         captureThumb = self.getArgumentValue(self.ARG_CAPTURE_THUMB)
 
@@ -136,6 +140,10 @@ class CmdModuleQuickSave(rs.base_OnModuleCommand):
                 return False
         return True
 
+    def deferSettingsSave(self):
+        # Settings are read from item tags when module is saved.
+        return False
+
     def execute(self, msg, flags):
         captureThumb = self.getArgumentValue(self.ARG_CAPTURE_THUMB)
 
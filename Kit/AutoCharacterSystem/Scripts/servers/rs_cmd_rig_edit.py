@@ -44,6 +44,13 @@ class CmdEditRigPopup(rs.Command):
 
             return index
 
+    def enableCacheOn(self):
+        return True
+
+    def queryCacheOn(self):
+        # Notifiers cover all the changes that can affect the edit rig index.
+        return True
+
     def execute(self, msg, flags):
         identIndex = self.getArgumentValue(self.ARG_LIST)
         if identIndex < 0:
@@ -1,6 +1,7 @@
 
 
 import os
+import json
 
 import lx
 import lxu
@@ -156,6 +157,83 @@ class CmdRigGameExportCommand(rs.RigCommand):
 rs.cmd.bless(CmdRigGameExportCommand, "rs.rig.gameExportCmd")
 
 
+class CmdRigGameExportBatch(rs.Command):
+    """ Exports all rigs listed in a game export queue file.
+
+    Queue file is json file saved with rs.game_export.GameExportQueue.save().
+    Optional manifest argument is a filename to save entire batch
+    export manifest to.
+
+    The command itself is not undoable, each queue entry is exported
+    with its own command that gets undone after export.
+    """
+
+    ARG_QUEUE = 'queue'
+    ARG_INCREMENTAL = 'incremental'
+    ARG_MANIFEST = 'manifest'
+
+    def arguments(self):
+        argQueue = rs.cmd.Argument(self.ARG_QUEUE, 'string')
+
+        argIncremental = rs.cmd.Argument(self.ARG_INCREMENTAL, 'boolean')
+        argIncremental.defaultValue = True
+        argIncremental.flags = 'optional'
+
+        argManifest = rs.cmd.Argument(self.ARG_MANIFEST, 'string')
+        argManifest.flags = 'optional'
+
+        return [argQueue, argIncremental, argManifest]
+
+    def flags(self):
+        return lx.symbol.fCMD_UI
+
+    def execute(self, msg, flags):
+        queue = rs.game_export.GameExportQueue()
+        try:
+            queue.load(self.getArgumentValue(self.ARG_QUEUE))
+        except LookupError:
+            rs.log.out("Cannot read game export queue file!", rs.log.MSG_ERROR)
+            return
+
+        ticksCount = 1000.0
+        monitor = modox.Monitor(ticksCount=ticksCount, title="Batch Game Export")
+
+        manifest = queue.do(monitor, ticksCount, incremental=self.getArgumentValue(self.ARG_INCREMENTAL))
+
+        monitor.release()
+
+        if self.isArgumentSet(self.ARG_MANIFEST):
+            with open(self.getArgumentValue(self.ARG_MANIFEST), 'w') as f:
+                json.dump(manifest, f, indent=4, sort_keys=True)
+
+rs.cmd.bless(CmdRigGameExportBatch, "rs.rig.gameExportBatch")
+
+
+class CmdRigGameExportQueueEntry(rs.Command):
+    """ Exports single entry of the game export queue that is currently being exported.
+
+    This is internal command used by game export queue.
+    All the changes done to the scene during export are undone after execution.
+    """
+
+    ARG_INDEX = 'index'
+
+    def arguments(self):
+        argIndex = rs.cmd.Argument(self.ARG_INDEX, 'integer')
+        return [argIndex]
+
+    def flags(self):
+        return lx.symbol.fCMD_UNDO | lx.symbol.fCMD_UNDO_AFTER_EXEC
+
+    def execute(self, msg, flags):
+        try:
+            rs.game_export.GameExportQueue.exportRunningQueueEntry(self.getArgumentValue(self.ARG_INDEX))
+        except LookupError:
+            rs.log.out("There is no game export queue entry to export!", rs.log.MSG_ERROR)
+
+rs.cmd.bless(CmdRigGameExportQueueEntry, "rs.rig.gameExportQueueEntry")
+
+
 class CmdRigGameExportSetPath(rs.RigCommand):
 
     def interact(self):
@@ -49,6 +49,10 @@ class CmdRigSave(rs.Command):
     def setupMode(self):
         return True
 
+    def deferSettingsSave(self):
+        # Settings are read from item tags when rig is saved.
+        return False
+
     def execute(self, msg, flags):
         captureThumb = self.getArgumentValue(self.ARG_CAPTURE_THUMB)
 
@@ -103,6 +107,10 @@ class CmdRigQuickSave(rs.RigCommand):
                 return False
         return True
 
+    def deferSettingsSave(self):
+        # Settings are read from item tags when rig is saved.
+        return False
+
     def execute(self, msg, flags):
         captureThumb = self.getArgumentValue(self.ARG_CAPTURE_THUMB)
 
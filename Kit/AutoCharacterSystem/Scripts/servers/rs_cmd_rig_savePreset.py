@@ -86,6 +86,10 @@ class CmdRigSavePreset(rs.Command):
             return icon
         return presetClass.descDefaultIcon
 
+    def deferSettingsSave(self):
+        # Settings are read from item tags when preset is saved.
+        return False
+
     def execute(self, msg, flags):
         identifier = self.getArgumentValue(self.ARG_IDENTIFIER)
         captureThumb = self.getArgumentValue(self.ARG_CAPTURE_THUMB)
@@ -5,6 +5,7 @@ import lxu
 import modo
 
 import rs
+from modox.command_profile import commandProfiler
 
 
 class CmdClearEventQueue(lxu.command.BasicCommand):
@@ -64,25 +65,92 @@ class CmdParseEventQueue(rs.Command):
         lx.eval('!rs.sys.clearEventQueue')
 
         queue = self.getArgumentValue(self.ARG_QUEUE)
-        events = queue.split(';')
-        
-        for event in events:
-            e = event.split(':')
-
-            identifier = e[0]
-            if len(e) > 1:
-                arguments = e[1].split(',')
-            else:
-                arguments = []
-
-            try:
-                eventObj = rs.service.systemComponent.get(rs.c.SystemComponentType.SCENE_EVENT, identifier)
-            except LookupError:
-                if rs.debug.output:
-                    rs.log.out('Unrecognised scene event!', rs.log.MSG_ERROR)
-                continue
-            else:
-                eventObj.process(arguments)
+        rs.SceneEventQueue(queue).process()
 
 
 rs.cmd.bless(CmdParseEventQueue, 'rs.sys.parseEventQueue')
+
+
+class CmdCommandProfile(rs.Command):
+    """ Turns profiling of command enable/query/notify calls on or off.
+    """
+
+    ARG_STATE = 'state'
+
+    def arguments(self):
+        stateArg = rs.cmd.Argument(self.ARG_STATE, 'boolean')
+        stateArg.flags = 'query'
+        stateArg.defaultValue = True
+        return [stateArg]
+
+    def enable(self, msg):
+        return True
+
+    def flags(self):
+        return lx.symbol.fCMD_UI
+
+    def stopListeners(self):
+        return False
+
+    def dropSceneCaches(self):
+        return False
+
+    def dropCommandResults(self):
+        return False
+
+    def notifiers(self):
+        return []
+
+    def execute(self, msg, flags):
+        commandProfiler.enabled = self.getArgumentValue(self.ARG_STATE)
+
+    def query(self, argument):
+        if argument == self.ARG_STATE:
+            return commandProfiler.enabled
+
+
+rs.cmd.bless(CmdCommandProfile, 'rs.sys.commandProfile')
+
+
+class CmdCommandProfileReport(rs.Command):
+    """ Outputs command profiler report to the event log.
+    """
+
+    ARG_SORT = 'sortBy'
+    ARG_RESET = 'reset'
+
+    def arguments(self):
+        sortArg = rs.cmd.Argument(self.ARG_SORT, 'string')
+        sortArg.flags = 'optional'
+        sortArg.defaultValue = commandProfiler.SORT_TOTAL
+
+        resetArg = rs.cmd.Argument(self.ARG_RESET, 'boolean')
+        resetArg.flags = 'optional'
+        resetArg.defaultValue = False
+        return [sortArg, resetArg]
+
+    def enable(self, msg):
+        return True
+
+    def flags(self):
+        return lx.symbol.fCMD_UI
+
+    def stopListeners(self):
+        return False
+
+    def dropSceneCaches(self):
+        return False
+
+    def dropCommandResults(self):
+        return False
+
+    def notifiers(self):
+        return []
+
+    def execute(self, msg, flags):
+        commandProfiler.outputReport(self.getArgumentValue(self.ARG_SORT))
+        if self.getArgumentValue(self.ARG_RESET):
+            commandProfiler.reset()
+
+
+rs.cmd.bless(CmdCommandProfileReport, 'rs.sys.commandProfileReport')